@@ -5,13 +5,23 @@ Interface Streamlit moderne pour le solveur de programmation linéaire.
 Design moderne avec couleurs attrayantes et animations.
 """
 
+import os
+import re
+import warnings
+from typing import TYPE_CHECKING, Optional
+
 import streamlit as st
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
 from src.models import ProblemePL, Solution
-from src.simplexe import SimplexeSolveur, TableauSimplexe
+from src.simplexe import SimplexeSolveur, TableauSimplexe, solution_depuis_resultat
+from src.cache import CacheSolutions
+from src.geometrie import region_realisable, segment_dans_boite
+
+# Plotly et pandas sont longs à importer : ils ne sont chargés que lorsqu'un
+# graphique ou un tableau est réellement affiché
+if TYPE_CHECKING:
+    import pandas as pd
+    from src.metriques import EcouteurMetriques
 
 
 # ============================================================
@@ -29,211 +39,24 @@ st.set_page_config(
 # STYLES CSS PERSONNALISÉS - DESIGN MODERNE
 # ============================================================
 
-st.markdown("""
-<style>
-    /* Import de la police Google */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Style global */
-    .main {
-        font-family: 'Inter', sans-serif;
-    }
-    
-    /* Header principal avec dégradé */
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem 2rem;
-        border-radius: 20px;
-        margin-bottom: 2rem;
-        box-shadow: 0 10px 40px rgba(102, 126, 234, 0.3);
-    }
-    
-    .main-header h1 {
-        color: white;
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin: 0;
-        text-align: center;
-    }
-    
-    .main-header p {
-        color: rgba(255,255,255,0.9);
-        text-align: center;
-        font-size: 1.1rem;
-        margin-top: 0.5rem;
-    }
-    
-    /* Cards modernes */
-    .card {
-        background: linear-gradient(145deg, #ffffff, #f0f0f0);
-        border-radius: 16px;
-        padding: 1.5rem;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-        margin-bottom: 1rem;
-        border: 1px solid rgba(200,200,200,0.8);
-        color: #333333;
-    }
-    
-    .card h4 {
-        color: #333333;
-        margin: 0 0 0.5rem 0;
-        font-size: 1.2rem;
-    }
-    
-    .card p {
-        color: #666666;
-        margin: 0;
-    }
-    
-    .card-success {
-        background: linear-gradient(145deg, #d4edda, #c3e6cb);
-        border-left: 5px solid #28a745;
-        color: #155724;
-    }
-    
-    .card-success h3 {
-        color: #155724;
-    }
-    
-    .card-error {
-        background: linear-gradient(145deg, #f8d7da, #f5c6cb);
-        border-left: 5px solid #dc3545;
-        color: #721c24;
-    }
-    
-    .card-error h3 {
-        color: #721c24;
-    }
-    
-    .card-info {
-        background: linear-gradient(145deg, #e7f3ff, #cce5ff);
-        border-left: 5px solid #007bff;
-        color: #004085;
-    }
-    
-    .card-info h3 {
-        color: #004085;
-    }
-    
-    /* Résultat principal */
-    .result-box {
-        background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-        border-radius: 20px;
-        padding: 2rem;
-        text-align: center;
-        box-shadow: 0 10px 40px rgba(17, 153, 142, 0.3);
-        margin: 1rem 0;
-    }
-    
-    .result-box h2 {
-        color: white;
-        font-size: 1.2rem;
-        margin-bottom: 0.5rem;
-        font-weight: 500;
-    }
-    
-    .result-box .value {
-        color: white;
-        font-size: 3rem;
-        font-weight: 700;
-    }
-    
-    /* Variables résultat */
-    .variable-card {
-        background: linear-gradient(145deg, #667eea, #764ba2);
-        border-radius: 12px;
-        padding: 1rem 1.5rem;
-        margin: 0.5rem 0;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-    }
-    
-    .variable-card .var-name {
-        color: rgba(255,255,255,0.8);
-        font-size: 0.9rem;
-    }
-    
-    .variable-card .var-value {
-        color: white;
-        font-size: 1.5rem;
-        font-weight: 600;
-    }
-    
-    /* Sidebar style */
-    .css-1d391kg {
-        background: linear-gradient(180deg, #1a1a2e 0%, #16213e 100%);
-    }
-    
-    /* Boutons stylisés */
-    .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        border-radius: 12px;
-        padding: 0.75rem 2rem;
-        font-weight: 600;
-        font-size: 1rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4);
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 25px rgba(102, 126, 234, 0.5);
-    }
-    
-    /* Metrics améliorés */
-    div[data-testid="metric-container"] {
-        background: linear-gradient(145deg, #ffffff, #f8f9fa);
-        border-radius: 12px;
-        padding: 1rem;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-    }
-    
-    /* Section titre */
-    .section-title {
-        color: #667eea;
-        font-size: 1.5rem;
-        font-weight: 600;
-        margin: 1.5rem 0 1rem 0;
-    }
-    
-    /* Exemple cards */
-    .example-card {
-        background: white;
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin: 0.5rem 0;
-        border: 2px solid transparent;
-        transition: all 0.3s ease;
-        cursor: pointer;
-    }
-    
-    .example-card:hover {
-        border-color: #667eea;
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.2);
-        transform: translateY(-3px);
-    }
-    
-    /* Animation fade-in */
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(20px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    .fade-in {
-        animation: fadeIn 0.5s ease-out;
-    }
-    
-    /* Footer */
-    .footer {
-        text-align: center;
-        color: #666;
-        padding: 2rem;
-        margin-top: 3rem;
-        border-top: 1px solid #eee;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def charger_css() -> str:
+    """
+    Lit et compacte la feuille de style une seule fois par serveur.
+    
+    Les commentaires et les espaces superflus sont retirés : le bloc envoyé
+    au navigateur à chaque relance du script est plus petit.
+    """
+    chemin = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'style.css')
+    with open(chemin, encoding='utf-8') as f:
+        css = f.read()
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    return f"<style>{css.strip()}</style>"
+
+
+st.markdown(charger_css(), unsafe_allow_html=True)
 
 
 # ============================================================
@@ -248,24 +71,49 @@ def creer_graphique_2d(probleme: ProblemePL, solution: Solution):
     if len(probleme.c) != 2:
         return None
     
+    import plotly.graph_objects as go
+    
     fig = go.Figure()
     
     # Couleurs modernes
     colors = ['#667eea', '#764ba2', '#f093fb', '#f5576c', '#4facfe', '#00f2fe']
     
-    # Tracer les contraintes
-    x_range = np.linspace(0, 50, 500)
+    # Région réalisable exacte (intersection de demi-plans) et zone affichée
+    points = []
+    if solution.succes:
+        points.append((solution.valeurs_variables[0], solution.valeurs_variables[1]))
+    sommets, boite = region_realisable(probleme, points)
     
+    if sommets:
+        fig.add_trace(go.Scatter(
+            x=[p[0] for p in sommets] + [sommets[0][0]],
+            y=[p[1] for p in sommets] + [sommets[0][1]],
+            mode='lines',
+            fill='toself',
+            fillcolor='rgba(102, 126, 234, 0.15)',
+            line=dict(color='rgba(102, 126, 234, 0.4)', width=1),
+            name='Région réalisable'
+        ))
+    
+    # Tracer les contraintes : un segment découpé par la zone affichée
+    contraintes = []
     if probleme.A_ub is not None:
-        for i, (row, b) in enumerate(zip(probleme.A_ub, probleme.b_ub)):
-            if row[1] != 0:
-                y = (b - row[0] * x_range) / row[1]
-                fig.add_trace(go.Scatter(
-                    x=x_range, y=y,
-                    mode='lines',
-                    name=f'Contrainte {i+1}',
-                    line=dict(color=colors[i % len(colors)], width=3)
-                ))
+        contraintes += [(row, b, f'Contrainte {i+1}') for i, (row, b) in enumerate(zip(probleme.A_ub, probleme.b_ub))]
+    if probleme.A_eq is not None:
+        contraintes += [(row, b, f'Égalité {i+1}') for i, (row, b) in enumerate(zip(probleme.A_eq, probleme.b_eq))]
+    
+    for i, (row, b, nom) in enumerate(contraintes):
+        if row[0] == 0 and row[1] == 0:
+            continue
+        segment = segment_dans_boite((float(row[0]), float(row[1]), float(b)), boite)
+        if segment is None:
+            continue
+        fig.add_trace(go.Scatter(
+            x=[segment[0][0], segment[1][0]], y=[segment[0][1], segment[1][1]],
+            mode='lines',
+            name=nom,
+            line=dict(color=colors[i % len(colors)], width=3)
+        ))
     
     # Marquer la solution optimale
     if solution.succes:
@@ -287,8 +135,8 @@ def creer_graphique_2d(probleme: ProblemePL, solution: Solution):
         ),
         xaxis_title=probleme.noms_variables[0],
         yaxis_title=probleme.noms_variables[1],
-        xaxis=dict(range=[0, 50], gridcolor='#eee'),
-        yaxis=dict(range=[0, 50], gridcolor='#eee'),
+        xaxis=dict(range=[boite[0], boite[1]], gridcolor='#eee'),
+        yaxis=dict(range=[boite[2], boite[3]], gridcolor='#eee'),
         plot_bgcolor='white',
         paper_bgcolor='white',
         font=dict(family='Inter'),
@@ -331,10 +179,61 @@ def afficher_formulation_mathematique(probleme: ProblemePL):
             st.latex(f"{' + '.join(termes)} = {b:.2g}")
 
 
-def afficher_tableaux_simplexe(probleme: ProblemePL):
+def creer_dataframe_tableau(tableau: TableauSimplexe) -> "pd.DataFrame":
+    """
+    Construit le DataFrame numérique d'un tableau du simplexe.
+    
+    Lignes : variables de base puis Δ. Colonnes : variables hors base, C et R.
+    Les ratios infinis (et la case R de la ligne Δ) valent NaN.
+    """
+    import pandas as pd
+    
+    n_lignes = len(tableau.vars_base)
+    
+    # Matrice + colonne C, puis la ligne Δ (avec -Z dans la colonne C)
+    data = np.empty((n_lignes + 1, len(tableau.vars_hb) + 1))
+    data[:n_lignes, :-1] = tableau.matrice
+    data[:n_lignes, -1] = tableau.colonne_c
+    data[n_lignes, :-1] = tableau.delta
+    data[n_lignes, -1] = tableau.valeur_z
+    
+    df = pd.DataFrame(data, columns=tableau.vars_hb + ['C'], index=tableau.vars_base + ['Δ'])
+    
+    if tableau.colonne_r is not None:
+        ratios = np.append(tableau.colonne_r, np.nan)
+        ratios[np.isinf(ratios)] = np.nan
+        df['R'] = ratios
+    
+    return df
+
+
+def styliser_tableau(df: "pd.DataFrame", tableau: TableauSimplexe):
+    """
+    Met en forme le DataFrame d'un tableau : 2 décimales, pivot en évidence.
+    
+    Returns:
+        Un Styler pandas
+    """
+    import pandas as pd
+    
+    def surligner(valeurs: pd.DataFrame) -> pd.DataFrame:
+        styles = pd.DataFrame('', index=valeurs.index, columns=valeurs.columns)
+        i, j = tableau.var_sortante_idx, tableau.var_entrante_idx
+        if j >= 0 and tableau.iteration > 0:
+            # Colonne de la variable entrante dans la ligne Δ
+            styles.iat[len(tableau.vars_base), j] = 'background-color: #e7f3ff; font-weight: bold'
+            if i >= 0:
+                styles.iat[i, j] = 'background-color: #667eea; color: white; font-weight: bold'
+        return styles
+    
+    return df.style.format("{:.2f}", na_rep="-").apply(surligner, axis=None)
+
+
+def afficher_tableaux_simplexe(probleme: ProblemePL, resultat: dict):
     """
     Affiche les tableaux du simplexe étape par étape.
     Uniquement pour les problèmes avec contraintes d'inégalité (<= seulement).
+    Les tableaux viennent de la résolution déjà faite (pas de nouveau calcul).
     """
     # Vérifier que le problème est compatible (seulement des contraintes <=)
     if probleme.A_eq is not None and len(probleme.b_eq) > 0:
@@ -347,101 +246,135 @@ def afficher_tableaux_simplexe(probleme: ProblemePL):
     
     st.markdown("### Tableaux du Simplexe (Méthode du cours)")
     
-    # Préparer les données pour le solveur simplexe
-    c = probleme.c.tolist()
-    A = probleme.A_ub.tolist()
-    b = probleme.b_ub.tolist()
-    noms_vars = probleme.noms_variables
-    maximiser = (probleme.type_optimisation == 'max')
+    tableaux = resultat['tableaux']
+    solution = resultat['solution']
     
-    # Résoudre avec notre solveur simplexe
-    solveur = SimplexeSolveur()
-    tableaux = solveur.resoudre(c, A, b, noms_vars, maximiser)
+    # Afficher un seul tableau à la fois (le coût ne dépend plus du nombre d'itérations)
+    if len(tableaux) > 1:
+        numero = st.slider(
+            "Itération", min_value=0, max_value=len(tableaux) - 1, value=0,
+            key=f"iteration_tableau_{len(tableaux)}"
+        )
+    else:
+        numero = 0
+    tableau = tableaux[numero]
     
-    # Afficher chaque tableau
-    for i, tableau in enumerate(tableaux):
-        # Titre du tableau
-        if tableau.iteration == 0:
-            st.markdown(f"**Tableau Initial**")
+    # Titre du tableau
+    if tableau.iteration == 0:
+        st.markdown(f"**Tableau Initial** ({numero + 1}/{len(tableaux)})")
+    else:
+        st.markdown(f"**Tableau {tableau.iteration}** ({numero + 1}/{len(tableaux)})")
+    
+    # Afficher le tableau (valeurs numériques, pivot mis en évidence)
+    st.dataframe(styliser_tableau(creer_dataframe_tableau(tableau), tableau),
+                 use_container_width=True)
+    
+    # Afficher le message explicatif
+    if tableau.message:
+        if "SOLUTION OPTIMALE" in tableau.message:
+            st.success(tableau.message)
+        elif "entrante" in tableau.message:
+            st.info(tableau.message)
         else:
-            st.markdown(f"**Tableau {tableau.iteration}**")
-        
-        # Construire le DataFrame pour l'affichage
-        n_vars_hb = len(tableau.vars_hb)
-        n_lignes = len(tableau.vars_base)
-        
-        # Colonnes du tableau
-        colonnes = tableau.vars_hb + ['C']
-        if tableau.colonne_r is not None:
-            colonnes.append('R')
-        
-        # Données du tableau
-        data = []
-        for j in range(n_lignes):
-            ligne = []
-            for k in range(n_vars_hb):
-                val = tableau.matrice[j, k]
-                # Mettre en évidence le pivot
-                if j == tableau.var_sortante_idx and k == tableau.var_entrante_idx:
-                    ligne.append(f"[{val:.2f}]")
-                else:
-                    ligne.append(f"{val:.2f}")
-            ligne.append(f"{tableau.colonne_c[j]:.2f}")
-            if tableau.colonne_r is not None:
-                if tableau.colonne_r[j] == np.inf:
-                    ligne.append("-")
-                else:
-                    ligne.append(f"{tableau.colonne_r[j]:.2f}")
-            data.append(ligne)
-        
-        # Ligne Delta
-        ligne_delta = []
-        for k in range(n_vars_hb):
-            val = tableau.delta[k]
-            if k == tableau.var_entrante_idx and tableau.iteration > 0:
-                ligne_delta.append(f"[{val:.2f}]")
-            else:
-                ligne_delta.append(f"{val:.2f}")
-        ligne_delta.append(f"{tableau.valeur_z:.2f}")
-        if tableau.colonne_r is not None:
-            ligne_delta.append("")
-        data.append(ligne_delta)
-        
-        # Index (variables de base + Δ)
-        index = tableau.vars_base + ['Δ']
-        
-        # Créer le DataFrame
-        df = pd.DataFrame(data, columns=colonnes, index=index)
-        
-        # Afficher le tableau avec style
-        st.dataframe(df, use_container_width=True)
-        
-        # Afficher le message explicatif
-        if tableau.message:
-            if "SOLUTION OPTIMALE" in tableau.message:
-                st.success(tableau.message)
-            elif "entrante" in tableau.message:
-                st.info(tableau.message)
-            else:
-                st.caption(tableau.message)
-        
-        st.markdown("---")
+            st.caption(tableau.message)
+    
+    st.markdown("---")
     
     # Résumé final
-    if solveur.solution_trouvee:
+    if solution.succes:
         st.markdown("### Interprétation des résultats")
         st.markdown(f"""
-        - **Valeur optimale** : Z = {solveur.valeur_optimale:.4f}
+        - **Valeur optimale** : Z = {solution.valeur_objectif:.4f}
         - Les variables **Hors Base (HB)** sont nulles
         - Les valeurs des variables **dans la Base** se lisent dans la colonne **C**
         - La valeur **-Z** se lit à l'intersection de C et Δ
         """)
 
 
+@st.cache_resource
+def metriques() -> Optional['EcouteurMetriques']:
+    """
+    Métriques Prometheus, seulement si PL_METRIQUES_PORT est défini :
+        PL_METRIQUES_PORT=9464 streamlit run app.py
+    sert GET http://127.0.0.1:9464/metrics (un seul serveur par processus).
+    
+    Si le port est invalide ou déjà pris, les métriques sont désactivées
+    (avertissement) : l'interface reste utilisable.
+    """
+    port = os.environ.get('PL_METRIQUES_PORT')
+    if not port:
+        return None
+    from src.metriques import EcouteurMetriques, RegistreMetriques
+    registre = RegistreMetriques()
+    try:
+        registre.servir(port=int(port))
+    except (OSError, ValueError) as erreur:
+        warnings.warn(f"Métriques désactivées : impossible d'écouter sur le port {port} ({erreur})",
+                      RuntimeWarning)
+        return None
+    return EcouteurMetriques(registre)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _resoudre_en_cache(cle: str, _probleme: ProblemePL) -> dict:
+    """
+    Résout le problème une seule fois par problème distinct.
+    
+    Streamlit relance tout le script à chaque interaction : le résultat est
+    gardé en cache entre les relances (et partagé entre les utilisateurs).
+    Le paramètre _probleme n'est pas haché par Streamlit, c'est `cle`
+    (l'empreinte des données du problème) qui identifie l'entrée.
+    
+    Returns:
+        Dictionnaire avec les tableaux, la solution et le graphique
+    """
+    c = _probleme.c.tolist()
+    A = _probleme.A_ub.tolist() if _probleme.A_ub is not None else []
+    b = _probleme.b_ub.tolist() if _probleme.b_ub is not None else []
+    noms_vars = _probleme.noms_variables
+    maximiser = (_probleme.type_optimisation == 'max')
+    
+    ecouteur = metriques()
+    if ecouteur is not None:
+        ecouteur.registre.compteurs_cache()[1].incrementer(cache='app')
+    solveur = SimplexeSolveur(ecouteurs=[ecouteur] if ecouteur is not None else None)
+    tableaux = solveur.resoudre(c, A, b, noms_vars, maximiser)
+    solution = solution_depuis_resultat(tableaux, noms_vars)
+    
+    # Graphique 2D si applicable
+    figure = None
+    if len(_probleme.c) == 2 and solution.succes:
+        figure = creer_graphique_2d(_probleme, solution)
+    
+    return {'tableaux': tableaux, 'solution': solution, 'figure': figure}
+
+
+def resoudre_probleme(probleme: ProblemePL) -> dict:
+    """
+    Résout le problème avec la méthode du Simplexe (avec cache).
+    
+    Args:
+        probleme: Le problème à résoudre
+    
+    Returns:
+        Dictionnaire avec les tableaux, la solution et le graphique
+    """
+    cle = CacheSolutions.cle(
+        'simplexe', probleme.c, probleme.A_ub, probleme.b_ub,
+        probleme.A_eq, probleme.b_eq, probleme.bounds,
+        probleme.type_optimisation, extra=list(probleme.noms_variables)
+    )
+    ecouteur = metriques()
+    if ecouteur is not None:
+        ecouteur.registre.compteurs_cache()[0].incrementer(cache='app')
+    return _resoudre_en_cache(cle, probleme)
+
+
 # ============================================================
 # EXEMPLES PRÉDÉFINIS
 # ============================================================
 
+@st.cache_resource
 def get_exemple_simple():
     """
     Retourne l'exemple du cours (Exemple 1 du syllabus).
@@ -457,6 +390,7 @@ def get_exemple_simple():
     probleme.definir_bornes([(0, None), (0, None)])
     return probleme
 
+@st.cache_resource
 def get_exemple_production():
     """Retourne l'exemple de production."""
     probleme = ProblemePL("Production Optimale")
@@ -467,6 +401,7 @@ def get_exemple_production():
     probleme.definir_bornes([(0, None), (0, None)])
     return probleme
 
+@st.cache_resource
 def get_exemple_melange():
     """Retourne l'exemple de mélange."""
     probleme = ProblemePL("Mélange Optimal")
@@ -477,6 +412,7 @@ def get_exemple_melange():
     probleme.definir_bornes([(0, None), (0, None)])
     return probleme
 
+@st.cache_resource
 def get_exemple_transport():
     """Retourne l'exemple de transport."""
     probleme = ProblemePL("Transport Optimal")
@@ -696,33 +632,10 @@ def afficher_probleme_et_solution(probleme: ProblemePL):
         afficher_formulation_mathematique(probleme)
     
     with col2:
-        # Résoudre le problème avec la méthode du Simplexe
-        solveur = SimplexeSolveur()
-        
-        # Extraire les données du problème
-        c = probleme.c.tolist()
-        A = probleme.A_ub.tolist() if probleme.A_ub is not None else []
-        b = probleme.b_ub.tolist() if probleme.b_ub is not None else []
-        noms_vars = probleme.noms_variables
-        maximiser = (probleme.type_optimisation == 'max')
-        
+        # Résoudre le problème avec la méthode du Simplexe (une seule fois)
         with st.spinner("Résolution en cours avec la méthode du Simplexe..."):
-            tableaux = solveur.resoudre(c, A, b, noms_vars, maximiser)
-        
-        # Créer l'objet Solution à partir des résultats du Simplexe
-        solution = Solution()
-        if solveur.solution_trouvee:
-            valeurs_vars = [solveur.variables_solution.get(nom, 0.0) for nom in noms_vars]
-            solution.succes = True
-            solution.valeurs_variables = np.array(valeurs_vars)
-            solution.valeur_objectif = solveur.valeur_optimale
-            solution.noms_variables = noms_vars
-            solution.message = "Solution optimale trouvée"
-        else:
-            solution.succes = False
-            solution.valeurs_variables = None
-            solution.valeur_objectif = None
-            solution.message = "Aucune solution trouvée" if not solveur.solution_infinie else "Solution infinie"
+            resultat = resoudre_probleme(probleme)
+        solution = resultat['solution']
         
         if solution.succes:
             # Affichage du résultat principal
@@ -753,7 +666,7 @@ def afficher_probleme_et_solution(probleme: ProblemePL):
         st.markdown("---")
         st.markdown('<p class="section-title">Visualisation Graphique</p>', unsafe_allow_html=True)
         
-        fig = creer_graphique_2d(probleme, solution)
+        fig = resultat['figure']
         if fig:
             st.plotly_chart(fig, use_container_width=True)
     
@@ -784,7 +697,7 @@ def afficher_probleme_et_solution(probleme: ProblemePL):
         st.markdown('<p class="section-title">Détail de la Résolution par le Simplexe</p>', unsafe_allow_html=True)
         
         with st.expander("Voir les tableaux du Simplexe étape par étape", expanded=False):
-            afficher_tableaux_simplexe(probleme)
+            afficher_tableaux_simplexe(probleme, resultat)
 
 
 # Point d'entrée
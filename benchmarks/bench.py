@@ -0,0 +1,296 @@
+"""
+bench.py
+--------
+Benchmarks des moteurs de résolution.
+
+Chaque moteur est chronométré sur chaque générateur (voir generateurs.py)
+et chaque taille ; les résultats sont écrits en JSON pour pouvoir comparer
+deux commits et détecter les régressions de performance.
+
+Utilisation :
+    python benchmarks/bench.py executer --tailles petite moyenne --sortie avant.json
+    python benchmarks/bench.py executer --sortie apres.json
+    python benchmarks/bench.py comparer avant.json apres.json --seuil 1.2
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from src.budget import Budget
+from src.instrumentation import CollecteurProfil
+from src.models import ProblemePL
+from src.simplexe import SimplexeSolveur
+from src.solver import SolveurPL
+from src.transport import SolveurTransport, detecter_transport
+from src.flot import SolveurFlot, detecter_reseau
+from generateurs import GENERATEURS
+
+
+# ============================================================
+# MOTEURS
+# ============================================================
+
+def moteur_simplexe(probleme: ProblemePL) -> dict:
+    """Méthode du Simplexe du cours (contraintes <= avec seconds membres >= 0)."""
+    if probleme.A_eq is not None or probleme.A_ub is None or np.any(probleme.b_ub < 0):
+        return {'statut': 'non_applicable'}
+
+    solveur = SimplexeSolveur()
+    tableaux = solveur.resoudre(
+        probleme.c.tolist(), probleme.A_ub.tolist(), probleme.b_ub.tolist(),
+        probleme.noms_variables, probleme.type_optimisation == 'max',
+        budget=Budget(max_iterations=100_000)
+    )
+
+    if solveur.solution_trouvee:
+        statut = 'optimal'
+    elif solveur.solution_infinie:
+        statut = 'non_borne'
+    else:
+        statut = 'budget_epuise'
+    return {'statut': statut, 'objectif': solveur.valeur_optimale,
+            'iterations': len(tableaux) - 1}
+
+
+def creer_moteur_scipy(methode: str) -> Callable[[ProblemePL], dict]:
+    """Crée un moteur SolveurPL utilisant la méthode donnée de linprog."""
+    def moteur(probleme: ProblemePL) -> dict:
+        collecteur = CollecteurProfil()
+        solveur = SolveurPL(ecouteurs=[collecteur])
+        solveur.methode = methode
+        solution = solveur.resoudre(probleme)
+        return {'statut': solution.statut, 'objectif': solution.valeur_objectif,
+                'iterations': collecteur.dernier.nb_pivots}
+    return moteur
+
+
+def moteur_transport(probleme: ProblemePL) -> dict:
+    """Méthode MODI (problèmes ayant la structure d'un transport uniquement)."""
+    if detecter_transport(probleme) is None:
+        return {'statut': 'non_applicable'}
+
+    solveur = SolveurTransport()
+    solution = solveur.resoudre(probleme)
+    return {'statut': solution.statut, 'objectif': solution.valeur_objectif,
+            'iterations': solveur.iterations}
+
+
+def moteur_flot(probleme: ProblemePL) -> dict:
+    """Plus courts chemins successifs (A_eq matrice d'incidence uniquement)."""
+    if detecter_reseau(probleme) is None:
+        return {'statut': 'non_applicable'}
+
+    solveur = SolveurFlot()
+    solution = solveur.resoudre(probleme)
+    return {'statut': solution.statut, 'objectif': solution.valeur_objectif,
+            'iterations': solveur.iterations}
+
+
+# nom -> fonction(probleme) -> {'statut', 'objectif', 'iterations'}
+MOTEURS: Dict[str, Callable[[ProblemePL], dict]] = {
+    'simplexe': moteur_simplexe,
+    'transport': moteur_transport,
+    'flot': moteur_flot,
+}
+for _methode in SolveurPL.METHODES:
+    MOTEURS[f"scipy-{_methode}"] = creer_moteur_scipy(_methode)
+
+
+# ============================================================
+# EXÉCUTION
+# ============================================================
+
+def chronometrer(moteur: Callable[[ProblemePL], dict], probleme: ProblemePL,
+                 repetitions: int) -> dict:
+    """
+    Chronomètre un moteur sur un problème.
+
+    Returns:
+        Le résultat du moteur, complété par les temps (secondes)
+    """
+    temps = []
+    resultat = {}
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        resultat = moteur(probleme)
+        temps.append(time.perf_counter() - debut)
+        if resultat['statut'] == 'non_applicable':
+            return resultat
+
+    resultat['temps_min'] = min(temps)
+    resultat['temps_median'] = statistics.median(temps)
+    return resultat
+
+
+def informations_environnement() -> dict:
+    """Commit git, versions et machine (pour interpréter les résultats)."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    import scipy
+    return {
+        'commit': commit,
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'machine': platform.platform(),
+    }
+
+
+def executer(generateurs: List[str], tailles: List[str], moteurs: List[str],
+             repetitions: int = 3, verbose: bool = True) -> dict:
+    """
+    Lance les benchmarks.
+
+    Args:
+        generateurs: Noms des générateurs (clés de GENERATEURS)
+        tailles: 'petite', 'moyenne' et/ou 'grande'
+        moteurs: Noms des moteurs (clés de MOTEURS)
+        repetitions: Nombre de répétitions par mesure
+        verbose: Afficher la progression
+
+    Returns:
+        Dictionnaire {'environnement': ..., 'resultats': [...]}
+    """
+    resultats = []
+    for nom_generateur in generateurs:
+        fonction, parametres = GENERATEURS[nom_generateur]
+        for taille in tailles:
+            probleme = fonction(*parametres[taille])
+            for nom_moteur in moteurs:
+                try:
+                    mesure = chronometrer(MOTEURS[nom_moteur], probleme, repetitions)
+                except Exception as e:
+                    mesure = {'statut': 'erreur', 'message': str(e)}
+
+                mesure.update({
+                    'generateur': nom_generateur,
+                    'taille': taille,
+                    'parametres': list(parametres[taille]),
+                    'moteur': nom_moteur,
+                })
+                resultats.append(mesure)
+
+                if verbose and 'temps_median' in mesure:
+                    print(f"{nom_generateur:<12} {taille:<8} {nom_moteur:<24} "
+                          f"{mesure['temps_median'] * 1000:10.2f} ms  {mesure['statut']}")
+
+    return {'environnement': informations_environnement(), 'resultats': resultats}
+
+
+# ============================================================
+# COMPARAISON
+# ============================================================
+
+def comparer(ancien: dict, nouveau: dict, seuil: float = 1.2) -> List[dict]:
+    """
+    Compare deux fichiers de résultats.
+
+    Args:
+        ancien: Résultats de référence
+        nouveau: Nouveaux résultats
+        seuil: Rapport de temps au-delà duquel on signale une régression
+
+    Returns:
+        Liste des régressions (temps), changements de statut/objectif et
+        mesures de l'ancien fichier absentes du nouveau
+    """
+    def indexer(donnees):
+        return {(r['generateur'], r['taille'], r['moteur']): r for r in donnees['resultats']}
+
+    avant, apres = indexer(ancien), indexer(nouveau)
+    differences = []
+    for cle in sorted(avant.keys()):
+        r1, r2 = avant[cle], apres.get(cle)
+        if r2 is None:
+            differences.append({'cle': cle, 'type': 'manquant',
+                                'avant': r1['statut'], 'apres': None})
+            continue
+
+        # Un moteur en erreur ou non applicable n'a pas de temps : seul le statut compte
+        if 'temps_median' in r1 and 'temps_median' in r2:
+            rapport = r2['temps_median'] / r1['temps_median'] if r1['temps_median'] > 0 else 1.0
+            if rapport > seuil:
+                differences.append({'cle': cle, 'type': 'regression', 'rapport': rapport})
+        if r1['statut'] != r2['statut']:
+            differences.append({'cle': cle, 'type': 'statut',
+                                'avant': r1['statut'], 'apres': r2['statut']})
+        elif (r1.get('objectif') is not None and r2.get('objectif') is not None
+              and abs(r1['objectif'] - r2['objectif']) > 1e-6 * max(1.0, abs(r1['objectif']))):
+            differences.append({'cle': cle, 'type': 'objectif',
+                                'avant': r1['objectif'], 'apres': r2['objectif']})
+    return differences
+
+
+# ============================================================
+# LIGNE DE COMMANDE
+# ============================================================
+
+def main(arguments=None) -> int:
+    """Point d'entrée de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Benchmarks des solveurs de PL")
+    sous_commandes = parser.add_subparsers(dest='commande', required=True)
+
+    p_exec = sous_commandes.add_parser('executer', help="Lancer les benchmarks")
+    p_exec.add_argument('--generateurs', nargs='+', default=list(GENERATEURS),
+                        choices=list(GENERATEURS))
+    p_exec.add_argument('--tailles', nargs='+', default=['petite', 'moyenne'],
+                        choices=['petite', 'moyenne', 'grande'])
+    p_exec.add_argument('--moteurs', nargs='+', default=list(MOTEURS), choices=list(MOTEURS))
+    p_exec.add_argument('--repetitions', type=int, default=3)
+    p_exec.add_argument('--sortie', default='bench_resultats.json')
+
+    p_comp = sous_commandes.add_parser('comparer', help="Comparer deux fichiers de résultats")
+    p_comp.add_argument('ancien')
+    p_comp.add_argument('nouveau')
+    p_comp.add_argument('--seuil', type=float, default=1.2)
+
+    args = parser.parse_args(arguments)
+
+    if args.commande == 'executer':
+        resultats = executer(args.generateurs, args.tailles, args.moteurs, args.repetitions)
+        with open(args.sortie, 'w', encoding='utf-8') as f:
+            json.dump(resultats, f, indent=2, ensure_ascii=False)
+        print(f"\nRésultats écrits dans {args.sortie}")
+        return 0
+
+    with open(args.ancien, encoding='utf-8') as f:
+        ancien = json.load(f)
+    with open(args.nouveau, encoding='utf-8') as f:
+        nouveau = json.load(f)
+
+    differences = comparer(ancien, nouveau, args.seuil)
+    for diff in differences:
+        generateur, taille, moteur = diff['cle']
+        if diff['type'] == 'regression':
+            print(f"✗ Régression {generateur}/{taille}/{moteur} : x{diff['rapport']:.2f}")
+        elif diff['type'] == 'manquant':
+            print(f"✗ Manquant {generateur}/{taille}/{moteur} : {diff['avant']} → absent")
+        else:
+            print(f"✗ {diff['type'].capitalize()} {generateur}/{taille}/{moteur} : "
+                  f"{diff['avant']} → {diff['apres']}")
+    if not differences:
+        print("✓ Aucune régression")
+    return 1 if differences else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
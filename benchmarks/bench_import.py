@@ -0,0 +1,113 @@
+"""
+bench_import.py
+---------------
+Benchmark du temps d'import (démarrage à froid d'un processus).
+
+Chaque instruction est exécutée dans un nouvel interpréteur Python, plusieurs
+fois ; on retire le temps de démarrage d'un interpréteur vide. On vérifie
+aussi quels modules lourds (SciPy...) ont été chargés.
+
+Utilisation :
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --sortie imports.json --max-ms 400
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import statistics
+import subprocess
+import time
+from typing import Dict, List
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Instructions mesurées -> modules lourds qui NE doivent PAS être chargés
+INSTRUCTIONS: Dict[str, List[str]] = {
+    "import src": ['numpy', 'scipy'],
+    "from src import ProblemePL": ['scipy'],
+    "from src import SimplexeSolveur": ['scipy'],
+    "from src import SolveurPL": ['scipy'],
+    "from src.simplexe import SimplexeSolveur; SimplexeSolveur().resoudre([1, 1], [[1, 2]], [4])": ['scipy'],
+}
+
+# Modules dont on signale le chargement
+MODULES_LOURDS = ['numpy', 'scipy', 'pandas', 'plotly', 'streamlit']
+
+
+def mesurer(instruction: str, repetitions: int) -> dict:
+    """
+    Mesure le temps d'exécution d'une instruction dans un nouvel interpréteur.
+
+    Returns:
+        Temps médian et minimum (secondes) et modules lourds chargés
+    """
+    verification = (
+        f"{instruction}\n"
+        "import sys, json\n"
+        f"print(json.dumps([m for m in {MODULES_LOURDS!r} if m in sys.modules]))"
+    )
+
+    temps = []
+    charges: List[str] = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        sortie = subprocess.run([sys.executable, '-c', verification], cwd=RACINE,
+                                capture_output=True, text=True, check=True).stdout
+        temps.append(time.perf_counter() - debut)
+        charges = json.loads(sortie.strip().splitlines()[-1])
+
+    return {'temps_median': statistics.median(temps), 'temps_min': min(temps),
+            'modules_charges': charges}
+
+
+def executer(repetitions: int = 5, verbose: bool = True) -> dict:
+    """
+    Mesure toutes les instructions de INSTRUCTIONS.
+
+    Returns:
+        Dictionnaire {'interpreteur_vide': ..., 'resultats': [...]}
+    """
+    vide = mesurer("pass", repetitions)['temps_median']
+
+    resultats = []
+    for instruction, interdits in INSTRUCTIONS.items():
+        mesure = mesurer(instruction, repetitions)
+        mesure['instruction'] = instruction
+        mesure['temps_import'] = max(0.0, mesure['temps_median'] - vide)
+        mesure['modules_interdits'] = [m for m in interdits if m in mesure['modules_charges']]
+        resultats.append(mesure)
+
+        if verbose:
+            etat = "✓" if not mesure['modules_interdits'] else f"✗ {mesure['modules_interdits']}"
+            print(f"{mesure['temps_import'] * 1000:8.1f} ms  {etat}  {instruction}")
+
+    return {'interpreteur_vide': vide, 'resultats': resultats}
+
+
+def main(arguments=None) -> int:
+    """Point d'entrée de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Temps d'import du package src")
+    parser.add_argument('--repetitions', type=int, default=5)
+    parser.add_argument('--sortie', default=None, help="Fichier JSON des résultats")
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help="Échouer si un import dépasse ce temps (ms)")
+    args = parser.parse_args(arguments)
+
+    resultats = executer(args.repetitions)
+
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as f:
+            json.dump(resultats, f, indent=2, ensure_ascii=False)
+
+    echecs = [r for r in resultats['resultats'] if r['modules_interdits']]
+    if args.max_ms is not None:
+        echecs += [r for r in resultats['resultats'] if r['temps_import'] * 1000 > args.max_ms]
+    return 1 if echecs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
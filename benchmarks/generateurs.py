@@ -0,0 +1,221 @@
+"""
+generateurs.py
+--------------
+Générateurs de problèmes de programmation linéaire pour les benchmarks.
+
+Chaque générateur prend une taille (et une graine pour les problèmes
+aléatoires) et retourne un ProblemePL. Les mêmes paramètres donnent
+toujours le même problème, ce qui permet de comparer deux commits.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from src.models import ProblemePL
+
+
+def lp_aleatoire_dense(m: int, n: int, graine: int = 0) -> ProblemePL:
+    """
+    Problème dense aléatoire (toujours réalisable et borné).
+
+    Maximiser c^T x  sous  A x <= b, x >= 0  avec A > 0 et b > 0.
+
+    Args:
+        m: Nombre de contraintes
+        n: Nombre de variables
+        graine: Graine du générateur aléatoire
+    """
+    rng = np.random.default_rng(graine)
+
+    probleme = ProblemePL(f"Dense {m}x{n}")
+    probleme.definir_fonction_objectif(rng.uniform(1, 10, n), maximiser=True)
+    A = rng.uniform(1, 10, (m, n))
+    b = rng.uniform(10, 100, m) * n
+    for ligne, borne in zip(A, b):
+        probleme.ajouter_contrainte_inegalite(ligne, borne)
+    probleme.definir_bornes([(0, None)] * n)
+    return probleme
+
+
+def lp_aleatoire_creux(m: int, n: int, densite: float = 0.1, graine: int = 0) -> ProblemePL:
+    """
+    Problème creux aléatoire (toujours réalisable et borné).
+
+    Chaque ligne a environ `densite * n` coefficients non nuls ; une dernière
+    contrainte (somme des x <= borne) garantit que le problème est borné.
+
+    Args:
+        m: Nombre de contraintes
+        n: Nombre de variables
+        densite: Proportion de coefficients non nuls
+        graine: Graine du générateur aléatoire
+    """
+    rng = np.random.default_rng(graine)
+
+    probleme = ProblemePL(f"Creux {m}x{n} ({densite:.0%})")
+    probleme.definir_fonction_objectif(rng.uniform(1, 10, n), maximiser=True)
+    for _ in range(m - 1):
+        ligne = rng.uniform(1, 10, n) * (rng.random(n) < densite)
+        probleme.ajouter_contrainte_inegalite(ligne, rng.uniform(10, 100))
+    probleme.ajouter_contrainte_inegalite(np.ones(n), 100.0 * n)
+    probleme.definir_bornes([(0, None)] * n)
+    return probleme
+
+
+def transport(k: int, l: int, graine: int = 0) -> ProblemePL:
+    """
+    Problème de transport k usines x l entrepôts (comme exemple_transport).
+
+    Capacités des usines : contraintes <= ; demandes des entrepôts : contraintes ==.
+    La capacité totale dépasse la demande totale (problème réalisable).
+
+    Args:
+        k: Nombre d'usines
+        l: Nombre d'entrepôts
+        graine: Graine du générateur aléatoire
+    """
+    rng = np.random.default_rng(graine)
+
+    demandes = rng.integers(10, 100, l).astype(float)
+    capacites = rng.integers(10, 100, k).astype(float)
+    capacites *= 1.2 * demandes.sum() / capacites.sum()
+    couts = rng.integers(1, 20, (k, l)).astype(float)
+
+    probleme = ProblemePL(f"Transport {k}x{l}")
+    probleme.definir_noms_variables([f"U{i+1}→E{j+1}" for i in range(k) for j in range(l)])
+    probleme.definir_fonction_objectif(couts.ravel(), maximiser=False)
+
+    for i in range(k):
+        ligne = np.zeros((k, l))
+        ligne[i, :] = 1
+        probleme.ajouter_contrainte_inegalite(ligne.ravel(), capacites[i])
+    for j in range(l):
+        ligne = np.zeros((k, l))
+        ligne[:, j] = 1
+        probleme.ajouter_contrainte_equalite(ligne.ravel(), demandes[j])
+
+    probleme.definir_bornes([(0, None)] * (k * l))
+    return probleme
+
+
+def klee_minty(d: int) -> ProblemePL:
+    """
+    Cube de Klee-Minty en dimension d.
+
+    Maximiser  somme_j 2^(d-j) x_j
+    sous       2 * somme_{j<i} 2^(i-j) x_j + x_i <= 5^i   (i = 1..d)
+
+    Avec la règle du plus grand Δ (celle du cours), le simplexe visite
+    les 2^d sommets du cube : 2^d - 1 pivots.
+
+    Args:
+        d: Dimension
+    """
+    probleme = ProblemePL(f"Klee-Minty d={d}")
+    probleme.definir_fonction_objectif([2.0 ** (d - j) for j in range(1, d + 1)], maximiser=True)
+    for i in range(1, d + 1):
+        ligne = np.zeros(d)
+        for j in range(1, i):
+            ligne[j - 1] = 2.0 ** (i - j + 1)
+        ligne[i - 1] = 1.0
+        probleme.ajouter_contrainte_inegalite(ligne, 5.0 ** i)
+    probleme.definir_bornes([(0, None)] * d)
+    return probleme
+
+
+def affectation_degeneree(n: int, graine: int = 0) -> ProblemePL:
+    """
+    Problème d'affectation n x n (très dégénéré).
+
+    Maximiser le gain total sous : chaque agent a au plus une tâche,
+    chaque tâche a au plus un agent. Tous les seconds membres valent 1,
+    d'où de nombreux pivots dégénérés.
+
+    Args:
+        n: Nombre d'agents (et de tâches)
+        graine: Graine du générateur aléatoire
+    """
+    rng = np.random.default_rng(graine)
+    gains = rng.integers(1, 10, (n, n)).astype(float)
+
+    probleme = ProblemePL(f"Affectation {n}x{n}")
+    probleme.definir_noms_variables([f"A{i+1}→T{j+1}" for i in range(n) for j in range(n)])
+    probleme.definir_fonction_objectif(gains.ravel(), maximiser=True)
+    for i in range(n):
+        ligne = np.zeros((n, n))
+        ligne[i, :] = 1
+        probleme.ajouter_contrainte_inegalite(ligne.ravel(), 1)
+    for j in range(n):
+        ligne = np.zeros((n, n))
+        ligne[:, j] = 1
+        probleme.ajouter_contrainte_inegalite(ligne.ravel(), 1)
+    probleme.definir_bornes([(0, None)] * (n * n))
+    return probleme
+
+
+def flot_cout_min(n_noeuds: int, n_arcs: int, graine: int = 0) -> ProblemePL:
+    """
+    Flot à coût minimum écrit avec des égalités denses (matrice d'incidence).
+
+    Un circuit passant par tous les nœuds (sans limite de capacité) garantit
+    que le problème est réalisable ; les autres arcs sont aléatoires, avec
+    une capacité. Un quart des nœuds sont des sources, un quart des puits.
+
+    Args:
+        n_noeuds: Nombre de nœuds
+        n_arcs: Nombre d'arcs (au moins n_noeuds)
+        graine: Graine du générateur aléatoire
+    """
+    rng = np.random.default_rng(graine)
+
+    origines = np.concatenate([np.arange(n_noeuds), rng.integers(0, n_noeuds, n_arcs - n_noeuds)])
+    decalages = rng.integers(1, n_noeuds, n_arcs - n_noeuds) if n_noeuds > 1 else np.zeros(0, int)
+    destinations = np.concatenate([(np.arange(n_noeuds) + 1) % n_noeuds,
+                                   (origines[n_noeuds:] + decalages) % n_noeuds])
+    capacites = [None] * n_noeuds + rng.integers(5, 50, n_arcs - n_noeuds).tolist()
+
+    offres = np.zeros(n_noeuds)
+    noeuds = rng.permutation(n_noeuds)
+    quart = max(1, n_noeuds // 4)
+    offres[noeuds[:quart]] = rng.integers(1, 20, quart)
+    demandes = rng.random(quart)
+    offres[noeuds[quart:2 * quart]] = -np.round(offres.sum() * demandes / demandes.sum())
+    offres[noeuds[quart]] -= offres.sum()
+
+    probleme = ProblemePL(f"Flot {n_noeuds} nœuds, {n_arcs} arcs")
+    probleme.definir_noms_variables([f"{u+1}→{v+1}" for u, v in zip(origines, destinations)])
+    probleme.definir_fonction_objectif(rng.integers(1, 100, n_arcs).astype(float), maximiser=False)
+    incidence = np.zeros((n_noeuds, n_arcs))
+    incidence[origines, np.arange(n_arcs)] = 1
+    incidence[destinations, np.arange(n_arcs)] -= 1
+    for ligne, b in zip(incidence, offres):
+        probleme.ajouter_contrainte_equalite(ligne, b)
+    probleme.definir_bornes([(0, u) for u in capacites])
+    return probleme
+
+
+# Générateurs et tailles utilisés par bench.py
+# nom -> (fonction, {taille: paramètres})
+GENERATEURS = {
+    'dense': (lp_aleatoire_dense, {
+        'petite': (10, 10), 'moyenne': (50, 50), 'grande': (200, 200)
+    }),
+    'creux': (lp_aleatoire_creux, {
+        'petite': (10, 20), 'moyenne': (50, 100), 'grande': (200, 400)
+    }),
+    'transport': (transport, {
+        'petite': (3, 4), 'moyenne': (10, 20), 'grande': (30, 60)
+    }),
+    'klee_minty': (klee_minty, {
+        'petite': (4,), 'moyenne': (8,), 'grande': (12,)
+    }),
+    'affectation': (affectation_degeneree, {
+        'petite': (4,), 'moyenne': (10,), 'grande': (25,)
+    }),
+    'flot': (flot_cout_min, {
+        'petite': (20, 60), 'moyenne': (200, 1000), 'grande': (1000, 5000)
+    }),
+}
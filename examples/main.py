@@ -3,14 +3,26 @@ main.py
 -------
 Point d'entrée principal du programme de programmation linéaire.
 Ce fichier fournit un menu interactif pour utiliser le solveur.
+
+Sans argument : menu interactif. Avec une sous-commande : mode non
+interactif, par exemple
+
+    python examples/main.py lot modeles/ --moteur scipy-highs --processus 4
+    python examples/main.py lot "modeles/*.npz" --sortie resultats.jsonl
+
+écrit une ligne JSON par modèle dès qu'il est résolu.
 """
 
+import argparse
+import json
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from src.models import ProblemePL
 from src.simplexe import resoudre_rapide
+from src.lot import MOTEURS, lister_fichiers, resoudre_lot
+from src.metriques import EcouteurMetriques
 from examples import (
     exemple_simple, 
     exemple_production, 
@@ -228,7 +240,55 @@ def main():
             input("Appuyez sur Entrée pour continuer...")
 
 
+def ligne_de_commande(arguments=None) -> int:
+    """Mode non interactif (sous-commandes)."""
+    parser = argparse.ArgumentParser(description="Solveur de programmation linéaire")
+    sous_commandes = parser.add_subparsers(dest='commande', required=True)
+
+    p_lot = sous_commandes.add_parser(
+        'lot', help="Résoudre des fichiers de modèles (.json / .npz), une ligne JSON par résultat")
+    p_lot.add_argument('chemins', nargs='+', help="Fichiers, répertoires ou motifs glob")
+    p_lot.add_argument('--moteur', default='scipy-highs', choices=MOTEURS)
+    p_lot.add_argument('--processus', type=int, default=os.cpu_count() or 1)
+    p_lot.add_argument('--sortie', default=None, help="Fichier JSON Lines (défaut : sortie standard)")
+    p_lot.add_argument('--metriques', default=None,
+                       help="Fichier de métriques Prometheus, mis à jour après chaque modèle")
+
+    args = parser.parse_args(arguments)
+
+    fichiers = lister_fichiers(args.chemins)
+    if not fichiers:
+        print("❌ Aucun fichier de modèle trouvé", file=sys.stderr)
+        return 1
+
+    # Les modèles sont résolus dans d'autres processus : les métriques sont
+    # alimentées par les résultats
+    metriques = EcouteurMetriques() if args.metriques else None
+
+    sortie = open(args.sortie, 'w', encoding='utf-8') if args.sortie else sys.stdout
+    echecs = 0
+    try:
+        for resultat in resoudre_lot(fichiers, args.moteur, args.processus):
+            # Une ligne par résultat, écrite tout de suite (pas de tampon jusqu'à la fin)
+            sortie.write(json.dumps(resultat, ensure_ascii=False) + "\n")
+            sortie.flush()
+            echecs += resultat['statut'] == 'erreur'
+            if metriques is not None:
+                metriques.observer(resultat['moteur'], resultat['statut'],
+                                   resultat['temps_resolution'], resultat['iterations'])
+                metriques.registre.ecrire(args.metriques)
+    finally:
+        if sortie is not sys.stdout:
+            sortie.close()
+
+    print(f"{len(fichiers)} modèles résolus ({echecs} erreurs)", file=sys.stderr)
+    return 1 if echecs else 0
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(ligne_de_commande())
+
     print("\n" + "#"*60)
     print("#" + " "*58 + "#")
     print("#" + " "*15 + "BIENVENUE DANS LE SOLVEUR PL" + " "*15 + "#")
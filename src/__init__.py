@@ -1,16 +1,62 @@
 """
 Package src - Solveur de Programmation Linéaire
+
+Les sous-modules sont importés à la demande (au premier accès à un nom) :
+`from src import SimplexeSolveur` ne charge pas SciPy, qui n'est importé
+que par SolveurPL au moment de résoudre.
 """
 
-from .models import ProblemePL, Solution
-from .solver import SolveurPL, resoudre_rapide
-from .simplexe import SimplexeSolveur, TableauSimplexe
-
-__all__ = [
-    'ProblemePL',
-    'Solution',
-    'SolveurPL',
-    'resoudre_rapide',
-    'SimplexeSolveur',
-    'TableauSimplexe'
-]
+import importlib
+
+# Nom exporté -> sous-module qui le définit
+_EXPORTS = {
+    'ProblemePL': '.models',
+    'Solution': '.models',
+    'SolveurPL': '.solver',
+    'resoudre_rapide': '.solver',
+    'SimplexeSolveur': '.simplexe',
+    'ResultatSimplexe': '.simplexe',
+    'PointReprise': '.simplexe',
+    'PoolSolveurs': '.pool_solveurs',
+    'TableauSimplexe': '.simplexe',
+    'SolveurTransport': '.transport',
+    'ProblemeTransport': '.transport',
+    'SolveurFlot': '.flot',
+    'ReseauFlot': '.flot',
+    'SimplexeStandard': '.simplexe_standard',
+    'BranchAndBound': '.branch_bound',
+    'GenerateurGomory': '.gomory',
+    'GenerationColonnes': '.generation_colonnes',
+    'Colonne': '.generation_colonnes',
+    'DecompositionDW': '.decomposition',
+    'ServeurSolveur': '.serveur',
+    'resoudre_distant': '.serveur',
+    'FileTravaux': '.file_travaux',
+    'Travailleur': '.file_travaux',
+    'resoudre_lot': '.lot',
+    'SolveurFormulation': '.dualite',
+    'probleme_dual': '.dualite',
+    'CacheSolutions': '.cache',
+    'Budget': '.budget',
+    'EcouteurSolveur': '.instrumentation',
+    'CollecteurProfil': '.instrumentation',
+    'RegistreMetriques': '.metriques',
+    'EcouteurMetriques': '.metriques',
+    'ProfilResolution': '.instrumentation',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(nom: str):
+    """Importe le sous-module d'un nom exporté au premier accès."""
+    module = _EXPORTS.get(nom)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+    valeur = getattr(importlib.import_module(module, __name__), nom)
+    globals()[nom] = valeur  # Les accès suivants ne passent plus par ici
+    return valeur
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
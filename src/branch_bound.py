@@ -0,0 +1,401 @@
+"""
+branch_bound.py
+---------------
+Ce fichier contient la résolution des problèmes en nombres entiers par
+séparation et évaluation (branch-and-bound).
+
+Principe :
+    1. Résoudre la relaxation continue (SimplexeStandard)
+    2. Si une variable entière x_j a une valeur fractionnaire v, séparer en
+       deux nœuds : x_j <= floor(v) et x_j >= ceil(v)
+    3. Un nœud dont la borne (valeur de sa relaxation) ne peut pas battre la
+       meilleure solution entière connue est abandonné
+
+Chaque nœud repart de la base de son parent : seules les bornes changent, la
+base reste dual-réalisable et quelques pivots du simplexe dual suffisent.
+
+Plusieurs nœuds peuvent être évalués en parallèle (n_processus > 1) : chaque
+processus garde sa propre copie du problème, on ne lui envoie que les bornes
+du nœud et la base du parent.
+
+Avec un GenerateurGomory, la relaxation de la racine est d'abord renforcée
+par des coupes (« cut-and-branch ») : moins de nœuds à explorer.
+"""
+
+import heapq
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from .models import ProblemePL, Solution
+from .budget import Budget
+from .simplexe_standard import SimplexeStandard, EtatBase
+from .gomory import GenerateurGomory
+from .instrumentation import EcouteurSolveur, CollecteurProfil, Chronometre, notifier
+
+# Méthodes de sélection du prochain nœud
+SELECTIONS = ('meilleure_borne', 'profondeur')
+
+
+@dataclass(order=True)
+class Noeud:
+    """Nœud de l'arbre : bornes des variables et base du parent."""
+    cle: tuple
+    bornes_min: np.ndarray = field(compare=False)
+    bornes_max: np.ndarray = field(compare=False)
+    borne: float = field(compare=False)              # Valeur de la relaxation du parent (min)
+    profondeur: int = field(compare=False)
+    base: Optional[EtatBase] = field(compare=False, default=None)
+
+
+@dataclass
+class RapportBB:
+    """Avancement de la recherche (envoyé après chaque lot de nœuds)."""
+    noeuds: int                    # Nœuds évalués
+    ouverts: int                   # Nœuds en attente
+    meilleure_valeur: Optional[float]  # Meilleure solution entière (sens du problème)
+    borne: Optional[float]         # Borne sur l'optimum (sens du problème)
+    ecart: Optional[float]         # Écart relatif |valeur - borne| / max(1, |valeur|)
+    temps: float                   # Secondes depuis le début
+
+
+# ============================================================
+# ÉVALUATION D'UN NŒUD (dans le processus courant ou un autre)
+# ============================================================
+
+def evaluer_noeud(lp: SimplexeStandard, bornes_min: np.ndarray, bornes_max: np.ndarray,
+                  base: Optional[EtatBase]) -> dict:
+    """
+    Résout la relaxation d'un nœud en repartant de la base du parent.
+
+    Args:
+        lp: Simplexe du problème (modifié : prend les bornes du nœud)
+        bornes_min, bornes_max: Bornes des variables au nœud
+        base: Base du parent (None = base courante du simplexe)
+
+    Returns:
+        Dictionnaire {'statut', 'valeur' (forme min), 'x', 'base', 'iterations'}
+    """
+    if np.any(bornes_min > bornes_max):
+        return {'statut': 'infaisable', 'iterations': 0}
+    if base is not None and not (np.array_equal(base.base, lp.base)
+                                 and np.array_equal(base.position, lp.position)):
+        lp.charger_base(base)
+    lp.fixer_bornes(bornes_min, bornes_max)
+    statut = lp.resoudre()
+    resultat = {'statut': statut, 'iterations': lp.iterations}
+    if statut == 'optimal':
+        valeur = lp.valeur_objectif
+        resultat.update(valeur=-valeur if lp.maximiser else valeur,
+                        x=lp.valeurs(), base=lp.etat_base())
+    return resultat
+
+
+# Simplexe propre à chaque processus de calcul (reçu par _initialiser_processus)
+_LP_PROCESSUS: Optional[SimplexeStandard] = None
+
+
+def _initialiser_processus(lp: SimplexeStandard):
+    """Garde la copie du simplexe de la racine dans un processus de calcul."""
+    global _LP_PROCESSUS
+    _LP_PROCESSUS = lp
+
+
+def _evaluer_dans_processus(arguments) -> dict:
+    """Évalue un nœud avec le simplexe du processus."""
+    return evaluer_noeud(_LP_PROCESSUS, *arguments)
+
+
+# ============================================================
+# BRANCH-AND-BOUND
+# ============================================================
+
+class BranchAndBound:
+    """
+    Résolution des problèmes en nombres entiers (branch-and-bound).
+
+    Exemple :
+        probleme.definir_variables_entieres([0, 1])
+        solveur = BranchAndBound(n_processus=4)
+        solution = solveur.resoudre(probleme, verbose=True)
+    """
+
+    def __init__(self, selection: str = 'meilleure_borne', n_processus: int = 1,
+                 tolerance_ecart: float = 1e-6, tolerance_entier: float = 1e-6,
+                 rapport: Optional[Callable[[RapportBB], None]] = None,
+                 coupes: Optional[GenerateurGomory] = None,
+                 ecouteurs: Optional[List[EcouteurSolveur]] = None):
+        """
+        Initialise le solveur.
+
+        Args:
+            selection: 'meilleure_borne' (nœud de plus petite borne d'abord :
+                       moins de nœuds) ou 'profondeur' (dernier nœud créé
+                       d'abord : trouve vite des solutions entières)
+            n_processus: Nombre de processus qui évaluent des nœuds en parallèle
+            tolerance_ecart: Écart relatif en dessous duquel on s'arrête
+            tolerance_entier: Une valeur à moins de cette distance d'un entier
+                              est considérée comme entière
+            rapport: Fonction appelée avec un RapportBB après chaque lot de nœuds
+            coupes: Générateur de coupes de Gomory appliqué à la racine (None = aucune)
+            ecouteurs: Écouteurs avertis pendant la résolution (profilage)
+        """
+        if selection not in SELECTIONS:
+            raise ValueError(f"Sélection inconnue : {selection} (choix : {', '.join(SELECTIONS)})")
+        if n_processus < 1:
+            raise ValueError("n_processus doit être au moins 1!")
+
+        self.selection = selection
+        self.n_processus = n_processus
+        self.tolerance_ecart = tolerance_ecart
+        self.tolerance_entier = tolerance_entier
+        self.rapport = rapport
+        self.coupes = coupes
+        self.ecouteurs: List[EcouteurSolveur] = list(ecouteurs) if ecouteurs else []
+
+        # Statistiques de la dernière résolution
+        self.noeuds = 0
+        self.iterations = 0
+        self.rapports: List[RapportBB] = []
+
+    def resoudre(self, probleme: ProblemePL, verbose: bool = False,
+                 budget: Optional[Budget] = None) -> Solution:
+        """
+        Résout un problème dont certaines variables sont entières.
+
+        Args:
+            probleme: Problème (variables marquées par definir_variables_entieres)
+            verbose: Si True, affiche l'avancement après chaque lot de nœuds
+            budget: Limite de temps / de nœuds évalués (optionnel). Si elle est
+                    atteinte, la solution a le statut 'budget_epuise' et
+                    ecart_optimalite borne l'écart à l'optimum
+
+        Returns:
+            Une instance de Solution
+        """
+        entieres = probleme.indices_entiers()
+        lp = SimplexeStandard.depuis_probleme(probleme)
+        signe = -1.0 if lp.maximiser else 1.0
+
+        if verbose:
+            print("🔍 Résolution en cours (branch-and-bound)...")
+            print(f"   Variables entières : {len(entieres)} / {len(probleme.c)}")
+            print(f"   Sélection : {self.selection}, processus : {self.n_processus}")
+
+        chrono = Chronometre()
+        debut = Budget.maintenant()
+        notifier(self.ecouteurs, 'debut_resolution', 'branch-and-bound',
+                 len(probleme.c), lp.m)
+        self.noeuds, self.iterations, self.rapports = 0, 0, []
+
+        bornes_min = np.array([lp.inf[j] for j in lp.structurelles])
+        bornes_max = np.array([lp.sup[j] for j in lp.structurelles])
+        base_racine = None
+        if self.coupes is not None and entieres:
+            # Les coupes deviennent des lignes du simplexe, copié dans chaque processus
+            self.coupes.renforcer(lp, entieres, budget)
+            base_racine = lp.etat_base() if lp.statut == 'optimal' else None
+            if verbose:
+                print(f"   Coupes de Gomory : {self.coupes.coupes_ajoutees} ajoutées, "
+                      f"{len(self.coupes.coupes)} gardées ({self.coupes.tours} tours)")
+        ouverts: List[Noeud] = [Noeud(self._cle(-np.inf, 0, 0), bornes_min, bornes_max, -np.inf, 0,
+                                      base_racine)]
+        compteur = 1
+
+        meilleure_valeur, meilleur_x = np.inf, None  # Forme min
+        statut = None
+        executeur = None
+        if self.n_processus > 1:
+            executeur = ProcessPoolExecutor(self.n_processus, initializer=_initialiser_processus,
+                                            initargs=(lp,))
+        try:
+            while ouverts:
+                if budget is not None and budget.epuise(self.noeuds, debut):
+                    statut = 'budget_epuise'
+                    break
+
+                # Lot de nœuds à évaluer (ceux qui ne peuvent plus gagner sont abandonnés)
+                lot = []
+                while ouverts and len(lot) < self.n_processus:
+                    noeud = self._extraire(ouverts)
+                    if noeud.borne < meilleure_valeur - self._marge(meilleure_valeur):
+                        lot.append(noeud)
+                if not lot:
+                    break
+
+                arguments = [(noeud.bornes_min, noeud.bornes_max, noeud.base) for noeud in lot]
+                if executeur is None:
+                    resultats = [evaluer_noeud(lp, *args) for args in arguments]
+                else:
+                    resultats = list(executeur.map(_evaluer_dans_processus, arguments))
+
+                for noeud, resultat in zip(lot, resultats):
+                    self.noeuds += 1
+                    self.iterations += resultat['iterations']
+                    if resultat['statut'] == 'non_borne':
+                        statut = 'non_borne'
+                        break
+                    if resultat['statut'] != 'optimal':
+                        continue  # Nœud infaisable
+                    valeur, x = resultat['valeur'], resultat['x']
+                    if valeur >= meilleure_valeur - self._marge(meilleure_valeur):
+                        continue
+
+                    j = self._variable_de_branchement(x, entieres)
+                    if j is None:
+                        meilleure_valeur, meilleur_x = valeur, x.copy()
+                        meilleur_x[entieres] = np.round(meilleur_x[entieres])
+                        continue
+
+                    # Séparation : x_j <= floor(v) et x_j >= ceil(v) (le plus proche d'abord)
+                    enfants = []
+                    max_bas = noeud.bornes_max.copy()
+                    max_bas[j] = math.floor(x[j])
+                    enfants.append((noeud.bornes_min, max_bas))
+                    min_haut = noeud.bornes_min.copy()
+                    min_haut[j] = math.ceil(x[j])
+                    enfants.append((min_haut, noeud.bornes_max))
+                    if x[j] - math.floor(x[j]) < 0.5:
+                        enfants.reverse()  # Pile : le dernier empilé sort en premier
+                    for bmin, bmax in enfants:
+                        cle = self._cle(valeur, noeud.profondeur + 1, compteur)
+                        self._ajouter(ouverts, Noeud(cle, bmin, bmax, valeur,
+                                                     noeud.profondeur + 1, resultat['base']))
+                        compteur += 1
+                if statut == 'non_borne':
+                    break
+
+                rapport = self._rapport(ouverts, meilleure_valeur, signe, debut)
+                if verbose:
+                    self._afficher(rapport)
+                if rapport.ecart is not None and rapport.ecart <= self.tolerance_ecart:
+                    break
+        finally:
+            if executeur is not None:
+                executeur.shutdown(cancel_futures=True)
+
+        solution = self._solution(probleme, statut, ouverts, meilleure_valeur, meilleur_x, signe)
+        notifier(self.ecouteurs, 'fin_resolution', solution.statut, self.noeuds, chrono.total())
+        for ecouteur in self.ecouteurs:
+            if isinstance(ecouteur, CollecteurProfil):
+                ecouteur.attacher(solution)
+                break
+
+        if verbose:
+            print(f"{'✓' if solution.succes else '✗'} {solution.message} ({self.noeuds} nœuds)")
+        return solution
+
+    # ------------------------------------------------------------
+    # Liste des nœuds ouverts
+    # ------------------------------------------------------------
+
+    def _cle(self, borne: float, profondeur: int, compteur: int) -> tuple:
+        """Clé de tri : plus petite borne (les plus profonds d'abord à égalité)."""
+        return (borne, -profondeur, compteur)
+
+    def _ajouter(self, ouverts: List[Noeud], noeud: Noeud):
+        if self.selection == 'meilleure_borne':
+            heapq.heappush(ouverts, noeud)
+        else:
+            ouverts.append(noeud)
+
+    def _extraire(self, ouverts: List[Noeud]) -> Noeud:
+        if self.selection == 'meilleure_borne':
+            return heapq.heappop(ouverts)
+        return ouverts.pop()
+
+    # ------------------------------------------------------------
+    # Outils
+    # ------------------------------------------------------------
+
+    def _marge(self, valeur: float) -> float:
+        """Amélioration minimale pour qu'un nœud vaille la peine d'être exploré."""
+        if not np.isfinite(valeur):
+            return 0.0
+        return self.tolerance_ecart * max(1.0, abs(valeur))
+
+    def _variable_de_branchement(self, x: np.ndarray, entieres: List[int]) -> Optional[int]:
+        """Variable entière la plus fractionnaire (None si toutes sont entières)."""
+        if not entieres:
+            return None
+        fractions = np.abs(x[entieres] - np.round(x[entieres]))
+        k = int(np.argmax(fractions))
+        return entieres[k] if fractions[k] > self.tolerance_entier else None
+
+    def _rapport(self, ouverts: List[Noeud], meilleure_valeur: float, signe: float,
+                 debut: float) -> RapportBB:
+        """Crée le rapport d'avancement et le transmet à la fonction `rapport`."""
+        borne = min([noeud.borne for noeud in ouverts] + [meilleure_valeur])
+        connue = np.isfinite(meilleure_valeur)
+        ecart = None
+        if connue and np.isfinite(borne):
+            ecart = max(0.0, meilleure_valeur - borne) / max(1.0, abs(meilleure_valeur))
+        rapport = RapportBB(
+            noeuds=self.noeuds, ouverts=len(ouverts),
+            meilleure_valeur=signe * meilleure_valeur if connue else None,
+            borne=signe * borne if np.isfinite(borne) else None,
+            ecart=ecart, temps=Budget.maintenant() - debut
+        )
+        self.rapports.append(rapport)
+        if self.rapport is not None:
+            self.rapport(rapport)
+        return rapport
+
+    @staticmethod
+    def _afficher(rapport: RapportBB):
+        valeur = '-' if rapport.meilleure_valeur is None else f"{rapport.meilleure_valeur:.4f}"
+        borne = '-' if rapport.borne is None else f"{rapport.borne:.4f}"
+        ecart = '-' if rapport.ecart is None else f"{100 * rapport.ecart:.2f}%"
+        print(f"   nœuds {rapport.noeuds:>6} | ouverts {rapport.ouverts:>6} | "
+              f"meilleure {valeur:>12} | borne {borne:>12} | écart {ecart}")
+
+    def _solution(self, probleme: ProblemePL, statut: Optional[str], ouverts: List[Noeud],
+                  meilleure_valeur: float, meilleur_x: Optional[np.ndarray], signe: float) -> Solution:
+        """Construit la Solution à partir de la meilleure solution entière."""
+        solution = Solution()
+        solution.noms_variables = probleme.noms_variables
+        if statut == 'non_borne':
+            solution.statut = 'non_borne'
+            solution.message = "La relaxation continue n'est pas bornée : solution infinie"
+            return solution
+
+        if statut == 'budget_epuise':
+            solution.statut = 'budget_epuise'
+            if meilleur_x is None:
+                solution.message = "Budget épuisé (aucune solution entière connue)"
+                return solution
+            borne = min([noeud.borne for noeud in ouverts] + [meilleure_valeur])
+            solution.ecart_optimalite = float(max(0.0, meilleure_valeur - borne))
+            solution.message = "Budget épuisé : meilleure solution entière connue"
+        elif meilleur_x is None:
+            solution.statut = 'infaisable'
+            solution.message = "Aucune solution entière ne respecte les contraintes"
+            return solution
+        else:
+            solution.statut = 'optimal'
+            solution.succes = True
+            solution.message = "Solution entière optimale trouvée"
+
+        solution.valeurs_variables = meilleur_x
+        solution.valeur_objectif = float(signe * meilleure_valeur)
+        return solution
+
+
+def resoudre_entier(probleme: ProblemePL, n_processus: int = 1, verbose: bool = False,
+                    budget: Optional[Budget] = None) -> Solution:
+    """
+    Fonction utilitaire : résout un problème en nombres entiers.
+
+    Args:
+        probleme: Problème (variables marquées par definir_variables_entieres)
+        n_processus: Nombre de processus qui évaluent des nœuds en parallèle
+        verbose: Si True, affiche l'avancement
+        budget: Limite de temps / de nœuds évalués (optionnel)
+
+    Returns:
+        Une instance de Solution
+    """
+    return BranchAndBound(n_processus=n_processus).resoudre(probleme, verbose=verbose, budget=budget)
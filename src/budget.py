@@ -0,0 +1,157 @@
+"""
+budget.py
+---------
+Ce fichier contient les budgets de résolution (temps et itérations).
+
+Quand le budget est épuisé, les solveurs s'arrêtent et renvoient la meilleure
+solution réalisable connue (si elle existe), avec une borne sur l'écart
+d'optimalité. Cette borne vient de la relaxation lagrangienne :
+
+    Pour  Min c^T x  s.c.  A_ub x <= b_ub,  A_eq x == b_eq,  l <= x <= u
+    et des multiplicateurs y_ub >= 0, y_eq quelconques :
+
+    L(y) = - y_ub^T b_ub - y_eq^T b_eq + somme_j min_{l_j <= x_j <= u_j} r_j x_j
+    avec r = c + A_ub^T y_ub + A_eq^T y_eq
+
+    L(y) est toujours <= à la valeur optimale.
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class Budget:
+    """
+    Budget de résolution : temps maximum et/ou nombre maximum d'itérations.
+
+    Un budget ne garde aucun état : on peut réutiliser le même objet pour
+    plusieurs résolutions (et dans plusieurs threads).
+    """
+
+    def __init__(self, temps_max: Optional[float] = None,
+                 max_iterations: Optional[int] = None):
+        """
+        Initialise le budget.
+
+        Args:
+            temps_max: Temps maximum en secondes (None = pas de limite)
+            max_iterations: Nombre maximum d'itérations (None = pas de limite)
+        """
+        if temps_max is not None and temps_max < 0:
+            raise ValueError("temps_max doit être positif!")
+        if max_iterations is not None and max_iterations < 0:
+            raise ValueError("max_iterations doit être positif!")
+
+        self.temps_max = temps_max
+        self.max_iterations = max_iterations
+
+    @staticmethod
+    def maintenant() -> float:
+        """Instant courant (à passer comme `debut` à epuise())."""
+        return time.perf_counter()
+
+    def epuise(self, iterations: int, debut: float) -> bool:
+        """
+        Indique si le budget est épuisé.
+
+        Args:
+            iterations: Nombre d'itérations déjà effectuées
+            debut: Instant de début de la résolution (Budget.maintenant())
+
+        Returns:
+            True si on doit s'arrêter
+        """
+        if self.max_iterations is not None and iterations >= self.max_iterations:
+            return True
+        if self.temps_max is not None and time.perf_counter() - debut >= self.temps_max:
+            return True
+        return False
+
+    def options_linprog(self, methode: str) -> dict:
+        """
+        Traduit le budget en options pour scipy.optimize.linprog.
+
+        Args:
+            methode: Méthode de linprog utilisée
+
+        Returns:
+            Dictionnaire d'options (éventuellement vide)
+        """
+        options = {}
+        if self.max_iterations is not None:
+            options['maxiter'] = self.max_iterations
+        # Seules les méthodes HiGHS acceptent une limite de temps
+        if self.temps_max is not None and methode.startswith('highs'):
+            options['time_limit'] = self.temps_max
+        return options
+
+    def __repr__(self) -> str:
+        return f"Budget(temps_max={self.temps_max}, max_iterations={self.max_iterations})"
+
+
+def borne_lagrangienne(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
+                       bounds: Optional[List[Tuple[Optional[float], Optional[float]]]] = None,
+                       y_ub=None, y_eq=None) -> float:
+    """
+    Calcule une borne inférieure de la valeur optimale d'un problème de minimisation.
+
+    Les bornes supérieures manquantes sont déduites, quand c'est possible, des
+    contraintes d'inégalité à coefficients positifs (ex: 3x1 + 4x2 <= 160
+    donne x1 <= 160/3 si x1, x2 >= 0).
+
+    Args:
+        c, A_ub, b_ub, A_eq, b_eq: Données du problème (forme minimisation)
+        bounds: Bornes sur les variables (None = toutes >= 0)
+        y_ub: Multiplicateurs des inégalités (>= 0, None = 0)
+        y_eq: Multiplicateurs des égalités (None = 0)
+
+    Returns:
+        La borne (peut valoir -inf si on ne peut rien garantir)
+    """
+    c = np.asarray(c, dtype=float)
+    n = len(c)
+
+    if bounds is None:
+        bounds = [(0, None)] * n
+    bornes_inf = np.array([-np.inf if l is None else l for l, _ in bounds], dtype=float)
+    bornes_sup = np.array([np.inf if u is None else u for _, u in bounds], dtype=float)
+
+    r = c.copy()
+    borne = 0.0
+
+    if A_ub is not None and len(A_ub) > 0:
+        A_ub = np.asarray(A_ub, dtype=float)
+        b_ub = np.asarray(b_ub, dtype=float)
+        if y_ub is not None:
+            y_ub = np.maximum(np.nan_to_num(np.asarray(y_ub, dtype=float)), 0.0)
+            r += A_ub.T @ y_ub
+            borne -= y_ub @ b_ub
+
+        # Bornes supérieures implicites (lignes à coefficients positifs, x >= 0)
+        if np.all(bornes_inf >= 0):
+            for ligne, b in zip(A_ub, b_ub):
+                if np.all(ligne >= 0):
+                    reste = b - ligne @ bornes_inf
+                    positifs = ligne > 0
+                    bornes_sup[positifs] = np.minimum(
+                        bornes_sup[positifs], bornes_inf[positifs] + reste / ligne[positifs]
+                    )
+
+    if A_eq is not None and len(A_eq) > 0 and y_eq is not None:
+        y_eq = np.nan_to_num(np.asarray(y_eq, dtype=float))
+        r += np.asarray(A_eq, dtype=float).T @ y_eq
+        borne -= y_eq @ np.asarray(b_eq, dtype=float)
+
+    # Ignorer le bruit numérique sur les coûts réduits
+    r[np.abs(r) < 1e-9] = 0.0
+
+    # Minimum de r_j * x_j sur [l_j, u_j]
+    for j in range(n):
+        if r[j] > 0:
+            borne += r[j] * bornes_inf[j]
+        elif r[j] < 0:
+            borne += r[j] * bornes_sup[j]
+
+    return float(borne)
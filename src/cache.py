@@ -0,0 +1,261 @@
+"""
+cache.py
+--------
+Ce fichier contient le cache des solutions.
+
+Un même problème est souvent résolu plusieurs fois (rechargement de la page
+Streamlit, nouvelle tentative dans un traitement par lots...). Le cache évite
+de relancer le solveur : la clé est une empreinte (hash SHA-256) des données
+du problème (c, A_ub, b_ub, A_eq, b_eq, bounds, sens) et du moteur utilisé.
+
+Deux niveaux :
+    1. Mémoire : LRU (le moins récemment utilisé est évincé en premier),
+       limité en nombre d'entrées et en octets
+    2. Disque (optionnel) : un fichier par entrée dans un répertoire
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+class CacheSolutions:
+    """
+    Cache LRU des résultats de résolution, avec un niveau disque optionnel.
+
+    Les valeurs sont stockées sérialisées (pickle) : chaque lecture renvoie
+    donc une copie neuve, qu'on peut modifier sans abîmer le cache.
+
+    Le cache peut être partagé par des solveurs de plusieurs threads (voir
+    PoolSolveurs) : les lectures et écritures sont protégées par un verrou.
+    """
+
+    def __init__(self, max_entrees: int = 128, max_octets: int = 64 * 1024 * 1024,
+                 repertoire: Optional[str] = None):
+        """
+        Initialise le cache.
+
+        Args:
+            max_entrees: Nombre maximum d'entrées gardées en mémoire
+            max_octets: Taille maximum (en octets) des entrées en mémoire
+            repertoire: Répertoire du cache disque (None = pas de cache disque)
+        """
+        if max_entrees <= 0:
+            raise ValueError("max_entrees doit être strictement positif!")
+        if max_octets <= 0:
+            raise ValueError("max_octets doit être strictement positif!")
+
+        self.max_entrees = max_entrees
+        self.max_octets = max_octets
+        self.repertoire = repertoire
+
+        if self.repertoire is not None:
+            os.makedirs(self.repertoire, exist_ok=True)
+
+        # Entrées en mémoire : clé -> valeur sérialisée (ordre = ordre d'utilisation)
+        self._entrees: "OrderedDict[str, bytes]" = OrderedDict()
+        self.octets = 0
+        self._verrou = threading.Lock()
+
+        # Compteurs
+        self.nb_hits = 0
+        self.nb_misses = 0
+        self.nb_hits_disque = 0
+        self.nb_evictions = 0
+
+    # ------------------------------------------------------------
+    # CLÉ CANONIQUE
+    # ------------------------------------------------------------
+
+    @staticmethod
+    def cle(moteur: str, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
+            bounds=None, sens: str = 'max', extra=None) -> str:
+        """
+        Calcule la clé canonique d'un problème.
+
+        Deux problèmes avec les mêmes données numériques ont la même clé,
+        qu'ils soient donnés sous forme de listes ou de tableaux NumPy.
+
+        Args:
+            moteur: Nom du moteur de résolution (ex: 'simplexe', 'scipy-highs')
+            c, A_ub, b_ub, A_eq, b_eq: Données du problème
+            bounds: Bornes sur les variables
+            sens: 'max' ou 'min'
+            extra: Autres paramètres influençant le résultat (ex: noms des variables)
+
+        Returns:
+            Empreinte hexadécimale SHA-256
+        """
+        h = hashlib.sha256()
+
+        def ajouter(etiquette: str, valeur):
+            h.update(etiquette.encode())
+            if valeur is None:
+                h.update(b'N')
+                return
+            tableau = np.ascontiguousarray(np.asarray(valeur, dtype=float))
+            h.update(repr(tableau.shape).encode())
+            h.update(tableau.tobytes())
+
+        h.update(f"moteur={moteur};sens={sens};".encode())
+        ajouter('c', c)
+        # Une matrice vide équivaut à pas de contrainte
+        ajouter('A_ub', A_ub if A_ub is not None and len(A_ub) > 0 else None)
+        ajouter('b_ub', b_ub if b_ub is not None and len(b_ub) > 0 else None)
+        ajouter('A_eq', A_eq if A_eq is not None and len(A_eq) > 0 else None)
+        ajouter('b_eq', b_eq if b_eq is not None and len(b_eq) > 0 else None)
+
+        h.update(b'bounds')
+        if bounds is None:
+            h.update(b'N')
+        else:
+            for borne_min, borne_max in bounds:
+                h.update(repr((None if borne_min is None else float(borne_min),
+                               None if borne_max is None else float(borne_max))).encode())
+
+        h.update(b'extra')
+        h.update(repr(extra).encode())
+
+        return h.hexdigest()
+
+    # ------------------------------------------------------------
+    # LECTURE / ÉCRITURE
+    # ------------------------------------------------------------
+
+    def obtenir(self, cle: str) -> Optional[Any]:
+        """
+        Cherche une valeur dans le cache.
+
+        Args:
+            cle: Clé calculée avec cle()
+
+        Returns:
+            Une copie de la valeur, ou None si absente
+        """
+        with self._verrou:
+            donnees = self._entrees.get(cle)
+            if donnees is not None:
+                self._entrees.move_to_end(cle)
+                self.nb_hits += 1
+        if donnees is not None:
+            return pickle.loads(donnees)
+
+        donnees = self._lire_disque(cle)
+        with self._verrou:
+            if donnees is None:
+                self.nb_misses += 1
+                return None
+            self.nb_hits += 1
+            self.nb_hits_disque += 1
+            self._ajouter_memoire(cle, donnees)
+        return pickle.loads(donnees)
+
+    def stocker(self, cle: str, valeur: Any):
+        """
+        Ajoute (ou remplace) une valeur dans le cache.
+
+        Args:
+            cle: Clé calculée avec cle()
+            valeur: Valeur à mémoriser (doit être sérialisable avec pickle)
+        """
+        donnees = pickle.dumps(valeur, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._verrou:
+            self._ajouter_memoire(cle, donnees)
+        self._ecrire_disque(cle, donnees)
+
+    def vider(self, disque: bool = False):
+        """
+        Vide le cache mémoire (et le cache disque si demandé).
+
+        Args:
+            disque: True pour supprimer aussi les fichiers du cache disque
+        """
+        with self._verrou:
+            self._entrees.clear()
+            self.octets = 0
+
+        if disque and self.repertoire is not None:
+            for nom in os.listdir(self.repertoire):
+                if nom.endswith('.pkl'):
+                    os.remove(os.path.join(self.repertoire, nom))
+
+    def statistiques(self) -> Dict[str, float]:
+        """
+        Retourne les compteurs du cache.
+
+        Returns:
+            Dictionnaire avec hits, misses, taux de hits, entrées et octets
+        """
+        total = self.nb_hits + self.nb_misses
+        return {
+            'hits': self.nb_hits,
+            'misses': self.nb_misses,
+            'hits_disque': self.nb_hits_disque,
+            'taux_hits': self.nb_hits / total if total else 0.0,
+            'evictions': self.nb_evictions,
+            'entrees': len(self._entrees),
+            'octets': self.octets,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entrees)
+
+    def __contains__(self, cle: str) -> bool:
+        return cle in self._entrees
+
+    # ------------------------------------------------------------
+    # NIVEAU MÉMOIRE (LRU)
+    # ------------------------------------------------------------
+
+    def _ajouter_memoire(self, cle: str, donnees: bytes):
+        """Ajoute une entrée en mémoire puis évince les plus anciennes si besoin."""
+        # Une entrée plus grosse que tout le cache n'est pas gardée en mémoire
+        if len(donnees) > self.max_octets:
+            return
+
+        ancienne = self._entrees.pop(cle, None)
+        if ancienne is not None:
+            self.octets -= len(ancienne)
+
+        self._entrees[cle] = donnees
+        self.octets += len(donnees)
+
+        while len(self._entrees) > self.max_entrees or self.octets > self.max_octets:
+            _, evincee = self._entrees.popitem(last=False)
+            self.octets -= len(evincee)
+            self.nb_evictions += 1
+
+    # ------------------------------------------------------------
+    # NIVEAU DISQUE
+    # ------------------------------------------------------------
+
+    def _chemin(self, cle: str) -> str:
+        return os.path.join(self.repertoire, f"{cle}.pkl")
+
+    def _lire_disque(self, cle: str) -> Optional[bytes]:
+        if self.repertoire is None:
+            return None
+        try:
+            with open(self._chemin(cle), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _ecrire_disque(self, cle: str, donnees: bytes):
+        if self.repertoire is None:
+            return
+        # Écriture atomique : fichier temporaire puis renommage
+        fd, chemin_tmp = tempfile.mkstemp(dir=self.repertoire, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(donnees)
+            os.replace(chemin_tmp, self._chemin(cle))
+        except OSError:
+            if os.path.exists(chemin_tmp):
+                os.remove(chemin_tmp)
@@ -0,0 +1,388 @@
+"""
+decomposition.py
+----------------
+Ce fichier contient la décomposition de Dantzig-Wolfe des problèmes à blocs.
+
+Un problème « bloc-angulaire » (un bloc de variables et de contraintes par
+site, reliés par quelques contraintes communes) s'écrit :
+
+    Min  somme_k c_k x_k
+    s.c. somme_k A0_k x_k (<= ou =) b0     <- contraintes liantes
+         B_k x_k (<= ou =) b_k              <- contraintes du bloc k
+         l_k <= x_k <= u_k
+
+Chaque x_k est une combinaison convexe de points extrêmes de son bloc.
+Le maître ne garde que les contraintes liantes et une contrainte de
+convexité par bloc ; ses colonnes sont des points extrêmes proposés par les
+sous-problèmes (un par bloc, indépendants) :
+
+    Min (c_k - y^T A0_k) x_k  s.c. contraintes du bloc k
+
+C'est une génération de colonnes (GenerationColonnes) dont le pricing
+résout les blocs, en parallèle dans plusieurs processus si demandé. Chaque
+bloc repart de sa base précédente (seuls les coûts changent) et le maître
+repart de la sienne quand des colonnes arrivent. À chaque tour :
+
+    borne = b^T y + somme_k (coût réduit du meilleur point du bloc k)
+
+est une borne sur l'optimum (borne inférieure en minimisation).
+"""
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from .models import ProblemePL, Solution
+from .budget import Budget
+from .simplexe_standard import SimplexeStandard
+from .generation_colonnes import GenerationColonnes, Colonne, ResultatPricing
+from .instrumentation import EcouteurSolveur, CollecteurProfil, Chronometre, notifier
+
+# Coût des variables artificielles du maître (multiplié par l'échelle des coûts)
+PENALITE_ARTIFICIELLE = 1e6
+
+
+# ============================================================
+# SOUS-PROBLÈMES (dans le processus courant ou un autre)
+# ============================================================
+
+def resoudre_bloc(lp: SimplexeStandard, couts: np.ndarray) -> dict:
+    """
+    Résout un bloc pour de nouveaux coûts, en repartant de sa base.
+
+    Args:
+        lp: Simplexe du bloc (garde sa base d'un appel à l'autre)
+        couts: Coûts des variables du bloc (sens du problème)
+
+    Returns:
+        {'statut', 'x', 'valeur', 'base', 'iterations'}
+    """
+    lp.modifier_couts(couts)
+    statut = lp.resoudre()
+    resultat = {'statut': statut, 'iterations': lp.iterations}
+    if statut == 'optimal':
+        resultat.update(x=lp.valeurs(), valeur=lp.valeur_objectif, base=lp.etat_base())
+    return resultat
+
+
+# Simplexes des blocs dans un processus de calcul (reçus par _initialiser_processus)
+_BLOCS_PROCESSUS: List[SimplexeStandard] = []
+
+
+def _initialiser_processus(blocs: List[SimplexeStandard]):
+    """Garde une copie des simplexes des blocs dans un processus de calcul."""
+    global _BLOCS_PROCESSUS
+    _BLOCS_PROCESSUS = blocs
+
+
+def _resoudre_bloc_dans_processus(arguments) -> dict:
+    """
+    Résout un bloc dans un processus de calcul.
+
+    Le bloc peut avoir été résolu la fois précédente par un autre processus :
+    on repart de la base envoyée par le processus principal.
+    """
+    k, couts, base = arguments
+    lp = _BLOCS_PROCESSUS[k]
+    if base is not None and not (np.array_equal(base.base, lp.base)
+                                 and np.array_equal(base.position, lp.position)):
+        lp.charger_base(base)
+    return resoudre_bloc(lp, couts)
+
+
+# ============================================================
+# DÉCOMPOSITION
+# ============================================================
+
+class DecompositionDW:
+    """
+    Décomposition de Dantzig-Wolfe d'un problème à blocs.
+
+    Exemple :
+        # Variables 0-2 : site A, variables 3-5 : site B
+        decomposition = DecompositionDW([[0, 1, 2], [3, 4, 5]], n_processus=2)
+        solution = decomposition.resoudre(probleme, verbose=True)
+    """
+
+    def __init__(self, blocs: Sequence[Sequence[int]],
+                 lignes: Optional[Sequence[Sequence[int]]] = None,
+                 n_processus: int = 1, stabilisation: float = 0.0,
+                 rapport: Optional[Callable[[dict], None]] = None,
+                 ecouteurs: Optional[List[EcouteurSolveur]] = None):
+        """
+        Initialise la décomposition.
+
+        Args:
+            blocs: Variables de chaque bloc (chaque variable dans exactement un bloc)
+            lignes: Contraintes de chaque bloc, numérotées inégalités puis
+                    égalités. None = détection automatique : une contrainte
+                    dont toutes les variables sont dans un même bloc appartient
+                    à ce bloc, les autres sont liantes
+            n_processus: Nombre de processus qui résolvent les blocs en parallèle
+            stabilisation: alpha de Wentges du maître (voir GenerationColonnes)
+            rapport: Fonction appelée à chaque tour avec
+                     {'iteration', 'valeur', 'borne', 'colonnes'}
+            ecouteurs: Écouteurs avertis pendant la résolution (profilage)
+        """
+        if n_processus < 1:
+            raise ValueError("n_processus doit être au moins 1!")
+
+        self.blocs = [list(bloc) for bloc in blocs]
+        self.lignes = None if lignes is None else [list(l) for l in lignes]
+        self.n_processus = n_processus
+        self.stabilisation = stabilisation
+        self.rapport = rapport
+        self.ecouteurs: List[EcouteurSolveur] = list(ecouteurs) if ecouteurs else []
+
+        # État de la dernière résolution
+        self.generation: Optional[GenerationColonnes] = None
+        self.iterations_blocs = 0  # Pivots cumulés des sous-problèmes
+        self.historique: List[dict] = []
+
+    # ------------------------------------------------------------
+    # Préparation
+    # ------------------------------------------------------------
+
+    def _lignes_des_blocs(self, A: np.ndarray) -> List[List[int]]:
+        """Contraintes de chaque bloc (détectées si elles ne sont pas données)."""
+        n = A.shape[1]
+        bloc_de = np.full(n, -1)
+        for k, bloc in enumerate(self.blocs):
+            if np.any(bloc_de[bloc] >= 0):
+                raise ValueError("Une variable appartient à plusieurs blocs!")
+            bloc_de[bloc] = k
+        if np.any(bloc_de < 0):
+            raise ValueError("Chaque variable doit appartenir à un bloc!")
+
+        if self.lignes is not None:
+            for k, lignes in enumerate(self.lignes):
+                for i in lignes:
+                    if np.any(bloc_de[np.flatnonzero(A[i])] != k):
+                        raise ValueError(f"La contrainte {i + 1} utilise des variables hors du bloc {k + 1}!")
+            return self.lignes
+
+        lignes = [[] for _ in self.blocs]
+        for i in range(A.shape[0]):
+            blocs_ligne = np.unique(bloc_de[np.flatnonzero(A[i])])
+            if len(blocs_ligne) == 1:
+                lignes[blocs_ligne[0]].append(i)
+        return lignes
+
+    def _simplexes_blocs(self, probleme: ProblemePL, lignes: List[List[int]], n_ub: int):
+        """Un SimplexeStandard par bloc (ses variables et ses contraintes)."""
+        bornes = probleme.bounds if probleme.bounds is not None else [(0, None)] * len(probleme.c)
+        A = self._matrice(probleme)
+        b = self._second_membre(probleme)
+        simplexes = []
+        for bloc, lignes_bloc in zip(self.blocs, lignes):
+            inegalites = [i for i in lignes_bloc if i < n_ub]
+            egalites = [i for i in lignes_bloc if i >= n_ub]
+            simplexes.append(SimplexeStandard(
+                probleme.c[bloc],
+                A[np.ix_(inegalites, bloc)] if inegalites else None, b[inegalites],
+                A[np.ix_(egalites, bloc)] if egalites else None, b[egalites],
+                [bornes[j] for j in bloc], probleme.type_optimisation == 'max'
+            ))
+        return simplexes
+
+    @staticmethod
+    def _matrice(probleme: ProblemePL) -> np.ndarray:
+        """Contraintes inégalités puis égalités, dans une seule matrice."""
+        n = len(probleme.c)
+        blocs = [np.asarray(M, dtype=float).reshape(-1, n) for M in (probleme.A_ub, probleme.A_eq)
+                 if M is not None]
+        return np.vstack(blocs) if blocs else np.zeros((0, n))
+
+    @staticmethod
+    def _second_membre(probleme: ProblemePL) -> np.ndarray:
+        seconds = [np.asarray(b, dtype=float) for b in (probleme.b_ub, probleme.b_eq) if b is not None]
+        return np.concatenate(seconds) if seconds else np.zeros(0)
+
+    # ------------------------------------------------------------
+    # Résolution
+    # ------------------------------------------------------------
+
+    def resoudre(self, probleme: ProblemePL, verbose: bool = False,
+                 budget: Optional[Budget] = None) -> Solution:
+        """
+        Résout la relaxation continue d'un problème à blocs.
+
+        Args:
+            probleme: Problème complet (les variables entières sont ignorées)
+            verbose: Si True, affiche la valeur du maître et la borne à chaque tour
+            budget: Limite de temps / de tours (optionnel)
+
+        Returns:
+            Une instance de Solution (variables du problème d'origine)
+        """
+        A = self._matrice(probleme)
+        b = self._second_membre(probleme)
+        n_ub = len(probleme.b_ub) if probleme.b_ub is not None else 0
+        lignes = self._lignes_des_blocs(A)
+        dans_un_bloc = {i for lignes_bloc in lignes for i in lignes_bloc}
+        liantes = [i for i in range(A.shape[0]) if i not in dans_un_bloc]
+        liantes_ub = [i for i in liantes if i < n_ub]
+        liantes_eq = [i for i in liantes if i >= n_ub]
+        A0 = A[liantes_ub + liantes_eq]
+        n_blocs = len(self.blocs)
+        maximiser = probleme.type_optimisation == 'max'
+
+        if verbose:
+            print("🔍 Résolution en cours (décomposition de Dantzig-Wolfe)...")
+            print(f"   Blocs : {n_blocs}, contraintes liantes : {len(liantes)}, "
+                  f"processus : {self.n_processus}")
+
+        chrono = Chronometre()
+        notifier(self.ecouteurs, 'debut_resolution', 'dantzig-wolfe', len(probleme.c), len(liantes))
+        self.iterations_blocs = 0
+        simplexes = self._simplexes_blocs(probleme, lignes, n_ub)
+        bases = [None] * n_blocs
+
+        executeur = None
+        if self.n_processus > 1:
+            executeur = ProcessPoolExecutor(self.n_processus, initializer=_initialiser_processus,
+                                            initargs=(simplexes,))
+
+        def resoudre_blocs(couts_blocs):
+            """Résout tous les blocs (en parallèle si possible)."""
+            if executeur is None:
+                resultats = [resoudre_bloc(lp, couts) for lp, couts in zip(simplexes, couts_blocs)]
+            else:
+                resultats = list(executeur.map(
+                    _resoudre_bloc_dans_processus,
+                    [(k, couts, bases[k]) for k, couts in enumerate(couts_blocs)]))
+            for k, resultat in enumerate(resultats):
+                self.iterations_blocs += resultat['iterations']
+                if resultat['statut'] == 'optimal':
+                    bases[k] = resultat['base']
+            return resultats
+
+        def colonne(k, x):
+            """Colonne du maître pour le point x du bloc k."""
+            coefficients = np.concatenate([A0[:, self.blocs[k]] @ x, np.eye(n_blocs)[k]])
+            return Colonne(float(probleme.c[self.blocs[k]] @ x), coefficients,
+                           nom=f"bloc{k + 1}_{next(numeros)}", donnees=(k, x))
+
+        numeros = itertools.count(1)
+        try:
+            # Points de départ : chaque bloc avec ses coûts d'origine
+            initiaux = resoudre_blocs([probleme.c[bloc] for bloc in self.blocs])
+            echec = next((r['statut'] for r in initiaux if r['statut'] != 'optimal'), None)
+            if echec is not None:
+                return self._echec(probleme, echec, chrono)
+
+            maitre = ProblemePL("Maître de Dantzig-Wolfe")
+            colonnes = [colonne(k, r['x']) for k, r in enumerate(initiaux)]
+            points = [c.donnees for c in colonnes]
+            self._construire_maitre(maitre, colonnes, b, liantes_ub, liantes_eq, n_blocs, maximiser,
+                                    float(np.abs(probleme.c).max()) if len(probleme.c) else 1.0)
+            n_artificielles = len(maitre.c) - n_blocs
+
+            def pricing(duales):
+                """Résout les blocs pour les coûts c_k - y^T A0_k."""
+                y0, mu = duales[:len(liantes)], duales[len(liantes):]
+                resultats = resoudre_blocs([probleme.c[bloc] - y0 @ A0[:, bloc] for bloc in self.blocs])
+                if any(r['statut'] != 'optimal' for r in resultats):
+                    raise ValueError("Un sous-problème n'a pas de solution bornée : "
+                                     "borner les variables de chaque bloc!")
+                borne = float(duales @ np.concatenate([b[liantes_ub + liantes_eq], np.ones(n_blocs)]))
+                borne += sum(r['valeur'] - mu[k] for k, r in enumerate(resultats))
+                nouvelles = [colonne(k, r['x']) for k, r in enumerate(resultats)]
+                return ResultatPricing(nouvelles, borne)
+
+            self.generation = GenerationColonnes(pricing, stabilisation=self.stabilisation,
+                                                 rapport=self.rapport)
+            solution_maitre = self.generation.resoudre(maitre, verbose=verbose, budget=budget)
+            self.historique = self.generation.historique
+        finally:
+            if executeur is not None:
+                executeur.shutdown(cancel_futures=True)
+
+        solution = self._solution(probleme, solution_maitre, points, n_artificielles)
+        notifier(self.ecouteurs, 'fin_resolution', solution.statut,
+                 self.generation.iterations, chrono.total())
+        for ecouteur in self.ecouteurs:
+            if isinstance(ecouteur, CollecteurProfil):
+                ecouteur.attacher(solution)
+                break
+        return solution
+
+    @staticmethod
+    def _construire_maitre(maitre: ProblemePL, colonnes: List[Colonne], b: np.ndarray,
+                           liantes_ub: List[int], liantes_eq: List[int], n_blocs: int,
+                           maximiser: bool, echelle: float):
+        """
+        Maître restreint : un point par bloc, plus une variable artificielle
+        (très coûteuse) par contrainte liante violée par ces points.
+        """
+        n_ub, n_eq = len(liantes_ub), len(liantes_eq)
+        M = np.column_stack([c.coefficients for c in colonnes])
+        couts = [c.cout for c in colonnes]
+        residu = np.concatenate([b[liantes_ub], b[liantes_eq]]) - M[:n_ub + n_eq].sum(axis=1)
+
+        penalite = PENALITE_ARTIFICIELLE * max(1.0, echelle)
+        artificielles = []
+        for i in range(n_ub + n_eq):
+            if (i < n_ub and residu[i] < 0) or (i >= n_ub and residu[i] != 0):
+                colonne_a = np.zeros(n_ub + n_eq + n_blocs)
+                colonne_a[i] = -1.0 if i < n_ub else np.sign(residu[i])
+                artificielles.append(colonne_a)
+        if artificielles:
+            M = np.column_stack([M] + artificielles)
+            couts += [-penalite if maximiser else penalite] * len(artificielles)
+
+        maitre.definir_fonction_objectif(couts, maximiser)
+        maitre.noms_variables = [c.nom for c in colonnes] + [f"artif{i + 1}" for i in range(len(artificielles))]
+        if n_ub:
+            maitre.A_ub, maitre.b_ub = M[:n_ub], b[liantes_ub]
+        maitre.A_eq = M[n_ub:]
+        maitre.b_eq = np.concatenate([b[liantes_eq], np.ones(n_blocs)])
+
+    def _solution(self, probleme: ProblemePL, solution_maitre: Solution,
+                  points: list, n_artificielles: int) -> Solution:
+        """Recompose x = somme des points pondérés par les poids du maître."""
+        solution = Solution()
+        solution.noms_variables = probleme.noms_variables
+        solution.statut = solution_maitre.statut
+        solution.message = solution_maitre.message
+        solution.ecart_optimalite = solution_maitre.ecart_optimalite
+        if solution_maitre.valeurs_variables is None:
+            return solution
+
+        poids = solution_maitre.valeurs_variables
+        n_initiaux = len(points)
+        artificielles = poids[n_initiaux:n_initiaux + n_artificielles]
+        if np.any(artificielles > 1e-7):
+            # Pas encore de solution réalisable (ou aucune si le maître est optimal)
+            if solution.statut == 'optimal':
+                solution.statut = 'infaisable'
+                solution.message = "Les contraintes liantes ne peuvent pas être respectées"
+            solution.ecart_optimalite = None
+            return solution
+
+        x = np.zeros(len(probleme.c))
+        generees = [c.donnees for c in self.generation.colonnes]
+        poids_points = list(poids[:n_initiaux]) + list(poids[n_initiaux + n_artificielles:])
+        for (k, point), lam in zip(points + generees, poids_points):
+            x[self.blocs[k]] += lam * point
+        solution.valeurs_variables = x
+        solution.valeur_objectif = float(probleme.c @ x)
+        solution.succes = solution_maitre.succes
+        if solution.succes:
+            solution.message = "Solution optimale trouvée (décomposition de Dantzig-Wolfe)"
+        return solution
+
+    def _echec(self, probleme: ProblemePL, statut: str, chrono: Chronometre) -> Solution:
+        """Solution quand un bloc n'a pas de solution (ou pas de solution bornée)."""
+        solution = Solution()
+        solution.noms_variables = probleme.noms_variables
+        if statut == 'infaisable':
+            solution.statut = 'infaisable'
+            solution.message = "Un bloc n'a pas de solution réalisable"
+        else:
+            solution.statut = 'echec'
+            solution.message = "Un bloc n'est pas borné : borner les variables de chaque bloc"
+        notifier(self.ecouteurs, 'fin_resolution', solution.statut, 0, chrono.total())
+        return solution
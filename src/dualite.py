@@ -0,0 +1,254 @@
+"""
+dualite.py
+----------
+Ce fichier contient le problème dual d'un ProblemePL et le choix
+automatique entre le primal et le dual.
+
+Pour  Max c^T x  s.c.  A_ub x <= b_ub,  A_eq x == b_eq,  x_j >= 0 (j dans P),
+x_j libre (j dans L), le dual est :
+
+    Min b_ub^T y + b_eq^T z
+    s.c. (A_ub^T y + A_eq^T z)_j >= c_j  (j dans P)
+         (A_ub^T y + A_eq^T z)_j == c_j  (j dans L)
+         y >= 0, z libre
+
+(pour un Min, les inégalités et le signe de y s'inversent) et les deux
+problèmes ont la même valeur optimale. Les bornes des variables sont
+ramenées à cette forme : une borne inférieure l non nulle par changement de
+variable x = x' + l, une borne supérieure finie par une ligne de plus.
+
+Le simplexe (SimplexeStandard) travaille sur un tableau de m lignes et
+n + m colonnes : un pivot coûte environ m (n + m) opérations. Le dual a
+n lignes ; quand il y a beaucoup plus de contraintes que de variables (ou
+l'inverse), une des deux formulations est bien moins chère. La solution du
+primal se lit sur les variables duales du dual (x_j = dérivée de la valeur
+optimale par rapport à c_j).
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from .budget import Budget
+from .models import ProblemePL, Solution
+from .simplexe_standard import SimplexeStandard
+
+# Le dual n'est choisi que s'il coûte moins de SEUIL_DUAL fois le primal
+SEUIL_DUAL = 0.5
+
+
+@dataclass
+class _FormeDuale:
+    """Dual d'un problème et informations pour revenir au primal."""
+    dual: ProblemePL
+    signe: float             # +1 si le primal maximise, -1 s'il minimise
+    decalage: np.ndarray     # Bornes inférieures l (x = x' + l), 0 si aucune
+    libres: np.ndarray       # Variables du primal sans borne inférieure
+    constante: float         # c^T l : valeur du primal = valeur du dual + constante
+
+
+def _dualiser(probleme: ProblemePL) -> _FormeDuale:
+    """Construit le dual (voir probleme_dual) en gardant de quoi revenir au primal."""
+    if probleme.indices_entiers():
+        raise ValueError("Le dual n'est défini que pour un problème continu!")
+
+    c = np.asarray(probleme.c, dtype=float)
+    n = len(c)
+    signe = 1.0 if probleme.type_optimisation == 'max' else -1.0
+    A_ub = np.asarray(probleme.A_ub, dtype=float).reshape(-1, n) if probleme.A_ub is not None \
+        else np.zeros((0, n))
+    b_ub = np.asarray(probleme.b_ub, dtype=float) if probleme.b_ub is not None else np.zeros(0)
+    A_eq = np.asarray(probleme.A_eq, dtype=float).reshape(-1, n) if probleme.A_eq is not None \
+        else np.zeros((0, n))
+    b_eq = np.asarray(probleme.b_eq, dtype=float) if probleme.b_eq is not None else np.zeros(0)
+
+    # Bornes : x = x' + l (x' >= 0), x libre si pas de borne inférieure,
+    # borne supérieure finie -> ligne x'_j <= u_j - l_j
+    bornes = probleme.bounds if probleme.bounds is not None else [(0, None)] * n
+    decalage = np.array([0.0 if l is None else float(l) for l, _ in bornes])
+    libres = np.array([l is None for l, _ in bornes], dtype=bool)
+    lignes_bornes = [(j, u - decalage[j]) for j, (_, u) in enumerate(bornes) if u is not None]
+
+    b_ub = b_ub - A_ub @ decalage
+    b_eq = b_eq - A_eq @ decalage
+    if lignes_bornes:
+        A_bornes = np.zeros((len(lignes_bornes), n))
+        A_bornes[np.arange(len(lignes_bornes)), [j for j, _ in lignes_bornes]] = 1.0
+        A_ub = np.vstack([A_ub, A_bornes])
+        b_ub = np.concatenate([b_ub, [u for _, u in lignes_bornes]])
+
+    # Variables du dual : y (lignes <=), puis z (lignes ==)
+    m_ub, m_eq = len(b_ub), len(b_eq)
+    A = np.vstack([A_ub, A_eq])
+    dual = ProblemePL(f"Dual de {probleme.nom}")
+    dual.definir_fonction_objectif(np.concatenate([b_ub, b_eq]), maximiser=signe < 0)
+    for j in range(n):
+        if libres[j]:
+            dual.ajouter_contrainte_equalite(A[:, j], c[j])
+        else:
+            # Max : A^T y >= c  ;  Min : A^T y <= c
+            dual.ajouter_contrainte_inegalite(-signe * A[:, j], -signe * c[j])
+    signe_y = (0, None) if signe > 0 else (None, 0)
+    dual.definir_bornes([signe_y] * m_ub + [(None, None)] * m_eq)
+    dual.definir_noms_variables([f"y{i+1}" for i in range(m_ub)] + [f"z{i+1}" for i in range(m_eq)])
+
+    return _FormeDuale(dual, signe, decalage, libres, float(c @ decalage))
+
+
+def probleme_dual(probleme: ProblemePL) -> ProblemePL:
+    """
+    Construit le problème dual.
+
+    Args:
+        probleme: Problème continu
+
+    Returns:
+        Le dual (variables y1.. des lignes <= et des bornes supérieures,
+        z1.. des lignes ==). Sa valeur optimale est celle du primal, moins
+        c^T l si des variables ont une borne inférieure l non nulle.
+    """
+    return _dualiser(probleme).dual
+
+
+def dimensions_formulations(probleme: ProblemePL):
+    """
+    Taille des tableaux du simplexe pour le primal et pour le dual.
+
+    Returns:
+        ((lignes, colonnes) du primal, (lignes, colonnes) du dual)
+    """
+    n = len(probleme.c)
+    m = sum(len(b) for b in (probleme.b_ub, probleme.b_eq) if b is not None)
+    bornes = probleme.bounds if probleme.bounds is not None else [(0, None)] * n
+    n_bornes_sup = sum(u is not None for _, u in bornes)
+    # Primal : les bornes sont gérées sans ligne ; dual : une variable par borne supérieure
+    return (m, n + m), (n, m + n_bornes_sup + n)
+
+
+def choisir_formulation(probleme: ProblemePL, seuil: float = SEUIL_DUAL) -> str:
+    """
+    Choisit la formulation la moins chère à résoudre.
+
+    Le coût d'un pivot est estimé par la taille du tableau (lignes x colonnes).
+    La densité de A ne départage pas : le dual a les mêmes coefficients que
+    le primal, et le tableau se remplit dès les premiers pivots.
+
+    Args:
+        probleme: Problème continu
+        seuil: Le dual est choisi s'il coûte moins de seuil fois le primal
+
+    Returns:
+        'primal' ou 'dual'
+    """
+    if probleme.indices_entiers():
+        return 'primal'
+    (m_p, n_p), (m_d, n_d) = dimensions_formulations(probleme)
+    return 'dual' if m_d * n_d < seuil * m_p * n_p else 'primal'
+
+
+class SolveurFormulation:
+    """
+    Résout un ProblemePL par le simplexe à bornes, sur le primal ou sur le
+    dual (au choix, ou automatiquement d'après la forme du problème).
+
+    La Solution est toujours celle du primal : l'appelant ne voit pas de
+    différence.
+    """
+
+    def __init__(self, formulation: str = 'auto', seuil: float = SEUIL_DUAL):
+        """
+        Initialise le solveur.
+
+        Args:
+            formulation: 'auto', 'primal' ou 'dual'
+            seuil: Pour 'auto' : le dual est choisi s'il coûte moins de
+                   seuil fois le primal
+        """
+        if formulation not in ('auto', 'primal', 'dual'):
+            raise ValueError("formulation doit être 'auto', 'primal' ou 'dual'!")
+        self.formulation = formulation
+        self.seuil = seuil
+        self.formulation_choisie: Optional[str] = None
+        self.iterations = 0
+
+    def resoudre(self, probleme: ProblemePL, verbose: bool = False,
+                 budget: Optional[Budget] = None) -> Solution:
+        """
+        Résout le problème.
+
+        Args:
+            probleme: Problème continu
+            verbose: Afficher la formulation choisie et le résultat
+            budget: Limite de temps / d'itérations (pivots)
+
+        Returns:
+            La Solution du primal
+        """
+        formulation = self.formulation
+        if formulation == 'auto':
+            formulation = choisir_formulation(probleme, self.seuil)
+        self.formulation_choisie = formulation
+        if verbose:
+            (m_p, n_p), (m_d, n_d) = dimensions_formulations(probleme)
+            print(f"🔍 Formulation : {formulation} (tableau primal {m_p}x{n_p}, dual {m_d}x{n_d})")
+
+        if formulation == 'primal':
+            solution = self._primal(probleme, budget)
+        else:
+            solution = self._dual(probleme, budget)
+
+        if verbose:
+            print(f"{'✓' if solution.succes else '✗'} {solution.message}")
+        return solution
+
+    def _primal(self, probleme: ProblemePL, budget: Optional[Budget]) -> Solution:
+        """Simplexe sur le primal."""
+        lp = SimplexeStandard.depuis_probleme(probleme)
+        statut = lp.resoudre(budget)
+        self.iterations = lp.iterations
+        return self._solution(probleme, statut, lp.valeurs() if statut == 'optimal' else None)
+
+    def _dual(self, probleme: ProblemePL, budget: Optional[Budget]) -> Solution:
+        """Simplexe sur le dual ; x se lit sur les variables duales du dual."""
+        forme = _dualiser(probleme)
+        if len(forme.dual.c) == 0:
+            # Aucune contrainte ni borne supérieure : le primal est immédiat
+            return self._primal(probleme, budget)
+        lp = SimplexeStandard.depuis_probleme(forme.dual)
+        statut = lp.resoudre(budget)
+        self.iterations = lp.iterations
+
+        if statut == 'non_borne':
+            # Dual non borné : primal infaisable
+            return self._solution(probleme, 'infaisable', None)
+        if statut == 'infaisable':
+            # Dual infaisable : primal infaisable ou non borné, seul le primal tranche
+            return self._primal(probleme, budget)
+        if statut != 'optimal':
+            return self._solution(probleme, statut, None)
+
+        # Lignes du dual : les inégalités (second membre -signe c_j), puis les
+        # égalités des variables libres (second membre c_j)
+        ordre = np.concatenate([np.flatnonzero(~forme.libres), np.flatnonzero(forme.libres)])
+        x = np.empty(len(ordre))
+        x[ordre] = lp.duales() * np.where(forme.libres[ordre], 1.0, -forme.signe)
+        return self._solution(probleme, statut, x + forme.decalage)
+
+    def _solution(self, probleme: ProblemePL, statut: str, x: Optional[np.ndarray]) -> Solution:
+        """Construit la Solution du primal."""
+        solution = Solution()
+        solution.noms_variables = list(probleme.noms_variables)
+        solution.statut = statut
+        if statut == 'optimal':
+            solution.succes = True
+            solution.valeurs_variables = x
+            solution.valeur_objectif = float(np.asarray(probleme.c, dtype=float) @ x)
+            solution.message = f"Solution optimale trouvée (formulation {self.formulation_choisie})"
+        elif statut == 'infaisable':
+            solution.message = "Le problème n'a pas de solution réalisable"
+        elif statut == 'non_borne':
+            solution.message = "Le problème est non borné"
+        else:
+            solution.message = "Budget épuisé"
+        return solution
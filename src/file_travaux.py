@@ -0,0 +1,514 @@
+"""
+file_travaux.py
+---------------
+Ce fichier contient une file de travaux persistante (SQLite) pour les
+longues résolutions.
+
+Une résolution lancée dans un processus meurt avec lui. Ici :
+    1. on soumet le problème (sérialisé) dans une base SQLite
+    2. des processus travailleurs réclament les travaux : un travail réclamé
+       est « loué » pour une durée limitée (bail), renouvelée à chaque point
+       de reprise (ou par un thread pour les problèmes en nombres entiers,
+       résolus d'un bloc)
+    3. pendant la résolution (SimplexeStandard), le travailleur enregistre
+       régulièrement la base courante et le nombre de pivots
+    4. à la fin, la Solution est écrite dans la base
+
+Si un travailleur meurt, son bail expire et un autre travailleur reprend le
+travail depuis la dernière base enregistrée, au lieu de tout recommencer.
+
+    file = FileTravaux("travaux.db")
+    numero = file.soumettre(probleme)
+    lancer_travailleurs("travaux.db", n_processus=4)
+    solution = file.attendre(numero)
+"""
+
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .budget import Budget
+from .models import ProblemePL, Solution
+from .simplexe_standard import EtatBase, SimplexeStandard
+
+# Statuts d'un travail
+EN_ATTENTE = 'en_attente'
+EN_COURS = 'en_cours'
+TERMINE = 'termine'
+ECHEC = 'echec'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS travaux (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    statut TEXT NOT NULL,
+    priorite INTEGER NOT NULL DEFAULT 0,
+    probleme BLOB NOT NULL,
+    base BLOB,
+    position BLOB,
+    iterations INTEGER NOT NULL DEFAULT 0,
+    points_reprise INTEGER NOT NULL DEFAULT 0,
+    proprietaire TEXT,
+    bail_expire REAL,
+    tentatives INTEGER NOT NULL DEFAULT 0,
+    solution TEXT,
+    message TEXT,
+    cree REAL NOT NULL,
+    modifie REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS travaux_a_faire ON travaux (statut, priorite, id);
+"""
+
+
+@dataclass
+class Travail:
+    """Travail réclamé par un travailleur."""
+    id: int
+    probleme: ProblemePL
+    point_reprise: Optional[EtatBase]  # Dernière base enregistrée (None = départ)
+    iterations: int                    # Pivots déjà faits (toutes tentatives)
+    tentatives: int                    # Nombre de fois où le travail a été réclamé
+
+
+# ============================================================
+# FILE
+# ============================================================
+
+class FileTravaux:
+    """
+    File de travaux stockée dans une base SQLite.
+
+    Utilisable depuis plusieurs processus en même temps : chacun ouvre sa
+    propre FileTravaux sur le même fichier.
+    """
+
+    def __init__(self, chemin: str, duree_bail: float = 30.0, max_tentatives: int = 3):
+        """
+        Ouvre (ou crée) la file.
+
+        Args:
+            chemin: Fichier de la base SQLite
+            duree_bail: Durée (s) pendant laquelle un travail réclamé reste
+                        réservé sans nouveau point de reprise
+            max_tentatives: Nombre maximum de réclamations d'un travail
+                            (au-delà, il passe en échec)
+        """
+        if duree_bail <= 0:
+            raise ValueError("duree_bail doit être strictement positive!")
+
+        self.chemin = chemin
+        self.duree_bail = duree_bail
+        self.max_tentatives = max_tentatives
+
+        # isolation_level=None : les transactions sont ouvertes explicitement
+        self._connexion = sqlite3.connect(chemin, timeout=30.0, isolation_level=None)
+        self._connexion.execute("PRAGMA journal_mode=WAL")
+        self._connexion.executescript(SCHEMA)
+
+    def fermer(self):
+        """Ferme la connexion à la base."""
+        self._connexion.close()
+
+    def __enter__(self) -> 'FileTravaux':
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+    # ------------------------------------------------------------
+    # Côté client
+    # ------------------------------------------------------------
+
+    def soumettre(self, probleme: ProblemePL, priorite: int = 0) -> int:
+        """
+        Ajoute un problème à la file.
+
+        Args:
+            probleme: Problème à résoudre
+            priorite: Les plus petites priorités passent en premier
+
+        Returns:
+            Le numéro du travail
+        """
+        maintenant = time.time()
+        curseur = self._connexion.execute(
+            "INSERT INTO travaux (statut, priorite, probleme, cree, modifie) VALUES (?, ?, ?, ?, ?)",
+            (EN_ATTENTE, priorite, probleme.vers_npz(), maintenant, maintenant))
+        return curseur.lastrowid
+
+    def statut(self, numero: int) -> Optional[str]:
+        """Statut d'un travail (None s'il n'existe pas)."""
+        ligne = self._connexion.execute("SELECT statut FROM travaux WHERE id = ?", (numero,)).fetchone()
+        return None if ligne is None else ligne[0]
+
+    def solution(self, numero: int) -> Optional[Solution]:
+        """
+        Solution d'un travail.
+
+        Returns:
+            La Solution (travail terminé ou en échec), None sinon
+        """
+        ligne = self._connexion.execute(
+            "SELECT statut, solution, message FROM travaux WHERE id = ?", (numero,)).fetchone()
+        if ligne is None or ligne[0] not in (TERMINE, ECHEC):
+            return None
+        if ligne[1] is not None:
+            return Solution.depuis_dict(json.loads(ligne[1]))
+        solution = Solution()
+        solution.statut = 'erreur'
+        solution.message = ligne[2] or ""
+        return solution
+
+    def attendre(self, numero: int, delai: Optional[float] = None,
+                 intervalle: float = 0.1) -> Optional[Solution]:
+        """
+        Attend la fin d'un travail.
+
+        Args:
+            numero: Numéro du travail
+            delai: Temps maximum d'attente (s), None = pas de limite
+            intervalle: Intervalle entre deux consultations de la base (s)
+
+        Returns:
+            La Solution, ou None si le délai est dépassé
+        """
+        debut = time.time()
+        while True:
+            solution = self.solution(numero)
+            if solution is not None:
+                return solution
+            if delai is not None and time.time() - debut >= delai:
+                return None
+            time.sleep(intervalle)
+
+    def compter(self) -> Dict[str, int]:
+        """Nombre de travaux par statut."""
+        comptes = {EN_ATTENTE: 0, EN_COURS: 0, TERMINE: 0, ECHEC: 0}
+        for statut, nombre in self._connexion.execute(
+                "SELECT statut, COUNT(*) FROM travaux GROUP BY statut"):
+            comptes[statut] = nombre
+        return comptes
+
+    # ------------------------------------------------------------
+    # Côté travailleur
+    # ------------------------------------------------------------
+
+    def reclamer(self, proprietaire: str) -> Optional[Travail]:
+        """
+        Réserve le prochain travail : en attente, ou en cours avec un bail
+        expiré (son travailleur est sans doute mort).
+
+        Args:
+            proprietaire: Identifiant du travailleur
+
+        Returns:
+            Le travail (avec son point de reprise), ou None si la file est vide
+        """
+        maintenant = time.time()
+        # BEGIN IMMEDIATE : un seul processus à la fois peut réclamer
+        self._connexion.execute("BEGIN IMMEDIATE")
+        try:
+            # Travaux abandonnés trop souvent : échec
+            self._connexion.execute(
+                "UPDATE travaux SET statut = ?, message = ?, proprietaire = NULL, modifie = ? "
+                "WHERE statut = ? AND bail_expire < ? AND tentatives >= ?",
+                (ECHEC, "Trop de tentatives interrompues", maintenant,
+                 EN_COURS, maintenant, self.max_tentatives))
+            ligne = self._connexion.execute(
+                "SELECT id, probleme, base, position, iterations, tentatives FROM travaux "
+                "WHERE statut = ? OR (statut = ? AND bail_expire < ?) "
+                "ORDER BY priorite, id LIMIT 1",
+                (EN_ATTENTE, EN_COURS, maintenant)).fetchone()
+            if ligne is None:
+                self._connexion.execute("COMMIT")
+                return None
+            numero, probleme, base, position, iterations, tentatives = ligne
+            self._connexion.execute(
+                "UPDATE travaux SET statut = ?, proprietaire = ?, bail_expire = ?, "
+                "tentatives = tentatives + 1, modifie = ? WHERE id = ?",
+                (EN_COURS, proprietaire, maintenant + self.duree_bail, maintenant, numero))
+            self._connexion.execute("COMMIT")
+        except BaseException:
+            self._connexion.execute("ROLLBACK")
+            raise
+
+        point_reprise = None
+        if base is not None:
+            point_reprise = EtatBase(np.frombuffer(base, dtype=np.int64).copy(),
+                                     np.frombuffer(position, dtype=np.int64).copy())
+        return Travail(numero, ProblemePL.depuis_npz(probleme), point_reprise,
+                       iterations, tentatives + 1)
+
+    def enregistrer_point_reprise(self, numero: int, proprietaire: str,
+                                  etat: EtatBase, iterations: int) -> bool:
+        """
+        Enregistre la base courante et renouvelle le bail.
+
+        Args:
+            numero: Numéro du travail
+            proprietaire: Identifiant du travailleur
+            etat: Base courante du simplexe
+            iterations: Nombre total de pivots faits
+
+        Returns:
+            False si le travail n'appartient plus à ce travailleur (bail
+            expiré et travail repris ailleurs) : il faut alors l'abandonner
+        """
+        maintenant = time.time()
+        curseur = self._connexion.execute(
+            "UPDATE travaux SET base = ?, position = ?, iterations = ?, "
+            "points_reprise = points_reprise + 1, bail_expire = ?, modifie = ? "
+            "WHERE id = ? AND statut = ? AND proprietaire = ?",
+            (np.asarray(etat.base, dtype=np.int64).tobytes(),
+             np.asarray(etat.position, dtype=np.int64).tobytes(),
+             iterations, maintenant + self.duree_bail, maintenant, numero, EN_COURS, proprietaire))
+        return curseur.rowcount == 1
+
+    def renouveler_bail(self, numero: int, proprietaire: str) -> bool:
+        """
+        Renouvelle le bail d'un travail sans point de reprise.
+
+        Returns:
+            False si le travail n'appartient plus à ce travailleur
+        """
+        maintenant = time.time()
+        curseur = self._connexion.execute(
+            "UPDATE travaux SET bail_expire = ?, modifie = ? "
+            "WHERE id = ? AND statut = ? AND proprietaire = ?",
+            (maintenant + self.duree_bail, maintenant, numero, EN_COURS, proprietaire))
+        return curseur.rowcount == 1
+
+    def terminer(self, numero: int, proprietaire: str, solution: Solution,
+                 iterations: Optional[int] = None) -> bool:
+        """
+        Écrit la solution d'un travail.
+
+        Args:
+            numero: Numéro du travail
+            proprietaire: Identifiant du travailleur
+            solution: Solution obtenue
+            iterations: Nombre total de pivots (None = inchangé)
+
+        Returns:
+            False si le travail n'appartient plus à ce travailleur
+        """
+        maintenant = time.time()
+        curseur = self._connexion.execute(
+            "UPDATE travaux SET statut = ?, solution = ?, message = ?, "
+            "iterations = COALESCE(?, iterations), proprietaire = NULL, bail_expire = NULL, "
+            "modifie = ? WHERE id = ? AND statut = ? AND proprietaire = ?",
+            (TERMINE, json.dumps(solution.vers_dict()), solution.message, iterations,
+             maintenant, numero, EN_COURS, proprietaire))
+        return curseur.rowcount == 1
+
+    def echouer(self, numero: int, proprietaire: str, message: str) -> bool:
+        """
+        Met un travail en échec (erreur pendant la résolution).
+
+        Returns:
+            False si le travail n'appartient plus à ce travailleur
+        """
+        curseur = self._connexion.execute(
+            "UPDATE travaux SET statut = ?, message = ?, proprietaire = NULL, bail_expire = NULL, "
+            "modifie = ? WHERE id = ? AND statut = ? AND proprietaire = ?",
+            (ECHEC, message, time.time(), numero, EN_COURS, proprietaire))
+        return curseur.rowcount == 1
+
+    def infos(self, numero: int) -> Optional[dict]:
+        """Informations de suivi d'un travail (statut, pivots, points de reprise...)."""
+        self._connexion.row_factory = sqlite3.Row
+        try:
+            ligne = self._connexion.execute(
+                "SELECT id, statut, priorite, iterations, points_reprise, proprietaire, "
+                "bail_expire, tentatives, message, cree, modifie FROM travaux WHERE id = ?",
+                (numero,)).fetchone()
+        finally:
+            self._connexion.row_factory = None
+        return None if ligne is None else dict(ligne)
+
+
+# ============================================================
+# TRAVAILLEUR
+# ============================================================
+
+class Travailleur:
+    """
+    Réclame et résout les travaux d'une file.
+
+    Les problèmes continus sont résolus par SimplexeStandard, par tranches
+    de `pivots_par_point` pivots : la base est enregistrée après chaque
+    tranche. Les problèmes en nombres entiers sont résolus d'un bloc par
+    SolveurPL (pas de point de reprise intermédiaire) : un thread renouvelle
+    le bail pendant la résolution.
+    """
+
+    def __init__(self, chemin: str, pivots_par_point: int = 500, duree_bail: float = 30.0,
+                 max_tentatives: int = 3, nom: Optional[str] = None):
+        """
+        Initialise le travailleur.
+
+        Args:
+            chemin: Fichier de la base SQLite
+            pivots_par_point: Nombre de pivots entre deux points de reprise
+            duree_bail: Durée du bail (s) ; doit dépasser largement le temps
+                        d'une tranche de pivots
+            max_tentatives: Nombre maximum de réclamations d'un travail
+            nom: Identifiant du travailleur (défaut : hôte et numéro de processus)
+        """
+        if pivots_par_point < 1:
+            raise ValueError("pivots_par_point doit être au moins 1!")
+
+        self.file = FileTravaux(chemin, duree_bail, max_tentatives)
+        self.pivots_par_point = pivots_par_point
+        self.nom = nom or f"{socket.gethostname()}-{os.getpid()}"
+        self.travaux_termines = 0
+
+    def traiter(self, travail: Travail) -> Optional[Solution]:
+        """
+        Résout un travail réclamé, en repartant de son point de reprise.
+
+        Args:
+            travail: Travail obtenu par FileTravaux.reclamer()
+
+        Returns:
+            La Solution écrite dans la file, ou None si le bail a été perdu
+        """
+        probleme = travail.probleme
+        if probleme.indices_entiers():
+            from .solver import SolveurPL
+            with self._bail_renouvele(travail.id):
+                solution = SolveurPL().resoudre(probleme)
+            return solution if self.file.terminer(travail.id, self.nom, solution) else None
+
+        lp = SimplexeStandard.depuis_probleme(probleme)
+        if travail.point_reprise is not None:
+            lp.charger_base(travail.point_reprise)
+
+        iterations = travail.iterations
+        tranche = Budget(max_iterations=self.pivots_par_point)
+        while lp.resoudre(tranche) == 'budget_epuise':
+            iterations += lp.iterations
+            if not self.file.enregistrer_point_reprise(travail.id, self.nom, lp.etat_base(), iterations):
+                return None
+        iterations += lp.iterations
+
+        solution = self._solution(lp, iterations)
+        return solution if self.file.terminer(travail.id, self.nom, solution, iterations) else None
+
+    @contextmanager
+    def _bail_renouvele(self, numero: int):
+        """
+        Renouvelle le bail d'un travail toutes les duree_bail / 3 secondes
+        tant que le bloc `with` s'exécute (résolution sans point de reprise).
+
+        Le thread a sa propre connexion : une connexion SQLite ne se partage
+        pas entre threads.
+        """
+        fin = threading.Event()
+        intervalle = self.file.duree_bail / 3
+
+        def battre():
+            with FileTravaux(self.file.chemin, self.file.duree_bail, self.file.max_tentatives) as file:
+                while not fin.wait(intervalle):
+                    if not file.renouveler_bail(numero, self.nom):
+                        return  # Travail repris ailleurs : terminer() le refusera
+
+        thread = threading.Thread(target=battre, name=f"bail-{numero}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            fin.set()
+            thread.join()
+
+    @staticmethod
+    def _solution(lp: SimplexeStandard, iterations: int) -> Solution:
+        """Construit la Solution du simplexe terminé."""
+        solution = Solution()
+        solution.noms_variables = list(lp.noms_variables)
+        solution.statut = lp.statut
+        if lp.statut == 'optimal':
+            solution.succes = True
+            solution.valeurs_variables = lp.valeurs()
+            solution.valeur_objectif = lp.valeur_objectif
+            solution.message = f"Solution optimale trouvée ({iterations} pivots)"
+        elif lp.statut == 'infaisable':
+            solution.message = "Le problème n'a pas de solution réalisable"
+        else:
+            solution.message = "Le problème est non borné"
+        return solution
+
+    def executer(self, max_travaux: Optional[int] = None, attendre: bool = False,
+                 intervalle: float = 0.5, arret=None) -> int:
+        """
+        Boucle du travailleur : réclame et résout les travaux.
+
+        Args:
+            max_travaux: Nombre maximum de travaux à traiter (None = pas de limite)
+            attendre: True pour attendre de nouveaux travaux quand la file est
+                      vide, False pour s'arrêter
+            intervalle: Attente (s) entre deux consultations d'une file vide
+            arret: Événement (threading / multiprocessing) qui arrête la boucle
+
+        Returns:
+            Le nombre de travaux terminés
+        """
+        termines = 0
+        while max_travaux is None or termines < max_travaux:
+            if arret is not None and arret.is_set():
+                break
+            travail = self.file.reclamer(self.nom)
+            if travail is None:
+                if not attendre:
+                    break
+                time.sleep(intervalle)
+                continue
+            try:
+                if self.traiter(travail) is not None:
+                    termines += 1
+            except Exception as erreur:
+                self.file.echouer(travail.id, self.nom, f"Erreur : {erreur}")
+        self.travaux_termines += termines
+        return termines
+
+
+def _boucle_travailleur(chemin: str, options: dict, attendre: bool, arret):
+    """Point d'entrée d'un processus travailleur."""
+    travailleur = Travailleur(chemin, **options)
+    try:
+        travailleur.executer(attendre=attendre, arret=arret)
+    finally:
+        travailleur.file.fermer()
+
+
+def lancer_travailleurs(chemin: str, n_processus: int = 2, attendre: bool = False,
+                        arret=None, **options) -> List[multiprocessing.Process]:
+    """
+    Lance des processus travailleurs sur une file.
+
+    Args:
+        chemin: Fichier de la base SQLite
+        n_processus: Nombre de processus
+        attendre: True pour que les travailleurs attendent de nouveaux travaux
+                  (jusqu'à `arret`), False pour qu'ils s'arrêtent quand la file est vide
+        arret: multiprocessing.Event qui arrête les travailleurs
+        **options: pivots_par_point, duree_bail, max_tentatives
+
+    Returns:
+        Les processus démarrés (à attendre avec join())
+    """
+    FileTravaux(chemin).fermer()  # Crée la base avant le démarrage des processus
+    processus = [multiprocessing.Process(target=_boucle_travailleur,
+                                         args=(chemin, options, attendre, arret), daemon=True)
+                 for _ in range(n_processus)]
+    for p in processus:
+        p.start()
+    return processus
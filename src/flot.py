@@ -0,0 +1,500 @@
+"""
+flot.py
+-------
+Ce fichier contient un solveur de flot à coût minimum.
+
+Un réseau a des nœuds (avec une offre b_v : > 0 pour une source, < 0 pour
+une demande) et des arcs (u -> v) avec un coût et une capacité :
+
+    Min  somme_a c_a x_a
+    s.c. flux sortant(v) - flux entrant(v) = b_v   pour chaque nœud v
+         l_a <= x_a <= u_a
+
+La matrice des égalités est la matrice d'incidence du réseau : chaque
+colonne contient un +1 (origine de l'arc) et un -1 (destination). Au lieu
+de la traiter comme un tableau dense, on travaille sur des tableaux d'arcs :
+    1. Les arcs de coût négatif et de capacité finie sont saturés ; un
+       Bellman-Ford donne des potentiels (le problème est non borné s'il
+       existe un cycle négatif sans limite de capacité, sinon les cycles
+       négatifs sont annulés)
+    2. Plus courts chemins successifs : Dijkstra sur les coûts réduits
+       c_uv + pi_u - pi_v >= 0, puis on pousse le flux le long du chemin
+
+SolveurFlot reconnaît cette structure dans un ProblemePL (A_eq matrice
+d'incidence, A_ub limité à des bornes sur une variable) ou accepte
+directement un ReseauFlot.
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from .models import ProblemePL, Solution
+from .budget import Budget
+from .instrumentation import (
+    Chronometre, CollecteurProfil, EcouteurSolveur, notifier,
+    PHASE_INITIALISATION, PHASE_PIVOT, PHASE_PLUS_COURT_CHEMIN
+)
+
+
+@dataclass
+class ReseauFlot:
+    """
+    Réseau d'un problème de flot à coût minimum.
+
+    Les arcs sont donnés par des tableaux : arc a de origines[a] vers
+    destinations[a]. Une capacité np.inf signifie « pas de limite ».
+    """
+    n_noeuds: int
+    origines: np.ndarray                 # Nœud de départ de chaque arc
+    destinations: np.ndarray             # Nœud d'arrivée de chaque arc
+    couts: np.ndarray                    # Coût unitaire de chaque arc
+    offres: np.ndarray                   # b_v (> 0 : offre, < 0 : demande)
+    capacites: Optional[np.ndarray] = None   # None = capacités infinies
+    bornes_inf: Optional[np.ndarray] = None  # None = flux >= 0
+    maximiser: bool = False
+    noms_arcs: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.origines = np.asarray(self.origines, dtype=int)
+        self.destinations = np.asarray(self.destinations, dtype=int)
+        self.couts = np.asarray(self.couts, dtype=float)
+        self.offres = np.asarray(self.offres, dtype=float)
+        n_arcs = len(self.origines)
+        self.capacites = (np.full(n_arcs, np.inf) if self.capacites is None
+                          else np.asarray(self.capacites, dtype=float))
+        self.bornes_inf = (np.zeros(n_arcs) if self.bornes_inf is None
+                           else np.asarray(self.bornes_inf, dtype=float))
+        if len(self.offres) != self.n_noeuds:
+            raise ValueError(f"Il faut une offre par nœud ({self.n_noeuds})!")
+        if not self.noms_arcs:
+            self.noms_arcs = [f"{u+1}→{v+1}" for u, v in zip(self.origines, self.destinations)]
+
+
+# ============================================================
+# DÉTECTION DE LA STRUCTURE
+# ============================================================
+
+def detecter_reseau(probleme: ProblemePL) -> Optional[ReseauFlot]:
+    """
+    Reconnaît un problème de flot dans un ProblemePL.
+
+    Conditions : A_eq n'a que des coefficients 0, 1 et -1, avec au plus un
+    +1 et un -1 par colonne (une colonne avec un seul coefficient est un
+    arc vers/depuis l'extérieur du réseau) ; les lignes de A_ub ne portent
+    que sur une variable (bornes) ; aucune variable n'est libre.
+
+    Args:
+        probleme: Problème à analyser
+
+    Returns:
+        Le ReseauFlot équivalent (un arc par variable), ou None
+    """
+    if probleme.c is None or probleme.A_eq is None:
+        return None
+    A = probleme.A_eq
+    n_noeuds, n_vars = A.shape
+
+    if not np.all((A == 0) | (A == 1) | (A == -1)):
+        return None
+    nb_plus = np.sum(A == 1, axis=0)
+    nb_moins = np.sum(A == -1, axis=0)
+    if np.any(nb_plus > 1) or np.any(nb_moins > 1) or np.any(nb_plus + nb_moins == 0):
+        return None
+
+    # Bornes des variables (bornes explicites et lignes de A_ub à une variable)
+    bornes = probleme.bounds if probleme.bounds is not None else [(0, None)] * n_vars
+    bornes_inf = np.array([-np.inf if l is None else l for l, _ in bornes], dtype=float)
+    capacites = np.array([np.inf if u is None else u for _, u in bornes], dtype=float)
+    if probleme.A_ub is not None:
+        for ligne, b in zip(probleme.A_ub, probleme.b_ub):
+            non_nuls = np.flatnonzero(ligne)
+            if len(non_nuls) != 1:
+                return None
+            k = non_nuls[0]
+            if ligne[k] > 0:
+                capacites[k] = min(capacites[k], b / ligne[k])
+            else:
+                bornes_inf[k] = max(bornes_inf[k], b / ligne[k])
+    if np.any(np.isinf(bornes_inf)):
+        return None
+
+    # Les arcs avec un seul coefficient vont vers (ou viennent de) un nœud
+    # extérieur, dont l'offre équilibre le réseau
+    externe = n_noeuds
+    origines = np.where(nb_plus == 1, np.argmax(A == 1, axis=0), externe)
+    destinations = np.where(nb_moins == 1, np.argmax(A == -1, axis=0), externe)
+    offres = np.asarray(probleme.b_eq, dtype=float)
+    if np.any(origines == externe) or np.any(destinations == externe):
+        offres = np.append(offres, -offres.sum())
+        n_noeuds += 1
+
+    return ReseauFlot(
+        n_noeuds=n_noeuds,
+        origines=origines,
+        destinations=destinations,
+        couts=probleme.c.copy(),
+        offres=offres,
+        capacites=capacites,
+        bornes_inf=bornes_inf,
+        maximiser=probleme.type_optimisation == 'max',
+        noms_arcs=list(probleme.noms_variables),
+    )
+
+
+# ============================================================
+# SOLVEUR
+# ============================================================
+
+class SolveurFlot:
+    """
+    Solveur de flot à coût minimum (plus courts chemins successifs).
+
+    Exemple :
+        solveur = SolveurFlot()
+        solution = solveur.resoudre(probleme)      # ProblemePL
+        solution = solveur.resoudre(ReseauFlot(...))
+    """
+
+    def __init__(self, ecouteurs: Optional[List[EcouteurSolveur]] = None):
+        """
+        Initialise le solveur.
+
+        Args:
+            ecouteurs: Écouteurs avertis pendant la résolution (profilage)
+        """
+        self.ecouteurs: List[EcouteurSolveur] = list(ecouteurs) if ecouteurs else []
+
+        # Nombre d'augmentations (chemins) de la dernière résolution
+        self.iterations = 0
+
+        # Potentiels des nœuds à la fin de la résolution (variables duales)
+        self.potentiels: Optional[np.ndarray] = None
+
+    def resoudre(self, probleme: Union[ProblemePL, ReseauFlot], verbose: bool = False,
+                 budget: Optional[Budget] = None) -> Solution:
+        """
+        Résout un problème de flot à coût minimum.
+
+        Args:
+            probleme: ReseauFlot, ou ProblemePL dont A_eq est une matrice d'incidence
+            verbose: Si True, affiche des informations détaillées
+            budget: Limite de temps / d'itérations (optionnel). Si elle est
+                    atteinte, la solution a le statut 'budget_epuise'
+
+        Returns:
+            Une instance de Solution (un arc par variable, dans l'ordre du problème)
+        """
+        if isinstance(probleme, ProblemePL):
+            reseau = detecter_reseau(probleme)
+            if reseau is None:
+                raise ValueError("Le problème n'a pas la structure d'un problème de flot!")
+        else:
+            reseau = probleme
+
+        if verbose:
+            print("🔍 Résolution en cours (flot à coût minimum)...")
+            print(f"   Nœuds : {reseau.n_noeuds}")
+            print(f"   Arcs : {len(reseau.origines)}")
+
+        chrono = Chronometre()
+        notifier(self.ecouteurs, 'debut_resolution', 'flot', len(reseau.origines), reseau.n_noeuds)
+
+        flux, statut = self._plus_courts_chemins(reseau, budget, chrono)
+
+        solution = Solution()
+        solution.noms_variables = reseau.noms_arcs
+        solution.statut = statut
+        if statut == 'optimal':
+            solution.succes = True
+            solution.valeurs_variables = flux
+            solution.valeur_objectif = float(reseau.couts @ flux)
+            solution.message = "Solution optimale trouvée"
+        elif statut == 'non_borne':
+            solution.message = "Cycle de coût négatif sans limite de capacité : solution infinie"
+        elif statut == 'infaisable':
+            solution.message = "Les offres ne peuvent pas être acheminées vers les demandes"
+        else:
+            solution.message = "Budget épuisé (aucune solution réalisable connue)"
+
+        notifier(self.ecouteurs, 'fin_resolution', statut, self.iterations, chrono.total())
+        for ecouteur in self.ecouteurs:
+            if isinstance(ecouteur, CollecteurProfil):
+                ecouteur.attacher(solution)
+                break
+
+        if verbose:
+            print(f"{'✓' if solution.succes else '✗'} {solution.message} ({self.iterations} chemins)")
+
+        return solution
+
+    def _plus_courts_chemins(self, reseau: ReseauFlot, budget: Optional[Budget],
+                             chrono: Chronometre):
+        """
+        Algorithme des plus courts chemins successifs sur le graphe résiduel.
+
+        Le graphe résiduel est stocké dans des tableaux d'arcs : l'arc 2a est
+        l'arc a du réseau, l'arc 2a+1 son arc inverse (coût opposé) ; pour
+        chaque nœud, `sortants[v]` liste les arcs résiduels qui en partent.
+
+        Returns:
+            (flux de chaque arc du réseau ou None, statut)
+        """
+        self.iterations = 0
+        self.potentiels = None
+        debut = Budget.maintenant()
+
+        n = reseau.n_noeuds
+        n_arcs = len(reseau.origines)
+        couts = -reseau.couts if reseau.maximiser else reseau.couts
+        capacites = reseau.capacites - reseau.bornes_inf
+        if np.any(capacites < 0):
+            notifier(self.ecouteurs, 'fin_phase', PHASE_INITIALISATION, chrono.tour())
+            return None, 'infaisable'
+
+        # Bornes inférieures : x = l + x', les offres sont corrigées
+        offres = reseau.offres.copy()
+        np.subtract.at(offres, reseau.origines, reseau.bornes_inf)
+        np.add.at(offres, reseau.destinations, reseau.bornes_inf)
+
+        # Arcs de coût négatif et de capacité finie : saturés dès le départ
+        satures = (couts < 0) & np.isfinite(capacites)
+        flux_initial = np.where(satures, capacites, 0.0)
+        np.subtract.at(offres, reseau.origines[satures], capacites[satures])
+        np.add.at(offres, reseau.destinations[satures], capacites[satures])
+
+        tol = 1e-9 * max(1.0, float(np.abs(offres).sum()))
+        if abs(offres.sum()) > tol:
+            notifier(self.ecouteurs, 'fin_phase', PHASE_INITIALISATION, chrono.tour())
+            return None, 'infaisable'
+
+        # Graphe résiduel (listes Python : plus rapides que NumPy élément par élément)
+        tete = np.empty(2 * n_arcs, dtype=int)
+        tete[0::2], tete[1::2] = reseau.destinations, reseau.origines
+        residuel = np.empty(2 * n_arcs)
+        residuel[0::2], residuel[1::2] = capacites - flux_initial, flux_initial
+        cout = np.empty(2 * n_arcs)
+        cout[0::2], cout[1::2] = couts, -couts
+        queue_arc = np.empty(2 * n_arcs, dtype=int)
+        queue_arc[0::2], queue_arc[1::2] = reseau.origines, reseau.destinations
+
+        ordre = np.argsort(queue_arc, kind='stable')
+        bornes = np.searchsorted(queue_arc[ordre], np.arange(n + 1))
+        sortants = [ordre[bornes[v]:bornes[v + 1]].tolist() for v in range(n)]
+        tete, residuel, cout = tete.tolist(), residuel.tolist(), cout.tolist()
+        notifier(self.ecouteurs, 'memoire', 4 * 8 * 2 * n_arcs + 8 * n)
+
+        # Potentiels initiaux (coûts réduits >= 0 sur les arcs résiduels)
+        potentiels, statut = self._potentiels_initiaux(n, sortants, tete, residuel, cout, tol,
+                                                       budget, debut)
+        notifier(self.ecouteurs, 'fin_phase', PHASE_INITIALISATION, chrono.tour())
+        if statut == 'budget_epuise':
+            return None, statut
+        if potentiels is None:
+            # Non borné seulement s'il existe un flux réalisable (mêmes arcs, coûts nuls)
+            sans_couts = replace(reseau, couts=np.zeros(n_arcs), maximiser=False)
+            _, statut = self._plus_courts_chemins(sans_couts, None, chrono)
+            return None, 'non_borne' if statut == 'optimal' else statut
+
+        exces = offres.tolist()
+        statut = 'optimal'
+        while True:
+            sources = [v for v in range(n) if exces[v] > tol]
+            if not sources:
+                break
+            if budget is not None and budget.epuise(self.iterations, debut):
+                statut = 'budget_epuise'
+                break
+
+            # Dijkstra depuis toutes les sources à la fois (coûts réduits)
+            distance = [float('inf')] * n
+            arc_parent = [-1] * n
+            tas = []
+            for s in sources:
+                distance[s] = 0.0
+                tas.append((0.0, s))
+            heapq.heapify(tas)
+            definitifs = []
+            puits = -1
+            while tas:
+                d, u = heapq.heappop(tas)
+                if d > distance[u]:
+                    continue
+                definitifs.append(u)
+                if exces[u] < -tol:
+                    puits = u
+                    break
+                pu = potentiels[u]
+                for a in sortants[u]:
+                    if residuel[a] <= tol:
+                        continue
+                    w = tete[a]
+                    reduit = cout[a] + pu - potentiels[w]
+                    nd = d + (reduit if reduit > 0 else 0.0)  # Bruit numérique
+                    if nd < distance[w] - 1e-12:
+                        distance[w] = nd
+                        arc_parent[w] = a
+                        heapq.heappush(tas, (nd, w))
+            notifier(self.ecouteurs, 'fin_phase', PHASE_PLUS_COURT_CHEMIN, chrono.tour())
+
+            if puits < 0:
+                statut = 'infaisable'
+                break
+
+            # Potentiels : les nœuds atteints avant le puits gagnent leur distance
+            # (les autres la distance du puits), ce qui garde des coûts réduits >= 0
+            d_puits = distance[puits]
+            for v in range(n):
+                potentiels[v] += min(distance[v], d_puits)
+
+            # Chemin de la source au puits et quantité poussée
+            chemin = []
+            v = puits
+            while arc_parent[v] >= 0:
+                a = arc_parent[v]
+                chemin.append(a)
+                v = tete[a ^ 1]
+            quantite = min(exces[v], -exces[puits], min(residuel[a] for a in chemin))
+            for a in chemin:
+                residuel[a] -= quantite
+                residuel[a ^ 1] += quantite
+            exces[v] -= quantite
+            exces[puits] += quantite
+
+            self.iterations += 1
+            notifier(self.ecouteurs, 'fin_phase', PHASE_PIVOT, chrono.tour())
+
+        self.potentiels = np.array(potentiels)
+        if statut != 'optimal':
+            return None, statut
+
+        # Flux des arcs du réseau = flux sur l'arc inverse résiduel
+        flux = np.array(residuel[1::2]) + reseau.bornes_inf
+        return flux, statut
+
+    @staticmethod
+    def _potentiels_initiaux(n, sortants, tete, residuel, cout, tol, budget: Optional[Budget],
+                             debut: float) -> Tuple[Optional[List[float]], str]:
+        """
+        Calcule des potentiels tels que tous les coûts réduits soient >= 0.
+
+        On cherche d'abord un cycle de coût négatif parmi les seuls arcs sans
+        limite de capacité : s'il y en a un, le problème est non borné.
+        Sinon, chaque cycle de coût négatif (de capacité finie) est annulé
+        (on y pousse le flux maximal) avant de recommencer ; chaque
+        annulation fait baisser le coût, ce qui finit par s'arrêter.
+
+        Returns:
+            (potentiels ou None, statut) : statut 'optimal', 'non_borne' (cycle
+            négatif sans limite de capacité) ou 'budget_epuise'
+        """
+        if all(cout[a] >= 0 for a in range(len(cout)) if residuel[a] > tol):
+            return [0.0] * n, 'optimal'
+
+        # Sans ce test, deux cycles finis peuvent s'annuler l'un l'autre sans fin
+        # (une unité de flux renvoyée d'un côté puis de l'autre)
+        infinis = [r if r == float('inf') else 0.0 for r in residuel]
+        if SolveurFlot._bellman_ford(n, sortants, tete, infinis, cout, tol)[2] >= 0:
+            return None, 'non_borne'
+
+        annulations = 0
+        while True:
+            distance, arc_parent, cycle_sur = SolveurFlot._bellman_ford(
+                n, sortants, tete, residuel, cout, tol)
+            if cycle_sur < 0:
+                return distance, 'optimal'
+            if budget is not None and budget.epuise(annulations, debut):
+                return None, 'budget_epuise'
+
+            v = cycle_sur
+            cycle = []
+            w = v
+            while True:
+                a = arc_parent[w]
+                cycle.append(a)
+                w = tete[a ^ 1]
+                if w == v:
+                    break
+
+            quantite = min(residuel[a] for a in cycle)
+            for a in cycle:
+                residuel[a] -= quantite
+                residuel[a ^ 1] += quantite
+            annulations += 1
+
+    @staticmethod
+    def _bellman_ford(n, sortants, tete, residuel, cout, tol) -> Tuple[List[float], List[int], int]:
+        """
+        Bellman-Ford (version avec file) depuis une source fictive reliée à
+        tous les nœuds, sur les arcs de résiduel > tol.
+
+        Returns:
+            (distances, arc parent de chaque nœud, un nœud d'un cycle de coût
+            négatif ou -1 s'il n'y en a pas)
+        """
+        distance = [0.0] * n
+        arc_parent = [-1] * n
+        nb_relaxations = [0] * n
+        dans_file = [True] * n
+        file = deque(range(n))
+        while file:
+            u = file.popleft()
+            dans_file[u] = False
+            for a in sortants[u]:
+                if residuel[a] <= tol:
+                    continue
+                w = tete[a]
+                nd = distance[u] + cout[a]
+                if nd < distance[w] - 1e-12:
+                    distance[w] = nd
+                    arc_parent[w] = a
+                    nb_relaxations[w] += 1
+                    if nb_relaxations[w] % n == 0:
+                        # Un cycle négatif finit par apparaître dans les parents
+                        cycle_sur = SolveurFlot._noeud_sur_cycle(w, arc_parent, tete, n)
+                        if cycle_sur >= 0:
+                            return distance, arc_parent, cycle_sur
+                    if not dans_file[w]:
+                        dans_file[w] = True
+                        file.append(w)
+        return distance, arc_parent, -1
+
+    @staticmethod
+    def _noeud_sur_cycle(depart, arc_parent, tete, n) -> int:
+        """
+        Remonte les parents depuis `depart` ; après n pas sans atteindre une
+        racine, on est forcément sur un cycle.
+
+        Returns:
+            Un nœud du cycle, ou -1 si la remontée atteint une racine
+        """
+        v = depart
+        for _ in range(n):
+            a = arc_parent[v]
+            if a < 0:
+                return -1
+            v = tete[a ^ 1]
+        return v
+
+
+def resoudre_flot(origines, destinations, couts, offres, capacites=None,
+                  verbose: bool = True, budget: Optional[Budget] = None) -> Solution:
+    """
+    Fonction utilitaire pour résoudre un problème de flot donné par ses arcs.
+
+    Args:
+        origines, destinations: Extrémités de chaque arc (nœuds numérotés à partir de 0)
+        couts: Coût unitaire de chaque arc
+        offres: Offre de chaque nœud (> 0 : source, < 0 : demande)
+        capacites: Capacité de chaque arc (None = infinie)
+        verbose: Afficher les détails ou non
+        budget: Limite de temps / d'itérations (optionnel)
+
+    Returns:
+        La solution (une variable par arc)
+    """
+    reseau = ReseauFlot(len(offres), origines, destinations, couts, offres, capacites)
+    return SolveurFlot().resoudre(reseau, verbose=verbose, budget=budget)
@@ -0,0 +1,328 @@
+"""
+generation_colonnes.py
+----------------------
+Ce fichier contient la génération de colonnes.
+
+Certains modèles (découpe, rotations d'équipages...) ont trop de variables
+pour être écrits en entier. On résout un problème maître restreint (quelques
+colonnes seulement) puis on demande à un sous-problème de « pricing »,
+fourni par l'utilisateur, des colonnes de coût réduit intéressant :
+
+    1. Résoudre le maître restreint -> variables duales y
+    2. pricing(y) propose des colonnes (coût c_j, coefficients a_j)
+    3. Ajouter celles dont le coût réduit c_j - y^T a_j améliore l'objectif
+       (< 0 en minimisation, > 0 en maximisation), sinon s'arrêter ; on
+       s'arrête aussi quand la valeur du maître atteint la borne
+
+Les colonnes sont ajoutées au SimplexeStandard sans le reconstruire : la base
+reste réalisable et le simplexe primal repart de la base précédente.
+
+Options :
+    - stabilisation (Wentges) : le pricing reçoit un lissage
+      alpha * centre + (1 - alpha) * y des duales, qui oscillent beaucoup moins
+    - éviction : les colonnes générées restées hors base trop longtemps sont
+      retirées du maître (taille du tableau maîtrisée)
+"""
+
+import copy
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Union
+
+import numpy as np
+
+from .models import ProblemePL, Solution
+from .budget import Budget
+from .simplexe_standard import SimplexeStandard, BASIQUE
+from .instrumentation import EcouteurSolveur, CollecteurProfil, Chronometre, notifier
+
+
+@dataclass
+class Colonne:
+    """Colonne proposée par le pricing."""
+    cout: float                       # Coefficient dans l'objectif
+    coefficients: np.ndarray          # Coefficient dans chaque ligne du maître (<= puis =)
+    nom: Optional[str] = None
+    borne_max: Optional[float] = None
+    donnees: Any = None               # Informations libres (ex: motif de découpe)
+
+
+@dataclass
+class ResultatPricing:
+    """Colonnes proposées, avec une borne sur l'optimum si le pricing la connaît."""
+    colonnes: List[Colonne]
+    borne: Optional[float] = None  # Borne lagrangienne pour ces duales (sens du problème)
+
+
+# Fonction de pricing : reçoit les duales (une par ligne du maître) et renvoie
+# des colonnes candidates (liste vide = aucune colonne intéressante), ou un
+# ResultatPricing quand elle sait calculer une borne
+Pricing = Callable[[np.ndarray], Union[List[Colonne], ResultatPricing]]
+
+
+class GenerationColonnes:
+    """
+    Génération de colonnes sur un problème maître restreint.
+
+    Exemple :
+        def pricing(duales):
+            motif = meilleur_motif(duales)        # Sous-problème de l'utilisateur
+            return [Colonne(1.0, -motif, donnees=motif)]
+
+        generation = GenerationColonnes(pricing, stabilisation=0.5)
+        solution = generation.resoudre(maitre)   # ProblemePL des colonnes initiales
+    """
+
+    def __init__(self, pricing: Pricing, stabilisation: float = 0.0,
+                 age_max: Optional[int] = None, taille_max: Optional[int] = None,
+                 borne_somme: Optional[float] = None, tolerance: float = 1e-9,
+                 rapport: Optional[Callable[[dict], None]] = None,
+                 ecouteurs: Optional[List[EcouteurSolveur]] = None):
+        """
+        Initialise la génération de colonnes.
+
+        Args:
+            pricing: Sous-problème : duales -> colonnes candidates
+            stabilisation: alpha de Wentges dans [0, 1) (0 = pas de lissage)
+            age_max: Une colonne générée hors base pendant plus de age_max
+                     itérations est retirée (None = jamais)
+            taille_max: Nombre maximum de colonnes générées gardées : les plus
+                        anciennement utiles sont retirées d'abord (None = pas de limite)
+            borne_somme: Majorant de la somme des variables d'une solution
+                         optimale. Si elle est donnée (et si pricing renvoie
+                         toujours sa meilleure colonne), on calcule la borne de
+                         Lasdon sur l'optimum à chaque itération
+            tolerance: Coût réduit minimum pour qu'une colonne soit ajoutée, et
+                       écart relatif valeur / borne en dessous duquel on s'arrête
+                       (relatifs à la taille des coûts et des duales)
+            rapport: Fonction appelée à chaque itération avec
+                     {'iteration', 'valeur', 'borne', 'colonnes'}
+            ecouteurs: Écouteurs avertis pendant la résolution (profilage)
+        """
+        if not 0 <= stabilisation < 1:
+            raise ValueError("stabilisation doit être dans [0, 1)!")
+
+        self.pricing = pricing
+        self.stabilisation = stabilisation
+        self.age_max = age_max
+        self.taille_max = taille_max
+        self.borne_somme = borne_somme
+        self.rapport = rapport
+        self.tolerance = tolerance
+        self.ecouteurs: List[EcouteurSolveur] = list(ecouteurs) if ecouteurs else []
+
+        # État de la dernière résolution
+        self.lp: Optional[SimplexeStandard] = None
+        self.maitre: Optional[ProblemePL] = None
+        self.colonnes: List[Colonne] = []  # Colonnes générées encore dans le maître
+        self.duales: Optional[np.ndarray] = None
+        self.iterations = 0
+        self.colonnes_ajoutees = 0
+        self.colonnes_retirees = 0
+        self.historique: List[dict] = []   # {'iteration', 'valeur', 'borne', 'colonnes'}
+
+    def resoudre(self, maitre: ProblemePL, verbose: bool = False,
+                 budget: Optional[Budget] = None) -> Solution:
+        """
+        Résout la relaxation continue du problème maître complet.
+
+        Args:
+            maitre: Problème maître restreint (ses colonnes doivent le rendre réalisable)
+            verbose: Si True, affiche la valeur et la borne à chaque itération
+            budget: Limite de temps / d'itérations (appels au pricing)
+
+        Returns:
+            Une instance de Solution (une valeur par colonne du maître final)
+        """
+        self.maitre = maitre
+        self.lp = lp = SimplexeStandard.depuis_probleme(maitre)
+        self.colonnes, self.historique = [], []
+        self.iterations, self.colonnes_ajoutees, self.colonnes_retirees = 0, 0, 0
+        n_initiales = len(maitre.c)
+        ages: List[int] = []  # Itérations hors base de chaque colonne générée
+        maximiser = lp.maximiser
+        signe = -1.0 if maximiser else 1.0  # Coûts réduits ramenés en minimisation
+
+        if verbose:
+            print("🔍 Résolution en cours (génération de colonnes)...")
+            print(f"   Colonnes initiales : {n_initiales}, lignes : {lp.m}")
+
+        chrono = Chronometre()
+        debut = Budget.maintenant()
+        notifier(self.ecouteurs, 'debut_resolution', 'generation-colonnes', n_initiales, lp.m)
+
+        # Colonnes du maître, pour ne pas proposer deux fois la même
+        lignes = [np.asarray(M, dtype=float).reshape(-1, n_initiales)
+                  for M in (maitre.A_ub, maitre.A_eq) if M is not None]
+        matrice = np.vstack(lignes) if lignes else np.zeros((0, n_initiales))
+        initiales = {self._cle(Colonne(maitre.c[j], matrice[:, j])) for j in range(n_initiales)}
+        presentes = set(initiales)
+
+        centre = None
+        meilleure_borne = -np.inf  # Forme min
+        statut = lp.resoudre()
+        while statut == 'optimal':
+            if budget is not None and budget.epuise(self.iterations, debut):
+                statut = 'budget_epuise'
+                break
+            self.iterations += 1
+            y = lp.duales()
+            valeur = signe * lp.valeur_objectif
+
+            # Duales lissées (Wentges) ; si elles ne donnent rien, duales exactes
+            points = [y]
+            if self.stabilisation > 0 and centre is not None:
+                points.insert(0, self.stabilisation * centre + (1 - self.stabilisation) * y)
+
+            nouvelles, borne_connue = [], False
+            for point in points:
+                resultat = self.pricing(point.copy())
+                if isinstance(resultat, ResultatPricing):
+                    candidates = resultat.colonnes
+                    borne = None if resultat.borne is None else signe * resultat.borne
+                else:
+                    candidates = resultat
+                    borne = self._borne_lasdon(lp, point, candidates, signe)
+                if borne is not None:
+                    borne_connue = True
+                    if borne > meilleure_borne:
+                        meilleure_borne = borne
+                        centre = point
+                nouvelles = [col for col in candidates
+                             if self._ameliorante(col, y, signe) and self._cle(col) not in presentes]
+                if nouvelles:
+                    break
+            if centre is None or not borne_connue:
+                centre = points[0]
+            # Écart fermé : les colonnes restantes ne peuvent plus rien apporter
+            if valeur - meilleure_borne <= self.tolerance * max(1.0, abs(valeur)):
+                nouvelles = []
+
+            self.historique.append({'iteration': self.iterations, 'valeur': signe * valeur,
+                                    'borne': float(signe * meilleure_borne) if np.isfinite(meilleure_borne) else None,
+                                    'colonnes': len(nouvelles)})
+            if self.rapport is not None:
+                self.rapport(self.historique[-1])
+            if verbose:
+                borne_texte = '-' if self.historique[-1]['borne'] is None else f"{self.historique[-1]['borne']:.4f}"
+                print(f"   itération {self.iterations:>4} | maître {signe * valeur:>14.4f} | "
+                      f"borne {borne_texte:>14} | +{len(nouvelles)} colonnes")
+            if not nouvelles:
+                break
+
+            for colonne in nouvelles:
+                presentes.add(self._cle(colonne))
+                lp.ajouter_colonne(colonne.cout, colonne.coefficients, 0.0, colonne.borne_max,
+                                   colonne.nom or f"col{n_initiales + self.colonnes_ajoutees + 1}")
+                self.colonnes.append(colonne)
+                ages.append(0)
+            self.colonnes_ajoutees += len(nouvelles)
+
+            statut = lp.resoudre()
+            if statut == 'optimal':
+                ages = self._evincer(lp, n_initiales, ages)
+                presentes = initiales | {self._cle(col) for col in self.colonnes}
+            notifier(self.ecouteurs, 'pivot', self.iterations, f"+{len(nouvelles)}", '', False)
+
+        self.duales = lp.duales() if lp.statut == 'optimal' else None
+        solution = self._solution(lp, statut, meilleure_borne, signe)
+        notifier(self.ecouteurs, 'fin_resolution', solution.statut, self.iterations, chrono.total())
+        for ecouteur in self.ecouteurs:
+            if isinstance(ecouteur, CollecteurProfil):
+                ecouteur.attacher(solution)
+                break
+
+        if verbose:
+            print(f"{'✓' if solution.succes else '✗'} {solution.message} "
+                  f"({self.colonnes_ajoutees} colonnes générées, {self.colonnes_retirees} retirées)")
+        return solution
+
+    def _ameliorante(self, colonne: Colonne, duales: np.ndarray, signe: float) -> bool:
+        """
+        Coût réduit améliorant, à la tolérance près.
+
+        La tolérance est relative à la taille des termes du coût réduit : avec
+        des duales de l'ordre de 1e7 (pénalités du maître), une erreur
+        d'arrondi dépasse largement une tolérance absolue.
+        """
+        echelle = max(1.0, abs(colonne.cout), float(np.abs(duales) @ np.abs(colonne.coefficients)))
+        return signe * (colonne.cout - duales @ colonne.coefficients) < -self.tolerance * echelle
+
+    @staticmethod
+    def _cle(colonne: Colonne) -> tuple:
+        """Clé d'une colonne (coût et coefficients) pour repérer les doublons."""
+        return (float(colonne.cout), np.asarray(colonne.coefficients, dtype=float).tobytes())
+
+    def _borne_lasdon(self, lp: SimplexeStandard, duales: np.ndarray,
+                      candidates: List[Colonne], signe: float) -> Optional[float]:
+        """
+        Borne de Lasdon (forme min) : b^T y + kappa * min(0, plus petit coût réduit).
+
+        Valable pour des duales de signe correct (celles du maître et leurs
+        combinaisons convexes) et des colonnes de bornes [0, +inf).
+        """
+        if self.borne_somme is None:
+            return None
+        cout_reduit = signe * (lp.couts_reduits_pour(duales))
+        meilleur = min([0.0] + list(cout_reduit)
+                       + [signe * (col.cout - duales @ col.coefficients) for col in candidates])
+        return signe * float(lp.b @ duales) + self.borne_somme * meilleur
+
+    def _evincer(self, lp: SimplexeStandard, n_initiales: int, ages: List[int]) -> List[int]:
+        """Vieillit les colonnes générées hors base et retire les plus inutiles."""
+        position = lp.position[lp.structurelles[n_initiales:]]
+        ages = [0 if p == BASIQUE else age + 1 for p, age in zip(position, ages)]
+
+        retirer = set()
+        if self.age_max is not None:
+            retirer |= {k for k, age in enumerate(ages) if age > self.age_max}
+        if self.taille_max is not None and len(ages) - len(retirer) > self.taille_max:
+            restantes = sorted((k for k in range(len(ages)) if k not in retirer and ages[k] > 0),
+                               key=lambda k: -ages[k])
+            retirer |= set(restantes[:len(ages) - len(retirer) - self.taille_max])
+
+        for k in sorted(retirer, reverse=True):
+            if lp.supprimer_colonne(n_initiales + k):
+                del self.colonnes[k]
+                del ages[k]
+                self.colonnes_retirees += 1
+        return ages
+
+    def probleme_maitre(self) -> ProblemePL:
+        """
+        Problème maître final : colonnes initiales et colonnes générées gardées.
+
+        Utile pour résoudre ensuite le maître en nombres entiers.
+
+        Returns:
+            Une copie du problème initial complétée par les colonnes générées
+        """
+        probleme = copy.deepcopy(self.maitre)
+        n_ub = len(probleme.A_ub) if probleme.A_ub is not None else 0
+        noms = self.lp.noms_variables[len(self.maitre.c):]
+        for colonne, nom in zip(self.colonnes, noms):
+            coefficients = np.asarray(colonne.coefficients, dtype=float)
+            probleme.ajouter_variable(colonne.cout, coefficients[:n_ub], coefficients[n_ub:],
+                                      (0, colonne.borne_max), nom)
+        return probleme
+
+    def _solution(self, lp: SimplexeStandard, statut: str, meilleure_borne: float,
+                  signe: float) -> Solution:
+        """Construit la Solution du maître final."""
+        solution = Solution()
+        solution.noms_variables = list(lp.noms_variables)
+        solution.statut = statut
+        if statut in ('optimal', 'budget_epuise') and lp.statut == 'optimal':
+            solution.valeurs_variables = lp.valeurs()
+            solution.valeur_objectif = lp.valeur_objectif
+        if statut == 'optimal':
+            solution.succes = True
+            solution.message = "Solution optimale trouvée (plus aucune colonne intéressante)"
+        elif statut == 'budget_epuise':
+            if solution.valeurs_variables is not None and np.isfinite(meilleure_borne):
+                solution.ecart_optimalite = float(max(0.0, signe * lp.valeur_objectif - meilleure_borne))
+            solution.message = "Budget épuisé : solution du maître restreint courant"
+        elif statut == 'infaisable':
+            solution.message = "Le maître restreint n'a pas de solution (ajouter des colonnes initiales)"
+        elif statut == 'non_borne':
+            solution.message = "Le maître restreint n'est pas borné : solution infinie"
+        return solution
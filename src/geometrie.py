@@ -0,0 +1,270 @@
+"""
+geometrie.py
+------------
+Ce fichier contient les calculs géométriques pour le graphique 2D.
+
+La région réalisable d'un problème à 2 variables est l'intersection de
+demi-plans a·x <= b (contraintes, égalités vues comme deux inégalités,
+bornes des variables). On la calcule exactement en O(m log m) :
+    1. Trier les demi-plans par angle de leur droite frontière
+    2. Parcourir les demi-plans en gardant, dans une file à deux bouts,
+       ceux qui participent au bord de la région
+    3. Les sommets sont les intersections des droites consécutives
+
+Le coût du tracé dépend alors du nombre de sommets, pas d'une grille fixe.
+"""
+
+import math
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import ProblemePL
+
+# Un demi-plan a·x <= b est représenté par le triplet (a1, a2, b)
+DemiPlan = Tuple[float, float, float]
+Point = Tuple[float, float]
+Boite = Tuple[float, float, float, float]  # (x_min, x_max, y_min, y_max)
+
+EPSILON = 1e-9
+
+
+def demi_plans_probleme(probleme: ProblemePL) -> List[DemiPlan]:
+    """
+    Construit les demi-plans d'un problème à 2 variables.
+
+    Args:
+        probleme: Problème à exactement 2 variables
+
+    Returns:
+        Liste de demi-plans (a1, a2, b) représentant a1*x1 + a2*x2 <= b
+    """
+    demi_plans = []
+
+    if probleme.A_ub is not None:
+        for ligne, b in zip(probleme.A_ub, probleme.b_ub):
+            demi_plans.append((float(ligne[0]), float(ligne[1]), float(b)))
+
+    # Une égalité = deux inégalités de sens opposés
+    if probleme.A_eq is not None:
+        for ligne, b in zip(probleme.A_eq, probleme.b_eq):
+            demi_plans.append((float(ligne[0]), float(ligne[1]), float(b)))
+            demi_plans.append((-float(ligne[0]), -float(ligne[1]), -float(b)))
+
+    # Bornes sur les variables (par défaut >= 0)
+    bornes = probleme.bounds if probleme.bounds is not None else [(0, None), (0, None)]
+    for j, (borne_min, borne_max) in enumerate(bornes):
+        unitaire = (1.0, 0.0) if j == 0 else (0.0, 1.0)
+        if borne_min is not None:
+            demi_plans.append((-unitaire[0], -unitaire[1], -float(borne_min)))
+        if borne_max is not None:
+            demi_plans.append((unitaire[0], unitaire[1], float(borne_max)))
+
+    # Les contraintes 0*x1 + 0*x2 <= b ne définissent pas de droite
+    return [(a1, a2, b) for a1, a2, b in demi_plans if abs(a1) > EPSILON or abs(a2) > EPSILON]
+
+
+def demi_plans_boite(boite: Boite) -> List[DemiPlan]:
+    """Les 4 demi-plans d'une boîte (x_min, x_max, y_min, y_max)."""
+    x_min, x_max, y_min, y_max = boite
+    return [(-1.0, 0.0, -x_min), (1.0, 0.0, x_max), (0.0, -1.0, -y_min), (0.0, 1.0, y_max)]
+
+
+def _intersection(p: DemiPlan, q: DemiPlan) -> Optional[Point]:
+    """Point d'intersection des droites frontières (None si parallèles)."""
+    det = p[0] * q[1] - p[1] * q[0]
+    if abs(det) < EPSILON:
+        return None
+    return ((p[2] * q[1] - p[1] * q[2]) / det, (p[0] * q[2] - p[2] * q[0]) / det)
+
+
+def _dehors(demi_plan: DemiPlan, point: Point) -> bool:
+    """Indique si le point viole le demi-plan (avec une tolérance relative)."""
+    a1, a2, b = demi_plan
+    return a1 * point[0] + a2 * point[1] - b > EPSILON * max(1.0, abs(b), math.hypot(a1, a2))
+
+
+def intersection_demi_plans(demi_plans: Sequence[DemiPlan]) -> List[Point]:
+    """
+    Calcule le polygone intersection de demi-plans (région bornée).
+
+    Il faut que l'intersection soit bornée : ajouter les demi-plans d'une
+    boîte englobante (demi_plans_boite) si nécessaire.
+
+    Args:
+        demi_plans: Liste de demi-plans (a1, a2, b)
+
+    Returns:
+        Sommets du polygone dans le sens trigonométrique ([] si vide).
+        Un polygone aplati (segment, point) est possible avec des égalités.
+    """
+    # La droite a·x = b est orientée par d = (-a2, a1) : le demi-plan est à gauche
+    tries = sorted(
+        ((math.atan2(a1, -a2), (a1 / math.hypot(a1, a2), a2 / math.hypot(a1, a2),
+                                 b / math.hypot(a1, a2)))
+         for a1, a2, b in demi_plans),
+        key=lambda element: (element[0], element[1][2])
+    )
+
+    # Pour un même angle, seul le demi-plan le plus restrictif compte (plus petit b normalisé)
+    uniques: List[DemiPlan] = []
+    dernier_angle = None
+    for angle, demi_plan in tries:
+        if dernier_angle is not None and abs(angle - dernier_angle) < EPSILON:
+            continue
+        uniques.append(demi_plan)
+        dernier_angle = angle
+
+    file: deque = deque()
+    for demi_plan in uniques:
+        while len(file) >= 2:
+            point = _intersection(file[-1], file[-2])
+            if point is None or _dehors(demi_plan, point):
+                file.pop()
+            else:
+                break
+        while len(file) >= 2:
+            point = _intersection(file[0], file[1])
+            if point is None or _dehors(demi_plan, point):
+                file.popleft()
+            else:
+                break
+        file.append(demi_plan)
+
+    # Refermer le polygone : retirer les demi-plans inutiles aux deux bouts
+    while len(file) >= 3:
+        point = _intersection(file[-1], file[-2])
+        if point is None or _dehors(file[0], point):
+            file.pop()
+        else:
+            break
+    while len(file) >= 3:
+        point = _intersection(file[0], file[1])
+        if point is None or _dehors(file[-1], point):
+            file.popleft()
+        else:
+            break
+
+    if len(file) < 3:
+        return []
+
+    sommets = []
+    for i in range(len(file)):
+        point = _intersection(file[i], file[(i + 1) % len(file)])
+        if point is None:
+            return []
+        sommets.append(point)
+
+    # Vérification finale : tous les sommets respectent tous les demi-plans
+    for point in sommets:
+        if any(_dehors(demi_plan, point) for demi_plan in uniques):
+            return []
+
+    # Supprimer les sommets confondus (polygones aplatis)
+    resultat: List[Point] = []
+    for point in sommets:
+        if not resultat or math.dist(point, resultat[-1]) > 1e-7 * max(1.0, abs(point[0]), abs(point[1])):
+            resultat.append(point)
+    if len(resultat) > 1 and math.dist(resultat[0], resultat[-1]) <= 1e-7 * max(1.0, *map(abs, resultat[0])):
+        resultat.pop()
+    return resultat
+
+
+def boite_englobante(demi_plans: Sequence[DemiPlan],
+                     points: Sequence[Point] = (), marge: float = 0.15) -> Boite:
+    """
+    Calcule automatiquement la zone à afficher.
+
+    La boîte contient les sommets (bornés) de la région réalisable, les
+    intersections des contraintes avec les axes et les points donnés
+    (ex: la solution), avec une marge.
+
+    Args:
+        demi_plans: Demi-plans du problème
+        points: Points supplémentaires à inclure
+        marge: Marge relative ajoutée de chaque côté
+
+    Returns:
+        (x_min, x_max, y_min, y_max)
+    """
+    # Grande boîte pour rendre la région bornée (échelle tirée des données)
+    echelle = 1.0
+    for a1, a2, b in demi_plans:
+        norme = max(abs(a1), abs(a2))
+        echelle = max(echelle, abs(b) / norme)
+    grand = 1e3 * echelle
+
+    candidats: List[Point] = [(0.0, 0.0)] + list(points)
+
+    region = intersection_demi_plans(list(demi_plans) + demi_plans_boite((-grand, grand, -grand, grand)))
+    for x, y in region:
+        if abs(x) < grand * (1 - 1e-9) and abs(y) < grand * (1 - 1e-9):
+            candidats.append((x, y))
+
+    # Intersections des droites avec les axes
+    for a1, a2, b in demi_plans:
+        if abs(a1) > EPSILON:
+            candidats.append((b / a1, 0.0))
+        if abs(a2) > EPSILON:
+            candidats.append((0.0, b / a2))
+
+    xs = np.clip([p[0] for p in candidats], -grand, grand)
+    ys = np.clip([p[1] for p in candidats], -grand, grand)
+    x_min, x_max, y_min, y_max = xs.min(), xs.max(), ys.min(), ys.max()
+
+    largeur = max(x_max - x_min, 1.0)
+    hauteur = max(y_max - y_min, 1.0)
+    return (float(x_min - marge * largeur), float(x_max + marge * largeur),
+            float(y_min - marge * hauteur), float(y_max + marge * hauteur))
+
+
+def segment_dans_boite(demi_plan: DemiPlan, boite: Boite) -> Optional[Tuple[Point, Point]]:
+    """
+    Découpe la droite frontière d'un demi-plan par une boîte.
+
+    Args:
+        demi_plan: (a1, a2, b) pour la droite a1*x1 + a2*x2 = b
+        boite: (x_min, x_max, y_min, y_max)
+
+    Returns:
+        Les deux extrémités du segment visible, ou None si la droite ne
+        traverse pas la boîte
+    """
+    a1, a2, b = demi_plan
+    x_min, x_max, y_min, y_max = boite
+
+    # Paramétrage x = p + t*d (Liang-Barsky)
+    norme2 = a1 * a1 + a2 * a2
+    p = (a1 * b / norme2, a2 * b / norme2)
+    d = (-a2, a1)
+
+    t_min, t_max = -math.inf, math.inf
+    for dk, pk, bas, haut in ((d[0], p[0], x_min, x_max), (d[1], p[1], y_min, y_max)):
+        if abs(dk) < EPSILON:
+            if pk < bas or pk > haut:
+                return None
+            continue
+        t1, t2 = (bas - pk) / dk, (haut - pk) / dk
+        t_min, t_max = max(t_min, min(t1, t2)), min(t_max, max(t1, t2))
+
+    if t_min > t_max:
+        return None
+    return ((p[0] + t_min * d[0], p[1] + t_min * d[1]),
+            (p[0] + t_max * d[0], p[1] + t_max * d[1]))
+
+
+def region_realisable(probleme: ProblemePL, points: Sequence[Point] = ()) -> Tuple[List[Point], Boite]:
+    """
+    Calcule la région réalisable d'un problème à 2 variables et la zone à afficher.
+
+    Args:
+        probleme: Problème à 2 variables
+        points: Points à garder visibles (ex: la solution)
+
+    Returns:
+        (sommets du polygone découpé par la boîte, boîte)
+    """
+    demi_plans = demi_plans_probleme(probleme)
+    boite = boite_englobante(demi_plans, points)
+    return intersection_demi_plans(demi_plans + demi_plans_boite(boite)), boite
@@ -0,0 +1,322 @@
+"""
+gomory.py
+---------
+Ce fichier contient les coupes de Gomory mixtes entières (GMI).
+
+Une ligne du tableau optimal dont la variable de base est entière mais de
+valeur fractionnaire donne une coupe : une contrainte que toutes les
+solutions entières respectent, mais que la solution courante viole.
+
+Pour la ligne  x_i + somme_j a_j y_j = b  (y_j >= 0 : variables hors base
+décalées à leur borne, f0 = partie fractionnaire de b, f_j celle de a_j) :
+
+    somme_{j entière, f_j <= f0} f_j / f0 y_j
+  + somme_{j entière, f_j >  f0} (1 - f_j) / (1 - f0) y_j
+  + somme_{j continue, a_j > 0} a_j / f0 y_j
+  + somme_{j continue, a_j < 0} -a_j / (1 - f0) y_j   >= 1
+
+Les coupes sont ajoutées comme nouvelles lignes du SimplexeStandard, puis on
+réoptimise par le simplexe dual (la base reste dual-réalisable). Les coupes
+qui ne servent plus (écart de base et non nul pendant plusieurs tours) sont
+retirées.
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .budget import Budget
+from .simplexe import TableauSimplexe
+from .simplexe_standard import SimplexeStandard, BASIQUE, SUP
+
+# On ne coupe pas sur une ligne presque entière (coupe faible et instable)
+FRACTION_MIN = 0.01
+
+# Rapport maximum entre le plus grand et le plus petit coefficient d'une coupe
+DYNAMIQUE_MAX = 1e8
+
+
+def coupe_gmi(ligne: np.ndarray, valeur: float, entieres: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Calcule la coupe GMI d'une ligne du tableau.
+
+    Args:
+        ligne: Coefficients a_j des variables hors base décalées (y_j >= 0)
+        valeur: Valeur de la variable de base (second membre b)
+        entieres: Masque des variables y_j entières
+
+    Returns:
+        Coefficients pi de la coupe  pi^T y >= 1, ou None si b est presque entier
+    """
+    f0 = valeur - math.floor(valeur)
+    if f0 < FRACTION_MIN or f0 > 1 - FRACTION_MIN:
+        return None
+
+    f = ligne - np.floor(ligne)
+    pi = np.zeros_like(ligne)
+    petite = entieres & (f <= f0)
+    grande = entieres & (f > f0)
+    pi[petite] = f[petite] / f0
+    pi[grande] = (1 - f[grande]) / (1 - f0)
+    pi[~entieres & (ligne > 0)] = ligne[~entieres & (ligne > 0)] / f0
+    pi[~entieres & (ligne < 0)] = -ligne[~entieres & (ligne < 0)] / (1 - f0)
+    return pi
+
+
+def _tableau_apres_pivot(tableau: TableauSimplexe):
+    """
+    Lignes du tableau après son pivot.
+
+    Un tableau de SimplexeSolveur montre l'état avant le pivot de son
+    itération (variables entrante et sortante indiquées) : le dernier tableau
+    d'une résolution optimale a donc encore un pivot à appliquer.
+
+    Returns:
+        (matrice, colonne_c, vars_base, vars_hb)
+    """
+    matrice = np.array(tableau.matrice, dtype=float)
+    colonne_c = np.array(tableau.colonne_c, dtype=float)
+    vars_base, vars_hb = list(tableau.vars_base), list(tableau.vars_hb)
+    r, q = tableau.var_sortante_idx, tableau.var_entrante_idx
+    if r < 0 or q < 0:
+        return matrice, colonne_c, vars_base, vars_hb
+
+    # Même règle du rectangle que SimplexeSolveur (tableau condensé)
+    pivot = matrice[r, q]
+    colonne = matrice[:, q].copy()
+    matrice[r] /= pivot
+    colonne_c[r] /= pivot
+    for i in range(len(vars_base)):
+        if i != r:
+            colonne_c[i] -= colonne[i] * colonne_c[r]
+            matrice[i] -= colonne[i] * matrice[r]
+    matrice[:, q] = -colonne / pivot
+    matrice[r, q] = 1.0 / pivot
+    vars_base[r], vars_hb[q] = vars_hb[q], vars_base[r]
+    return matrice, colonne_c, vars_base, vars_hb
+
+
+def coupe_tableau(tableau: TableauSimplexe, variable: str,
+                  entieres: Set[str]) -> Optional[Tuple[Dict[str, float], float]]:
+    """
+    Coupe de Gomory lue sur un tableau de SimplexeSolveur (méthode du cours).
+
+    Dans ce tableau toutes les variables sont >= 0 et les variables hors base
+    valent 0 : après le pivot du tableau, la ligne de `variable` s'écrit
+        variable + somme_j matrice[i, j] * HB_j = C_i
+
+    Args:
+        tableau: Tableau final (optimal) du simplexe
+        variable: Nom d'une variable de base entière (ex: 'x1')
+        entieres: Noms des variables entières (les écarts peuvent en faire partie)
+
+    Returns:
+        ({nom hors base: coefficient}, 1.0) pour la coupe
+        somme coefficient * variable >= 1, ou None (variable hors base ou de
+        valeur presque entière)
+    """
+    matrice, colonne_c, vars_base, vars_hb = _tableau_apres_pivot(tableau)
+    if variable not in vars_base:
+        return None
+    i = vars_base.index(variable)
+    masque = np.array([nom in entieres for nom in vars_hb])
+    pi = coupe_gmi(matrice[i], float(colonne_c[i]), masque)
+    if pi is None:
+        return None
+    return {nom: float(coef) for nom, coef in zip(vars_hb, pi) if coef != 0}, 1.0
+
+
+class GenerateurGomory:
+    """
+    Plans coupants de Gomory sur un SimplexeStandard.
+
+    Exemple :
+        lp = SimplexeStandard.depuis_probleme(probleme)
+        generateur = GenerateurGomory()
+        generateur.renforcer(lp, probleme.indices_entiers())
+        # lp contient maintenant les coupes : sa relaxation est plus serrée
+    """
+
+    def __init__(self, max_tours: int = 20, max_coupes_par_tour: int = 50,
+                 age_max: int = 3, tolerance_entier: float = 1e-6,
+                 amelioration_min: float = 1e-4):
+        """
+        Initialise le générateur.
+
+        Args:
+            max_tours: Nombre maximum de tours (séparation + réoptimisation)
+            max_coupes_par_tour: Nombre maximum de coupes ajoutées par tour
+            age_max: Une coupe inactive pendant plus de age_max tours est retirée
+            tolerance_entier: Une valeur à moins de cette distance d'un entier
+                              est considérée comme entière
+            amelioration_min: On s'arrête quand la borne progresse de moins
+                              que cette fraction en un tour
+        """
+        self.max_tours = max_tours
+        self.max_coupes_par_tour = max_coupes_par_tour
+        self.age_max = age_max
+        self.tolerance_entier = tolerance_entier
+        self.amelioration_min = amelioration_min
+
+        # Coupes ajoutées au simplexe par le dernier renforcer() et encore
+        # présentes : {'ligne': indice, 'age': tours inactive}
+        self.coupes: List[dict] = []
+
+        # Statistiques de la dernière utilisation
+        self.tours = 0
+        self.coupes_ajoutees = 0
+        self.coupes_retirees = 0
+        self.bornes: List[float] = []
+
+    # ------------------------------------------------------------
+    # Séparation
+    # ------------------------------------------------------------
+
+    def _colonnes_entieres(self, lp: SimplexeStandard, entieres: Sequence[int]) -> np.ndarray:
+        """
+        Colonnes entières du simplexe : variables entières, et écarts des
+        lignes à coefficients et second membre entiers sur ces variables.
+        """
+        masque = np.zeros(lp.A.shape[1], dtype=bool)
+        masque[[lp.structurelles[j] for j in entieres]] = True
+
+        coefficients = lp.A[:, lp.structurelles]
+        sur_entieres = np.all((coefficients == 0) | masque[lp.structurelles], axis=1)
+        entiers = np.all(coefficients == np.round(coefficients), axis=1) & (lp.b == np.round(lp.b))
+        masque[np.array(lp.ecart_de_ligne, dtype=int)[sur_entieres & entiers]] = True
+
+        # Une variable décalée par une borne fractionnaire n'est plus entière
+        hors_base = lp.position != BASIQUE
+        decalage = np.where(lp.position == SUP, lp.sup, lp.inf)
+        fractionnaire = hors_base & np.isfinite(decalage) & (decalage != np.round(decalage))
+        return masque & ~fractionnaire
+
+    def separer(self, lp: SimplexeStandard, entieres: Sequence[int]) -> List[Tuple[np.ndarray, float]]:
+        """
+        Calcule les coupes GMI de la solution optimale courante.
+
+        Args:
+            lp: Simplexe résolu à l'optimum
+            entieres: Indices des variables entières
+
+        Returns:
+            Liste de coupes (coefficients sur les variables, second membre)
+            au sens coefficients . x >= second membre
+        """
+        x = lp.valeurs()
+        fractions = np.abs(x[entieres] - np.round(x[entieres])) if len(entieres) else np.zeros(0)
+        candidates = [entieres[k] for k in np.argsort(-fractions) if fractions[k] > self.tolerance_entier]
+        if not candidates:
+            return []
+
+        masque = self._colonnes_entieres(lp, entieres)
+        hors_base = lp.position != BASIQUE
+        signe = np.where(lp.position == SUP, -1.0, 1.0)
+        decalage = np.where(lp.position == SUP, lp.sup, lp.inf)
+        libres = hors_base & ~np.isfinite(decalage)
+        fixes = lp.inf == lp.sup
+
+        coupes = []
+        for variable in candidates:
+            ligne_valeur = lp.ligne_tableau(variable)
+            if ligne_valeur is None:
+                continue
+            ligne, valeur = ligne_valeur
+            ligne = np.where(hors_base & ~fixes, ligne * signe, 0.0)
+            if np.any(np.abs(ligne[libres]) > lp.tol):
+                continue  # Variable hors base sans borne : pas de décalage possible
+            ligne[np.abs(ligne) < lp.tol] = 0.0
+
+            pi = coupe_gmi(ligne, valeur, masque)
+            if pi is None:
+                continue
+            coupe = self._vers_variables(lp, pi, signe, decalage)
+            if coupe is not None:
+                coupes.append(coupe)
+            if len(coupes) >= self.max_coupes_par_tour:
+                break
+        return coupes
+
+    def _vers_variables(self, lp: SimplexeStandard, pi: np.ndarray, signe: np.ndarray,
+                        decalage: np.ndarray) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        Réécrit la coupe  pi^T y >= 1  sur les variables du problème :
+        y_j = signe_j (x_j - décalage_j), et chaque écart s_k = b_k - A_k x.
+        """
+        utiles = pi != 0
+        gamma = np.zeros_like(pi)
+        gamma[utiles] = pi[utiles] * signe[utiles]
+        second_membre = 1.0 + float(gamma[utiles] @ decalage[utiles])
+
+        ecarts = np.array(lp.ecart_de_ligne, dtype=int)
+        coefficients = gamma[lp.structurelles] - gamma[ecarts] @ lp.A[:, lp.structurelles]
+        second_membre -= float(gamma[ecarts] @ lp.b)
+
+        non_nuls = np.abs(coefficients[coefficients != 0])
+        if len(non_nuls) == 0 or non_nuls.max() > DYNAMIQUE_MAX * non_nuls.min():
+            return None
+
+        # La solution courante doit violer la coupe
+        violation = second_membre - coefficients @ lp.valeurs()
+        if violation <= 1e-6 * max(1.0, abs(second_membre)):
+            return None
+        echelle = non_nuls.max()
+        return coefficients / echelle, second_membre / echelle
+
+    # ------------------------------------------------------------
+    # Boucle de coupes
+    # ------------------------------------------------------------
+
+    def renforcer(self, lp: SimplexeStandard, entieres: Sequence[int],
+                  budget: Optional[Budget] = None) -> str:
+        """
+        Ajoute des tours de coupes à la relaxation et réoptimise.
+
+        Args:
+            lp: Simplexe du problème (modifié : reçoit les coupes)
+            entieres: Indices des variables entières
+            budget: Limite de temps / d'itérations de chaque réoptimisation
+
+        Returns:
+            Le statut de la dernière résolution
+        """
+        entieres = list(entieres)
+        self.coupes = []
+        self.tours, self.coupes_ajoutees, self.coupes_retirees = 0, 0, 0
+        statut = lp.statut if lp.statut == 'optimal' else lp.resoudre(budget)
+        self.bornes = [lp.valeur_objectif] if statut == 'optimal' else []
+
+        while statut == 'optimal' and self.tours < self.max_tours:
+            coupes = self.separer(lp, entieres)
+            if not coupes:
+                break
+            for coefficients, second_membre in coupes:
+                ligne = lp.ajouter_ligne(coefficients, second_membre, '>=')
+                self.coupes.append({'ligne': ligne, 'age': 0})
+            self.coupes_ajoutees += len(coupes)
+            self.tours += 1
+
+            statut = lp.resoudre(budget)
+            if statut != 'optimal':
+                break
+            self._retirer_inactives(lp)
+
+            self.bornes.append(lp.valeur_objectif)
+            progres = abs(self.bornes[-1] - self.bornes[-2])
+            if progres <= self.amelioration_min * max(1.0, abs(self.bornes[-2])):
+                break
+        return statut
+
+    def _retirer_inactives(self, lp: SimplexeStandard):
+        """Vieillit les coupes inactives et retire les plus anciennes."""
+        for coupe in sorted(self.coupes, key=lambda c: -c['ligne']):
+            ecart = lp.ecart_de_ligne[coupe['ligne']]
+            active = lp.position[ecart] != BASIQUE or lp.x[ecart] <= lp.tol
+            coupe['age'] = 0 if active else coupe['age'] + 1
+            if coupe['age'] > self.age_max and lp.supprimer_ligne(coupe['ligne']):
+                self.coupes.remove(coupe)
+                self.coupes_retirees += 1
+                for autre in self.coupes:
+                    if autre['ligne'] > coupe['ligne']:
+                        autre['ligne'] -= 1
@@ -0,0 +1,234 @@
+"""
+instrumentation.py
+------------------
+Ce fichier contient les hooks (écouteurs) des solveurs.
+
+Un écouteur est averti pendant la résolution :
+    - début et fin de la résolution
+    - durée de chaque phase (choix de la variable entrante, test du ratio,
+      application du pivot, sauvegarde du tableau...)
+    - chaque pivot (et s'il est dégénéré)
+    - mémoire occupée par les tableaux NumPy
+
+CollecteurProfil est un écouteur prêt à l'emploi qui agrège ces mesures
+par résolution ; le profil obtenu peut être attaché à une Solution.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+# Noms des phases mesurées
+PHASE_INITIALISATION = 'initialisation'  # Construction du tableau initial
+PHASE_PRICING = 'pricing'                # Choix de la variable entrante (ligne Δ)
+PHASE_RATIO = 'ratio'                    # Test du ratio (variable sortante)
+PHASE_PIVOT = 'pivot'                    # Application du pivot (règle du rectangle)
+PHASE_HISTORIQUE = 'historique'          # Copie du tableau pour l'affichage
+PHASE_POINT_REPRISE = 'point_reprise'    # Écriture d'un point de reprise sur disque
+PHASE_RESOLUTION = 'resolution'          # Appel global à un solveur externe (scipy)
+PHASE_CACHE = 'cache'                    # Solution lue dans le cache (aucun pivot)
+PHASE_PLUS_COURT_CHEMIN = 'plus_court_chemin'  # Recherche d'un chemin (flot à coût minimum)
+
+
+class EcouteurSolveur:
+    """
+    Interface des écouteurs de solveur.
+
+    Toutes les méthodes ne font rien par défaut : il suffit de redéfinir
+    celles qui nous intéressent.
+    """
+
+    def debut_resolution(self, moteur: str, n_variables: int, n_contraintes: int):
+        """Appelé au début d'une résolution."""
+
+    def fin_phase(self, phase: str, duree: float):
+        """Appelé à la fin d'une phase (durée en secondes)."""
+
+    def pivot(self, iteration: int, var_entrante: str, var_sortante: str, degenere: bool):
+        """Appelé après chaque pivot."""
+
+    def memoire(self, octets: int):
+        """Appelé avec la mémoire occupée par les tableaux NumPy."""
+
+    def fin_resolution(self, statut: str, iterations: int, duree: float):
+        """Appelé à la fin d'une résolution (durée totale en secondes)."""
+
+
+def notifier(ecouteurs: List[EcouteurSolveur], evenement: str, *args):
+    """
+    Transmet un événement à tous les écouteurs.
+
+    Args:
+        ecouteurs: Liste des écouteurs
+        evenement: Nom de la méthode à appeler (ex: 'fin_phase')
+        *args: Arguments de l'événement
+    """
+    for ecouteur in ecouteurs:
+        getattr(ecouteur, evenement)(*args)
+
+
+@dataclass
+class ProfilResolution:
+    """
+    Mesures agrégées d'une résolution.
+    """
+    # Moteur utilisé (ex: 'simplexe', 'scipy-highs')
+    moteur: str = ""
+
+    # Taille du problème
+    n_variables: int = 0
+    n_contraintes: int = 0
+
+    # Temps cumulé par phase (secondes)
+    temps_phases: Dict[str, float] = field(default_factory=dict)
+
+    # Nombre de pivots (itérations) et de pivots dégénérés (ratio nul)
+    nb_pivots: int = 0
+    nb_pivots_degeneres: int = 0
+
+    # Pic de mémoire des tableaux NumPy (octets)
+    memoire_max_octets: int = 0
+
+    # Durée totale (secondes) et statut final
+    duree_totale: float = 0.0
+    statut: str = ""
+
+    def vers_dict(self) -> dict:
+        """Convertit le profil en dictionnaire (pour l'export JSON)."""
+        return {
+            'moteur': self.moteur,
+            'n_variables': self.n_variables,
+            'n_contraintes': self.n_contraintes,
+            'temps_phases': dict(self.temps_phases),
+            'nb_pivots': self.nb_pivots,
+            'nb_pivots_degeneres': self.nb_pivots_degeneres,
+            'memoire_max_octets': self.memoire_max_octets,
+            'duree_totale': self.duree_totale,
+            'statut': self.statut,
+        }
+
+    def afficher(self) -> str:
+        """
+        Génère un résumé textuel du profil.
+
+        Returns:
+            Chaîne de caractères formatée
+        """
+        lignes = [
+            f"Profil ({self.moteur}) : {self.duree_totale * 1000:.2f} ms, statut {self.statut}",
+            f"  Pivots : {self.nb_pivots} (dont {self.nb_pivots_degeneres} dégénérés)",
+            f"  Mémoire max : {self.memoire_max_octets / 1024:.1f} Ko",
+        ]
+        for phase, duree in sorted(self.temps_phases.items(), key=lambda p: -p[1]):
+            part = 100 * duree / self.duree_totale if self.duree_totale > 0 else 0.0
+            lignes.append(f"  • {phase:<12} {duree * 1000:9.3f} ms ({part:5.1f} %)")
+        return "\n".join(lignes)
+
+
+class CollecteurProfil(EcouteurSolveur):
+    """
+    Écouteur qui construit un ProfilResolution par résolution.
+
+    Exemple :
+        collecteur = CollecteurProfil()
+        solveur = SimplexeSolveur(ecouteurs=[collecteur])
+        solveur.resoudre(c, A, b)
+        print(collecteur.dernier.afficher())
+    """
+
+    def __init__(self):
+        """Initialise le collecteur."""
+        self.profils: List[ProfilResolution] = []
+        self._courant: Optional[ProfilResolution] = None
+
+    @property
+    def dernier(self) -> Optional[ProfilResolution]:
+        """Profil de la dernière résolution terminée (None si aucune)."""
+        return self.profils[-1] if self.profils else None
+
+    def debut_resolution(self, moteur: str, n_variables: int, n_contraintes: int):
+        self._courant = ProfilResolution(moteur=moteur, n_variables=n_variables,
+                                         n_contraintes=n_contraintes)
+
+    def fin_phase(self, phase: str, duree: float):
+        if self._courant is not None:
+            phases = self._courant.temps_phases
+            phases[phase] = phases.get(phase, 0.0) + duree
+
+    def pivot(self, iteration: int, var_entrante: str, var_sortante: str, degenere: bool):
+        if self._courant is not None:
+            self._courant.nb_pivots += 1
+            if degenere:
+                self._courant.nb_pivots_degeneres += 1
+
+    def memoire(self, octets: int):
+        if self._courant is not None:
+            self._courant.memoire_max_octets = max(self._courant.memoire_max_octets, octets)
+
+    def fin_resolution(self, statut: str, iterations: int, duree: float):
+        if self._courant is None:
+            return
+        self._courant.statut = statut
+        self._courant.duree_totale = duree
+        # Les solveurs externes ne signalent pas les pivots un par un
+        self._courant.nb_pivots = max(self._courant.nb_pivots, iterations)
+        self.profils.append(self._courant)
+        self._courant = None
+
+    def attacher(self, solution) -> None:
+        """
+        Attache le dernier profil à une Solution (attribut `profil`).
+
+        Args:
+            solution: Instance de Solution
+        """
+        solution.profil = self.dernier
+
+    def total(self) -> ProfilResolution:
+        """
+        Agrège tous les profils collectés.
+
+        Returns:
+            Un ProfilResolution cumulé (mémoire = maximum)
+        """
+        total = ProfilResolution(moteur='total', statut=f"{len(self.profils)} résolution(s)")
+        for profil in self.profils:
+            for phase, duree in profil.temps_phases.items():
+                total.temps_phases[phase] = total.temps_phases.get(phase, 0.0) + duree
+            total.nb_pivots += profil.nb_pivots
+            total.nb_pivots_degeneres += profil.nb_pivots_degeneres
+            total.memoire_max_octets = max(total.memoire_max_octets, profil.memoire_max_octets)
+            total.duree_totale += profil.duree_totale
+        return total
+
+    def vider(self):
+        """Oublie les profils collectés."""
+        self.profils = []
+        self._courant = None
+
+
+class Chronometre:
+    """
+    Petit chronomètre pour mesurer les phases.
+
+    Exemple :
+        chrono = Chronometre()
+        ...                          # phase 1
+        duree = chrono.tour()        # durée de la phase 1
+    """
+
+    def __init__(self):
+        self._debut = time.perf_counter()
+        self._dernier = self._debut
+
+    def tour(self) -> float:
+        """Retourne le temps écoulé depuis le tour précédent."""
+        maintenant = time.perf_counter()
+        duree = maintenant - self._dernier
+        self._dernier = maintenant
+        return duree
+
+    def total(self) -> float:
+        """Retourne le temps écoulé depuis la création."""
+        return time.perf_counter() - self._debut
@@ -0,0 +1,167 @@
+"""
+lot.py
+------
+Ce fichier contient la résolution par lots de fichiers de modèles.
+
+Les modèles sont des fichiers .json (ProblemePL.vers_dict()) ou .npz
+(ProblemePL.vers_npz()). Ils sont résolus dans plusieurs processus et
+chaque résultat est rendu dès qu'il est prêt (dans l'ordre de fin, pas
+dans l'ordre des fichiers) : on peut écrire une ligne JSON par résultat
+sans attendre la fin du lot.
+
+    for resultat in resoudre_lot(lister_fichiers(["modeles/"]), 'scipy-highs', 4):
+        print(json.dumps(resultat))
+"""
+
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, List
+
+from .instrumentation import CollecteurProfil
+from .models import ProblemePL
+from .solver import SolveurPL
+
+EXTENSIONS = ('.json', '.npz')
+
+# Moteurs disponibles : les méthodes de linprog, puis nos moteurs
+MOTEURS = [f"scipy-{methode}" for methode in SolveurPL.METHODES] + ['simplexe-standard', 'branch-bound']
+
+
+def lister_fichiers(chemins: List[str]) -> List[str]:
+    """
+    Liste les fichiers de modèles.
+
+    Args:
+        chemins: Fichiers, répertoires (tous leurs .json / .npz) ou motifs
+                 glob (ex: "modeles/*.npz")
+
+    Returns:
+        Les fichiers trouvés, triés et sans doublon
+    """
+    fichiers = set()
+    for chemin in chemins:
+        if os.path.isdir(chemin):
+            for extension in EXTENSIONS:
+                fichiers.update(glob.glob(os.path.join(chemin, f"*{extension}")))
+        elif os.path.isfile(chemin):
+            fichiers.add(chemin)
+        else:
+            fichiers.update(f for f in glob.glob(chemin, recursive=True)
+                            if f.endswith(EXTENSIONS))
+    return sorted(fichiers)
+
+
+def charger_probleme(chemin: str) -> ProblemePL:
+    """
+    Lit un modèle (.json ou .npz).
+
+    Args:
+        chemin: Fichier du modèle
+
+    Returns:
+        Le ProblemePL
+    """
+    if chemin.endswith('.npz'):
+        with open(chemin, 'rb') as f:
+            return ProblemePL.depuis_npz(f.read())
+    with open(chemin, encoding='utf-8') as f:
+        return ProblemePL.depuis_dict(json.load(f))
+
+
+def enregistrer_probleme(probleme: ProblemePL, chemin: str):
+    """
+    Écrit un modèle (.json ou .npz, d'après l'extension).
+
+    Args:
+        probleme: Problème à écrire
+        chemin: Fichier de destination
+    """
+    if chemin.endswith('.npz'):
+        with open(chemin, 'wb') as f:
+            f.write(probleme.vers_npz())
+    else:
+        with open(chemin, 'w', encoding='utf-8') as f:
+            json.dump(probleme.vers_dict(), f, ensure_ascii=False)
+
+
+def _resoudre(probleme: ProblemePL, moteur: str) -> dict:
+    """Résout un problème avec le moteur donné : statut, objectif, iterations, message."""
+    if moteur.startswith('scipy-'):
+        collecteur = CollecteurProfil()
+        solveur = SolveurPL(ecouteurs=[collecteur])
+        solveur.methode = moteur[len('scipy-'):]
+        solution = solveur.resoudre(probleme)
+        iterations = collecteur.dernier.nb_pivots if collecteur.dernier else None
+    elif moteur == 'simplexe-standard':
+        from .simplexe_standard import SimplexeStandard
+        lp = SimplexeStandard.depuis_probleme(probleme)
+        statut = lp.resoudre()
+        return {'statut': statut, 'objectif': lp.valeur_objectif if statut == 'optimal' else None,
+                'iterations': lp.iterations, 'message': ''}
+    elif moteur == 'branch-bound':
+        from .branch_bound import BranchAndBound
+        solveur = BranchAndBound()
+        solution = solveur.resoudre(probleme)
+        iterations = solveur.iterations
+    else:
+        raise ValueError(f"Moteur inconnu : {moteur} (disponibles : {', '.join(MOTEURS)})")
+    return {'statut': solution.statut, 'objectif': solution.valeur_objectif,
+            'iterations': iterations, 'message': solution.message}
+
+
+def resoudre_fichier(chemin: str, moteur: str = 'scipy-highs') -> dict:
+    """
+    Lit et résout un modèle.
+
+    Args:
+        chemin: Fichier du modèle
+        moteur: Nom du moteur (voir MOTEURS)
+
+    Returns:
+        Résultat : fichier, moteur, statut, objectif, iterations, message,
+        temps_lecture, temps_resolution (secondes) ; une erreur donne le
+        statut 'erreur' au lieu d'interrompre le lot
+    """
+    resultat = {'fichier': chemin, 'moteur': moteur, 'statut': 'erreur', 'objectif': None,
+                'iterations': None, 'message': '', 'temps_lecture': None, 'temps_resolution': None}
+    try:
+        debut = time.perf_counter()
+        probleme = charger_probleme(chemin)
+        resultat['temps_lecture'] = time.perf_counter() - debut
+
+        debut = time.perf_counter()
+        resultat.update(_resoudre(probleme, moteur))
+        resultat['temps_resolution'] = time.perf_counter() - debut
+    except Exception as erreur:
+        resultat['message'] = str(erreur)
+    return resultat
+
+
+def resoudre_lot(fichiers: List[str], moteur: str = 'scipy-highs',
+                 n_processus: int = 1) -> Iterator[dict]:
+    """
+    Résout des modèles et rend chaque résultat dès qu'il est prêt.
+
+    Args:
+        fichiers: Fichiers des modèles (voir lister_fichiers)
+        moteur: Nom du moteur (voir MOTEURS)
+        n_processus: Nombre de processus (1 = dans le processus courant)
+
+    Yields:
+        Le résultat de resoudre_fichier() de chaque modèle, dans l'ordre de fin
+    """
+    if moteur not in MOTEURS:
+        raise ValueError(f"Moteur inconnu : {moteur} (disponibles : {', '.join(MOTEURS)})")
+
+    if n_processus <= 1:
+        for chemin in fichiers:
+            yield resoudre_fichier(chemin, moteur)
+        return
+
+    with ProcessPoolExecutor(n_processus) as executeur:
+        taches = [executeur.submit(resoudre_fichier, chemin, moteur) for chemin in fichiers]
+        for tache in as_completed(taches):
+            yield tache.result()
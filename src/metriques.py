@@ -0,0 +1,419 @@
+"""
+metriques.py
+------------
+Ce fichier contient un registre de métriques au format texte de Prometheus
+(compteurs, jauges, histogrammes), à activer au besoin.
+
+Rien n'est mesuré tant qu'on n'ajoute pas d'EcouteurMetriques aux solveurs :
+
+    registre = RegistreMetriques()
+    ecouteur = EcouteurMetriques(registre)
+    registre.suivre_cache(cache)                # Requêtes / défauts du cache
+    solveur = SimplexeSolveur(cache=cache, ecouteurs=[ecouteur])
+    ...
+    registre.servir(port=9464)                  # GET /metrics
+    registre.ecrire('/var/lib/node_exporter/pl.prom')   # ou fichier texte
+
+Métriques des résolutions (étiquette moteur) :
+    pl_resolutions_total{moteur, statut}     Résolutions par statut
+    pl_duree_resolution_secondes{moteur}     Histogramme des durées
+    pl_iterations_resolution{moteur}         Histogramme des itérations (pivots)
+    pl_pivots_degeneres_total{moteur}        Pivots dégénérés (ratio nul)
+    pl_memoire_historique_octets{moteur}     Histogramme de la mémoire des tableaux
+
+Une résolution servie par le cache (phase 'cache') est comptée dans
+pl_resolutions_total mais pas dans les histogrammes.
+"""
+
+import math
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .instrumentation import EcouteurSolveur, PHASE_CACHE
+
+TYPE_PROMETHEUS = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seuils des histogrammes (bornes supérieures des classes)
+SEUILS_DUREE = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0, 600.0)
+SEUILS_ITERATIONS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000, 50000)
+SEUILS_OCTETS = tuple(float(4 ** k) for k in range(5, 16))   # 1 Kio .. 1 Gio
+
+
+def _nombre(valeur: float) -> str:
+    """Écrit un nombre comme Prometheus (+Inf, -Inf, NaN)."""
+    if math.isnan(valeur):
+        return 'NaN'
+    if math.isinf(valeur):
+        return '+Inf' if valeur > 0 else '-Inf'
+    if float(valeur).is_integer() and abs(valeur) < 2 ** 53:
+        return str(int(valeur))
+    return repr(float(valeur))
+
+
+def _echapper(texte: str) -> str:
+    """Échappe une valeur d'étiquette."""
+    return texte.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _etiquettes(noms: Sequence[str], valeurs: Sequence[str], extra: str = '') -> str:
+    """Écrit {nom="valeur",...} (vide s'il n'y a pas d'étiquette)."""
+    paires = [f'{nom}="{_echapper(valeur)}"' for nom, valeur in zip(noms, valeurs)]
+    if extra:
+        paires.append(extra)
+    return '{' + ','.join(paires) + '}' if paires else ''
+
+
+# ============================================================
+# MÉTRIQUES
+# ============================================================
+
+class _Metrique(ABC):
+    """Métrique nommée, une valeur par combinaison d'étiquettes."""
+
+    type_prometheus = ''
+
+    def __init__(self, nom: str, aide: str, etiquettes: Sequence[str], verrou: threading.Lock):
+        self.nom = nom
+        self.aide = aide
+        self.etiquettes = tuple(etiquettes)
+        self._verrou = verrou
+        self._valeurs: Dict[Tuple[str, ...], object] = {}
+
+    def _cle(self, etiquettes: Dict[str, object]) -> Tuple[str, ...]:
+        if set(etiquettes) != set(self.etiquettes):
+            raise ValueError(f"{self.nom} attend les étiquettes {self.etiquettes}, "
+                             f"reçu {tuple(etiquettes)}!")
+        return tuple(str(etiquettes[nom]) for nom in self.etiquettes)
+
+    @abstractmethod
+    def _lignes(self) -> List[str]:
+        """Lignes des valeurs au format Prometheus (appelée sous le verrou)."""
+
+    def texte(self) -> str:
+        """Bloc HELP / TYPE / valeurs au format Prometheus."""
+        aide = self.aide.replace('\\', '\\\\').replace('\n', '\\n')
+        with self._verrou:
+            lignes = self._lignes()
+        return '\n'.join([f"# HELP {self.nom} {aide}", f"# TYPE {self.nom} {self.type_prometheus}"]
+                         + lignes)
+
+
+class Compteur(_Metrique):
+    """Valeur qui ne fait qu'augmenter (ex: nombre de résolutions)."""
+
+    type_prometheus = 'counter'
+
+    def incrementer(self, valeur: float = 1.0, **etiquettes):
+        """Ajoute valeur (>= 0)."""
+        if valeur < 0:
+            raise ValueError("Un compteur ne peut pas diminuer!")
+        cle = self._cle(etiquettes)
+        with self._verrou:
+            self._valeurs[cle] = self._valeurs.get(cle, 0.0) + valeur
+
+    def fixer(self, valeur: float, **etiquettes):
+        """Recopie un total compté ailleurs (ex: compteurs de CacheSolutions)."""
+        cle = self._cle(etiquettes)
+        with self._verrou:
+            self._valeurs[cle] = float(valeur)
+
+    def valeur(self, **etiquettes) -> float:
+        with self._verrou:
+            return self._valeurs.get(self._cle(etiquettes), 0.0)
+
+    def _lignes(self) -> List[str]:
+        return [f"{self.nom}{_etiquettes(self.etiquettes, cle)} {_nombre(valeur)}"
+                for cle, valeur in sorted(self._valeurs.items())]
+
+
+class Jauge(Compteur):
+    """Valeur qui monte et descend (ex: taux de hits du cache)."""
+
+    type_prometheus = 'gauge'
+
+    def incrementer(self, valeur: float = 1.0, **etiquettes):
+        cle = self._cle(etiquettes)
+        with self._verrou:
+            self._valeurs[cle] = self._valeurs.get(cle, 0.0) + valeur
+
+
+class Histogramme(_Metrique):
+    """Répartition d'observations en classes (ex: durées des résolutions)."""
+
+    type_prometheus = 'histogram'
+
+    def __init__(self, nom: str, aide: str, etiquettes: Sequence[str], verrou: threading.Lock,
+                 seuils: Sequence[float]):
+        super().__init__(nom, aide, etiquettes, verrou)
+        self.seuils = tuple(sorted(float(s) for s in seuils))
+
+    def observer(self, valeur: float, **etiquettes):
+        """Ajoute une observation."""
+        cle = self._cle(etiquettes)
+        with self._verrou:
+            if cle not in self._valeurs:
+                # Effectif de chaque classe (la dernière : au-delà du dernier seuil), somme
+                self._valeurs[cle] = [[0] * (len(self.seuils) + 1), 0.0]
+            effectifs, _ = self._valeurs[cle]
+            classe = next((k for k, seuil in enumerate(self.seuils) if valeur <= seuil),
+                          len(self.seuils))
+            effectifs[classe] += 1
+            self._valeurs[cle][1] += valeur
+
+    def nombre(self, **etiquettes) -> int:
+        """Nombre d'observations."""
+        with self._verrou:
+            donnees = self._valeurs.get(self._cle(etiquettes))
+            return sum(donnees[0]) if donnees else 0
+
+    def _lignes(self) -> List[str]:
+        lignes = []
+        for cle, (effectifs, somme) in sorted(self._valeurs.items()):
+            cumul = 0
+            for seuil, effectif in zip(self.seuils + (math.inf,), effectifs):
+                cumul += effectif
+                le = f'le="{_nombre(seuil)}"'
+                lignes.append(f"{self.nom}_bucket{_etiquettes(self.etiquettes, cle, le)} {cumul}")
+            lignes.append(f"{self.nom}_sum{_etiquettes(self.etiquettes, cle)} {_nombre(somme)}")
+            lignes.append(f"{self.nom}_count{_etiquettes(self.etiquettes, cle)} {cumul}")
+        return lignes
+
+
+# ============================================================
+# REGISTRE
+# ============================================================
+
+class RegistreMetriques:
+    """
+    Ensemble des métriques exportées.
+
+    Déclarer deux fois la même métrique (même nom, même type) renvoie la
+    première : on peut déclarer les métriques là où on s'en sert (ex: à
+    chaque relance d'un script Streamlit).
+    """
+
+    def __init__(self):
+        self._metriques: Dict[str, _Metrique] = {}
+        self._collecteurs: List[Callable[[], None]] = []
+        self._verrou = threading.Lock()
+
+    def _declarer(self, classe, nom: str, aide: str, etiquettes: Sequence[str], *args) -> _Metrique:
+        with self._verrou:
+            metrique = self._metriques.get(nom)
+            if metrique is None:
+                metrique = classe(nom, aide, etiquettes, threading.Lock(), *args)
+                self._metriques[nom] = metrique
+        if type(metrique) is not classe or metrique.etiquettes != tuple(etiquettes):
+            raise ValueError(f"La métrique {nom} existe déjà avec un autre type ou d'autres étiquettes!")
+        return metrique
+
+    def compteur(self, nom: str, aide: str, etiquettes: Sequence[str] = ()) -> Compteur:
+        """Déclare (ou retrouve) un compteur."""
+        return self._declarer(Compteur, nom, aide, etiquettes)
+
+    def jauge(self, nom: str, aide: str, etiquettes: Sequence[str] = ()) -> Jauge:
+        """Déclare (ou retrouve) une jauge."""
+        return self._declarer(Jauge, nom, aide, etiquettes)
+
+    def histogramme(self, nom: str, aide: str, etiquettes: Sequence[str] = (),
+                    seuils: Sequence[float] = SEUILS_DUREE) -> Histogramme:
+        """Déclare (ou retrouve) un histogramme (seuils : bornes supérieures des classes)."""
+        return self._declarer(Histogramme, nom, aide, etiquettes, seuils)
+
+    def ajouter_collecteur(self, collecteur: Callable[[], None]):
+        """Ajoute une fonction appelée juste avant chaque export (pour recopier des valeurs)."""
+        with self._verrou:
+            self._collecteurs.append(collecteur)
+
+    def compteurs_cache(self) -> Tuple[Compteur, Compteur]:
+        """
+        Compteurs des caches (étiquette cache) : requêtes et défauts.
+
+        Pour un cache sans statistiques (ex: cache de Streamlit), les
+        incrémenter soi-même ; le taux de hits est 1 - défauts / requêtes.
+        """
+        return (self.compteur('pl_cache_requetes_total', "Requêtes au cache", ('cache',)),
+                self.compteur('pl_cache_misses_total', "Requêtes sans résultat en cache", ('cache',)))
+
+    def suivre_cache(self, cache, nom: str = 'solutions'):
+        """
+        Exporte les compteurs d'un CacheSolutions (lus à chaque export).
+
+        Args:
+            cache: Le CacheSolutions
+            nom: Valeur de l'étiquette cache
+        """
+        requetes, defauts = self.compteurs_cache()
+        taux = self.jauge('pl_cache_taux_hits', "Part des requêtes servies par le cache", ('cache',))
+        entrees = self.jauge('pl_cache_entrees', "Entrées en mémoire", ('cache',))
+        octets = self.jauge('pl_cache_octets', "Taille des entrées en mémoire", ('cache',))
+
+        def collecter():
+            stats = cache.statistiques()
+            requetes.fixer(stats['hits'] + stats['misses'], cache=nom)
+            defauts.fixer(stats['misses'], cache=nom)
+            taux.fixer(stats['taux_hits'], cache=nom)
+            entrees.fixer(stats['entrees'], cache=nom)
+            octets.fixer(stats['octets'], cache=nom)
+        self.ajouter_collecteur(collecter)
+
+    def texte(self) -> str:
+        """Toutes les métriques au format texte de Prometheus."""
+        with self._verrou:
+            collecteurs = list(self._collecteurs)
+            metriques = sorted(self._metriques.values(), key=lambda m: m.nom)
+        for collecteur in collecteurs:
+            collecteur()
+        return ''.join(metrique.texte() + '\n' for metrique in metriques)
+
+    def ecrire(self, chemin: str):
+        """
+        Écrit les métriques dans un fichier (ex: pour le collecteur textfile
+        de node_exporter). Le fichier est remplacé d'un bloc : un lecteur ne
+        voit jamais un fichier à moitié écrit.
+        """
+        temporaire = f"{chemin}.tmp"
+        with open(temporaire, 'w', encoding='utf-8') as fichier:
+            fichier.write(self.texte())
+        os.replace(temporaire, chemin)
+
+    def servir(self, hote: str = '127.0.0.1', port: int = 9464) -> ThreadingHTTPServer:
+        """
+        Sert GET /metrics dans un thread (en arrière-plan).
+
+        Args:
+            hote: Adresse d'écoute (locale par défaut)
+            port: Port (0 = port libre choisi par le système)
+
+        Returns:
+            Le serveur HTTP (server_address donne le port ; shutdown() l'arrête)
+        """
+        serveur = ThreadingHTTPServer((hote, port), _GestionnaireMetriques)
+        serveur.daemon_threads = True
+        serveur.registre = self
+        threading.Thread(target=serveur.serve_forever, name='metriques', daemon=True).start()
+        return serveur
+
+
+class _GestionnaireMetriques(BaseHTTPRequestHandler):
+    """Répond à GET /metrics."""
+
+    def log_message(self, format, *args):
+        pass  # Pas de journal par requête
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        corps = self.server.registre.texte().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', TYPE_PROMETHEUS)
+        self.send_header('Content-Length', str(len(corps)))
+        self.end_headers()
+        self.wfile.write(corps)
+
+
+# ============================================================
+# ÉCOUTEUR DES SOLVEURS
+# ============================================================
+
+@dataclass
+class _ResolutionEnCours:
+    moteur: str
+    octets: int = 0
+    degeneres: int = 0
+    cache: bool = False
+
+
+class EcouteurMetriques(EcouteurSolveur):
+    """
+    Écouteur qui alimente les métriques des résolutions (voir en tête du fichier).
+
+    Un même écouteur peut être partagé entre solveurs et threads ; les
+    résolutions imbriquées (ex: branch-and-bound) sont comptées chacune
+    sous leur moteur.
+    """
+
+    def __init__(self, registre: Optional[RegistreMetriques] = None):
+        """
+        Initialise l'écouteur.
+
+        Args:
+            registre: Registre où déclarer les métriques (défaut : un registre neuf)
+        """
+        self.registre = registre if registre is not None else RegistreMetriques()
+        self.resolutions = self.registre.compteur(
+            'pl_resolutions_total', "Résolutions terminées", ('moteur', 'statut'))
+        self.durees = self.registre.histogramme(
+            'pl_duree_resolution_secondes', "Durée des résolutions", ('moteur',), SEUILS_DUREE)
+        self.iterations = self.registre.histogramme(
+            'pl_iterations_resolution', "Itérations (pivots) par résolution", ('moteur',),
+            SEUILS_ITERATIONS)
+        self.degeneres = self.registre.compteur(
+            'pl_pivots_degeneres_total', "Pivots dégénérés (ratio nul)", ('moteur',))
+        self.memoire_historique = self.registre.histogramme(
+            'pl_memoire_historique_octets', "Mémoire des tableaux (historique) par résolution",
+            ('moteur',), SEUILS_OCTETS)
+        self._local = threading.local()
+
+    def _en_cours(self) -> List[_ResolutionEnCours]:
+        pile = getattr(self._local, 'pile', None)
+        if pile is None:
+            pile = self._local.pile = []
+        return pile
+
+    def observer(self, moteur: str, statut: str, duree: float,
+                 iterations: Optional[int] = None, octets: Optional[int] = None,
+                 degeneres: int = 0):
+        """
+        Enregistre une résolution terminée.
+
+        Sert aussi pour les résolutions faites dans d'autres processus
+        (ex: résultats de resoudre_lot), où l'écouteur ne peut pas être passé.
+        """
+        self.resolutions.incrementer(moteur=moteur, statut=statut)
+        if duree is not None:
+            self.durees.observer(duree, moteur=moteur)
+        if iterations is not None:
+            self.iterations.observer(iterations, moteur=moteur)
+        if octets:
+            self.memoire_historique.observer(octets, moteur=moteur)
+        if degeneres:
+            self.degeneres.incrementer(degeneres, moteur=moteur)
+
+    # ------------------------------------------------------------
+    # Événements des solveurs
+    # ------------------------------------------------------------
+
+    def debut_resolution(self, moteur: str, n_variables: int, n_contraintes: int):
+        self._en_cours().append(_ResolutionEnCours(moteur))
+
+    def fin_phase(self, phase: str, duree: float):
+        pile = self._en_cours()
+        if pile and phase == PHASE_CACHE:
+            pile[-1].cache = True
+
+    def pivot(self, iteration: int, var_entrante: str, var_sortante: str, degenere: bool):
+        pile = self._en_cours()
+        if pile and degenere:
+            pile[-1].degeneres += 1
+
+    def memoire(self, octets: int):
+        pile = self._en_cours()
+        if pile:
+            pile[-1].octets = max(pile[-1].octets, octets)
+
+    def fin_resolution(self, statut: str, iterations: int, duree: float):
+        pile = self._en_cours()
+        if not pile:
+            return
+        resolution = pile.pop()
+        if resolution.cache:
+            self.observer(resolution.moteur, statut, None)
+            return
+        self.observer(resolution.moteur, statut, duree, iterations,
+                      resolution.octets, resolution.degeneres)
@@ -9,10 +9,16 @@ Un problème de programmation linéaire standard a la forme :
         A_ub * x <= b_ub  (contraintes d'inégalité)
         A_eq * x == b_eq  (contraintes d'égalité)
         bounds : limites sur les variables
+    Certaines variables peuvent être déclarées entières (ou binaires).
 """
 
+import io
+import json
+
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
+
+from .instrumentation import ProfilResolution
 
 
 class ProblemePL:
@@ -48,6 +54,10 @@ class ProblemePL:
         
         # Noms des variables pour un affichage plus clair
         self.noms_variables = []
+        
+        # Type de chaque variable : 'continue', 'entiere' ou 'binaire'
+        # (liste vide = toutes continues)
+        self.types_variables = []
     
     def definir_fonction_objectif(self, coefficients: List[float], maximiser: bool = True):
         """
@@ -118,6 +128,178 @@ class ProblemePL:
         """
         self.noms_variables = noms
     
+    def ajouter_variable(self, coefficient_objectif: float,
+                         coefficients_inegalite: Optional[List[float]] = None,
+                         coefficients_egalite: Optional[List[float]] = None,
+                         bornes: Tuple[Optional[float], Optional[float]] = (0, None),
+                         nom: Optional[str] = None):
+        """
+        Ajoute une variable (une colonne) à un problème déjà défini.
+        
+        Args:
+            coefficient_objectif: Coefficient de la variable dans l'objectif
+            coefficients_inegalite: Coefficient dans chaque contrainte <= (None = 0)
+            coefficients_egalite: Coefficient dans chaque contrainte = (None = 0)
+            bornes: (min, max) de la variable, None signifie pas de borne
+            nom: Nom de la variable (par défaut x<n>)
+        """
+        n = len(self.c)
+        self.c = np.append(self.c, coefficient_objectif)
+        if self.A_ub is not None:
+            colonne = np.zeros(len(self.A_ub)) if coefficients_inegalite is None else coefficients_inegalite
+            self.A_ub = np.column_stack([self.A_ub, colonne])
+        if self.A_eq is not None:
+            colonne = np.zeros(len(self.A_eq)) if coefficients_egalite is None else coefficients_egalite
+            self.A_eq = np.column_stack([self.A_eq, colonne])
+        
+        if self.bounds is not None or bornes != (0, None):
+            self.bounds = list(self.bounds) if self.bounds is not None else [(0, None)] * n
+            self.bounds.append(bornes)
+        if self.types_variables:
+            self.types_variables.append('continue')
+        self.noms_variables = list(self.noms_variables) + [nom or f'x{n+1}']
+    
+    def _indices(self, variables: List[Union[int, str]]) -> List[int]:
+        """Convertit des noms ou des indices de variables en indices."""
+        return [self.noms_variables.index(v) if isinstance(v, str) else int(v) for v in variables]
+    
+    def definir_variables_entieres(self, variables: List[Union[int, str]]):
+        """
+        Déclare des variables entières.
+        
+        Args:
+            variables: Indices (à partir de 0) ou noms des variables
+        """
+        if not self.types_variables:
+            self.types_variables = ['continue'] * len(self.c)
+        for j in self._indices(variables):
+            self.types_variables[j] = 'entiere'
+    
+    def definir_variables_binaires(self, variables: List[Union[int, str]]):
+        """
+        Déclare des variables binaires (entières entre 0 et 1).
+        
+        Args:
+            variables: Indices (à partir de 0) ou noms des variables
+        """
+        if not self.types_variables:
+            self.types_variables = ['continue'] * len(self.c)
+        if self.bounds is None:
+            self.bounds = [(0, None)] * len(self.c)
+        self.bounds = list(self.bounds)
+        for j in self._indices(variables):
+            self.types_variables[j] = 'binaire'
+            self.bounds[j] = (0, 1)
+    
+    def indices_entiers(self) -> List[int]:
+        """
+        Indices des variables entières (y compris binaires).
+        
+        Returns:
+            Liste d'indices (vide si le problème est continu)
+        """
+        return [j for j, t in enumerate(self.types_variables) if t != 'continue']
+    
+    def vers_dict(self) -> dict:
+        """
+        Convertit le problème en dictionnaire (listes Python, pour l'export JSON).
+        
+        Returns:
+            Dictionnaire accepté par ProblemePL.depuis_dict()
+        """
+        def liste(tableau):
+            return None if tableau is None else np.asarray(tableau, dtype=float).tolist()
+        
+        return {
+            'nom': self.nom,
+            'c': liste(self.c),
+            'type_optimisation': self.type_optimisation,
+            'A_ub': liste(self.A_ub),
+            'b_ub': liste(self.b_ub),
+            'A_eq': liste(self.A_eq),
+            'b_eq': liste(self.b_eq),
+            'bornes': None if self.bounds is None else [list(b) for b in self.bounds],
+            'noms_variables': list(self.noms_variables),
+            'types_variables': list(self.types_variables),
+        }
+    
+    @classmethod
+    def depuis_dict(cls, donnees: dict) -> 'ProblemePL':
+        """
+        Reconstruit un problème à partir de vers_dict() (ou d'un JSON équivalent).
+        
+        Args:
+            donnees: Dictionnaire avec au moins 'c' ; les autres clés sont optionnelles
+        
+        Returns:
+            Une instance de ProblemePL
+        """
+        if donnees.get('c') is None:
+            raise ValueError("La fonction objectif 'c' est obligatoire!")
+        
+        probleme = cls(donnees.get('nom', "Problème PL"))
+        probleme.definir_fonction_objectif(donnees['c'], donnees.get('type_optimisation', 'max') == 'max')
+        n = len(probleme.c)
+        for nom_A, nom_b in (('A_ub', 'b_ub'), ('A_eq', 'b_eq')):
+            if donnees.get(nom_A) is not None and len(donnees[nom_A]) > 0:
+                A = np.array(donnees[nom_A], dtype=float).reshape(-1, n)
+                b = np.array(donnees[nom_b], dtype=float)
+                if len(b) != len(A):
+                    raise ValueError(f"{nom_A} et {nom_b} n'ont pas le même nombre de lignes!")
+                setattr(probleme, nom_A, A)
+                setattr(probleme, nom_b, b)
+        if donnees.get('bornes') is not None:
+            if len(donnees['bornes']) != n:
+                raise ValueError("Il faut une borne (min, max) par variable!")
+            probleme.bounds = [tuple(b) for b in donnees['bornes']]
+        if donnees.get('noms_variables'):
+            probleme.noms_variables = list(donnees['noms_variables'])
+        if donnees.get('types_variables'):
+            probleme.types_variables = list(donnees['types_variables'])
+        return probleme
+    
+    def vers_npz(self) -> bytes:
+        """
+        Sérialise le problème au format binaire NumPy (.npz compressé).
+        
+        Plus compact et plus rapide à lire que le JSON pour les grandes matrices.
+        
+        Returns:
+            Contenu du fichier .npz
+        """
+        tableaux = {nom: np.asarray(getattr(self, nom), dtype=float)
+                    for nom in ('c', 'A_ub', 'b_ub', 'A_eq', 'b_eq') if getattr(self, nom) is not None}
+        if self.bounds is not None:
+            tableaux['bornes'] = np.array([[np.nan if v is None else v for v in b] for b in self.bounds],
+                                          dtype=float)
+        entete = {'nom': self.nom, 'type_optimisation': self.type_optimisation,
+                  'noms_variables': list(self.noms_variables),
+                  'types_variables': list(self.types_variables)}
+        tampon = io.BytesIO()
+        np.savez_compressed(tampon, entete=np.array(json.dumps(entete)), **tableaux)
+        return tampon.getvalue()
+    
+    @classmethod
+    def depuis_npz(cls, contenu: bytes) -> 'ProblemePL':
+        """
+        Reconstruit un problème à partir de vers_npz().
+        
+        Args:
+            contenu: Contenu d'un fichier .npz
+        
+        Returns:
+            Une instance de ProblemePL
+        """
+        with np.load(io.BytesIO(contenu), allow_pickle=False) as fichier:
+            donnees = json.loads(str(fichier['entete']))
+            for nom in ('c', 'A_ub', 'b_ub', 'A_eq', 'b_eq'):
+                if nom in fichier:
+                    donnees[nom] = fichier[nom]
+            if 'bornes' in fichier:
+                donnees['bornes'] = [tuple(None if np.isnan(v) else float(v) for v in b)
+                                     for b in fichier['bornes']]
+        return cls.depuis_dict(donnees)
+    
     def afficher_probleme(self):
         """
         Affiche une représentation textuelle du problème.
@@ -158,6 +340,12 @@ class ProblemePL:
                 max_str = f"{max_val:.2f}" if max_val is not None else "+∞"
                 print(f"  {min_str} <= {self.noms_variables[i]} <= {max_str}")
         
+        # Variables entières
+        for type_var, libelle in (('entiere', 'entières'), ('binaire', 'binaires')):
+            noms = [self.noms_variables[j] for j, t in enumerate(self.types_variables) if t == type_var]
+            if noms:
+                print(f"\nVariables {libelle} : {', '.join(noms)}")
+        
         print(f"\n{'='*60}\n")
 
 
@@ -173,6 +361,54 @@ class Solution:
         self.valeur_objectif = None
         self.message = ""
         self.noms_variables = []
+        
+        # Statut : 'optimal', 'infaisable', 'non_borne', 'budget_epuise',
+        # 'echec' ou 'erreur' ('non_resolu' tant qu'aucun solveur n'est passé)
+        self.statut = 'non_resolu'
+        
+        # Borne sur l'écart à l'optimum (budget épuisé uniquement)
+        self.ecart_optimalite = None
+        
+        # Profil de la résolution (ProfilResolution, si un CollecteurProfil est utilisé)
+        self.profil = None
+    
+    def vers_dict(self) -> dict:
+        """Convertit la solution en dictionnaire (pour l'export JSON)."""
+        return {
+            'succes': self.succes,
+            'statut': self.statut,
+            'message': self.message,
+            'valeur_objectif': None if self.valeur_objectif is None else float(self.valeur_objectif),
+            'valeurs_variables': (None if self.valeurs_variables is None
+                                  else np.asarray(self.valeurs_variables, dtype=float).tolist()),
+            'noms_variables': list(self.noms_variables),
+            'ecart_optimalite': None if self.ecart_optimalite is None else float(self.ecart_optimalite),
+            'profil': None if self.profil is None else self.profil.vers_dict(),
+        }
+    
+    @classmethod
+    def depuis_dict(cls, donnees: dict) -> 'Solution':
+        """
+        Reconstruit une solution à partir de vers_dict().
+        
+        Args:
+            donnees: Dictionnaire produit par vers_dict()
+        
+        Returns:
+            Une instance de Solution
+        """
+        solution = cls()
+        solution.succes = bool(donnees.get('succes', False))
+        solution.statut = donnees.get('statut', 'non_resolu')
+        solution.message = donnees.get('message', "")
+        solution.valeur_objectif = donnees.get('valeur_objectif')
+        if donnees.get('valeurs_variables') is not None:
+            solution.valeurs_variables = np.array(donnees['valeurs_variables'], dtype=float)
+        solution.noms_variables = list(donnees.get('noms_variables', []))
+        solution.ecart_optimalite = donnees.get('ecart_optimalite')
+        if donnees.get('profil') is not None:
+            solution.profil = ProfilResolution(**donnees['profil'])
+        return solution
     
     def afficher_solution(self):
         """Affiche la solution de manière formatée."""
@@ -187,6 +423,15 @@ class Solution:
             print(f"Valeur optimale : Z = {self.valeur_objectif:.4f}\n")
             
             # Valeurs des variables
+            print("Valeurs des variables :")
+            for nom, valeur in zip(self.noms_variables, self.valeurs_variables):
+                print(f"  {nom} = {valeur:.4f}")
+        elif self.statut == 'budget_epuise' and self.valeurs_variables is not None:
+            print("⏱ Budget épuisé - meilleure solution réalisable connue\n")
+            
+            print(f"Valeur courante : Z = {self.valeur_objectif:.4f}")
+            print(f"Écart à l'optimum : <= {self.ecart_optimalite:.4f}\n")
+            
             print("Valeurs des variables :")
             for nom, valeur in zip(self.noms_variables, self.valeurs_variables):
                 print(f"  {nom} = {valeur:.4f}")
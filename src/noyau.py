@@ -0,0 +1,248 @@
+"""
+noyau.py
+--------
+Ce fichier contient les noyaux de calcul d'une itération du simplexe du
+cours (SimplexeSolveur) : choix du pivot (Δ puis ratios) et règle du
+rectangle.
+
+Trois noyaux, qui donnent exactement les mêmes itérations (mêmes pivots,
+mêmes valeurs) :
+    - 'numpy'  : opérations vectorisées NumPy (toujours disponible)
+    - 'numba'  : boucles compilées par Numba (si Numba est installé) ; une
+                 itération entière tient en un seul appel compilé, sans les
+                 appels NumPy successifs qui coûtent cher sur les petits tableaux
+    - 'python' : les boucles du noyau Numba, non compilées (lent : sert de
+                 référence pour les tests quand Numba n'est pas installé)
+
+charger_noyau('auto') choisit Numba s'il est installé, NumPy sinon. Numba
+n'est importé (et le noyau compilé) qu'au premier chargement du noyau
+'numba' : importer ce module reste rapide.
+"""
+
+import importlib.util
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+NUMBA_DISPONIBLE = importlib.util.find_spec('numba') is not None
+
+# Résultat du choix du pivot
+PIVOT = 0
+OPTIMAL = 1
+NON_BORNE = 2
+
+
+# ============================================================
+# NOYAU NUMPY
+# ============================================================
+
+def _choisir_pivot_numpy(matrice, colonne_c, delta, ratios, masque):
+    """
+    Choisit le pivot : variable entrante (plus grand Δ > 0), puis sortante
+    (plus petit ratio C / colonne pour les coefficients > 0).
+
+    Returns:
+        (code, q, r) : code PIVOT, OPTIMAL ou NON_BORNE ; q colonne entrante, r ligne sortante
+    """
+    if len(delta) == 0 or delta.max() <= 0:
+        return OPTIMAL, -1, -1
+    q = int(np.argmax(delta))
+    colonne_entrante = matrice[:, q]
+    if len(colonne_c) == 0 or colonne_entrante.max() <= 0:
+        return NON_BORNE, q, -1
+
+    ratios.fill(np.inf)
+    np.greater(colonne_entrante, 0, out=masque)
+    np.divide(colonne_c, colonne_entrante, out=ratios, where=masque)
+    return PIVOT, q, int(np.argmin(ratios))
+
+
+def _appliquer_pivot_numpy(matrice, colonne_c, delta, r, q, valeur_z,
+                           colonne, facteurs, produit, ligne):
+    """
+    Règle du rectangle sur le pivot (r, q), en place.
+
+    Returns:
+        La nouvelle valeur de -Z
+    """
+    pivot = matrice[r, q]
+    ligne_pivot = matrice[r, :]
+    colonne_entrante = matrice[:, q]
+
+    # Colonne du pivot avant transformation (voir étape 4)
+    colonne[...] = colonne_entrante
+
+    # 1. Diviser la ligne du pivot par le pivot
+    np.divide(ligne_pivot, pivot, out=ligne_pivot)
+    colonne_c[r] /= pivot
+
+    # 2. Mettre à zéro les autres éléments de la colonne du pivot :
+    #    matrice -= facteurs ⊗ ligne du pivot (facteur nul sur la ligne du pivot)
+    facteurs[...] = colonne
+    facteurs[r] = 0.0
+    np.multiply(facteurs[:, None], ligne_pivot, out=produit)
+    np.subtract(matrice, produit, out=matrice)
+    np.multiply(facteurs, colonne_c[r], out=facteurs)
+    np.subtract(colonne_c, facteurs, out=colonne_c)
+
+    # 3. Mettre à jour la ligne Δ
+    facteur_delta = delta[q]
+    np.multiply(ligne_pivot, facteur_delta, out=ligne)
+    np.subtract(delta, ligne, out=delta)
+    valeur_z -= facteur_delta * colonne_c[r]
+
+    # 4. La colonne du pivot devient celle de la variable sortante :
+    #    1/pivot sur la ligne du pivot, -a/pivot ailleurs (et -Δ/pivot)
+    np.divide(colonne, -pivot, out=colonne_entrante)
+    matrice[r, q] = 1.0 / pivot
+    delta[q] = -facteur_delta / pivot
+    return valeur_z
+
+
+def _iterer_numpy(matrice, colonne_c, delta, ratios, masque, valeur_z,
+                  colonne, facteurs, produit, ligne):
+    """Choix du pivot puis règle du rectangle : (code, q, r, valeur_z)."""
+    code, q, r = _choisir_pivot_numpy(matrice, colonne_c, delta, ratios, masque)
+    if code == PIVOT:
+        valeur_z = _appliquer_pivot_numpy(matrice, colonne_c, delta, r, q, valeur_z,
+                                          colonne, facteurs, produit, ligne)
+    return code, q, r, valeur_z
+
+
+# ============================================================
+# NOYAU EN BOUCLES (compilé par Numba)
+# ============================================================
+# Mêmes opérations, dans le même ordre, que le noyau NumPy : les résultats
+# sont identiques au bit près (Numba ne fusionne pas a*b+c sans fastmath).
+
+def _choisir_pivot_boucles(matrice, colonne_c, delta, ratios, masque):
+    m, n = matrice.shape
+    q = -1
+    meilleur = 0.0
+    for j in range(n):
+        if delta[j] > meilleur:
+            meilleur = delta[j]
+            q = j
+    if q < 0:
+        return OPTIMAL, -1, -1
+
+    r = -1
+    plus_petit = np.inf
+    for i in range(m):
+        ratios[i] = np.inf
+        if matrice[i, q] > 0:
+            ratios[i] = colonne_c[i] / matrice[i, q]
+            if r < 0 or ratios[i] < plus_petit:
+                plus_petit = ratios[i]
+                r = i
+    if r < 0:
+        return NON_BORNE, q, -1
+    return PIVOT, q, r
+
+
+def _appliquer_pivot_boucles(matrice, colonne_c, delta, r, q, valeur_z,
+                             colonne, facteurs, produit, ligne):
+    m, n = matrice.shape
+    pivot = matrice[r, q]
+    for i in range(m):
+        colonne[i] = matrice[i, q]
+
+    for j in range(n):
+        matrice[r, j] = matrice[r, j] / pivot
+    colonne_c[r] = colonne_c[r] / pivot
+
+    for i in range(m):
+        if i != r:
+            facteur = colonne[i]
+            for j in range(n):
+                matrice[i, j] = matrice[i, j] - facteur * matrice[r, j]
+            colonne_c[i] = colonne_c[i] - facteur * colonne_c[r]
+
+    facteur_delta = delta[q]
+    for j in range(n):
+        delta[j] = delta[j] - matrice[r, j] * facteur_delta
+    valeur_z -= facteur_delta * colonne_c[r]
+
+    for i in range(m):
+        matrice[i, q] = colonne[i] / -pivot
+    matrice[r, q] = 1.0 / pivot
+    delta[q] = -facteur_delta / pivot
+    return valeur_z
+
+
+def _iterer_boucles(matrice, colonne_c, delta, ratios, masque, valeur_z,
+                    colonne, facteurs, produit, ligne):
+    """Itération complète (fusionnée en un seul appel une fois compilée)."""
+    code, q, r = _choisir_pivot_boucles(matrice, colonne_c, delta, ratios, masque)
+    if code == PIVOT:
+        valeur_z = _appliquer_pivot_boucles(matrice, colonne_c, delta, r, q, valeur_z,
+                                            colonne, facteurs, produit, ligne)
+    return code, q, r, valeur_z
+
+
+# ============================================================
+# CHOIX DU NOYAU
+# ============================================================
+
+@dataclass(frozen=True)
+class Noyau:
+    """Fonctions d'un noyau (mêmes signatures pour tous les noyaux)."""
+    nom: str
+    choisir_pivot: Callable
+    appliquer_pivot: Callable
+    iterer: Callable
+
+
+NOYAU_NUMPY = Noyau('numpy', _choisir_pivot_numpy, _appliquer_pivot_numpy, _iterer_numpy)
+NOYAU_PYTHON = Noyau('python', _choisir_pivot_boucles, _appliquer_pivot_boucles, _iterer_boucles)
+
+_noyau_numba = None
+
+
+def _compiler_numba() -> Noyau:
+    """
+    Compile les boucles avec Numba (une seule fois par processus).
+
+    Les trois fonctions sont mises en cache sur disque (cache=True) : les
+    processus suivants ne recompilent pas. _iterer_boucles appelle les deux
+    autres par leur nom global ; register_jitable les rend appelables depuis
+    le code compilé sans les remplacer pour le noyau 'python'.
+    """
+    global _noyau_numba
+    if _noyau_numba is None:
+        import numba
+        from numba.extending import register_jitable
+        register_jitable(_choisir_pivot_boucles)
+        register_jitable(_appliquer_pivot_boucles)
+        _noyau_numba = Noyau('numba',
+                             numba.njit(cache=True)(_choisir_pivot_boucles),
+                             numba.njit(cache=True)(_appliquer_pivot_boucles),
+                             numba.njit(cache=True)(_iterer_boucles))
+    return _noyau_numba
+
+
+def charger_noyau(nom: str = 'auto') -> Noyau:
+    """
+    Retourne un noyau.
+
+    Args:
+        nom: 'auto' (Numba s'il est installé, NumPy sinon), 'numpy', 'numba' ou 'python'
+
+    Returns:
+        Le Noyau
+
+    Raises:
+        ValueError: Nom inconnu, ou 'numba' demandé sans Numba installé
+    """
+    if nom == 'auto':
+        nom = 'numba' if NUMBA_DISPONIBLE else 'numpy'
+    if nom == 'numpy':
+        return NOYAU_NUMPY
+    if nom == 'python':
+        return NOYAU_PYTHON
+    if nom == 'numba':
+        if not NUMBA_DISPONIBLE:
+            raise ValueError("Le noyau 'numba' demande Numba (pip install numba)!")
+        return _compiler_numba()
+    raise ValueError(f"Noyau inconnu : {nom} ('auto', 'numpy', 'numba' ou 'python')")
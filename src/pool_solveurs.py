@@ -0,0 +1,112 @@
+"""
+pool_solveurs.py
+----------------
+Ce fichier contient un pool de threads et de solveurs réutilisables.
+
+Un solveur garde sa configuration (cache, écouteurs, tampons préalloués...)
+d'une résolution à l'autre. On peut donc le réutiliser, mais pas dans deux
+threads à la fois : ses écouteurs (ex: CollecteurProfil) ne sont pas prévus
+pour ça. Le pool crée n solveurs et les prête aux threads : chaque
+résolution emprunte un solveur libre et le rend à la fin.
+
+    with PoolSolveurs(SimplexeSolveur, n_threads=4) as pool:
+        futures = [pool.resoudre(c, A, b) for c, A, b in problemes]
+        resultats = [f.result() for f in futures]
+"""
+
+import os
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+class PoolSolveurs:
+    """
+    Pool de threads, chacun résolvant avec un solveur emprunté au pool.
+    """
+
+    def __init__(self, fabrique: Optional[Callable[[], Any]] = None,
+                 n_threads: Optional[int] = None):
+        """
+        Initialise le pool (les solveurs sont créés tout de suite).
+
+        Args:
+            fabrique: Fonction sans argument qui crée un solveur
+                      (défaut : SimplexeSolveur)
+            n_threads: Nombre de threads et de solveurs
+                       (défaut : nombre de processeurs)
+        """
+        if fabrique is None:
+            from .simplexe import SimplexeSolveur
+            fabrique = SimplexeSolveur
+        if n_threads is None:
+            n_threads = os.cpu_count() or 1
+        if n_threads < 1:
+            raise ValueError("n_threads doit être au moins 1!")
+
+        self.n_threads = n_threads
+        self.solveurs = [fabrique() for _ in range(n_threads)]
+        self._libres: queue.Queue = queue.Queue()
+        for solveur in self.solveurs:
+            self._libres.put(solveur)
+        self._executeur = ThreadPoolExecutor(n_threads, thread_name_prefix='solveur')
+
+    @contextmanager
+    def emprunter(self):
+        """
+        Emprunte un solveur libre (attend si tous sont occupés).
+
+        Exemple :
+            with pool.emprunter() as solveur:
+                resultat = solveur.resoudre(c, A, b)
+        """
+        solveur = self._libres.get()
+        try:
+            yield solveur
+        finally:
+            self._libres.put(solveur)
+
+    def soumettre(self, fonction: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Exécute fonction(solveur, *args, **kwargs) dans un thread du pool.
+
+        Args:
+            fonction: Fonction recevant le solveur emprunté en premier argument
+
+        Returns:
+            Future du résultat de la fonction
+        """
+        def tache():
+            with self.emprunter() as solveur:
+                return fonction(solveur, *args, **kwargs)
+        return self._executeur.submit(tache)
+
+    def resoudre(self, *args, **kwargs) -> Future:
+        """
+        Appelle solveur.resoudre(*args, **kwargs) dans un thread du pool.
+
+        Returns:
+            Future du résultat (ex: ResultatSimplexe pour SimplexeSolveur,
+            Solution pour SolveurPL)
+        """
+        return self.soumettre(lambda solveur: solveur.resoudre(*args, **kwargs))
+
+    def map(self, fonction: Callable[..., Any], *iterables: Iterable) -> Iterator:
+        """
+        Comme Executor.map : fonction(solveur, *elements) pour chaque élément,
+        résultats dans l'ordre des éléments.
+        """
+        futures = [self.soumettre(fonction, *elements) for elements in zip(*iterables)]
+        for future in futures:
+            yield future.result()
+
+    def fermer(self, attendre: bool = True):
+        """Arrête les threads (après les tâches en cours si attendre est True)."""
+        self._executeur.shutdown(wait=attendre)
+
+    def __enter__(self) -> 'PoolSolveurs':
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
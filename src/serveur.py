@@ -0,0 +1,555 @@
+"""
+serveur.py
+----------
+Ce fichier contient un serveur HTTP local de résolution.
+
+    python -m src.serveur --port 8000 --processus 4
+
+Points d'entrée :
+    POST /resoudre    Corps JSON (ProblemePL.vers_dict()) ou binaire
+                      (Content-Type: application/x-npz, ProblemePL.vers_npz())
+                      -> Solution.vers_dict() en JSON
+    GET  /sante       État du serveur (processus prêts, file d'attente)
+    GET  /metriques   Compteurs et latences (p50, p95, p99)
+
+Fonctionnement :
+    - un pool de processus de calcul, « préchauffés » au démarrage (SciPy
+      importé et une première résolution faite) : la première requête ne
+      paie pas ces coûts
+    - les petites requêtes qui arrivent ensemble sont regroupées en lots
+      (micro-batching) : un seul aller-retour vers un processus pour
+      plusieurs problèmes
+    - la file d'attente est bornée : quand elle est pleine, le serveur répond
+      tout de suite 503 (avec Retry-After) au lieu d'accumuler du retard ;
+      le nombre de lots en cours de calcul est lui aussi limité
+    - si un processus de calcul meurt (mémoire, signal...), le pool est
+      recréé en arrière-plan ; pendant ce temps /sante répond 503 et les
+      lots attendent le nouveau pool
+"""
+
+import argparse
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+from urllib import request as urllib_request
+
+import numpy as np
+
+from .models import ProblemePL, Solution
+
+TYPE_JSON = 'application/json'
+TYPE_NPZ = 'application/x-npz'
+
+# Un problème est « petit » (regroupable) si variables x contraintes <= SEUIL_PETIT
+SEUIL_PETIT = 10_000
+
+# Nombre de latences gardées pour les percentiles
+FENETRE_LATENCES = 1000
+
+
+# ============================================================
+# PROCESSUS DE CALCUL
+# ============================================================
+
+def _prechauffer():
+    """Importe SciPy et fait une première résolution dans le processus de calcul."""
+    from .solver import SolveurPL
+    probleme = ProblemePL("Préchauffage")
+    probleme.definir_fonction_objectif([1.0, 1.0])
+    probleme.ajouter_contrainte_inegalite([1.0, 1.0], 1.0)
+    SolveurPL().resoudre(probleme)
+
+
+def _pret() -> bool:
+    """Tâche vide : le processus est démarré et préchauffé."""
+    return True
+
+
+def _resoudre_lot(problemes: List[dict]) -> List[dict]:
+    """
+    Résout un lot de problèmes dans un processus de calcul.
+
+    Args:
+        problemes: Problèmes au format ProblemePL.vers_dict()
+
+    Returns:
+        Solutions au format Solution.vers_dict() (une erreur ne touche que son problème)
+    """
+    from .solver import SolveurPL
+    solveur = SolveurPL()
+    resultats = []
+    for donnees in problemes:
+        try:
+            resultats.append(solveur.resoudre(ProblemePL.depuis_dict(donnees)).vers_dict())
+        except Exception as erreur:
+            solution = Solution()
+            solution.statut = 'erreur'
+            solution.message = str(erreur)
+            resultats.append(solution.vers_dict())
+    return resultats
+
+
+# ============================================================
+# MÉTRIQUES
+# ============================================================
+
+@dataclass
+class MetriquesServeur:
+    """Compteurs du serveur (protégés par un verrou : plusieurs threads)."""
+    requetes: int = 0
+    reussies: int = 0
+    rejetees: int = 0          # File pleine (503)
+    erreurs: int = 0           # Requête invalide ou erreur de calcul
+    delais_depasses: int = 0   # Pas de réponse à temps (504)
+    redemarrages: int = 0      # Pools recréés après la mort d'un processus
+    lots: int = 0
+    problemes_en_lot: int = 0
+    latences: deque = field(default_factory=lambda: deque(maxlen=FENETRE_LATENCES))
+    verrou: threading.Lock = field(default_factory=threading.Lock)
+    debut: float = field(default_factory=time.perf_counter)
+
+    def compter(self, nom: str, valeur: int = 1):
+        with self.verrou:
+            setattr(self, nom, getattr(self, nom) + valeur)
+
+    def ajouter_latence(self, secondes: float):
+        with self.verrou:
+            self.latences.append(secondes)
+
+    def vers_dict(self) -> dict:
+        """Photographie des métriques (pour /metriques)."""
+        with self.verrou:
+            latences = np.array(self.latences) * 1000
+            resultat = {
+                'requetes': self.requetes,
+                'reussies': self.reussies,
+                'rejetees': self.rejetees,
+                'erreurs': self.erreurs,
+                'delais_depasses': self.delais_depasses,
+                'redemarrages': self.redemarrages,
+                'lots': self.lots,
+                'taille_moyenne_lot': self.problemes_en_lot / self.lots if self.lots else 0.0,
+                'duree_fonctionnement_s': time.perf_counter() - self.debut,
+            }
+        for p in (50, 95, 99):
+            resultat[f'latence_p{p}_ms'] = float(np.percentile(latences, p)) if len(latences) else None
+        return resultat
+
+
+@dataclass
+class _Requete:
+    """Requête en attente : le problème et le Future de sa réponse."""
+    probleme: dict
+    petit: bool
+    reponse: Future = field(default_factory=Future)
+
+
+# ============================================================
+# SERVEUR
+# ============================================================
+
+class ServeurSolveur:
+    """
+    Serveur HTTP local de résolution.
+
+    Exemple :
+        with ServeurSolveur(port=0, n_processus=2) as serveur:
+            solution = resoudre_distant(probleme, serveur.url)
+    """
+
+    def __init__(self, hote: str = '127.0.0.1', port: int = 8000, n_processus: int = 2,
+                 taille_lot: int = 16, attente_lot: float = 0.002, taille_file: int = 256,
+                 lots_en_cours: Optional[int] = None, delai_reponse: float = 60.0):
+        """
+        Initialise le serveur (il démarre avec demarrer()).
+
+        Args:
+            hote: Adresse d'écoute (locale par défaut)
+            port: Port d'écoute (0 = port libre choisi par le système)
+            n_processus: Nombre de processus de calcul
+            taille_lot: Nombre maximum de petits problèmes par lot
+            attente_lot: Temps d'attente maximum (s) pour compléter un lot
+            taille_file: Nombre maximum de requêtes en attente (au-delà : 503)
+            lots_en_cours: Nombre maximum de lots envoyés aux processus et pas
+                           encore terminés (défaut : 2 par processus)
+            delai_reponse: Temps maximum (s) d'attente d'une réponse (au-delà : 504)
+        """
+        if n_processus < 1:
+            raise ValueError("n_processus doit être au moins 1!")
+
+        self.hote = hote
+        self.port = port
+        self.n_processus = n_processus
+        self.taille_lot = taille_lot
+        self.attente_lot = attente_lot
+        self.delai_reponse = delai_reponse
+        self.file: queue.Queue = queue.Queue(maxsize=taille_file)
+        self._places = threading.BoundedSemaphore(lots_en_cours or 2 * n_processus)
+        self.metriques = MetriquesServeur()
+
+        self._executeur: Optional[ProcessPoolExecutor] = None
+        self._pool_pret = threading.Event()
+        self._verrou_pool = threading.Lock()
+        self._http: Optional[ThreadingHTTPServer] = None
+        self._threads: List[threading.Thread] = []
+        self._arret = threading.Event()
+        self.processus_prets = 0
+
+    @property
+    def url(self) -> str:
+        """Adresse du serveur (ex: http://127.0.0.1:8000)."""
+        return f"http://{self.hote}:{self.port}"
+
+    # ------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------
+
+    def demarrer(self) -> 'ServeurSolveur':
+        """
+        Démarre les processus (préchauffés), le regroupement en lots et le
+        serveur HTTP, chacun dans son thread.
+
+        Returns:
+            Le serveur (pour enchaîner : serveur = ServeurSolveur().demarrer())
+        """
+        self._executeur = self._creer_pool()
+        self.processus_prets = self.n_processus
+        self._pool_pret.set()
+
+        self._http = ThreadingHTTPServer((self.hote, self.port), _GestionnaireHTTP)
+        self._http.daemon_threads = True
+        self._http.serveur_solveur = self
+        self.port = self._http.server_address[1]
+
+        self._arret.clear()
+        self._threads = [
+            threading.Thread(target=self._regrouper, name='regroupement', daemon=True),
+            threading.Thread(target=self._http.serve_forever, name='http', daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def arreter(self):
+        """Arrête le serveur HTTP, le regroupement et les processus."""
+        self._arret.set()
+        if self._http is not None:
+            self._http.shutdown()
+            self._http.server_close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        with self._verrou_pool:
+            self._pool_pret.clear()
+            if self._executeur is not None:
+                self._executeur.shutdown(cancel_futures=True)
+        self.processus_prets = 0
+
+        # Les requêtes restées dans la file ne seront pas traitées
+        while True:
+            try:
+                self.file.get_nowait().reponse.set_exception(RuntimeError("Serveur arrêté"))
+            except queue.Empty:
+                break
+
+    def __enter__(self) -> 'ServeurSolveur':
+        return self.demarrer()
+
+    def __exit__(self, *exc):
+        self.arreter()
+
+    def servir(self):
+        """Démarre le serveur et bloque jusqu'à Ctrl+C."""
+        self.demarrer()
+        print(f"🚀 Serveur prêt sur {self.url} ({self.n_processus} processus)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print("\nArrêt du serveur...")
+        finally:
+            self.arreter()
+
+    # ------------------------------------------------------------
+    # Pool de processus
+    # ------------------------------------------------------------
+
+    def _creer_pool(self) -> ProcessPoolExecutor:
+        """Crée le pool de processus et attend qu'ils soient tous préchauffés."""
+        executeur = ProcessPoolExecutor(self.n_processus, initializer=_prechauffer)
+        # Une tâche par processus : ils sont tous démarrés et préchauffés au retour
+        for tache in [executeur.submit(_pret) for _ in range(self.n_processus)]:
+            tache.result()
+        return executeur
+
+    def _signaler_panne(self, executeur: ProcessPoolExecutor):
+        """
+        Un processus du pool est mort (BrokenProcessPool) : le pool est
+        inutilisable, on le recrée dans un thread (une seule fois par pool).
+        """
+        with self._verrou_pool:
+            if executeur is not self._executeur or not self._pool_pret.is_set() or self._arret.is_set():
+                return
+            self._pool_pret.clear()
+            self.processus_prets = 0
+        self.metriques.compter('redemarrages')
+        threading.Thread(target=self._recreer_pool, args=(executeur,),
+                         name='redemarrage-pool', daemon=True).start()
+
+    def _recreer_pool(self, ancien: ProcessPoolExecutor):
+        """Remplace un pool cassé (on réessaie tant que le serveur tourne)."""
+        ancien.shutdown(wait=False, cancel_futures=True)
+        while not self._arret.is_set():
+            try:
+                nouveau = self._creer_pool()
+            except Exception:
+                time.sleep(1.0)
+                continue
+            with self._verrou_pool:
+                if self._arret.is_set():
+                    nouveau.shutdown(cancel_futures=True)
+                    return
+                self._executeur = nouveau
+                self.processus_prets = self.n_processus
+                self._pool_pret.set()
+            return
+
+    # ------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------
+
+    def soumettre(self, probleme: ProblemePL) -> Future:
+        """
+        Met un problème dans la file.
+
+        Args:
+            probleme: Problème à résoudre
+
+        Returns:
+            Future dont le résultat est Solution.vers_dict()
+
+        Raises:
+            queue.Full: File pleine (le serveur HTTP répond alors 503)
+        """
+        n_contraintes = sum(len(b) for b in (probleme.b_ub, probleme.b_eq) if b is not None)
+        requete = _Requete(probleme.vers_dict(), len(probleme.c) * max(1, n_contraintes) <= SEUIL_PETIT)
+        self.file.put_nowait(requete)
+        return requete.reponse
+
+    def _regrouper(self):
+        """
+        Thread de regroupement : forme des lots de petits problèmes arrivés
+        presque en même temps et les envoie aux processus.
+        """
+        en_attente: Optional[_Requete] = None
+        while not self._arret.is_set():
+            if en_attente is None:
+                try:
+                    en_attente = self.file.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            lot, en_attente = [en_attente], None
+
+            # Un gros problème part seul ; les petits attendent brièvement des voisins
+            limite = time.perf_counter() + self.attente_lot
+            while lot[0].petit and len(lot) < self.taille_lot:
+                reste = limite - time.perf_counter()
+                try:
+                    suivante = self.file.get(timeout=reste) if reste > 0 else self.file.get_nowait()
+                except queue.Empty:
+                    break
+                if not suivante.petit:
+                    en_attente = suivante
+                    break
+                lot.append(suivante)
+
+            if not self._envoyer(lot):
+                return
+
+    def _envoyer(self, lot: List[_Requete]) -> bool:
+        """
+        Envoie un lot aux processus.
+
+        Returns:
+            False si le serveur s'arrête (les requêtes du lot reçoivent une erreur)
+        """
+        while True:
+            # Pool en état de marche, puis contre-pression : pas plus de lots en cours que de places
+            while not (self._pool_pret.wait(timeout=0.1) and self._places.acquire(timeout=0.1)):
+                if self._arret.is_set():
+                    for requete in lot:
+                        requete.reponse.set_exception(RuntimeError("Serveur arrêté"))
+                    return False
+            executeur = self._executeur
+            try:
+                tache = executeur.submit(_resoudre_lot, [r.probleme for r in lot])
+            except BrokenProcessPool:
+                # Processus mort depuis le lot précédent : rien n'a été calculé,
+                # le lot partira dans le nouveau pool
+                self._places.release()
+                self._signaler_panne(executeur)
+                continue
+            except RuntimeError as erreur:
+                self._places.release()
+                for requete in lot:
+                    requete.reponse.set_exception(erreur)
+                return True
+            self.metriques.compter('lots')
+            self.metriques.compter('problemes_en_lot', len(lot))
+            tache.add_done_callback(lambda t, lot=lot: self._distribuer(t, lot, executeur))
+            return True
+
+    def _distribuer(self, tache: Future, lot: List[_Requete], executeur: ProcessPoolExecutor):
+        """Transmet les solutions d'un lot terminé à chaque requête."""
+        self._places.release()
+        try:
+            solutions = tache.result()
+        except Exception as erreur:
+            # Le lot était en cours quand un processus est mort : il n'est pas
+            # relancé (il a peut-être causé la panne), mais le pool est recréé
+            if isinstance(erreur, BrokenProcessPool):
+                self._signaler_panne(executeur)
+            for requete in lot:
+                requete.reponse.set_exception(erreur)
+            return
+        for requete, solution in zip(lot, solutions):
+            requete.reponse.set_result(solution)
+
+    def sante(self) -> dict:
+        """État du serveur (pour /sante)."""
+        if self._arret.is_set():
+            statut = 'arret'
+        else:
+            statut = 'ok' if self._pool_pret.is_set() else 'redemarrage'
+        return {
+            'statut': statut,
+            'processus': self.processus_prets,
+            'file': self.file.qsize(),
+            'file_max': self.file.maxsize,
+        }
+
+
+class _GestionnaireHTTP(BaseHTTPRequestHandler):
+    """Traite une requête HTTP (un thread par connexion)."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass  # Pas de journal par requête (les métriques suffisent)
+
+    def _repondre(self, code: int, donnees: dict, entetes: Tuple[Tuple[str, str], ...] = ()):
+        corps = json.dumps(donnees, ensure_ascii=False).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', TYPE_JSON)
+        self.send_header('Content-Length', str(len(corps)))
+        for nom, valeur in entetes:
+            self.send_header(nom, valeur)
+        self.end_headers()
+        self.wfile.write(corps)
+
+    def do_GET(self):
+        serveur: ServeurSolveur = self.server.serveur_solveur
+        if self.path == '/sante':
+            sante = serveur.sante()
+            self._repondre(200 if sante['statut'] == 'ok' else 503, sante)
+        elif self.path == '/metriques':
+            self._repondre(200, serveur.metriques.vers_dict())
+        else:
+            self._repondre(404, {'erreur': f"Chemin inconnu : {self.path}"})
+
+    def do_POST(self):
+        serveur: ServeurSolveur = self.server.serveur_solveur
+        if self.path != '/resoudre':
+            self._repondre(404, {'erreur': f"Chemin inconnu : {self.path}"})
+            return
+
+        debut = time.perf_counter()
+        serveur.metriques.compter('requetes')
+        try:
+            corps = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            if self.headers.get('Content-Type', TYPE_JSON).startswith(TYPE_NPZ):
+                probleme = ProblemePL.depuis_npz(corps)
+            else:
+                probleme = ProblemePL.depuis_dict(json.loads(corps))
+        except Exception as erreur:
+            serveur.metriques.compter('erreurs')
+            self._repondre(400, {'erreur': f"Problème invalide : {erreur}"})
+            return
+
+        try:
+            reponse = serveur.soumettre(probleme)
+        except queue.Full:
+            serveur.metriques.compter('rejetees')
+            self._repondre(503, {'erreur': "File d'attente pleine, réessayer plus tard"},
+                           (('Retry-After', '1'),))
+            return
+
+        try:
+            solution = reponse.result(timeout=serveur.delai_reponse)
+        except TimeoutError:
+            serveur.metriques.compter('delais_depasses')
+            self._repondre(504, {'erreur': "Pas de réponse dans le délai"})
+            return
+        except Exception as erreur:
+            serveur.metriques.compter('erreurs')
+            self._repondre(500, {'erreur': str(erreur)})
+            return
+
+        serveur.metriques.compter('erreurs' if solution['statut'] == 'erreur' else 'reussies')
+        serveur.metriques.ajouter_latence(time.perf_counter() - debut)
+        self._repondre(200, solution)
+
+
+# ============================================================
+# CLIENT
+# ============================================================
+
+def resoudre_distant(probleme: ProblemePL, url: str, binaire: bool = False,
+                     delai: float = 60.0) -> Solution:
+    """
+    Envoie un problème à un ServeurSolveur et renvoie sa solution.
+
+    Args:
+        probleme: Problème à résoudre
+        url: Adresse du serveur (ex: http://127.0.0.1:8000)
+        binaire: True pour envoyer le problème au format .npz
+        delai: Temps maximum d'attente (s)
+
+    Returns:
+        Une instance de Solution
+
+    Raises:
+        urllib.error.HTTPError: Réponse d'erreur du serveur (ex: 503 file pleine)
+    """
+    if binaire:
+        corps, type_contenu = probleme.vers_npz(), TYPE_NPZ
+    else:
+        corps, type_contenu = json.dumps(probleme.vers_dict()).encode('utf-8'), TYPE_JSON
+    requete = urllib_request.Request(f"{url}/resoudre", data=corps, method='POST',
+                                     headers={'Content-Type': type_contenu})
+    with urllib_request.urlopen(requete, timeout=delai) as reponse:
+        return Solution.depuis_dict(json.loads(reponse.read()))
+
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Serveur HTTP local de résolution")
+    parser.add_argument('--hote', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--processus', type=int, default=2)
+    parser.add_argument('--taille-lot', type=int, default=16)
+    parser.add_argument('--taille-file', type=int, default=256)
+    args = parser.parse_args()
+
+    ServeurSolveur(args.hote, args.port, args.processus, args.taille_lot,
+                   taille_file=args.taille_file).servir()
+
+
+if __name__ == "__main__":
+    main()
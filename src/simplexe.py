@@ -12,9 +12,20 @@ La méthode suit les étapes :
 5. Répéter jusqu'à ce que tous les Δ soient négatifs ou nuls
 """
 
+import json
+import os
 import numpy as np
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from collections.abc import Sequence
+from typing import Dict, Iterator, List, Tuple, Optional
+from dataclasses import dataclass, field
+from .cache import CacheSolutions
+from .noyau import NON_BORNE, OPTIMAL, Noyau, charger_noyau
+from .budget import Budget, borne_lagrangienne
+from .instrumentation import (
+    Chronometre, CollecteurProfil, EcouteurSolveur, notifier,
+    PHASE_CACHE, PHASE_HISTORIQUE, PHASE_INITIALISATION, PHASE_PIVOT,
+    PHASE_POINT_REPRISE, PHASE_PRICING, PHASE_RATIO
+)
 
 
 @dataclass
@@ -60,22 +71,387 @@ class TableauSimplexe:
     message: str = ""
 
 
+@dataclass(frozen=True, eq=False)
+class ResultatSimplexe(Sequence):
+    """
+    Résultat (immuable) d'une résolution par SimplexeSolveur.
+
+    Il se comporte aussi comme la liste des tableaux (len, indice, boucle for),
+    ce que renvoyait resoudre() auparavant.
+    """
+    # Tableaux du simplexe, un par itération (vide pour iter_resoudre)
+    tableaux: Tuple[TableauSimplexe, ...]
+    
+    # 'optimal', 'non_borne', 'budget_epuise' ou 'interrompu'
+    statut: str
+    
+    # Nombre d'itérations (pivots)
+    iterations: int
+    
+    # Valeur optimale (solution trouvée uniquement)
+    valeur_optimale: Optional[float] = None
+    
+    # Valeurs des variables (principales et d'écart), en paires (nom, valeur)
+    valeurs: Tuple[Tuple[str, float], ...] = ()
+    
+    # Budget épuisé : valeur de la base courante (si réalisable) et écart à l'optimum
+    valeur_courante: Optional[float] = None
+    ecart_optimalite: Optional[float] = None
+    
+    @property
+    def solution_trouvee(self) -> bool:
+        return self.statut == 'optimal'
+    
+    @property
+    def solution_infinie(self) -> bool:
+        return self.statut == 'non_borne'
+    
+    @property
+    def budget_epuise(self) -> bool:
+        return self.statut == 'budget_epuise'
+    
+    @property
+    def variables_solution(self) -> Dict[str, float]:
+        """Valeurs des variables par nom (dictionnaire neuf à chaque appel)."""
+        return dict(self.valeurs)
+    
+    def __getitem__(self, indice):
+        return self.tableaux[indice]
+    
+    def __len__(self) -> int:
+        return len(self.tableaux)
+
+
+def _tableaux_vers_npz(tableaux: Sequence[TableauSimplexe]) -> Tuple[list, dict]:
+    """Tableaux -> (infos JSON, tableaux NumPy empilés) pour un fichier .npz."""
+    infos = [{'vars_hb': t.vars_hb, 'vars_base': t.vars_base, 'iteration': t.iteration,
+              'var_entrante_idx': t.var_entrante_idx, 'var_sortante_idx': t.var_sortante_idx,
+              'ratios': t.colonne_r is not None, 'message': t.message}
+             for t in tableaux]
+    tableaux_npz = {
+        'hist_matrice': np.array([t.matrice for t in tableaux]),
+        'hist_delta': np.array([t.delta for t in tableaux]),
+        'hist_colonne_c': np.array([t.colonne_c for t in tableaux]),
+        'hist_valeur_z': np.array([t.valeur_z for t in tableaux], dtype=float),
+        'hist_colonne_r': np.array([
+            t.colonne_r if t.colonne_r is not None else np.full(len(t.colonne_c), np.nan)
+            for t in tableaux
+        ]),
+    }
+    return infos, tableaux_npz
+
+
+def _tableaux_depuis_npz(infos: list, fichier) -> List[TableauSimplexe]:
+    """Inverse de _tableaux_vers_npz (fichier : résultat de np.load)."""
+    return [
+        TableauSimplexe(
+            matrice=fichier['hist_matrice'][k],
+            delta=fichier['hist_delta'][k],
+            colonne_c=fichier['hist_colonne_c'][k],
+            valeur_z=fichier['hist_valeur_z'][k],
+            vars_hb=info['vars_hb'],
+            vars_base=info['vars_base'],
+            var_entrante_idx=info['var_entrante_idx'],
+            var_sortante_idx=info['var_sortante_idx'],
+            colonne_r=fichier['hist_colonne_r'][k] if info['ratios'] else None,
+            iteration=info['iteration'],
+            message=info['message']
+        )
+        for k, info in enumerate(infos)
+    ]
+
+
+def _ecrire_npz(chemin: str, entete: dict, tableaux: dict):
+    """
+    Écrit un .npz compressé (entête JSON + tableaux).
+
+    Le fichier est d'abord écrit à côté puis renommé : une interruption
+    pendant l'écriture laisse le fichier précédent intact.
+    """
+    temporaire = f"{chemin}.tmp"
+    with open(temporaire, 'wb') as fichier:
+        np.savez_compressed(fichier, entete=np.array(json.dumps(entete)), **tableaux)
+    os.replace(temporaire, chemin)
+
+
+@dataclass
+class PointReprise:
+    """
+    État d'une résolution de SimplexeSolveur après un pivot, enregistré
+    régulièrement sur disque pour reprendre une longue résolution
+    interrompue (voir SimplexeSolveur.reprendre()).
+    
+    Le tableau courant est enregistré tel quel (au bit près) : la reprise
+    fait exactement les mêmes pivots que la résolution sans interruption.
+    
+    Avec historique, les tableaux déjà produits sont écrits par segments à
+    côté du fichier (chemin.historique-0.npz, -1...) : chaque point de
+    reprise n'écrit que les tableaux produits depuis le précédent. Le point
+    de reprise final (fin de la résolution) regroupe tout l'historique dans
+    le fichier principal et supprime les segments.
+    """
+    # Problème (c tel que donné, avant inversion pour une minimisation)
+    c: np.ndarray
+    A: np.ndarray
+    b: np.ndarray
+    noms_vars: List[str]
+    maximiser: bool
+    
+    # Nombre de pivots effectués
+    iteration: int
+    
+    # Tableau courant
+    matrice: np.ndarray
+    delta: np.ndarray
+    colonne_c: np.ndarray
+    valeur_z: float
+    vars_hb: List[str]
+    vars_base: List[str]
+    
+    # Tableaux déjà produits, puis celui de la dernière itération (None sans historique)
+    historique: Optional[Tuple[TableauSimplexe, ...]] = None
+    
+    # Segments d'historique déjà sur disque : nombre cumulé de tableaux à la fin de chacun
+    segments: Tuple[int, ...] = ()
+    
+    @staticmethod
+    def chemin_segment(chemin: str, k: int) -> str:
+        """Fichier du k-ième segment d'historique du point de reprise `chemin`."""
+        return f"{chemin}.historique-{k}.npz"
+    
+    def enregistrer(self, chemin: str, final: bool = False) -> Tuple[int, ...]:
+        """
+        Écrit le point de reprise (.npz compressé), précédé d'un segment avec
+        les tableaux de l'historique produits depuis le dernier segment.
+        
+        Chaque fichier est d'abord écrit à côté puis renommé : une
+        interruption pendant l'écriture laisse le point de reprise précédent
+        intact (il ne référence que des segments complets).
+        
+        Args:
+            chemin: Fichier du point de reprise
+            final: Dernier point de reprise de la résolution : tout l'historique
+                   va dans le fichier principal et les segments sont supprimés
+        
+        Returns:
+            Les segments à passer au point de reprise suivant (même fichier)
+        """
+        entete = {'noms_vars': list(self.noms_vars), 'maximiser': self.maximiser,
+                  'iteration': self.iteration,
+                  'vars_hb': list(self.vars_hb), 'vars_base': list(self.vars_base)}
+        tableaux = {'c': self.c, 'A': self.A, 'b': self.b, 'matrice': self.matrice,
+                    'delta': self.delta, 'colonne_c': self.colonne_c,
+                    'valeur_z': np.float64(self.valeur_z)}
+        segments = self.segments
+        if self.historique is not None:
+            *produits, dernier = self.historique
+            if final:
+                segments = ()
+                hors_segments = list(self.historique)
+            else:
+                deja_ecrits = segments[-1] if segments else 0
+                if len(produits) > deja_ecrits:
+                    infos, tableaux_segment = _tableaux_vers_npz(produits[deja_ecrits:])
+                    _ecrire_npz(self.chemin_segment(chemin, len(segments)),
+                                {'historique': infos}, tableaux_segment)
+                    segments = segments + (len(produits),)
+                # Le dernier tableau peut encore changer (message) : il reste dans le fichier principal
+                hors_segments = [dernier]
+            infos, tableaux_dernier = _tableaux_vers_npz(hors_segments)
+            entete['historique'] = {'segments': list(segments), 'dernier': infos}
+            tableaux.update(tableaux_dernier)
+        
+        _ecrire_npz(chemin, entete, tableaux)
+        if final:
+            # Le fichier principal ne les référence plus
+            for k in range(len(self.segments)):
+                os.remove(self.chemin_segment(chemin, k))
+        return segments
+    
+    @classmethod
+    def charger(cls, chemin: str) -> 'PointReprise':
+        """
+        Lit un point de reprise écrit par enregistrer().
+        
+        Args:
+            chemin: Fichier du point de reprise
+        
+        Returns:
+            Le PointReprise
+        """
+        with np.load(chemin, allow_pickle=False) as fichier:
+            entete = json.loads(str(fichier['entete']))
+            historique, segments = None, ()
+            if 'historique' in entete:
+                segments = tuple(entete['historique']['segments'])
+                tableaux: List[TableauSimplexe] = []
+                for k, fin in enumerate(segments):
+                    with np.load(cls.chemin_segment(chemin, k), allow_pickle=False) as segment:
+                        tableaux += _tableaux_depuis_npz(
+                            json.loads(str(segment['entete']))['historique'], segment)
+                    if len(tableaux) != fin:
+                        raise ValueError(f"Segment d'historique {k} incomplet : {chemin}")
+                tableaux += _tableaux_depuis_npz(entete['historique']['dernier'], fichier)
+                historique = tuple(tableaux)
+            return cls(
+                c=fichier['c'], A=fichier['A'], b=fichier['b'],
+                noms_vars=entete['noms_vars'], maximiser=entete['maximiser'],
+                iteration=entete['iteration'],
+                matrice=fichier['matrice'], delta=fichier['delta'],
+                colonne_c=fichier['colonne_c'], valeur_z=fichier['valeur_z'][()],
+                vars_hb=entete['vars_hb'], vars_base=entete['vars_base'],
+                historique=historique, segments=segments
+            )
+
+
+@dataclass
+class _EtatResolution:
+    """État d'une résolution en cours (propre à un appel de resoudre)."""
+    statut: str = 'interrompu'
+    iterations: int = 0
+    valeur_optimale: Optional[float] = None
+    variables_solution: Dict[str, float] = field(default_factory=dict)
+    valeur_courante: Optional[float] = None
+    ecart_optimalite: Optional[float] = None
+    
+    # Points de reprise : fichier, intervalle (en pivots) et point à reprendre
+    chemin_reprise: Optional[str] = None
+    intervalle_reprise: int = 1000
+    reprise: Optional[PointReprise] = None
+    
+    def resultat(self, tableaux: Tuple[TableauSimplexe, ...] = ()) -> ResultatSimplexe:
+        return ResultatSimplexe(
+            tableaux=tuple(tableaux),
+            statut=self.statut,
+            iterations=self.iterations,
+            valeur_optimale=self.valeur_optimale,
+            valeurs=tuple((nom, float(valeur)) for nom, valeur in self.variables_solution.items()),
+            valeur_courante=self.valeur_courante,
+            ecart_optimalite=self.ecart_optimalite,
+        )
+
+
+class _Tampons:
+    """
+    Tableaux de travail du simplexe, agrandis si besoin et réutilisés d'une
+    résolution à l'autre (les vues ont la taille du problème courant).
+    """
+    
+    def __init__(self):
+        self.capacite = (0, 0)
+        self.nb_allocations = 0
+    
+    def preparer(self, m: int, n: int):
+        """Prépare des vues de taille (m, n), en agrandissant les tableaux si besoin."""
+        cap_m, cap_n = self.capacite
+        if m > cap_m or n > cap_n:
+            cap_m, cap_n = max(m, cap_m), max(n, cap_n)
+            self._matrice = np.empty((cap_m, cap_n))
+            self._produit = np.empty((cap_m, cap_n))
+            self._colonnes = np.empty((4, cap_m))   # C, ratios, colonne du pivot, facteurs
+            self._masque = np.empty(cap_m, dtype=bool)
+            self._lignes = np.empty((2, cap_n))     # Δ, ligne de travail
+            self.capacite = (cap_m, cap_n)
+            self.nb_allocations += 1
+        
+        self.matrice = self._matrice[:m, :n]
+        self.produit = self._produit[:m, :n]
+        self.colonne_c, self.ratios, self.colonne, self.facteurs = self._colonnes[:, :m]
+        self.masque = self._masque[:m]
+        self.delta, self.ligne = self._lignes[:, :n]
+
+
 class SimplexeSolveur:
     """
     Solveur utilisant l'algorithme du Simplexe avec affichage des tableaux.
     Implémente la méthode vue en cours.
+    
+    Le solveur ne garde que sa configuration (cache, écouteurs) : chaque
+    résolution a son propre état et renvoie un ResultatSimplexe. Les
+    attributs solution_trouvee, valeur_optimale, variables_solution...
+    décrivent le dernier résultat (compatibilité) ; en multithread, utiliser
+    le résultat renvoyé, ou un solveur par thread (voir PoolSolveurs).
+    
+    Pour résoudre beaucoup de problèmes de tailles voisines :
+        SimplexeSolveur(reutiliser_tampons=True, historique=False)
+    garde ses tableaux de travail d'une résolution à l'autre (aucune
+    allocation dans la boucle des pivots) et ne copie que le tableau final.
+    Si Numba est installé, les itérations sont compilées (même suite de
+    pivots, mêmes valeurs qu'avec NumPy) ; sans historique, une itération
+    entière est alors un seul appel compilé.
     """
     
-    def __init__(self):
-        """Initialise le solveur."""
-        self.tableaux: List[TableauSimplexe] = []
-        self.solution_trouvee = False
-        self.solution_infinie = False
-        self.valeur_optimale = None
-        self.variables_solution = {}
+    def __init__(self, cache: Optional[CacheSolutions] = None,
+                 ecouteurs: Optional[List[EcouteurSolveur]] = None,
+                 reutiliser_tampons: bool = False, historique: bool = True,
+                 noyau: str = 'auto'):
+        """
+        Initialise le solveur.
+        
+        Args:
+            cache: Cache des solutions (None = pas de cache)
+            ecouteurs: Écouteurs avertis pendant la résolution (profilage)
+            reutiliser_tampons: True pour garder les tableaux de travail entre
+                                deux résolutions (un solveur = un thread à la fois)
+            historique: False pour ne garder que le tableau final (pas de
+                        copie des tableaux à chaque itération)
+            noyau: Noyau de calcul des itérations : 'auto' (Numba s'il est
+                   installé, NumPy sinon), 'numpy' ou 'numba' (voir noyau.py)
+        """
+        self.cache = cache
+        self.ecouteurs: List[EcouteurSolveur] = list(ecouteurs) if ecouteurs else []
+        self.historique = historique
+        self._tampons: Optional[_Tampons] = _Tampons() if reutiliser_tampons else None
+        self.noyau: Noyau = charger_noyau(noyau)
+        
+        # Dernier résultat produit (remplacé d'un bloc à la fin de chaque résolution)
+        self.dernier_resultat: Optional[ResultatSimplexe] = None
+    
+    # ------------------------------------------------------------
+    # Dernier résultat (compatibilité)
+    # ------------------------------------------------------------
+    
+    @property
+    def tableaux(self) -> List[TableauSimplexe]:
+        return list(self.dernier_resultat.tableaux) if self.dernier_resultat is not None else []
+    
+    @property
+    def solution_trouvee(self) -> bool:
+        return self.dernier_resultat is not None and self.dernier_resultat.solution_trouvee
+    
+    @property
+    def solution_infinie(self) -> bool:
+        return self.dernier_resultat is not None and self.dernier_resultat.solution_infinie
+    
+    @property
+    def budget_epuise(self) -> bool:
+        return self.dernier_resultat is not None and self.dernier_resultat.budget_epuise
+    
+    @property
+    def valeur_optimale(self) -> Optional[float]:
+        return self.dernier_resultat.valeur_optimale if self.dernier_resultat is not None else None
+    
+    @property
+    def variables_solution(self) -> Dict[str, float]:
+        return self.dernier_resultat.variables_solution if self.dernier_resultat is not None else {}
+    
+    @property
+    def valeur_courante(self) -> Optional[float]:
+        return self.dernier_resultat.valeur_courante if self.dernier_resultat is not None else None
+    
+    @property
+    def ecart_optimalite(self) -> Optional[float]:
+        return self.dernier_resultat.ecart_optimalite if self.dernier_resultat is not None else None
+    
+    # ------------------------------------------------------------
+    # Résolution
+    # ------------------------------------------------------------
     
     def resoudre(self, c: List[float], A: List[List[float]], b: List[float],
-                 noms_vars: Optional[List[str]] = None, maximiser: bool = True) -> List[TableauSimplexe]:
+                 noms_vars: Optional[List[str]] = None, maximiser: bool = True,
+                 budget: Optional[Budget] = None,
+                 point_reprise: Optional[str] = None,
+                 intervalle_reprise: int = 1000) -> ResultatSimplexe:
         """
         Résout un problème de programmation linéaire sous forme standard.
         
@@ -85,9 +461,15 @@ class SimplexeSolveur:
             b: Termes constants des contraintes
             noms_vars: Noms des variables principales (optionnel)
             maximiser: True pour maximiser, False pour minimiser
+            budget: Limite de temps / d'itérations (par défaut 100 itérations).
+                    Si elle est atteinte, budget_epuise vaut True et
+                    variables_solution contient la base courante si elle est réalisable
+            point_reprise: Fichier où enregistrer régulièrement l'état de la
+                           résolution (voir reprendre())
+            intervalle_reprise: Nombre de pivots entre deux points de reprise
         
         Returns:
-            Liste des tableaux du simplexe (un par itération)
+            Le ResultatSimplexe (qui se parcourt comme la liste des tableaux)
         
         Exemple du cours :
             Max Z = 1200x1 + 1000x2
@@ -98,9 +480,154 @@ class SimplexeSolveur:
             A = [[3, 4], [6, 3]]
             b = [160, 180]
         """
-        self.tableaux = []
-        self.solution_trouvee = False
-        self.solution_infinie = False
+        # Noms des variables
+        if noms_vars is None:
+            noms_vars = [f"x{i+1}" for i in range(len(c))]
+        
+        # Chercher d'abord dans le cache
+        cle_cache = None
+        if self.cache is not None:
+            chrono = Chronometre()
+            cle_cache = CacheSolutions.cle(
+                'simplexe', c, A_ub=A, b_ub=b,
+                sens='max' if maximiser else 'min',
+                extra=list(noms_vars) if self.historique else [list(noms_vars), 'sans_historique']
+            )
+            resultat = self.cache.obtenir(cle_cache)
+            if isinstance(resultat, ResultatSimplexe):
+                # Les écouteurs voient une résolution sans pivot (phase 'cache')
+                notifier(self.ecouteurs, 'debut_resolution', 'simplexe', len(c), len(b))
+                notifier(self.ecouteurs, 'fin_phase', PHASE_CACHE, chrono.tour())
+                notifier(self.ecouteurs, 'fin_resolution', resultat.statut, 0, chrono.total())
+                self.dernier_resultat = resultat
+                return resultat
+        
+        # Dérouler toutes les itérations
+        etat = _EtatResolution(chemin_reprise=point_reprise, intervalle_reprise=intervalle_reprise)
+        tableaux = tuple(self._suivre(c, A, b, noms_vars, maximiser, budget, etat))
+        resultat = etat.resultat(tableaux)
+        self.dernier_resultat = resultat
+        
+        # Un résultat interrompu par le budget n'est pas mis en cache
+        if cle_cache is not None and not resultat.budget_epuise:
+            self.cache.stocker(cle_cache, resultat)
+        
+        return resultat
+    
+    def reprendre(self, point_reprise: str, budget: Optional[Budget] = None,
+                  intervalle_reprise: int = 1000) -> ResultatSimplexe:
+        """
+        Reprend une résolution interrompue à son dernier point de reprise.
+        
+        Le résultat (tableaux compris) est identique au bit près à celui
+        d'une résolution sans interruption. Les points de reprise suivants
+        sont écrits dans le même fichier.
+        
+        Args:
+            point_reprise: Fichier passé à resoudre(point_reprise=...)
+            budget: Limite de temps / d'itérations ; les itérations comptent
+                    depuis le début de la résolution (par défaut 100)
+            intervalle_reprise: Nombre de pivots entre deux points de reprise
+        
+        Returns:
+            Le ResultatSimplexe
+        
+        Raises:
+            ValueError: Le solveur garde l'historique mais pas le point de reprise
+        
+        Exemple :
+            solveur = SimplexeSolveur(historique=False)
+            try:
+                solveur.resoudre(c, A, b, budget=budget, point_reprise='pl.npz')
+            except KeyboardInterrupt:
+                pass
+            resultat = solveur.reprendre('pl.npz', budget=budget)
+        """
+        reprise = PointReprise.charger(point_reprise)
+        if self.historique and reprise.historique is None:
+            raise ValueError("Le point de reprise n'a pas d'historique : "
+                             "reprendre avec SimplexeSolveur(historique=False)!")
+        
+        etat = _EtatResolution(chemin_reprise=point_reprise,
+                               intervalle_reprise=intervalle_reprise, reprise=reprise)
+        tableaux = tuple(self._suivre(reprise.c, reprise.A, reprise.b, reprise.noms_vars,
+                                      reprise.maximiser, budget, etat))
+        resultat = etat.resultat(tableaux)
+        self.dernier_resultat = resultat
+        return resultat
+    
+    def iter_resoudre(self, c: List[float], A: List[List[float]], b: List[float],
+                      noms_vars: Optional[List[str]] = None,
+                      maximiser: bool = True,
+                      budget: Optional[Budget] = None) -> Iterator[TableauSimplexe]:
+        """
+        Version générateur de resoudre() : produit les tableaux un par un.
+        
+        Chaque tableau est produit dès qu'il est complet (message compris),
+        sans garder l'historique en mémoire. On peut arrêter la boucle à tout
+        moment. À la fin de la boucle, dernier_resultat (et donc
+        solution_trouvee, valeur_optimale, ...) décrit cette résolution, sans
+        les tableaux ; son statut est 'interrompu' si on l'a arrêtée avant la fin.
+        
+        Les écouteurs reçoivent debut_resolution / fin_resolution (statut
+        'interrompu' si on arrête la boucle avant la fin).
+        
+        Sans historique (historique=False), seul le tableau final est produit.
+        
+        Args:
+            Les mêmes que resoudre()
+        
+        Yields:
+            Les tableaux du simplexe, dans l'ordre des itérations
+        
+        Exemple :
+            for tableau in solveur.iter_resoudre(c, A, b):
+                print(tableau.iteration)
+                if tableau.iteration >= 10:
+                    break
+        """
+        etat = _EtatResolution()
+        try:
+            yield from self._suivre(c, A, b, noms_vars, maximiser, budget, etat)
+        finally:
+            self.dernier_resultat = etat.resultat()
+    
+    def _suivre(self, c, A, b, noms_vars, maximiser, budget,
+                etat: _EtatResolution) -> Iterator[TableauSimplexe]:
+        """Déroule _iterations() en avertissant les écouteurs (mémoire, fin de résolution)."""
+        chrono = Chronometre()
+        notifier(self.ecouteurs, 'debut_resolution', 'simplexe', len(c), len(b))
+        
+        octets_historique = 0
+        try:
+            for tableau in self._iterations(c, A, b, noms_vars, maximiser, budget, etat):
+                etat.iterations = tableau.iteration
+                octets_tableau = (tableau.matrice.nbytes + tableau.delta.nbytes
+                                  + tableau.colonne_c.nbytes)
+                if tableau.colonne_r is not None:
+                    octets_tableau += tableau.colonne_r.nbytes
+                # Tableaux de travail (même taille qu'un tableau) + historique produit
+                octets_historique += octets_tableau
+                notifier(self.ecouteurs, 'memoire', octets_historique + octets_tableau)
+                yield tableau
+        finally:
+            notifier(self.ecouteurs, 'fin_resolution', etat.statut, etat.iterations, chrono.total())
+    
+    def _iterations(self, c: List[float], A: List[List[float]], b: List[float],
+                    noms_vars: Optional[List[str]], maximiser: bool,
+                    budget: Optional[Budget], etat: _EtatResolution) -> Iterator[TableauSimplexe]:
+        """
+        Boucle de l'algorithme du simplexe (voir iter_resoudre()).
+        
+        Les durées des phases sont transmises aux écouteurs ; le temps passé
+        par l'appelant entre deux tableaux n'est pas compté.
+        """
+        chrono = Chronometre()
+        
+        # Budget par défaut : sécurité contre les boucles infinies
+        if budget is None:
+            budget = Budget(max_iterations=100)
+        debut = Budget.maintenant()
         
         n_vars = len(c)  # Nombre de variables principales
         n_contraintes = len(b)  # Nombre de contraintes
@@ -112,7 +639,8 @@ class SimplexeSolveur:
         # Noms des variables d'écart
         noms_ecart = [f"t{i+1}" for i in range(n_contraintes)]
         
-        # Si minimisation, on inverse les coefficients
+        # Si minimisation, on inverse les coefficients (c_initial : pour les points de reprise)
+        c_initial = c
         if not maximiser:
             c = [-ci for ci in c]
         
@@ -120,154 +648,284 @@ class SimplexeSolveur:
         # CONSTRUCTION DU TABLEAU INITIAL
         # ============================================================
         
+        # Tableaux de travail : ceux du solveur (réutilisés) ou neufs
+        tampons = self._tampons if self._tampons is not None else _Tampons()
+        tampons.preparer(n_contraintes, n_vars)
+        
         # Variables Hors Base (HB) : les variables principales
-        vars_hb = noms_vars.copy()
+        vars_hb = list(noms_vars)
         
         # Variables dans la Base (B) : les variables d'écart
         vars_base = noms_ecart.copy()
         
         # Matrice du tableau (coefficients des contraintes)
         # Chaque ligne correspond à une contrainte
-        matrice = np.array(A, dtype=float)
+        matrice = tampons.matrice
+        if n_contraintes > 0:
+            matrice[...] = A
         
         # Colonne C : termes constants
-        colonne_c = np.array(b, dtype=float)
+        colonne_c = tampons.colonne_c
+        colonne_c[...] = b
         
         # Ligne Δ : coefficients de la fonction objectif
         # Au départ, ce sont les coefficients de Z
-        delta = np.array(c, dtype=float)
+        delta = tampons.delta
+        delta[...] = c
         
         # Valeur initiale de -Z
         valeur_z = 0.0
         
-        # Créer le tableau initial
-        tableau_initial = TableauSimplexe(
-            matrice=matrice.copy(),
-            delta=delta.copy(),
-            colonne_c=colonne_c.copy(),
-            valeur_z=valeur_z,
-            vars_hb=vars_hb.copy(),
-            vars_base=vars_base.copy(),
-            iteration=0,
-            message="Tableau initial - Solution de départ : variables principales = 0"
-        )
-        self.tableaux.append(tableau_initial)
+        iteration = 0
+        message = ""
+        
+        # Tableaux déjà produits (gardés pour les points de reprise avec historique)
+        # et segments de l'historique déjà écrits sur disque
+        produits: List[TableauSimplexe] = []
+        segments: Tuple[int, ...] = ()
+        
+        reprise = etat.reprise
+        if reprise is None:
+            # Le dernier tableau n'est produit qu'une fois son message définitif
+            # (il peut encore devenir "SOLUTION OPTIMALE" ou "SOLUTION INFINIE")
+            precedent = TableauSimplexe(
+                matrice=matrice.copy(),
+                delta=delta.copy(),
+                colonne_c=colonne_c.copy(),
+                valeur_z=valeur_z,
+                vars_hb=vars_hb.copy(),
+                vars_base=vars_base.copy(),
+                iteration=0,
+                message="Tableau initial - Solution de départ : variables principales = 0"
+            ) if self.historique else None
+        else:
+            # Reprise : on repart du tableau enregistré
+            matrice[...] = reprise.matrice
+            colonne_c[...] = reprise.colonne_c
+            delta[...] = reprise.delta
+            valeur_z = reprise.valeur_z
+            vars_hb, vars_base = list(reprise.vars_hb), list(reprise.vars_base)
+            iteration = etat.iterations = reprise.iteration
+            precedent = None
+            if self.historique:
+                *produits, precedent = reprise.historique
+                segments = reprise.segments
+        derniere_reprise = iteration
+        
+        def point_reprise() -> PointReprise:
+            """Point de reprise de l'état courant (après iteration - 1 pivots)."""
+            return PointReprise(
+                c=np.asarray(c_initial, dtype=float),
+                A=np.asarray(A, dtype=float).reshape(n_contraintes, n_vars),
+                b=np.asarray(b, dtype=float),
+                noms_vars=list(noms_vars), maximiser=maximiser,
+                iteration=iteration - 1,
+                matrice=matrice, delta=delta, colonne_c=colonne_c, valeur_z=valeur_z,
+                vars_hb=vars_hb, vars_base=vars_base,
+                historique=tuple(produits) + (precedent,) if self.historique else None,
+                segments=segments
+            )
+        
+        notifier(self.ecouteurs, 'fin_phase', PHASE_INITIALISATION, chrono.tour())
+        
+        # Tableaux déjà produits avant l'interruption
+        for tableau in list(produits):
+            yield tableau
+        chrono.tour()
         
         # ============================================================
         # ITERATIONS DU SIMPLEXE
         # ============================================================
         
-        iteration = 0
-        max_iterations = 100  # Sécurité contre les boucles infinies
+        noyau = self.noyau
+        # Sans historique, rien à faire entre le choix du pivot et la règle du
+        # rectangle : une itération = un seul appel au noyau
+        fusion = not self.historique
+        ratios = tampons.ratios
+        travail = (tampons.colonne, tampons.facteurs, tampons.produit, tampons.ligne)
         
-        while iteration < max_iterations:
+        while True:
             iteration += 1
             
+            # ---------------------------------------------------------
+            # POINT DE REPRISE (tous les intervalle_reprise pivots)
+            # ---------------------------------------------------------
+            if (etat.chemin_reprise is not None
+                    and iteration - 1 - derniere_reprise >= etat.intervalle_reprise):
+                segments = point_reprise().enregistrer(etat.chemin_reprise)
+                derniere_reprise = iteration - 1
+                notifier(self.ecouteurs, 'fin_phase', PHASE_POINT_REPRISE, chrono.tour())
+            
+            epuise = budget.epuise(iteration - 1, debut)
+            
+            # ---------------------------------------------------------
+            # CHOIX DU PIVOT
+            # Variable entrante : la variable HB avec le plus grand Δ positif
+            # Variable sortante : le plus petit ratio R = C / colonne entrante
+            # (coefficients > 0 seulement)
+            # ---------------------------------------------------------
+            if fusion and not epuise:
+                code, var_entrante_idx, var_sortante_idx, valeur_z = noyau.iterer(
+                    matrice, colonne_c, delta, ratios, tampons.masque, valeur_z, *travail)
+            else:
+                code, var_entrante_idx, var_sortante_idx = noyau.choisir_pivot(
+                    matrice, colonne_c, delta, ratios, tampons.masque)
+                notifier(self.ecouteurs, 'fin_phase', PHASE_PRICING, chrono.tour())
+            
             # ---------------------------------------------------------
             # CRITÈRE D'ARRÊT : tous les Δ sont négatifs ou nuls
             # ---------------------------------------------------------
-            if np.all(delta <= 0):
-                self.solution_trouvee = True
-                self.valeur_optimale = -valeur_z if maximiser else valeur_z
+            if code == OPTIMAL:
+                etat.statut = 'optimal'
+                etat.valeur_optimale = -valeur_z if maximiser else valeur_z
                 
                 # Récupérer les valeurs des variables
                 for i, var in enumerate(vars_base):
-                    self.variables_solution[var] = colonne_c[i]
+                    etat.variables_solution[var] = colonne_c[i]
                 for var in vars_hb:
-                    self.variables_solution[var] = 0.0
+                    etat.variables_solution[var] = 0.0
                 
-                # Mettre à jour le message du dernier tableau
-                self.tableaux[-1].message = (
+                # Message du dernier tableau
+                message = (
                     f"SOLUTION OPTIMALE TROUVÉE !\n"
                     f"Tous les coefficients Δ sont ≤ 0.\n"
-                    f"Valeur optimale Z = {self.valeur_optimale:.4f}"
+                    f"Valeur optimale Z = {etat.valeur_optimale:.4f}"
                 )
                 break
             
             # ---------------------------------------------------------
-            # CRITÈRE DE SÉLECTION DE LA VARIABLE ENTRANTE
-            # On choisit la variable HB avec le plus grand Δ positif
+            # BUDGET ÉPUISÉ : on garde la base courante
             # ---------------------------------------------------------
-            var_entrante_idx = np.argmax(delta)
-            var_entrante = vars_hb[var_entrante_idx]
+            if epuise:
+                self._arret_budget(etat, c, A, b, maximiser, noms_ecart,
+                                   vars_hb, vars_base, delta, colonne_c, valeur_z)
+                message = (
+                    f"BUDGET ÉPUISÉ après {iteration - 1} itération(s).\n"
+                    + (f"Valeur courante Z = {etat.valeur_courante:.4f} "
+                       f"(écart à l'optimum ≤ {etat.ecart_optimalite:.4f})"
+                       if etat.valeur_courante is not None
+                       else "La base courante n'est pas réalisable.")
+                )
+                break
             
-            # Colonne de la variable entrante
-            colonne_entrante = matrice[:, var_entrante_idx]
+            var_entrante = vars_hb[var_entrante_idx]
             
             # ---------------------------------------------------------
             # VÉRIFICATION : solution infinie ?
             # Si tous les coefficients de la colonne entrante sont <= 0
             # ---------------------------------------------------------
-            if np.all(colonne_entrante <= 0):
-                self.solution_infinie = True
-                self.tableaux[-1].message = (
+            if code == NON_BORNE:
+                etat.statut = 'non_borne'
+                message = (
                     f"SOLUTION INFINIE !\n"
                     f"La variable {var_entrante} a tous ses coefficients ≤ 0."
                 )
                 break
             
-            # ---------------------------------------------------------
-            # CRITÈRE DE SÉLECTION DE LA VARIABLE SORTANTE
-            # On calcule les ratios R = C / colonne_entrante
-            # On prend le plus petit ratio positif
-            # ---------------------------------------------------------
-            ratios = np.full(len(colonne_c), np.inf)
-            for i in range(len(colonne_c)):
-                if colonne_entrante[i] > 0:
-                    ratios[i] = colonne_c[i] / colonne_entrante[i]
-            
-            var_sortante_idx = np.argmin(ratios)
             var_sortante = vars_base[var_sortante_idx]
             
-            # Valeur du pivot
-            pivot = matrice[var_sortante_idx, var_entrante_idx]
+            if not fusion:
+                # Valeur du pivot
+                pivot = matrice[var_sortante_idx, var_entrante_idx]
+                
+                notifier(self.ecouteurs, 'fin_phase', PHASE_RATIO, chrono.tour())
+                
+                # Le tableau précédent est maintenant définitif
+                if etat.chemin_reprise is not None:
+                    produits.append(precedent)
+                yield precedent
+                chrono.tour()  # Ne pas compter le temps passé chez l'appelant
+                
+                # Créer un tableau avec les infos de cette itération
+                precedent = TableauSimplexe(
+                    matrice=matrice.copy(),
+                    delta=delta.copy(),
+                    colonne_c=colonne_c.copy(),
+                    valeur_z=valeur_z,
+                    vars_hb=vars_hb.copy(),
+                    vars_base=vars_base.copy(),
+                    var_entrante_idx=var_entrante_idx,
+                    var_sortante_idx=var_sortante_idx,
+                    colonne_r=ratios.copy(),
+                    iteration=iteration,
+                    message=(
+                        f"Itération {iteration}\n"
+                        f"• Variable entrante : {var_entrante} (Δ = {delta[var_entrante_idx]:.2f})\n"
+                        f"• Variable sortante : {var_sortante} (R = {ratios[var_sortante_idx]:.2f})\n"
+                        f"• Pivot = {pivot:.2f}"
+                    )
+                )
+                notifier(self.ecouteurs, 'fin_phase', PHASE_HISTORIQUE, chrono.tour())
+                
+                # ---------------------------------------------------------
+                # APPLICATION DU PIVOT (Règle du rectangle)
+                # Toutes les opérations écrivent dans les tableaux de travail
+                # ---------------------------------------------------------
+                valeur_z = noyau.appliquer_pivot(matrice, colonne_c, delta,
+                                                 var_sortante_idx, var_entrante_idx,
+                                                 valeur_z, *travail)
+            # Les ratios ne sont pas modifiés par le pivot
+            degenere = bool(ratios[var_sortante_idx] <= 1e-12)
+            
+            # Échanger les variables (entrante <-> sortante)
+            vars_base[var_sortante_idx] = var_entrante
+            vars_hb[var_entrante_idx] = var_sortante
+            etat.iterations = iteration
             
-            # Créer un tableau avec les infos de cette itération
-            tableau_pivot = TableauSimplexe(
+            notifier(self.ecouteurs, 'fin_phase', PHASE_PIVOT, chrono.tour())
+            notifier(self.ecouteurs, 'pivot', iteration, var_entrante, var_sortante, degenere)
+        
+        if self.historique:
+            precedent.message = message
+        else:
+            # Sans historique : seulement le tableau final (une copie par résolution)
+            precedent = TableauSimplexe(
                 matrice=matrice.copy(),
                 delta=delta.copy(),
                 colonne_c=colonne_c.copy(),
                 valeur_z=valeur_z,
                 vars_hb=vars_hb.copy(),
                 vars_base=vars_base.copy(),
-                var_entrante_idx=var_entrante_idx,
-                var_sortante_idx=var_sortante_idx,
-                colonne_r=ratios.copy(),
-                iteration=iteration,
-                message=(
-                    f"Itération {iteration}\n"
-                    f"• Variable entrante : {var_entrante} (Δ = {delta[var_entrante_idx]:.2f})\n"
-                    f"• Variable sortante : {var_sortante} (R = {ratios[var_sortante_idx]:.2f})\n"
-                    f"• Pivot = {pivot:.2f}"
-                )
+                iteration=iteration - 1,
+                message=message
             )
-            self.tableaux.append(tableau_pivot)
-            
-            # ---------------------------------------------------------
-            # APPLICATION DU PIVOT (Règle du rectangle)
-            # ---------------------------------------------------------
-            
-            # 1. Diviser la ligne du pivot par le pivot
-            matrice[var_sortante_idx, :] /= pivot
-            colonne_c[var_sortante_idx] /= pivot
-            
-            # 2. Mettre à zéro les autres éléments de la colonne du pivot
-            for i in range(len(vars_base)):
-                if i != var_sortante_idx:
-                    facteur = matrice[i, var_entrante_idx]
-                    matrice[i, :] -= facteur * matrice[var_sortante_idx, :]
-                    colonne_c[i] -= facteur * colonne_c[var_sortante_idx]
-            
-            # 3. Mettre à jour la ligne Δ
-            facteur_delta = delta[var_entrante_idx]
-            delta -= facteur_delta * matrice[var_sortante_idx, :]
-            valeur_z -= facteur_delta * colonne_c[var_sortante_idx]
-            
-            # 4. Échanger les variables (entrante <-> sortante)
-            vars_base[var_sortante_idx] = var_entrante
-            vars_hb[var_entrante_idx] = var_sortante
         
-        return self.tableaux
+        # Point de reprise final (fichier unique, sans segments)
+        if etat.chemin_reprise is not None:
+            point_reprise().enregistrer(etat.chemin_reprise, final=True)
+            notifier(self.ecouteurs, 'fin_phase', PHASE_POINT_REPRISE, chrono.tour())
+        yield precedent
+    
+    def _arret_budget(self, etat: _EtatResolution, c, A, b, maximiser, noms_ecart,
+                      vars_hb, vars_base, delta, colonne_c, valeur_z):
+        """
+        Enregistre la base courante quand le budget est épuisé.
+        
+        La base n'est gardée que si elle est réalisable (colonne C >= 0).
+        L'écart est borné par relaxation lagrangienne, avec comme
+        multiplicateurs les -Δ des variables d'écart hors base.
+        """
+        etat.statut = 'budget_epuise'
+        
+        if np.any(colonne_c < -1e-9):
+            return
+        
+        for i, var in enumerate(vars_base):
+            etat.variables_solution[var] = colonne_c[i]
+        for var in vars_hb:
+            etat.variables_solution[var] = 0.0
+        
+        # Multiplicateurs des contraintes (c est déjà sous forme maximisation)
+        indices_ecart = {nom: i for i, nom in enumerate(noms_ecart)}
+        y = np.zeros(len(noms_ecart))
+        for j, var in enumerate(vars_hb):
+            if var in indices_ecart:
+                y[indices_ecart[var]] = max(0.0, -delta[j])
+        
+        # Max c^T x = -Min (-c)^T x : la borne inférieure du Min donne une borne supérieure
+        borne_sup = -borne_lagrangienne(-np.asarray(c, dtype=float), A, b, y_ub=y)
+        etat.ecart_optimalite = max(0.0, borne_sup - (-valeur_z))
+        etat.valeur_courante = -valeur_z if maximiser else valeur_z
     
     def afficher_tableau(self, tableau: TableauSimplexe) -> str:
         """
@@ -345,34 +1003,41 @@ class SimplexeSolveur:
         
         return "\n".join(lignes)
     
-    def afficher_solution(self) -> str:
+    def afficher_solution(self, resultat: Optional[ResultatSimplexe] = None) -> str:
         """
         Affiche la solution finale.
         
+        Args:
+            resultat: Résultat à afficher (défaut : le dernier résultat du solveur)
+        
         Returns:
             Chaîne de caractères avec la solution
         """
+        if resultat is None:
+            resultat = self.dernier_resultat
+        if resultat is None:
+            resultat = _EtatResolution().resultat()
         lignes = []
         lignes.append(f"\n{'='*60}")
         lignes.append("RÉSULTAT FINAL")
         lignes.append(f"{'='*60}\n")
         
-        if self.solution_trouvee:
+        if resultat.solution_trouvee:
             lignes.append("✓ Solution optimale trouvée !")
-            lignes.append(f"\nValeur optimale : Z = {self.valeur_optimale:.4f}")
+            lignes.append(f"\nValeur optimale : Z = {resultat.valeur_optimale:.4f}")
             lignes.append("\nValeurs des variables :")
             
             # Trier les variables pour un affichage cohérent
-            for var, val in sorted(self.variables_solution.items()):
+            for var, val in sorted(resultat.variables_solution.items()):
                 if var.startswith('x') or var.startswith('y'):
                     lignes.append(f"  • {var} = {val:.4f}")
             
             lignes.append("\nVariables d'écart :")
-            for var, val in sorted(self.variables_solution.items()):
+            for var, val in sorted(resultat.variables_solution.items()):
                 if var.startswith('t') or var.startswith('s'):
                     lignes.append(f"  • {var} = {val:.4f}")
         
-        elif self.solution_infinie:
+        elif resultat.solution_infinie:
             lignes.append("✗ Le problème a une solution infinie.")
         
         else:
@@ -418,20 +1083,64 @@ def exemple_cours():
     print(solveur.afficher_solution())
 
 
-def resoudre_rapide(probleme, verbose: bool = True):
+def solution_depuis_resultat(resultat: ResultatSimplexe, noms_variables: List[str]):
+    """
+    Construit la Solution correspondant au résultat d'un SimplexeSolveur.
+    
+    Args:
+        resultat: Résultat renvoyé par SimplexeSolveur.resoudre()
+        noms_variables: Noms des variables principales (dans l'ordre)
+    
+    Returns:
+        La solution (Solution)
+    """
+    from .models import Solution
+    
+    solution = Solution()
+    solution.noms_variables = noms_variables
+    
+    if resultat.solution_trouvee:
+        valeurs_vars = [resultat.variables_solution.get(nom, 0.0) for nom in noms_variables]
+        solution.succes = True
+        solution.valeurs_variables = np.array(valeurs_vars)
+        solution.valeur_objectif = resultat.valeur_optimale
+        solution.message = "Solution optimale trouvée"
+        solution.statut = 'optimal'
+    elif resultat.budget_epuise:
+        solution.succes = False
+        solution.statut = 'budget_epuise'
+        solution.message = "Budget épuisé"
+        if resultat.valeur_courante is not None:
+            valeurs_vars = [resultat.variables_solution.get(nom, 0.0) for nom in noms_variables]
+            solution.valeurs_variables = np.array(valeurs_vars)
+            solution.valeur_objectif = resultat.valeur_courante
+            solution.ecart_optimalite = resultat.ecart_optimalite
+    else:
+        solution.succes = False
+        solution.valeurs_variables = None
+        solution.valeur_objectif = None
+        solution.message = "Aucune solution trouvée" if not resultat.solution_infinie else "Solution infinie"
+        solution.statut = 'non_borne' if resultat.solution_infinie else 'echec'
+    
+    return solution
+
+
+def resoudre_rapide(probleme, verbose: bool = True, cache: Optional[CacheSolutions] = None,
+                    budget: Optional[Budget] = None,
+                    ecouteurs: Optional[List[EcouteurSolveur]] = None):
     """
     Fonction utilitaire pour résoudre rapidement un problème avec le Simplexe.
     
     Args:
         probleme: Le problème à résoudre (ProblemePL)
         verbose: Afficher les détails ou non
+        cache: Cache des solutions (optionnel)
+        budget: Limite de temps / d'itérations (optionnel)
+        ecouteurs: Écouteurs de profilage (un CollecteurProfil est attaché à la solution)
     
     Returns:
         La solution du problème (Solution)
     """
-    from .models import Solution
-    import numpy as np
-    
     # Extraire les données du problème
     c = probleme.c.tolist()
     A = probleme.A_ub.tolist() if probleme.A_ub is not None else []
@@ -445,29 +1154,21 @@ def resoudre_rapide(probleme, verbose: bool = True):
         print(f"   Contraintes : {len(b)}")
     
     # Résoudre
-    solveur = SimplexeSolveur()
-    tableaux = solveur.resoudre(c, A, b, noms_vars, maximiser)
+    solveur = SimplexeSolveur(cache=cache, ecouteurs=ecouteurs)
+    resultat = solveur.resoudre(c, A, b, noms_vars, maximiser, budget)
     
     # Créer l'objet Solution
-    solution = Solution()
-    solution.noms_variables = noms_vars
+    solution = solution_depuis_resultat(resultat, noms_vars)
+    for ecouteur in solveur.ecouteurs:
+        if isinstance(ecouteur, CollecteurProfil):
+            ecouteur.attacher(solution)
     
-    if solveur.solution_trouvee:
-        valeurs_vars = [solveur.variables_solution.get(nom, 0.0) for nom in noms_vars]
-        solution.succes = True
-        solution.valeurs_variables = np.array(valeurs_vars)
-        solution.valeur_objectif = solveur.valeur_optimale
-        solution.message = "Solution optimale trouvée"
-        
-        if verbose:
+    if verbose:
+        if solution.succes:
             print("✓ Solution trouvée avec succès!")
-    else:
-        solution.succes = False
-        solution.valeurs_variables = None
-        solution.valeur_objectif = None
-        solution.message = "Aucune solution trouvée" if not solveur.solution_infinie else "Solution infinie"
-        
-        if verbose:
+        elif solution.statut == 'budget_epuise':
+            print(f"⏱ {solution.message}")
+        else:
             print(f"✗ {solution.message}")
     
     return solution
@@ -0,0 +1,669 @@
+"""
+simplexe_standard.py
+--------------------
+Ce fichier contient un simplexe à base explicite pour les problèmes généraux.
+
+Contrairement à SimplexeSolveur (tableaux du cours : contraintes <= avec
+seconds membres positifs), SimplexeStandard accepte des inégalités, des
+égalités et des bornes quelconques, et garde sa base entre deux résolutions.
+On peut donc, sans tout recommencer :
+    - modifier des bornes puis réoptimiser (simplexe dual) : branch-and-bound
+    - ajouter des lignes puis réoptimiser (simplexe dual) : plans coupants
+    - ajouter (ou retirer) des colonnes puis réoptimiser (simplexe primal) :
+      génération de colonnes
+
+Forme interne (minimisation) :
+    Min c^T x   s.c.   A x + s = b,   l <= x <= u
+    avec un écart s_i par ligne : s_i >= 0 pour une inégalité <=, s_i = 0
+    pour une égalité. La base de départ est celle des écarts (B = I).
+
+On garde le tableau complet T = B^-1 [A | I], la valeur de toutes les
+variables (les variables hors base sont à une de leurs bornes) et les coûts
+réduits d = c - c_B T. Chaque pivot met à jour T en O(m x n).
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from .models import ProblemePL
+from .budget import Budget
+from .instrumentation import (
+    Chronometre, EcouteurSolveur, notifier,
+    PHASE_PRICING, PHASE_RATIO, PHASE_PIVOT
+)
+
+
+# Position d'une variable par rapport à la base
+BASIQUE = 0  # Variable de base
+INF = 1      # Hors base, à sa borne inférieure
+SUP = 2      # Hors base, à sa borne supérieure
+LIBRE = 3    # Hors base, sans borne (valeur 0)
+
+# Après ce nombre de pivots dégénérés consécutifs, on passe à la règle de
+# Bland (plus petit indice) qui empêche le cyclage
+MAX_PIVOTS_DEGENERES = 50
+
+# Le tableau est recalculé depuis la base tous les REFACTORISATION pivots
+# (limite l'accumulation des erreurs d'arrondi)
+REFACTORISATION = 100
+
+
+@dataclass
+class EtatBase:
+    """
+    Base du simplexe : permet de repartir d'une base connue (ex: nœud parent).
+    """
+    base: np.ndarray      # Colonne de base de chaque ligne du tableau
+    position: np.ndarray  # BASIQUE, INF, SUP ou LIBRE pour chaque colonne
+
+    def copie(self) -> 'EtatBase':
+        """Copie indépendante de la base."""
+        return EtatBase(self.base.copy(), self.position.copy())
+
+
+class SimplexeStandard:
+    """
+    Simplexe primal et dual à bornes, avec base explicite.
+
+    Exemple :
+        lp = SimplexeStandard.depuis_probleme(probleme)
+        lp.resoudre()                    # 'optimal', 'infaisable', 'non_borne'...
+        lp.modifier_bornes(0, 0, 2)      # x1 <= 2
+        lp.resoudre()                    # repart de la base : simplexe dual
+    """
+
+    def __init__(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
+                 bornes=None, maximiser: bool = False, noms_variables: Optional[List[str]] = None,
+                 ecouteurs: Optional[List[EcouteurSolveur]] = None, tol: float = 1e-9):
+        """
+        Initialise le problème (base des écarts).
+
+        Args:
+            c, A_ub, b_ub, A_eq, b_eq: Données du problème
+            bornes: Bornes (min, max) de chaque variable, None = pas de borne
+                    (par défaut toutes les variables sont >= 0)
+            maximiser: True pour maximiser c^T x
+            noms_variables: Noms des variables (pour les écouteurs)
+            ecouteurs: Écouteurs avertis pendant la résolution (profilage)
+            tol: Tolérance numérique
+        """
+        c = np.asarray(c, dtype=float)
+        n = len(c)
+        blocs, seconds = [], []
+        n_ub = 0
+        if A_ub is not None and len(A_ub) > 0:
+            blocs.append(np.asarray(A_ub, dtype=float).reshape(-1, n))
+            seconds.append(np.asarray(b_ub, dtype=float))
+            n_ub = len(seconds[-1])
+        if A_eq is not None and len(A_eq) > 0:
+            blocs.append(np.asarray(A_eq, dtype=float).reshape(-1, n))
+            seconds.append(np.asarray(b_eq, dtype=float))
+        A = np.vstack(blocs) if blocs else np.zeros((0, n))
+        m = A.shape[0]
+
+        if bornes is None:
+            bornes = [(0, None)] * n
+        inf = [-np.inf if l is None else l for l, _ in bornes]
+        sup = [np.inf if u is None else u for _, u in bornes]
+
+        self.maximiser = maximiser
+        self.tol = tol
+        self.ecouteurs: List[EcouteurSolveur] = list(ecouteurs) if ecouteurs else []
+        self.noms_variables = list(noms_variables) if noms_variables else [f"x{j+1}" for j in range(n)]
+
+        # Colonnes : les n variables, puis un écart par ligne
+        self.A = np.hstack([A, np.eye(m)])
+        self.b = np.concatenate(seconds) if seconds else np.zeros(0)
+        self.c = np.concatenate([-c if maximiser else c, np.zeros(m)])
+        self.inf = np.array(inf + [0.0] * m, dtype=float)
+        self.sup = np.array(sup + [np.inf] * n_ub + [0.0] * (m - n_ub), dtype=float)
+        self.structurelles = list(range(n))          # Colonne de chaque variable
+        self.ecart_de_ligne = list(range(n, n + m))  # Colonne d'écart de chaque ligne
+
+        self.statut = 'non_resolu'
+        self.iterations = 0
+        self._base_des_ecarts()
+
+    @classmethod
+    def depuis_probleme(cls, probleme: ProblemePL, **options) -> 'SimplexeStandard':
+        """
+        Crée le simplexe d'un ProblemePL.
+
+        Args:
+            probleme: Problème à résoudre (les variables entières sont ignorées)
+            **options: ecouteurs, tol
+
+        Returns:
+            Une instance de SimplexeStandard
+        """
+        return cls(probleme.c, probleme.A_ub, probleme.b_ub, probleme.A_eq, probleme.b_eq,
+                   probleme.bounds, probleme.type_optimisation == 'max',
+                   probleme.noms_variables, **options)
+
+    # ------------------------------------------------------------
+    # Base
+    # ------------------------------------------------------------
+
+    @property
+    def m(self) -> int:
+        """Nombre de lignes."""
+        return self.A.shape[0]
+
+    def _position_hors_base(self, j: int) -> int:
+        """Position par défaut d'une variable hors base (borne finie la plus proche de 0)."""
+        if np.isfinite(self.inf[j]):
+            return INF
+        return SUP if np.isfinite(self.sup[j]) else LIBRE
+
+    def _valeur_hors_base(self, j: int) -> float:
+        """Valeur d'une variable hors base d'après sa position."""
+        return {INF: self.inf[j], SUP: self.sup[j]}.get(self.position[j], 0.0)
+
+    def _base_des_ecarts(self):
+        """Base de départ : les écarts (B = I)."""
+        n_col = self.A.shape[1]
+        position = np.array([self._position_hors_base(j) for j in range(n_col)], dtype=int)
+        position[self.ecart_de_ligne] = BASIQUE
+        self.charger_base(EtatBase(np.array(self.ecart_de_ligne, dtype=int), position))
+
+    def etat_base(self) -> EtatBase:
+        """Copie de la base courante (à passer à charger_base)."""
+        return EtatBase(self.base.copy(), self.position.copy())
+
+    def charger_base(self, etat: EtatBase):
+        """
+        Repart d'une base donnée : le tableau, les valeurs et les coûts
+        réduits sont recalculés (factorisation de B).
+
+        Args:
+            etat: Base obtenue par etat_base() (même nombre de lignes et de colonnes)
+        """
+        self.base = np.array(etat.base, dtype=int)
+        self.position = np.array(etat.position, dtype=int)
+        for j in np.flatnonzero(self.position != BASIQUE):
+            # Une borne a pu disparaître depuis l'enregistrement de la base
+            if (self.position[j] == INF and not np.isfinite(self.inf[j])) or \
+               (self.position[j] == SUP and not np.isfinite(self.sup[j])):
+                self.position[j] = self._position_hors_base(j)
+        self._refactoriser()
+
+    def _refactoriser(self):
+        """Recalcule T = B^-1 A, les valeurs de base et les coûts réduits."""
+        hors_base = self.position != BASIQUE
+        self.x = np.zeros(self.A.shape[1])
+        self.x[self.position == INF] = self.inf[self.position == INF]
+        self.x[self.position == SUP] = self.sup[self.position == SUP]
+
+        if self.m > 0:
+            B = self.A[:, self.base]
+            self.T = np.linalg.solve(B, self.A)
+            self.x[self.base] = np.linalg.solve(B, self.b - self.A[:, hors_base] @ self.x[hors_base])
+        else:
+            self.T = np.zeros((0, self.A.shape[1]))
+        self.T[:, self.base] = np.eye(self.m)
+        self.d = self.c - self.c[self.base] @ self.T
+        self.d[self.base] = 0.0
+        self._pivots_depuis_factorisation = 0
+
+    def _pivoter(self, r: int, q: int):
+        """Fait entrer la colonne q dans la base à la ligne r (règle du rectangle)."""
+        ligne = self.T[r] / self.T[r, q]
+        colonne = self.T[:, q].copy()
+        colonne[r] = 0.0
+        self.T -= np.outer(colonne, ligne)
+        self.T[r] = ligne
+        self.d -= self.d[q] * ligne
+        self.d[q] = 0.0
+
+        self.position[self.base[r]] = INF  # Corrigé par l'appelant si besoin
+        self.base[r] = q
+        self.position[q] = BASIQUE
+
+        self._pivots_depuis_factorisation += 1
+        if self._pivots_depuis_factorisation >= REFACTORISATION:
+            self._refactoriser()
+
+    # ------------------------------------------------------------
+    # Modifications du problème
+    # ------------------------------------------------------------
+
+    def modifier_bornes(self, variable: int, borne_min: Optional[float], borne_max: Optional[float]):
+        """
+        Change les bornes d'une variable ; la base est conservée.
+
+        Args:
+            variable: Indice de la variable (ordre du problème)
+            borne_min, borne_max: Nouvelles bornes (None = pas de borne)
+        """
+        j = self.structurelles[variable]
+        self.inf[j] = -np.inf if borne_min is None else borne_min
+        self.sup[j] = np.inf if borne_max is None else borne_max
+        if self.position[j] == BASIQUE:
+            return  # Une variable de base hors de ses bornes : simplexe dual
+
+        ancienne = self.x[j]
+        if self.position[j] == INF and not np.isfinite(self.inf[j]) or \
+           self.position[j] == SUP and not np.isfinite(self.sup[j]) or \
+           self.position[j] == LIBRE:
+            self.position[j] = self._position_hors_base(j)
+        self.x[j] = self._valeur_hors_base(j)
+        self.x[self.base] -= self.T[:, j] * (self.x[j] - ancienne)
+
+    def modifier_couts(self, couts):
+        """
+        Change l'objectif ; la base reste réalisable (simplexe primal).
+
+        Args:
+            couts: Nouveau coefficient de chaque variable (sens du problème)
+        """
+        couts = np.asarray(couts, dtype=float)
+        self.c[self.structurelles] = -couts if self.maximiser else couts
+        self.d = self.c - self.c[self.base] @ self.T
+        self.d[self.base] = 0.0
+
+    def fixer_bornes(self, bornes_min: np.ndarray, bornes_max: np.ndarray):
+        """
+        Change les bornes de toutes les variables (ex: bornes d'un nœud).
+
+        Args:
+            bornes_min, bornes_max: Tableaux de bornes (-inf / +inf = pas de borne)
+        """
+        for variable, (l, u) in enumerate(zip(bornes_min, bornes_max)):
+            j = self.structurelles[variable]
+            if self.inf[j] != l or self.sup[j] != u:
+                self.modifier_bornes(variable, None if np.isinf(l) else l, None if np.isinf(u) else u)
+
+    def ajouter_ligne(self, coefficients, borne: float, sens: str = '<=') -> int:
+        """
+        Ajoute une contrainte ; son écart entre dans la base.
+
+        Si la solution courante la viole, resoudre() utilise le simplexe dual.
+
+        Args:
+            coefficients: Coefficients sur les variables (ordre du problème)
+            borne: Second membre
+            sens: '<=', '>=' ou '='
+
+        Returns:
+            Indice de la nouvelle ligne
+        """
+        coefficients = np.asarray(coefficients, dtype=float)
+        if sens == '>=':
+            coefficients, borne = -coefficients, -borne
+
+        m, n_col = self.A.shape
+        ligne = np.zeros(n_col + 1)
+        ligne[self.structurelles] = coefficients
+        ligne[n_col] = 1.0
+
+        self.A = np.vstack([np.hstack([self.A, np.zeros((m, 1))]), ligne])
+        self.b = np.append(self.b, borne)
+        self.c = np.append(self.c, 0.0)
+        self.d = np.append(self.d, 0.0)
+        self.inf = np.append(self.inf, 0.0)
+        self.sup = np.append(self.sup, 0.0 if sens == '=' else np.inf)
+
+        # Ligne du tableau : on élimine les colonnes de base de la nouvelle ligne
+        T = np.hstack([self.T, np.zeros((m, 1))])
+        self.T = np.vstack([T, ligne - ligne[self.base] @ T])
+
+        self.x = np.append(self.x, borne - coefficients @ self.x[self.structurelles])
+        self.base = np.append(self.base, n_col)
+        self.position = np.append(self.position, BASIQUE)
+        self.ecart_de_ligne.append(n_col)
+        return self.m - 1
+
+    def supprimer_ligne(self, ligne: int) -> bool:
+        """
+        Supprime une contrainte inactive (son écart doit être dans la base).
+
+        Args:
+            ligne: Indice de la ligne
+
+        Returns:
+            True si la ligne a été supprimée (False si elle est active)
+        """
+        s = self.ecart_de_ligne[ligne]
+        if self.position[s] != BASIQUE:
+            return False
+        r = int(np.flatnonzero(self.base == s)[0])
+
+        garder_col = np.arange(self.A.shape[1]) != s
+        self.A = np.delete(np.delete(self.A, ligne, axis=0), s, axis=1)
+        self.T = np.delete(np.delete(self.T, r, axis=0), s, axis=1)
+        self.b = np.delete(self.b, ligne)
+        self.c, self.d, self.x = self.c[garder_col], self.d[garder_col], self.x[garder_col]
+        self.inf, self.sup = self.inf[garder_col], self.sup[garder_col]
+        self.position = self.position[garder_col]
+
+        def decaler(indices):
+            return [k - 1 if k > s else k for k in indices]
+
+        self.base = np.array(decaler(np.delete(self.base, r)), dtype=int)
+        del self.ecart_de_ligne[ligne]
+        self.ecart_de_ligne = decaler(self.ecart_de_ligne)
+        self.structurelles = decaler(self.structurelles)
+        return True
+
+    def ajouter_colonne(self, cout: float, coefficients, borne_min: float = 0.0,
+                        borne_max: Optional[float] = None, nom: Optional[str] = None) -> int:
+        """
+        Ajoute une variable hors base (à sa borne inférieure).
+
+        La base reste réalisable : resoudre() utilise le simplexe primal.
+
+        Args:
+            cout: Coefficient dans l'objectif (dans le sens du problème)
+            coefficients: Coefficient de la variable dans chaque ligne
+            borne_min, borne_max: Bornes de la variable (None = pas de borne max)
+            nom: Nom de la variable
+
+        Returns:
+            Indice de la nouvelle variable (ordre du problème)
+        """
+        colonne = np.asarray(coefficients, dtype=float)
+        n_col = self.A.shape[1]
+
+        self.A = np.hstack([self.A, colonne.reshape(-1, 1)])
+        self.c = np.append(self.c, -cout if self.maximiser else cout)
+        self.inf = np.append(self.inf, borne_min)
+        self.sup = np.append(self.sup, np.inf if borne_max is None else borne_max)
+
+        # Colonne du tableau B^-1 a et coût réduit c_j - y^T a
+        inverse = self.T[:, self.ecart_de_ligne]
+        self.T = np.hstack([self.T, (inverse @ colonne).reshape(-1, 1)])
+        self.d = np.append(self.d, self.c[n_col] - (self.c[self.base] @ inverse) @ colonne)
+
+        self.position = np.append(self.position, INF)
+        self.x = np.append(self.x, borne_min)
+        self.x[self.base] -= self.T[:, n_col] * borne_min
+        self.structurelles.append(n_col)
+        self.noms_variables.append(nom or f"x{len(self.structurelles)}")
+        return len(self.structurelles) - 1
+
+    def supprimer_colonne(self, variable: int) -> bool:
+        """
+        Supprime une variable hors base (ex: colonne inutile en génération de colonnes).
+
+        Args:
+            variable: Indice de la variable (ordre du problème)
+
+        Returns:
+            True si la variable a été supprimée (False si elle est dans la base)
+        """
+        j = self.structurelles[variable]
+        if self.position[j] == BASIQUE:
+            return False
+
+        # La variable disparaît : les variables de base compensent sa valeur
+        self.x[self.base] += self.T[:, j] * self.x[j]
+        garder = np.arange(self.A.shape[1]) != j
+        self.A, self.T = self.A[:, garder], self.T[:, garder]
+        self.c, self.d, self.x = self.c[garder], self.d[garder], self.x[garder]
+        self.inf, self.sup = self.inf[garder], self.sup[garder]
+        self.position = self.position[garder]
+
+        def decaler(indices):
+            return [k - 1 if k > j else k for k in indices]
+
+        self.base = np.array(decaler(self.base), dtype=int)
+        del self.structurelles[variable]
+        del self.noms_variables[variable]
+        self.structurelles = decaler(self.structurelles)
+        self.ecart_de_ligne = decaler(self.ecart_de_ligne)
+        return True
+
+    # ------------------------------------------------------------
+    # Résolution
+    # ------------------------------------------------------------
+
+    def _primal_realisable(self) -> bool:
+        """Les variables de base respectent-elles leurs bornes ?"""
+        xb = self.x[self.base]
+        return bool(np.all(xb >= self.inf[self.base] - self._tol_primal())
+                    and np.all(xb <= self.sup[self.base] + self._tol_primal()))
+
+    def _dual_realisable(self, d: np.ndarray) -> bool:
+        """Les coûts réduits ont-ils le bon signe (base optimale si réalisable) ?"""
+        fixe = self.inf == self.sup
+        return not (np.any((self.position == INF) & ~fixe & (d < -self.tol))
+                    or np.any((self.position == SUP) & ~fixe & (d > self.tol))
+                    or np.any((self.position == LIBRE) & (np.abs(d) > self.tol)))
+
+    def _tol_primal(self) -> float:
+        return self.tol * max(1.0, float(np.abs(self.b).max()) if len(self.b) else 1.0)
+
+    def resoudre(self, budget: Optional[Budget] = None) -> str:
+        """
+        Résout le problème en partant de la base courante.
+
+        - base réalisable : simplexe primal
+        - base dual-réalisable (ex: après un changement de bornes ou l'ajout
+          d'une ligne) : simplexe dual
+        - sinon : simplexe dual sur un objectif nul (phase 1), puis primal
+
+        Args:
+            budget: Limite de temps / d'itérations (pivots) ; None = pas de limite
+
+        Returns:
+            Le statut : 'optimal', 'infaisable', 'non_borne' ou 'budget_epuise'
+        """
+        chrono = Chronometre()
+        self.iterations = 0
+        debut = Budget.maintenant()
+        notifier(self.ecouteurs, 'debut_resolution', 'simplexe-standard',
+                 len(self.structurelles), self.m)
+        notifier(self.ecouteurs, 'memoire', self.T.nbytes + self.A.nbytes)
+
+        if self._primal_realisable():
+            self.statut = self._primal(budget, debut, chrono)
+        elif self._dual_realisable(self.d):
+            self.statut = self._dual(budget, debut, chrono)
+        else:
+            # Phase 1 : avec des coûts nuls, toute base est dual-réalisable
+            couts = self.c
+            self.c = np.zeros_like(couts)
+            self.d = np.zeros_like(couts)
+            self.statut = self._dual(budget, debut, chrono)
+            self.c = couts
+            self.d = self.c - self.c[self.base] @ self.T
+            self.d[self.base] = 0.0
+            if self.statut == 'optimal':
+                self.statut = self._primal(budget, debut, chrono)
+
+        notifier(self.ecouteurs, 'fin_resolution', self.statut, self.iterations, chrono.total())
+        return self.statut
+
+    def _nom_colonne(self, j: int) -> str:
+        """Nom d'une colonne (variable ou écart) pour les écouteurs."""
+        if j in self.structurelles:
+            return self.noms_variables[self.structurelles.index(j)]
+        return f"e{self.ecart_de_ligne.index(j) + 1}"
+
+    def _primal(self, budget: Optional[Budget], debut: float, chrono: Chronometre) -> str:
+        """Simplexe primal à bornes (base réalisable)."""
+        degeneres = 0
+        while True:
+            if budget is not None and budget.epuise(self.iterations, debut):
+                return 'budget_epuise'
+            fixe = self.inf == self.sup
+
+            # Variable entrante : coût réduit du bon signe (plus grand, ou Bland)
+            d = self.d
+            candidats = (((self.position == INF) & (d < -self.tol))
+                         | ((self.position == SUP) & (d > self.tol))
+                         | ((self.position == LIBRE) & (np.abs(d) > self.tol))) & ~fixe
+            indices = np.flatnonzero(candidats)
+            notifier(self.ecouteurs, 'fin_phase', PHASE_PRICING, chrono.tour())
+            if len(indices) == 0:
+                return 'optimal'
+            q = int(indices[0]) if degeneres >= MAX_PIVOTS_DEGENERES \
+                else int(indices[np.argmax(np.abs(d[indices]))])
+            sens = 1.0 if d[q] < 0 else -1.0
+
+            # Test du ratio (variables de base et changement de borne de q)
+            alpha = sens * self.T[:, q]
+            xb = self.x[self.base]
+            limites = np.full(self.m, np.inf)
+            baisse = alpha > self.tol
+            hausse = alpha < -self.tol
+            limites[baisse] = (xb[baisse] - self.inf[self.base][baisse]) / alpha[baisse]
+            limites[hausse] = (xb[hausse] - self.sup[self.base][hausse]) / alpha[hausse]
+            limites = np.maximum(limites, 0.0)
+
+            pas = self.sup[q] - self.inf[q]
+            r = -1
+            if self.m > 0 and np.isfinite(limites.min()) and limites.min() < pas:
+                minimum = limites.min()
+                egaux = np.flatnonzero(limites <= minimum + self.tol)
+                r = int(egaux[0]) if degeneres >= MAX_PIVOTS_DEGENERES \
+                    else int(egaux[np.argmax(np.abs(alpha[egaux]))])
+                pas = limites[r]
+            notifier(self.ecouteurs, 'fin_phase', PHASE_RATIO, chrono.tour())
+            if not np.isfinite(pas):
+                return 'non_borne'
+
+            self.x[q] += sens * pas
+            self.x[self.base] -= alpha * pas
+            degeneres = degeneres + 1 if pas <= self.tol else 0
+            self.iterations += 1
+
+            if r < 0:
+                # Changement de borne : q passe à son autre borne, sans pivot
+                self.position[q] = SUP if sens > 0 else INF
+                self.x[q] = self._valeur_hors_base(q)
+                sortante = q
+            else:
+                sortante = int(self.base[r])
+                a_la_borne_inf = alpha[r] > 0
+                self._pivoter(r, q)
+                self.position[sortante] = INF if a_la_borne_inf else SUP
+                if self.inf[sortante] == self.sup[sortante]:
+                    self.position[sortante] = INF
+                self.x[sortante] = self._valeur_hors_base(sortante)
+            notifier(self.ecouteurs, 'fin_phase', PHASE_PIVOT, chrono.tour())
+            if self.ecouteurs:
+                notifier(self.ecouteurs, 'pivot', self.iterations, self._nom_colonne(q),
+                         self._nom_colonne(sortante), pas <= self.tol)
+
+    def _dual(self, budget: Optional[Budget], debut: float, chrono: Chronometre) -> str:
+        """Simplexe dual à bornes (base dual-réalisable)."""
+        degeneres = 0
+        tol_primal = self._tol_primal()
+        while True:
+            if budget is not None and budget.epuise(self.iterations, debut):
+                return 'budget_epuise'
+
+            # Variable sortante : variable de base la plus hors de ses bornes
+            xb = self.x[self.base]
+            sous = self.inf[self.base] - xb
+            dessus = xb - self.sup[self.base]
+            violation = np.maximum(sous, dessus)
+            if self.m == 0 or violation.max() <= tol_primal:
+                notifier(self.ecouteurs, 'fin_phase', PHASE_RATIO, chrono.tour())
+                return 'optimal'
+            if degeneres >= MAX_PIVOTS_DEGENERES:
+                violees = np.flatnonzero(violation > tol_primal)
+                r = int(violees[np.argmin(self.base[violees])])
+            else:
+                r = int(np.argmax(violation))
+            vers_inf = sous[r] > dessus[r]
+            cible = self.inf[self.base[r]] if vers_inf else self.sup[self.base[r]]
+
+            # Variable entrante : test du ratio sur les coûts réduits
+            alpha = self.T[r]
+            fixe = self.inf == self.sup
+            if vers_inf:  # x_Br doit augmenter
+                eligibles = ((self.position == INF) & (alpha < -self.tol)) \
+                    | ((self.position == SUP) & (alpha > self.tol))
+            else:         # x_Br doit diminuer
+                eligibles = ((self.position == INF) & (alpha > self.tol)) \
+                    | ((self.position == SUP) & (alpha < -self.tol))
+            eligibles |= (self.position == LIBRE) & (np.abs(alpha) > self.tol)
+            eligibles &= ~fixe
+            indices = np.flatnonzero(eligibles)
+            notifier(self.ecouteurs, 'fin_phase', PHASE_RATIO, chrono.tour())
+            if len(indices) == 0:
+                return 'infaisable'
+
+            ratios = np.abs(self.d[indices]) / np.abs(alpha[indices])
+            egaux = indices[ratios <= ratios.min() + self.tol]
+            q = int(egaux[0]) if degeneres >= MAX_PIVOTS_DEGENERES \
+                else int(egaux[np.argmax(np.abs(alpha[egaux]))])
+            notifier(self.ecouteurs, 'fin_phase', PHASE_PRICING, chrono.tour())
+
+            # x_Br atteint sa borne ; q varie de pas
+            pas = (self.x[self.base[r]] - cible) / alpha[q]
+            sortante = int(self.base[r])
+            self.x[q] += pas
+            self.x[self.base] -= self.T[:, q] * pas
+            degeneres = degeneres + 1 if abs(self.d[q]) <= self.tol else 0
+            self.iterations += 1
+
+            self._pivoter(r, q)
+            self.position[sortante] = INF if vers_inf else SUP
+            self.x[sortante] = cible
+            notifier(self.ecouteurs, 'fin_phase', PHASE_PIVOT, chrono.tour())
+            if self.ecouteurs:
+                notifier(self.ecouteurs, 'pivot', self.iterations, self._nom_colonne(q),
+                         self._nom_colonne(sortante), abs(pas) <= self.tol)
+
+    # ------------------------------------------------------------
+    # Résultats
+    # ------------------------------------------------------------
+
+    def valeurs(self) -> np.ndarray:
+        """Valeurs des variables (ordre du problème)."""
+        return self.x[self.structurelles].copy()
+
+    @property
+    def valeur_objectif(self) -> float:
+        """Valeur de l'objectif (dans le sens du problème)."""
+        valeur = float(self.c @ self.x)
+        return -valeur if self.maximiser else valeur
+
+    def duales(self) -> np.ndarray:
+        """
+        Variables duales : dérivée de l'objectif (sens du problème) par
+        rapport au second membre de chaque ligne.
+        """
+        y = self.c[self.base] @ self.T[:, self.ecart_de_ligne]
+        return -y if self.maximiser else y
+
+    def couts_reduits(self) -> np.ndarray:
+        """Coûts réduits des variables (sens du problème)."""
+        d = self.d[self.structurelles]
+        return -d if self.maximiser else d.copy()
+
+    def couts_reduits_pour(self, duales: np.ndarray) -> np.ndarray:
+        """
+        Coûts réduits c_j - y^T a_j des variables pour des duales quelconques.
+
+        Args:
+            duales: Une valeur par ligne (convention de duales())
+
+        Returns:
+            Coûts réduits (sens du problème)
+        """
+        c = self.c[self.structurelles]
+        return (-c if self.maximiser else c) - duales @ self.A[:, self.structurelles]
+
+    def ligne_tableau(self, variable: int):
+        """
+        Ligne du tableau où la variable est de base.
+
+        Args:
+            variable: Indice de la variable (ordre du problème)
+
+        Returns:
+            (coefficients sur toutes les colonnes, valeur), ou None si la
+            variable est hors base
+        """
+        j = self.structurelles[variable]
+        lignes = np.flatnonzero(self.base == j)
+        if len(lignes) == 0:
+            return None
+        r = int(lignes[0])
+        return self.T[r].copy(), float(self.x[j])
@@ -3,11 +3,18 @@ solver.py
 ---------
 Ce fichier contient le solveur pour résoudre les problèmes de programmation linéaire.
 On utilise scipy.optimize.linprog qui implémente l'algorithme du simplexe.
+
+SciPy est long à importer : il n'est chargé qu'à la première résolution.
 """
 
 import numpy as np
-from scipy.optimize import linprog
+from typing import List, Optional
 from .models import ProblemePL, Solution
+from .cache import CacheSolutions
+from .budget import Budget, borne_lagrangienne
+from .instrumentation import (
+    Chronometre, CollecteurProfil, EcouteurSolveur, notifier, PHASE_CACHE, PHASE_RESOLUTION
+)
 
 
 class SolveurPL:
@@ -15,17 +22,35 @@ class SolveurPL:
     Classe qui résout un problème de programmation linéaire.
     """
     
-    def __init__(self):
-        """Initialise le solveur."""
+    # Méthodes acceptées par scipy.optimize.linprog
+    METHODES = [
+        'highs', 'highs-ds', 'highs-ipm', 
+        'interior-point', 'revised simplex', 'simplex'
+    ]
+    
+    def __init__(self, cache: Optional[CacheSolutions] = None,
+                 ecouteurs: Optional[List[EcouteurSolveur]] = None):
+        """
+        Initialise le solveur.
+        
+        Args:
+            cache: Cache des solutions (None = pas de cache)
+            ecouteurs: Écouteurs avertis pendant la résolution (profilage)
+        """
         self.methode = 'highs'  # Méthode HiGHS (la plus rapide et robuste)
+        self.cache = cache
+        self.ecouteurs: List[EcouteurSolveur] = list(ecouteurs) if ecouteurs else []
     
-    def resoudre(self, probleme: ProblemePL, verbose: bool = False) -> Solution:
+    def resoudre(self, probleme: ProblemePL, verbose: bool = False,
+                 budget: Optional[Budget] = None) -> Solution:
         """
         Résout le problème de programmation linéaire.
         
         Args:
             probleme: Instance de ProblemePL à résoudre
             verbose: Si True, affiche des informations détaillées
+            budget: Limite de temps / d'itérations (optionnel). Si elle est
+                    atteinte, la solution a le statut 'budget_epuise'
         
         Returns:
             Une instance de Solution contenant le résultat
@@ -53,7 +78,34 @@ class SolveurPL:
             print(f"   Contraintes inégalité : {len(probleme.b_ub) if probleme.b_ub is not None else 0}")
             print(f"   Contraintes égalité : {len(probleme.b_eq) if probleme.b_eq is not None else 0}")
         
-        # Résoudre avec scipy
+        chrono = Chronometre()
+        n_contraintes = ((len(probleme.b_ub) if probleme.b_ub is not None else 0)
+                         + (len(probleme.b_eq) if probleme.b_eq is not None else 0))
+        
+        # Chercher d'abord dans le cache
+        cle_cache = None
+        if self.cache is not None:
+            cle_cache = CacheSolutions.cle(
+                f"scipy-{self.methode}", probleme.c,
+                probleme.A_ub, probleme.b_ub, probleme.A_eq, probleme.b_eq,
+                bounds, probleme.type_optimisation,
+                extra=list(probleme.noms_variables) + list(probleme.types_variables)
+            )
+            solution = self.cache.obtenir(cle_cache)
+            if solution is not None:
+                if verbose:
+                    print("✓ Solution trouvée dans le cache!")
+                return self._solution_en_cache(solution, len(c), n_contraintes, chrono)
+        
+        # Résoudre avec scipy (import différé, voir en-tête du fichier)
+        from scipy.optimize import linprog
+        
+        notifier(self.ecouteurs, 'debut_resolution', f"scipy-{self.methode}", len(c), n_contraintes)
+        notifier(self.ecouteurs, 'memoire', sum(
+            tableau.nbytes for tableau in (c, probleme.A_ub, probleme.b_ub, probleme.A_eq, probleme.b_eq)
+            if tableau is not None
+        ))
+        
         try:
             resultat = linprog(
                 c=c,
@@ -62,8 +114,11 @@ class SolveurPL:
                 A_eq=probleme.A_eq,
                 b_eq=probleme.b_eq,
                 bounds=bounds,
-                method=self.methode
+                method=self.methode,
+                options=budget.options_linprog(self.methode) if budget is not None else None,
+                **self._options_integrite(probleme)
             )
+            notifier(self.ecouteurs, 'fin_phase', PHASE_RESOLUTION, chrono.tour())
             
             # Créer l'objet Solution
             solution = Solution()
@@ -80,16 +135,32 @@ class SolveurPL:
                     solution.valeur_objectif = resultat.fun
                 
                 solution.message = "Solution optimale trouvée"
+                solution.statut = 'optimal'
                 
                 if verbose:
                     print("✓ Solution trouvée avec succès!")
+            elif resultat.status == 1:
+                # Limite de temps ou d'itérations atteinte
+                self._remplir_budget_epuise(solution, probleme, c, bounds, resultat)
+                
+                if verbose:
+                    print(f"⏱ Budget épuisé: {resultat.message}")
             else:
                 solution.succes = False
                 solution.message = resultat.message
+                solution.statut = {2: 'infaisable', 3: 'non_borne'}.get(resultat.status, 'echec')
                 
                 if verbose:
                     print(f"✗ Échec: {resultat.message}")
             
+            notifier(self.ecouteurs, 'fin_resolution', solution.statut,
+                     int(getattr(resultat, 'nit', 0)), chrono.total())
+            self._attacher_profil(solution)
+            
+            # Une solution interrompue par le budget n'est pas mise en cache
+            if cle_cache is not None and solution.statut != 'budget_epuise':
+                self.cache.stocker(cle_cache, solution)
+            
             return solution
             
         except Exception as e:
@@ -97,13 +168,85 @@ class SolveurPL:
             solution = Solution()
             solution.succes = False
             solution.message = f"Erreur lors de la résolution: {str(e)}"
+            solution.statut = 'erreur'
             solution.noms_variables = probleme.noms_variables
             
+            notifier(self.ecouteurs, 'fin_resolution', solution.statut, 0, chrono.total())
+            self._attacher_profil(solution)
+            
             if verbose:
                 print(f"✗ Erreur: {str(e)}")
             
             return solution
     
+    def _solution_en_cache(self, solution: Solution, n_variables: int, n_contraintes: int,
+                           chrono: Chronometre) -> Solution:
+        """
+        Termine une résolution servie par le cache.
+        
+        Le cache renvoie une copie de la solution ; son profil est celui de
+        la première résolution : il est remplacé par celui de cet appel. Les
+        écouteurs voient une résolution sans pivot (phase 'cache').
+        """
+        solution.profil = None
+        notifier(self.ecouteurs, 'debut_resolution', f"scipy-{self.methode}", n_variables, n_contraintes)
+        notifier(self.ecouteurs, 'fin_phase', PHASE_CACHE, chrono.tour())
+        notifier(self.ecouteurs, 'fin_resolution', solution.statut, 0, chrono.total())
+        self._attacher_profil(solution)
+        return solution
+    
+    def _options_integrite(self, probleme: ProblemePL) -> dict:
+        """
+        Variables entières pour linprog (seules les méthodes HiGHS les gèrent ;
+        les autres résolvent la relaxation continue, voir BranchAndBound).
+        """
+        if not probleme.indices_entiers() or not self.methode.startswith('highs'):
+            return {}
+        integrite = np.zeros(len(probleme.c), dtype=int)
+        integrite[probleme.indices_entiers()] = 1
+        return {'integrality': integrite}
+    
+    def _attacher_profil(self, solution: Solution):
+        """Attache le profil du (premier) CollecteurProfil à la solution."""
+        for ecouteur in self.ecouteurs:
+            if isinstance(ecouteur, CollecteurProfil):
+                ecouteur.attacher(solution)
+                return
+    
+    def _remplir_budget_epuise(self, solution: Solution, probleme: ProblemePL,
+                               c: np.ndarray, bounds, resultat):
+        """
+        Remplit la solution quand linprog s'est arrêté sur une limite.
+        
+        Le point courant n'est gardé que s'il est réalisable ; l'écart à
+        l'optimum est borné avec les multiplicateurs renvoyés par linprog.
+        """
+        solution.succes = False
+        solution.statut = 'budget_epuise'
+        solution.message = f"Budget épuisé : {resultat.message}"
+        
+        x = resultat.x
+        if x is None or not _est_realisable(probleme, x, bounds):
+            solution.message += " (aucune solution réalisable connue)"
+            return
+        
+        # Multiplicateurs de Lagrange (linprog donne les sensibilités, <= 0 pour A_ub)
+        y_ub = y_eq = None
+        ineqlin = getattr(resultat, 'ineqlin', None)
+        eqlin = getattr(resultat, 'eqlin', None)
+        if ineqlin is not None and getattr(ineqlin, 'marginals', None) is not None:
+            y_ub = -np.asarray(ineqlin.marginals)
+        if eqlin is not None and getattr(eqlin, 'marginals', None) is not None:
+            y_eq = -np.asarray(eqlin.marginals)
+        
+        valeur_min = float(c @ x)
+        borne = borne_lagrangienne(c, probleme.A_ub, probleme.b_ub, probleme.A_eq,
+                                   probleme.b_eq, bounds, y_ub, y_eq)
+        
+        solution.valeurs_variables = x
+        solution.valeur_objectif = -valeur_min if probleme.type_optimisation == 'max' else valeur_min
+        solution.ecart_optimalite = max(0.0, valeur_min - borne)
+    
     def changer_methode(self, methode: str):
         """
         Change la méthode de résolution.
@@ -112,28 +255,43 @@ class SolveurPL:
             methode: 'highs', 'highs-ds', 'highs-ipm', 'interior-point', 
                     'revised simplex', ou 'simplex'
         """
-        methodes_valides = [
-            'highs', 'highs-ds', 'highs-ipm', 
-            'interior-point', 'revised simplex', 'simplex'
-        ]
-        
-        if methode in methodes_valides:
+        if methode in self.METHODES:
             self.methode = methode
             print(f"Méthode changée en: {methode}")
         else:
-            print(f"Méthode invalide. Méthodes disponibles: {methodes_valides}")
+            print(f"Méthode invalide. Méthodes disponibles: {self.METHODES}")
+
+
+def _est_realisable(probleme: ProblemePL, x: np.ndarray, bounds, tol: float = 1e-7) -> bool:
+    """Vérifie que x respecte les contraintes et les bornes du problème."""
+    if probleme.A_ub is not None and np.any(probleme.A_ub @ x > probleme.b_ub + tol):
+        return False
+    if probleme.A_eq is not None and np.any(np.abs(probleme.A_eq @ x - probleme.b_eq) > tol):
+        return False
+    for xj, (borne_min, borne_max) in zip(x, bounds):
+        if borne_min is not None and xj < borne_min - tol:
+            return False
+        if borne_max is not None and xj > borne_max + tol:
+            return False
+    return True
 
 
-def resoudre_rapide(probleme: ProblemePL, verbose: bool = True) -> Solution:
+def resoudre_rapide(probleme: ProblemePL, verbose: bool = True,
+                    cache: Optional[CacheSolutions] = None,
+                    budget: Optional[Budget] = None,
+                    ecouteurs: Optional[List[EcouteurSolveur]] = None) -> Solution:
     """
     Fonction utilitaire pour résoudre rapidement un problème.
     
     Args:
         probleme: Le problème à résoudre
         verbose: Afficher les détails ou non
+        cache: Cache des solutions (optionnel)
+        budget: Limite de temps / d'itérations (optionnel)
+        ecouteurs: Écouteurs de profilage (un CollecteurProfil est attaché à la solution)
     
     Returns:
         La solution du problème
     """
-    solveur = SolveurPL()
-    return solveur.resoudre(probleme, verbose=verbose)
+    solveur = SolveurPL(cache=cache, ecouteurs=ecouteurs)
+    return solveur.resoudre(probleme, verbose=verbose, budget=budget)
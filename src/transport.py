@@ -0,0 +1,719 @@
+"""
+transport.py
+------------
+Ce fichier contient un solveur spécialisé pour les problèmes de transport.
+
+Un problème de transport (m sources, n destinations) :
+
+    Min  somme_ij c_ij x_ij
+    s.c. somme_j x_ij <= a_i   (offre de la source i, ou = a_i)
+         somme_i x_ij  = b_j   (demande de la destination j, ou >= b_j)
+         x_ij >= 0
+
+Au lieu d'un tableau du simplexe de taille (m+n) x (m*n), la base est un
+arbre couvrant de m+n-1 cases (mémoire O(m+n)) :
+    1. Solution de départ : Vogel, moindre coût ou coin nord-ouest
+    2. Potentiels u_i, v_j (méthode MODI) : c_ij = u_i + v_j sur la base
+    3. Coûts réduits d_ij = c_ij - u_i - v_j ; si tous >= 0 : optimal
+    4. Sinon la case la plus négative entre dans la base ; on fait circuler
+       le flux le long du cycle qu'elle forme dans l'arbre
+
+SolveurTransport reconnaît cette structure dans un ProblemePL (chaque
+variable apparaît avec le coefficient 1 dans une ligne "source" et une
+ligne "destination") ou accepte directement offres, demandes et coûts.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .models import ProblemePL, Solution
+from .cache import CacheSolutions
+from .budget import Budget
+from .instrumentation import (
+    Chronometre, CollecteurProfil, EcouteurSolveur, notifier,
+    PHASE_INITIALISATION, PHASE_PRICING, PHASE_PIVOT
+)
+
+
+# Au-delà de ce nombre de cases, Vogel (O(m*n) par allocation) est trop cher
+SEUIL_VOGEL = 20_000
+
+# Nombre de cases dont on calcule les coûts réduits à la fois (pricing partiel)
+TAILLE_BLOC_PRICING = 65_536
+
+
+@dataclass
+class ProblemeTransport:
+    """
+    Données d'un problème de transport.
+
+    Les routes interdites ont un coût np.inf. Si le problème vient d'un
+    ProblemePL (voir detecter_transport), `routes` donne pour chaque
+    variable d'origine sa case (source, destination).
+    """
+    offres: np.ndarray                   # a_i (m)
+    demandes: np.ndarray                 # b_j (n)
+    couts: np.ndarray                    # c_ij (m x n), np.inf = route interdite
+    maximiser: bool = False
+    sens_offres: List[str] = field(default_factory=list)     # '<=' ou '=' (défaut '<=')
+    sens_demandes: List[str] = field(default_factory=list)   # '=' ou '>=' (défaut '=')
+    noms_variables: List[str] = field(default_factory=list)
+    routes: Optional[np.ndarray] = None  # (nb variables x 2), ou None = toutes les cases
+                                         # (-1, -1) = variable en double, laissée à 0
+
+    def __post_init__(self):
+        self.offres = np.asarray(self.offres, dtype=float)
+        self.demandes = np.asarray(self.demandes, dtype=float)
+        self.couts = np.asarray(self.couts, dtype=float)
+        m, n = len(self.offres), len(self.demandes)
+        if self.couts.shape != (m, n):
+            raise ValueError(f"La matrice des coûts doit être de taille {m}x{n}!")
+        if not self.sens_offres:
+            self.sens_offres = ['<='] * m
+        if not self.sens_demandes:
+            self.sens_demandes = ['='] * n
+        if not self.noms_variables and self.routes is None:
+            self.noms_variables = [f"U{i+1}→E{j+1}" for i in range(m) for j in range(n)]
+
+
+# ============================================================
+# DÉTECTION DE LA STRUCTURE
+# ============================================================
+
+def detecter_transport(probleme: ProblemePL) -> Optional[ProblemeTransport]:
+    """
+    Reconnaît un problème de transport dans un ProblemePL.
+
+    Conditions : variables >= 0 sans borne supérieure, chaque ligne a des
+    coefficients tous égaux à 1 (ou tous à -1), chaque variable apparaît
+    dans exactement deux lignes, et les lignes se séparent en sources
+    (<= ou =) et destinations (= ou >=).
+
+    Args:
+        probleme: Problème à analyser
+
+    Returns:
+        Le ProblemeTransport équivalent, ou None si la structure n'est pas reconnue
+    """
+    if probleme.c is None:
+        return None
+    n_vars = len(probleme.c)
+
+    if probleme.bounds is not None:
+        for borne_min, borne_max in probleme.bounds:
+            if borne_min != 0 or (borne_max is not None and borne_max != np.inf):
+                return None
+
+    # Lignes normalisées (coefficients 1) avec leur sens
+    blocs, seconds, sens = [], [], []
+    for A, b, egalite in ((probleme.A_ub, probleme.b_ub, False), (probleme.A_eq, probleme.b_eq, True)):
+        if A is None:
+            continue
+        for ligne, borne in zip(A, b):
+            non_nuls = ligne[ligne != 0]
+            if len(non_nuls) == 0:
+                if (egalite and borne != 0) or borne < 0:
+                    return None
+                continue
+            if np.all(non_nuls == 1):
+                signe = 1.0
+            elif np.all(non_nuls == -1):
+                signe = -1.0
+            else:
+                return None
+            blocs.append(ligne * signe)
+            seconds.append(borne * signe)
+            sens.append('=' if egalite else ('<=' if signe > 0 else '>='))
+
+    if not blocs:
+        return None
+    M = np.array(blocs)
+
+    # Chaque variable relie exactement deux lignes
+    lignes_var, colonnes_var = np.nonzero(M.T)
+    if not np.array_equal(np.bincount(lignes_var, minlength=n_vars), np.full(n_vars, 2)):
+        return None
+    extremites = colonnes_var.reshape(n_vars, 2)
+
+    # Coloriage en deux camps (sources / destinations), composante par composante
+    n_lignes = len(blocs)
+    voisins: List[List[int]] = [[] for _ in range(n_lignes)]
+    for r1, r2 in extremites:
+        voisins[r1].append(r2)
+        voisins[r2].append(r1)
+
+    camp = [-1] * n_lignes
+    for depart in range(n_lignes):
+        if camp[depart] != -1:
+            continue
+        composante = [depart]
+        camp[depart] = 0
+        file = deque([depart])
+        while file:
+            r = file.popleft()
+            for s in voisins[r]:
+                if camp[s] == -1:
+                    camp[s] = 1 - camp[r]
+                    composante.append(s)
+                    file.append(s)
+                elif camp[s] == camp[r]:
+                    return None
+
+        # Orienter la composante : sources en <= ou =, destinations en = ou >=
+        def valide(camp_sources):
+            return all((sens[r] != '>=') if camp[r] == camp_sources else (sens[r] != '<=')
+                       for r in composante)
+
+        if valide(0):
+            continue
+        if not valide(1):
+            return None
+        for r in composante:
+            camp[r] = 1 - camp[r]
+
+    sources = [r for r in range(n_lignes) if camp[r] == 0]
+    destinations = [r for r in range(n_lignes) if camp[r] == 1]
+    indice = {r: k for k, r in enumerate(sources)}
+    indice.update({r: k for k, r in enumerate(destinations)})
+
+    # Cases (source, destination) de chaque variable ; en cas de doublon,
+    # la route la moins chère (dans le sens de l'optimisation) est gardée
+    maximiser = probleme.type_optimisation == 'max'
+    routes = np.empty((n_vars, 2), dtype=int)
+    couts = np.full((len(sources), len(destinations)), np.inf)  # Routes absentes : interdites
+    choisie: Dict[Tuple[int, int], int] = {}
+    for k, (r1, r2) in enumerate(extremites):
+        i, j = (indice[r1], indice[r2]) if camp[r1] == 0 else (indice[r2], indice[r1])
+        routes[k] = (i, j)
+        ancienne = choisie.get((i, j))
+        if ancienne is None or (probleme.c[k] > probleme.c[ancienne] if maximiser
+                                else probleme.c[k] < probleme.c[ancienne]):
+            choisie[(i, j)] = k
+            couts[i, j] = probleme.c[k]
+
+    # Les variables en double (non choisies) restent à 0
+    for k, (i, j) in enumerate(routes):
+        if choisie[(i, j)] != k:
+            routes[k] = (-1, -1)
+
+    return ProblemeTransport(
+        offres=np.array([seconds[r] for r in sources]),
+        demandes=np.array([seconds[r] for r in destinations]),
+        couts=couts,
+        maximiser=maximiser,
+        sens_offres=[sens[r] for r in sources],
+        sens_demandes=[sens[r] for r in destinations],
+        noms_variables=list(probleme.noms_variables),
+        routes=routes,
+    )
+
+
+# ============================================================
+# SOLVEUR
+# ============================================================
+
+class SolveurTransport:
+    """
+    Solveur des problèmes de transport (méthode MODI / simplexe des réseaux).
+
+    Exemple :
+        solveur = SolveurTransport()
+        solution = solveur.resoudre(probleme)          # ProblemePL
+        solution = solveur.resoudre(ProblemeTransport(offres, demandes, couts))
+    """
+
+    METHODES_DEPART = ['auto', 'vogel', 'moindre_cout', 'coin_nord_ouest']
+
+    def __init__(self, methode_depart: str = 'auto', cache: Optional[CacheSolutions] = None,
+                 ecouteurs: Optional[List[EcouteurSolveur]] = None):
+        """
+        Initialise le solveur.
+
+        Args:
+            methode_depart: 'vogel', 'moindre_cout', 'coin_nord_ouest' ou 'auto'
+                            (Vogel pour les petits problèmes, moindre coût sinon)
+            cache: Cache des solutions (None = pas de cache)
+            ecouteurs: Écouteurs avertis pendant la résolution (profilage)
+        """
+        if methode_depart not in self.METHODES_DEPART:
+            raise ValueError(f"Méthode de départ invalide. Méthodes disponibles: {self.METHODES_DEPART}")
+        self.methode_depart = methode_depart
+        self.cache = cache
+        self.ecouteurs: List[EcouteurSolveur] = list(ecouteurs) if ecouteurs else []
+
+        # Nombre de pivots de la dernière résolution
+        self.iterations = 0
+
+    def resoudre(self, probleme: Union[ProblemePL, ProblemeTransport], verbose: bool = False,
+                 budget: Optional[Budget] = None) -> Solution:
+        """
+        Résout un problème de transport.
+
+        Args:
+            probleme: ProblemeTransport, ou ProblemePL ayant la structure d'un transport
+            verbose: Si True, affiche des informations détaillées
+            budget: Limite de temps / d'itérations (optionnel). Si elle est
+                    atteinte, la solution a le statut 'budget_epuise'
+
+        Returns:
+            Une instance de Solution (variables dans l'ordre du problème)
+        """
+        if isinstance(probleme, ProblemePL):
+            transport = detecter_transport(probleme)
+            if transport is None:
+                raise ValueError("Le problème n'a pas la structure d'un problème de transport!")
+        else:
+            transport = probleme
+
+        # Chercher d'abord dans le cache
+        cle_cache = None
+        if self.cache is not None:
+            cle_cache = CacheSolutions.cle(
+                'transport', transport.couts, None, transport.offres, None, transport.demandes,
+                None, 'max' if transport.maximiser else 'min',
+                extra=[transport.sens_offres, transport.sens_demandes, transport.noms_variables,
+                       None if transport.routes is None else transport.routes.tolist()]
+            )
+            solution = self.cache.obtenir(cle_cache)
+            if solution is not None:
+                if verbose:
+                    print("✓ Solution trouvée dans le cache!")
+                return solution
+
+        m, n = transport.couts.shape
+        if verbose:
+            print("🔍 Résolution en cours (transport, méthode MODI)...")
+            print(f"   Sources : {m}")
+            print(f"   Destinations : {n}")
+
+        chrono = Chronometre()
+        n_variables = m * n if transport.routes is None else len(transport.routes)
+        notifier(self.ecouteurs, 'debut_resolution', 'transport', n_variables, m + n)
+
+        solution = Solution()
+        solution.noms_variables = transport.noms_variables
+
+        x, statut, ecart = self._resoudre_matrices(transport, budget, chrono)
+        valeurs = None if x is None else self._valeurs_variables(transport, x)
+
+        if statut == 'optimal':
+            solution.succes = True
+            solution.message = "Solution optimale trouvée"
+        elif statut == 'budget_epuise':
+            solution.message = "Budget épuisé"
+            if x is None:
+                solution.message += " (aucune solution réalisable connue)"
+            solution.ecart_optimalite = ecart if x is not None else None
+        else:
+            solution.message = "Offre insuffisante ou routes interdites : aucune solution réalisable"
+        solution.statut = statut
+
+        if valeurs is not None:
+            solution.valeurs_variables = valeurs
+            finis = np.isfinite(transport.couts)
+            solution.valeur_objectif = float(np.sum(transport.couts[finis] * x[finis]))
+
+        notifier(self.ecouteurs, 'fin_resolution', statut, self.iterations, chrono.total())
+        for ecouteur in self.ecouteurs:
+            if isinstance(ecouteur, CollecteurProfil):
+                ecouteur.attacher(solution)
+                break
+
+        if verbose:
+            print(f"{'✓' if solution.succes else '✗'} {solution.message} ({self.iterations} pivots)")
+
+        # Une solution interrompue par le budget n'est pas mise en cache
+        if cle_cache is not None and statut != 'budget_epuise':
+            self.cache.stocker(cle_cache, solution)
+
+        return solution
+
+    # ------------------------------------------------------------
+    # Mise sous forme équilibrée
+    # ------------------------------------------------------------
+
+    @staticmethod
+    def _equilibrer(transport: ProblemeTransport):
+        """
+        Construit le problème équilibré (minimisation, offre totale = demande totale).
+
+        L'excédent d'offre va vers une destination fictive : coût 0 depuis une
+        source en <=, ou coût de la destination en >= la moins chère (livrer
+        plus que la demande), sinon route interdite. Les routes interdites
+        reçoivent un coût très élevé (grand M).
+
+        Returns:
+            (couts, offres, demandes, interdites, choix_fictif) ; choix_fictif[i]
+            est la destination réelle qui reçoit l'excédent de i (-1 = aucune)
+        """
+        couts = -transport.couts if transport.maximiser else transport.couts.copy()
+        interdites = ~np.isfinite(couts)
+        m, n = couts.shape
+
+        excedent = transport.offres.sum() - transport.demandes.sum()
+        choix_fictif = np.full(m, -1)
+        if excedent > 1e-9 * max(1.0, transport.offres.sum()):
+            colonne = np.full(m, np.inf)
+            for i in range(m):
+                if transport.sens_offres[i] == '<=':
+                    colonne[i] = 0.0
+            surplus = [j for j in range(n) if transport.sens_demandes[j] == '>=']
+            if surplus:
+                sous = np.where(interdites[:, surplus], np.inf, couts[:, surplus])
+                meilleurs = np.argmin(sous, axis=1)
+                for i in range(m):
+                    if sous[i, meilleurs[i]] < colonne[i]:
+                        colonne[i] = sous[i, meilleurs[i]]
+                        choix_fictif[i] = surplus[meilleurs[i]]
+            couts = np.column_stack([couts, colonne])
+            interdites = np.column_stack([interdites, ~np.isfinite(colonne)])
+            demandes = np.append(transport.demandes, excedent)
+        else:
+            demandes = transport.demandes.copy()
+
+        finis = couts[~interdites]
+        grand_m = (1.0 + (np.abs(finis).max() if finis.size else 0.0)) \
+            * (1.0 + transport.offres.sum() + demandes.sum())
+        couts = np.where(interdites, grand_m, couts)
+        return couts, transport.offres.copy(), demandes, interdites, choix_fictif
+
+    # ------------------------------------------------------------
+    # Solutions de départ (m+n-1 cases formant un arbre)
+    # ------------------------------------------------------------
+
+    @staticmethod
+    def _allouer(cases, a, b, i, j, lignes_restantes, tol) -> bool:
+        """
+        Alloue min(a_i, b_j) à la case (i, j).
+
+        Returns:
+            True si c'est la ligne i qui est saturée (sinon la colonne j) :
+            une seule des deux est retirée, pour garder m+n-1 cases
+        """
+        q = min(a[i], b[j])
+        cases[(i, j)] = q
+        a[i] -= q
+        b[j] -= q
+        return a[i] <= tol and lignes_restantes > 1
+
+    def _depart_coin_nord_ouest(self, couts, a, b, tol) -> Dict[Tuple[int, int], float]:
+        """Règle du coin nord-ouest (O(m+n), sans regarder les coûts)."""
+        m, n = couts.shape
+        cases: Dict[Tuple[int, int], float] = {}
+        i = j = 0
+        while len(cases) < m + n - 1:
+            if self._allouer(cases, a, b, i, j, m - i, tol):
+                i += 1
+            else:
+                j += 1
+        return cases
+
+    def _depart_moindre_cout(self, couts, a, b, tol) -> Dict[Tuple[int, int], float]:
+        """Méthode du moindre coût (cases parcourues par coût croissant)."""
+        m, n = couts.shape
+        cases: Dict[Tuple[int, int], float] = {}
+        ligne_active = np.ones(m, dtype=bool)
+        colonne_active = np.ones(n, dtype=bool)
+        lignes_restantes = m
+        for indice in np.argsort(couts, axis=None, kind='stable'):
+            i, j = divmod(int(indice), n)
+            if not (ligne_active[i] and colonne_active[j]):
+                continue
+            if self._allouer(cases, a, b, i, j, lignes_restantes, tol):
+                ligne_active[i] = False
+                lignes_restantes -= 1
+            else:
+                colonne_active[j] = False
+            if len(cases) == m + n - 1:
+                break
+        return cases
+
+    def _depart_vogel(self, couts, a, b, tol) -> Dict[Tuple[int, int], float]:
+        """
+        Méthode de Vogel : on sert d'abord la ligne ou la colonne dont la
+        pénalité (écart entre ses deux plus petits coûts) est la plus grande.
+        """
+        m, n = couts.shape
+        cases: Dict[Tuple[int, int], float] = {}
+        lignes = np.arange(m)
+        colonnes = np.arange(n)
+
+        def penalites(sous, axe):
+            if sous.shape[axe] < 2:
+                return np.min(sous, axis=axe)
+            deux = np.partition(sous, 1, axis=axe)
+            return np.take(deux, 1, axis=axe) - np.take(deux, 0, axis=axe)
+
+        while len(lignes) > 0 and len(colonnes) > 0:
+            sous = couts[np.ix_(lignes, colonnes)]
+            p_lignes = penalites(sous, 1)
+            p_colonnes = penalites(sous, 0)
+
+            if p_lignes.max() >= p_colonnes.max():
+                k = int(np.argmax(p_lignes))
+                i, j = lignes[k], colonnes[int(np.argmin(sous[k]))]
+            else:
+                k = int(np.argmax(p_colonnes))
+                i, j = lignes[int(np.argmin(sous[:, k]))], colonnes[k]
+
+            if self._allouer(cases, a, b, i, j, len(lignes), tol):
+                lignes = lignes[lignes != i]
+            else:
+                colonnes = colonnes[colonnes != j]
+        return cases
+
+    # ------------------------------------------------------------
+    # Itérations MODI
+    # ------------------------------------------------------------
+
+    def _resoudre_matrices(self, transport: ProblemeTransport, budget: Optional[Budget],
+                           chrono: Chronometre):
+        """
+        Applique la méthode MODI au problème équilibré.
+
+        Returns:
+            (x de taille m x n du problème d'origine ou None, statut, écart d'optimalité)
+        """
+        self.iterations = 0
+        debut = Budget.maintenant()
+
+        if transport.offres.sum() < transport.demandes.sum() - 1e-9 * max(1.0, transport.demandes.sum()):
+            notifier(self.ecouteurs, 'fin_phase', PHASE_INITIALISATION, chrono.tour())
+            return None, 'infaisable', None
+
+        couts, a, b, interdites, choix_fictif = self._equilibrer(transport)
+        m, n = couts.shape
+        tol = 1e-9 * max(1.0, a.sum())
+
+        methode = self.methode_depart
+        if methode == 'auto':
+            methode = 'vogel' if m * n <= SEUIL_VOGEL else 'moindre_cout'
+        depart = {'vogel': self._depart_vogel, 'moindre_cout': self._depart_moindre_cout,
+                  'coin_nord_ouest': self._depart_coin_nord_ouest}[methode]
+        flux = depart(couts, a.copy(), b.copy(), tol)
+
+        # Arbre de la base : voisins de chaque nœud (sources 0..m-1, destinations m..m+n-1)
+        voisins: List[set] = [set() for _ in range(m + n)]
+        for i, j in flux:
+            voisins[i].add(m + j)
+            voisins[m + j].add(i)
+
+        # Potentiels (u_i, v_j) et arbre enraciné en la source 0 ; ils sont
+        # ensuite mis à jour à chaque pivot sur le seul sous-arbre déplacé
+        u, v, parent, profondeur = self._potentiels(couts, voisins, m, n)
+
+        # Pricing partiel : les coûts réduits sont calculés par blocs de lignes,
+        # la première case négative du bloc courant entre dans la base
+        taille_bloc = max(1, min(m, TAILLE_BLOC_PRICING // n))
+        nb_blocs = -(-m // taille_bloc)
+        bloc = 0
+        reduits = np.empty((taille_bloc, n))
+        tol_cout = 1e-9 * max(1.0, float(np.abs(couts).max()))
+        notifier(self.ecouteurs, 'memoire', couts.nbytes + reduits.nbytes + 64 * len(flux))
+        notifier(self.ecouteurs, 'fin_phase', PHASE_INITIALISATION, chrono.tour())
+
+        statut = 'optimal'
+        noms_cases = None
+        while True:
+            entrante = None
+            for _ in range(nb_blocs):
+                premiere = bloc * taille_bloc
+                lignes = slice(premiere, min(premiere + taille_bloc, m))
+                tampon = reduits[:lignes.stop - premiere]
+                np.subtract(couts[lignes], u[lignes, None], out=tampon)
+                tampon -= v[None, :]
+                indice = int(np.argmin(tampon))
+                if tampon.flat[indice] < -tol_cout:
+                    i, j = divmod(indice, n)
+                    entrante = (premiere + i, j, float(tampon.flat[indice]))
+                    break
+                bloc = (bloc + 1) % nb_blocs
+            notifier(self.ecouteurs, 'fin_phase', PHASE_PRICING, chrono.tour())
+
+            if entrante is None:
+                break
+
+            if budget is not None and budget.epuise(self.iterations, debut):
+                statut = 'budget_epuise'
+                break
+            i_entrant, j_entrant, reduit = entrante
+
+            # Cycle : case entrante puis chemin de l'arbre de la destination à la source
+            chemin_source, chemin_dest = [i_entrant], [m + j_entrant]
+            p, q = i_entrant, m + j_entrant
+            while p != q:
+                if profondeur[p] >= profondeur[q]:
+                    p = parent[p]
+                    chemin_source.append(p)
+                else:
+                    q = parent[q]
+                    chemin_dest.append(q)
+            noeuds = chemin_dest + chemin_source[-2::-1]
+
+            # Cases du cycle après la case entrante : signes -, +, -, ...
+            cycle = []
+            for k in range(len(noeuds) - 1):
+                r, s = noeuds[k], noeuds[k + 1]
+                cycle.append((r, s - m) if r < m else (s, r - m))
+            moins, plus = cycle[0::2], cycle[1::2]
+
+            position = min(range(0, len(cycle), 2), key=lambda k: flux[cycle[k]])
+            sortante = cycle[position]
+            theta = flux[sortante]
+            for case in moins:
+                flux[case] -= theta
+            for case in plus:
+                flux[case] += theta
+
+            del flux[sortante]
+            flux[(i_entrant, j_entrant)] = theta
+            voisins[sortante[0]].discard(m + sortante[1])
+            voisins[m + sortante[1]].discard(sortante[0])
+            # La case sortante est sur le chemin de la destination (début du cycle) :
+            # c'est la destination entrante qui est détachée du reste de l'arbre
+            if position < len(chemin_dest) - 1:
+                self._deplacer_sous_arbre(m + j_entrant, i_entrant, -reduit,
+                                          voisins, parent, profondeur, u, v, m)
+            else:
+                self._deplacer_sous_arbre(i_entrant, m + j_entrant, reduit,
+                                          voisins, parent, profondeur, u, v, m)
+            voisins[i_entrant].add(m + j_entrant)
+            voisins[m + j_entrant].add(i_entrant)
+
+            self.iterations += 1
+            notifier(self.ecouteurs, 'fin_phase', PHASE_PIVOT, chrono.tour())
+            if self.ecouteurs:
+                if noms_cases is None:
+                    noms_cases = self._noms_cases(transport)
+                notifier(self.ecouteurs, 'pivot', self.iterations,
+                         noms_cases.get((i_entrant, j_entrant), ''),
+                         noms_cases.get(sortante, ''), theta <= tol)
+
+        # Solution du problème d'origine (l'excédent vers une destination en >= y est ajouté)
+        x_equilibre = np.zeros((m, n))
+        for (i, j), q in flux.items():
+            x_equilibre[i, j] = max(q, 0.0)
+
+        ecart = None
+        if statut == 'budget_epuise':
+            # Borne lagrangienne avec les potentiels : x_ij <= min(a_i, b_j)
+            tous_reduits = couts - u[:, None] - v[None, :]
+            capacites = np.minimum.outer(a, b)
+            borne = a @ u + b @ v + float(np.sum(np.minimum(tous_reduits, 0.0) * capacites))
+            ecart = max(0.0, float(np.sum(couts * x_equilibre)) - borne)
+
+        if np.any(x_equilibre[interdites] > tol):
+            return None, ('budget_epuise' if statut == 'budget_epuise' else 'infaisable'), None
+
+        n_reel = transport.couts.shape[1]
+        x = x_equilibre[:, :n_reel].copy()
+        for i in np.flatnonzero(choix_fictif >= 0):
+            x[i, choix_fictif[i]] += x_equilibre[i, n_reel]
+        return x, statut, ecart
+
+    @staticmethod
+    def _potentiels(couts, voisins, m, n):
+        """
+        Calcule les potentiels (u_i + v_j = c_ij sur la base) par parcours de l'arbre.
+
+        Returns:
+            (u, v, parent, profondeur) ; parent et profondeur décrivent
+            l'arbre enraciné en la source 0 (pour trouver les cycles)
+        """
+        u = np.zeros(m)
+        v = np.zeros(n)
+        parent = [-1] * (m + n)
+        profondeur = [0] * (m + n)
+        vus = [False] * (m + n)
+        vus[0] = True
+        pile = [0]
+        while pile:
+            k = pile.pop()
+            for s in voisins[k]:
+                if vus[s]:
+                    continue
+                vus[s] = True
+                parent[s] = k
+                profondeur[s] = profondeur[k] + 1
+                if k < m:
+                    v[s - m] = couts[k, s - m] - u[k]
+                else:
+                    u[s] = couts[s, k - m] - v[k - m]
+                pile.append(s)
+        return u, v, parent, profondeur
+
+    @staticmethod
+    def _deplacer_sous_arbre(racine, attache, decalage, voisins, parent, profondeur, u, v, m):
+        """
+        Met à jour l'arbre et les potentiels après un pivot.
+
+        Retirer la case sortante détache un sous-arbre, que la case entrante
+        raccroche au reste par `racine` (son extrémité dans le sous-arbre) et
+        `attache`. Seuls les nœuds de ce sous-arbre changent : leur parent et
+        leur profondeur, et leurs potentiels sont décalés du coût réduit de la
+        case entrante (pour avoir de nouveau u_i + v_j = c_ij).
+        L'arête sortante doit déjà être retirée de `voisins`, l'entrante pas encore.
+        """
+        parent[racine] = attache
+        profondeur[racine] = profondeur[attache] + 1
+        lignes, colonnes = [], []
+        pile = [racine]
+        while pile:
+            k = pile.pop()
+            if k < m:
+                lignes.append(k)
+            else:
+                colonnes.append(k - m)
+            for t in voisins[k]:
+                if t != parent[k]:
+                    parent[t] = k
+                    profondeur[t] = profondeur[k] + 1
+                    pile.append(t)
+        u[lignes] += decalage
+        v[colonnes] -= decalage
+
+    @staticmethod
+    def _noms_cases(transport: ProblemeTransport) -> Dict[Tuple[int, int], str]:
+        """Nom de la variable de chaque case (pour les écouteurs)."""
+        m, n = transport.couts.shape
+        noms = {(i, n): f"U{i+1}→fictif" for i in range(m)}
+        if transport.routes is None:
+            noms.update({divmod(k, n): nom for k, nom in enumerate(transport.noms_variables)})
+        else:
+            noms.update({(int(i), int(j)): nom for (i, j), nom
+                         in zip(transport.routes, transport.noms_variables) if i >= 0})
+        return noms
+
+    @staticmethod
+    def _valeurs_variables(transport: ProblemeTransport, x: np.ndarray) -> np.ndarray:
+        """Valeurs des variables dans l'ordre du problème d'origine."""
+        if transport.routes is None:
+            return x.ravel()
+
+        valeurs = np.zeros(len(transport.routes))
+        utilisees = transport.routes[:, 0] >= 0
+        valeurs[utilisees] = x[transport.routes[utilisees, 0], transport.routes[utilisees, 1]]
+        return valeurs
+
+
+def resoudre_transport(offres, demandes, couts, maximiser: bool = False,
+                       verbose: bool = True, budget: Optional[Budget] = None) -> Solution:
+    """
+    Fonction utilitaire pour résoudre un problème de transport donné par ses matrices.
+
+    Args:
+        offres: Offre de chaque source (contraintes <=)
+        demandes: Demande de chaque destination (contraintes =)
+        couts: Matrice des coûts (np.inf = route interdite)
+        maximiser: True si `couts` sont des gains à maximiser
+        verbose: Afficher les détails ou non
+        budget: Limite de temps / d'itérations (optionnel)
+
+    Returns:
+        La solution (variables U{i}→E{j} dans l'ordre ligne par ligne)
+    """
+    transport = ProblemeTransport(offres, demandes, couts, maximiser=maximiser)
+    return SolveurTransport().resoudre(transport, verbose=verbose, budget=budget)
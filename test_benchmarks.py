@@ -0,0 +1,69 @@
+import sys
+import os
+import json
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
+
+from generateurs import klee_minty, transport, affectation_degeneree
+from bench import MOTEURS, comparer, executer, main
+
+
+def test_klee_minty_exponentiel():
+    # Règle du plus grand Δ : 2^d - 1 pivots
+    for d in (3, 5):
+        resultat = MOTEURS['simplexe'](klee_minty(d))
+        assert resultat['statut'] == 'optimal'
+        assert resultat['iterations'] == 2 ** d - 1
+        assert abs(resultat['objectif'] - 5 ** d) < 1e-6
+
+
+def test_generateurs_reproductibles():
+    p1, p2 = transport(3, 4, graine=7), transport(3, 4, graine=7)
+    assert (p1.c == p2.c).all() and (p1.b_eq == p2.b_eq).all()
+    assert MOTEURS['scipy-highs'](p1)['statut'] == 'optimal'
+    assert MOTEURS['simplexe'](p1)['statut'] == 'non_applicable'
+
+    # Affectation : optimum entier (une tâche par agent)
+    resultat = MOTEURS['scipy-highs'](affectation_degeneree(5))
+    assert abs(resultat['objectif'] - round(resultat['objectif'])) < 1e-6
+
+
+def test_comparaison():
+    resultats = executer(['klee_minty'], ['petite'], ['simplexe'], repetitions=1, verbose=False)
+    assert comparer(resultats, resultats) == []
+
+    plus_lent = {'resultats': [dict(r, temps_median=r['temps_median'] * 10)
+                               for r in resultats['resultats']]}
+    differences = comparer(resultats, plus_lent)
+    assert [d['type'] for d in differences] == ['regression']
+
+    # Une ligne sans temps (erreur) et une ligne disparue sont signalées
+    en_erreur = {'resultats': [{'generateur': r['generateur'], 'taille': r['taille'],
+                                'moteur': r['moteur'], 'statut': 'erreur'}
+                               for r in resultats['resultats']]}
+    differences = comparer(resultats, en_erreur)
+    assert [(d['type'], d['apres']) for d in differences] == [('statut', 'erreur')]
+    assert comparer(en_erreur, resultats)[0]['avant'] == 'erreur'
+    differences = comparer(resultats, {'resultats': []})
+    assert [d['type'] for d in differences] == ['manquant']
+
+
+def test_comparer_code_retour():
+    resultats = executer(['klee_minty'], ['petite'], ['simplexe'], repetitions=1, verbose=False)
+    with tempfile.TemporaryDirectory() as repertoire:
+        ancien = os.path.join(repertoire, 'avant.json')
+        nouveau = os.path.join(repertoire, 'apres.json')
+        with open(ancien, 'w', encoding='utf-8') as f:
+            json.dump(resultats, f)
+        with open(nouveau, 'w', encoding='utf-8') as f:
+            json.dump({'resultats': []}, f)
+        assert main(['comparer', ancien, ancien]) == 0
+        assert main(['comparer', ancien, nouveau]) == 1
+
+
+if __name__ == "__main__":
+    test_klee_minty_exponentiel()
+    test_generateurs_reproductibles()
+    test_comparaison()
+    test_comparer_code_retour()
+    print("✓ Test réussi!")
@@ -0,0 +1,105 @@
+"""
+Tests du branch-and-bound et du simplexe à base explicite
+"""
+
+import numpy as np
+from scipy.optimize import linprog
+
+from src.models import ProblemePL
+from src.budget import Budget
+from src.simplexe_standard import SimplexeStandard
+from src.branch_bound import BranchAndBound
+from src.solver import SolveurPL
+
+
+def sac_a_dos(n=20, graine=3):
+    """Sac à dos binaire à 2 contraintes."""
+    rng = np.random.default_rng(graine)
+    poids = rng.integers(10, 60, (2, n)).astype(float)
+    valeurs = rng.integers(10, 80, n).astype(float)
+
+    probleme = ProblemePL()
+    probleme.definir_fonction_objectif(list(valeurs), maximiser=True)
+    for ligne in poids:
+        probleme.ajouter_contrainte_inegalite(list(ligne), ligne.sum() / 3)
+    probleme.definir_variables_binaires(list(range(n)))
+    return probleme
+
+
+def test_simplexe_standard_reoptimise():
+    """Égalité, variable libre, puis changement de borne et nouvelle ligne."""
+    c = [1, -2, 1]
+    A_ub, b_ub = [[1, 1, 0], [0, 1, 1]], [4, 5]
+    A_eq, b_eq = [[1, -1, 1]], [1]
+    bornes = [(0, None), (None, 3.5), (0, 10)]
+
+    lp = SimplexeStandard(c, A_ub, b_ub, A_eq, b_eq, bornes)
+    assert lp.resoudre() == 'optimal'
+    reference = linprog(c, A_ub, b_ub, A_eq, b_eq, bounds=bornes)
+    assert np.isclose(lp.valeur_objectif, reference.fun)
+    assert np.allclose(lp.duales(), np.concatenate([reference.ineqlin.marginals, reference.eqlin.marginals]))
+
+    lp.modifier_bornes(1, None, 2)
+    lp.ajouter_ligne([1, 0, 1], 2.5, '>=')
+    assert lp.resoudre() == 'optimal'
+    reference = linprog(c, A_ub + [[-1, 0, -1]], b_ub + [-2.5], A_eq, b_eq,
+                        bounds=[(0, None), (None, 2), (0, 10)])
+    assert np.isclose(lp.valeur_objectif, reference.fun)
+
+    print("✓ Test réussi!")
+
+
+def test_branch_bound_identique_a_highs():
+    """Même optimum que HiGHS (integrality), avec les deux sélections de nœuds."""
+    probleme = sac_a_dos()
+    reference = SolveurPL().resoudre(probleme)
+    assert reference.succes
+
+    for selection in ('meilleure_borne', 'profondeur'):
+        solveur = BranchAndBound(selection=selection)
+        solution = solveur.resoudre(probleme)
+        assert solution.statut == 'optimal'
+        assert np.isclose(solution.valeur_objectif, reference.valeur_objectif)
+        assert np.allclose(solution.valeurs_variables, np.round(solution.valeurs_variables))
+        # La borne rejoint la meilleure solution à la fin
+        assert solveur.rapports[-1].ecart <= 1e-6
+
+    print("✓ Test réussi!")
+
+
+def test_branch_bound_parallele():
+    """Évaluation des nœuds dans plusieurs processus."""
+    probleme = sac_a_dos(n=15)
+    sequentiel = BranchAndBound().resoudre(probleme)
+    parallele = BranchAndBound(n_processus=2).resoudre(probleme)
+    assert parallele.statut == 'optimal'
+    assert np.isclose(parallele.valeur_objectif, sequentiel.valeur_objectif)
+
+    print("✓ Test réussi!")
+
+
+def test_branch_bound_budget_et_infaisable():
+    """Budget de nœuds : meilleure solution connue et écart ; problème sans solution entière."""
+    rapports = []
+    solution = BranchAndBound(selection='profondeur', rapport=rapports.append).resoudre(
+        sac_a_dos(n=30), budget=Budget(max_iterations=200))
+    assert solution.statut in ('budget_epuise', 'optimal')
+    if solution.statut == 'budget_epuise' and solution.valeurs_variables is not None:
+        assert solution.ecart_optimalite >= 0
+    assert len(rapports) > 0
+
+    # 2 x = 1 avec x entier
+    probleme = ProblemePL()
+    probleme.definir_fonction_objectif([1], maximiser=False)
+    probleme.ajouter_contrainte_equalite([2], 1)
+    probleme.definir_variables_entieres([0])
+    assert BranchAndBound().resoudre(probleme).statut == 'infaisable'
+
+    print("✓ Test réussi!")
+
+
+if __name__ == "__main__":
+    test_simplexe_standard_reoptimise()
+    test_branch_bound_identique_a_highs()
+    test_branch_bound_parallele()
+    test_branch_bound_budget_et_infaisable()
@@ -0,0 +1,101 @@
+import tempfile
+
+from src.cache import CacheSolutions
+from src.instrumentation import CollecteurProfil, PHASE_CACHE
+from src.models import ProblemePL
+from src.simplexe import SimplexeSolveur
+from src.solver import SolveurPL
+
+
+def probleme_cours():
+    probleme = ProblemePL("Exemple du cours")
+    probleme.definir_fonction_objectif([1200, 1000], maximiser=True)
+    probleme.ajouter_contrainte_inegalite([3, 4], 160)
+    probleme.ajouter_contrainte_inegalite([6, 3], 180)
+    return probleme
+
+
+def test_cle_canonique():
+    # Listes et tableaux NumPy donnent la même clé
+    import numpy as np
+    cle1 = CacheSolutions.cle('simplexe', [1, 2], [[3, 4]], [5])
+    cle2 = CacheSolutions.cle('simplexe', np.array([1.0, 2.0]), np.array([[3.0, 4.0]]), np.array([5.0]))
+    assert cle1 == cle2
+    # Le sens et le moteur font partie de la clé
+    assert cle1 != CacheSolutions.cle('simplexe', [1, 2], [[3, 4]], [5], sens='min')
+    assert cle1 != CacheSolutions.cle('scipy-highs', [1, 2], [[3, 4]], [5])
+
+
+def test_simplexe_avec_cache():
+    cache = CacheSolutions()
+    c, A, b = [1200, 1000], [[3, 4], [6, 3]], [160, 180]
+
+    premier = SimplexeSolveur(cache=cache)
+    tableaux1 = premier.resoudre(c, A, b)
+    second = SimplexeSolveur(cache=cache)
+    tableaux2 = second.resoudre(c, A, b)
+
+    assert cache.nb_misses == 1 and cache.nb_hits == 1
+    assert len(tableaux1) == len(tableaux2)
+    assert second.solution_trouvee
+    assert abs(second.valeur_optimale - 47200) < 1e-6
+    assert abs(second.variables_solution['x1'] - 16) < 1e-6
+
+
+def test_solveur_pl_avec_cache():
+    cache = CacheSolutions()
+    solveur = SolveurPL(cache=cache)
+    solution1 = solveur.resoudre(probleme_cours())
+    solution2 = solveur.resoudre(probleme_cours())
+    assert cache.statistiques()['hits'] == 1
+    assert abs(solution2.valeur_objectif - solution1.valeur_objectif) < 1e-9
+    # Chaque lecture renvoie une copie
+    solution2.valeur_objectif = 0
+    assert abs(solveur.resoudre(probleme_cours()).valeur_objectif - 47200) < 1e-6
+
+
+def test_profil_apres_hit():
+    # Une solution lue dans le cache ne garde pas le profil de la première résolution
+    cache = CacheSolutions()
+    collecteur = CollecteurProfil()
+    solveur = SolveurPL(cache=cache, ecouteurs=[collecteur])
+    solution1 = solveur.resoudre(probleme_cours())
+    solution2 = solveur.resoudre(probleme_cours())
+    assert cache.statistiques()['hits'] == 1
+    assert len(collecteur.profils) == 2
+    assert solution2.profil is collecteur.dernier
+    assert solution2.profil is not solution1.profil
+    assert PHASE_CACHE in solution2.profil.temps_phases
+    assert PHASE_CACHE not in solution1.profil.temps_phases
+
+    # Sans écouteur, le profil n'est pas celui (copié) de la première résolution
+    solution3 = SolveurPL(cache=cache).resoudre(probleme_cours())
+    assert solution3.profil is None
+
+
+def test_eviction_lru_et_disque():
+    with tempfile.TemporaryDirectory() as repertoire:
+        cache = CacheSolutions(max_entrees=2, repertoire=repertoire)
+        cache.stocker('a', 1)
+        cache.stocker('b', 2)
+        cache.obtenir('a')
+        cache.stocker('c', 3)  # 'b' est le moins récemment utilisé
+        assert 'b' not in cache and 'a' in cache and 'c' in cache
+        assert cache.nb_evictions == 1
+
+        # 'b' est encore sur le disque
+        assert cache.obtenir('b') == 2
+        assert cache.nb_hits_disque == 1
+
+    petit = CacheSolutions(max_octets=100)
+    petit.stocker('gros', 'x' * 1000)
+    assert 'gros' not in petit
+
+
+if __name__ == "__main__":
+    test_cle_canonique()
+    test_simplexe_avec_cache()
+    test_solveur_pl_avec_cache()
+    test_profil_apres_hit()
+    test_eviction_lru_et_disque()
+    print("✓ Test réussi!")
@@ -0,0 +1,110 @@
+"""
+Tests de la décomposition de Dantzig-Wolfe
+"""
+
+import numpy as np
+
+from src.models import ProblemePL
+from src.budget import Budget
+from src.decomposition import DecompositionDW
+from src.solver import SolveurPL
+
+
+def probleme_sites(n_sites=3, n_produits=4, graine=0):
+    """
+    Plan de production : chaque site a ses capacités, les sites partagent
+    une matière première et doivent couvrir une demande commune.
+    """
+    rng = np.random.default_rng(graine)
+    n = n_sites * n_produits
+    probleme = ProblemePL("Sites")
+    probleme.definir_fonction_objectif(list(rng.integers(3, 10, n).astype(float)), maximiser=True)
+
+    for s in range(n_sites):
+        for _ in range(2):
+            ligne = np.zeros(n)
+            ligne[s * n_produits:(s + 1) * n_produits] = rng.integers(1, 5, n_produits)
+            probleme.ajouter_contrainte_inegalite(ligne, float(rng.integers(20, 40)))
+    # Contrainte liante : matière première commune
+    probleme.ajouter_contrainte_inegalite(rng.integers(1, 4, n).astype(float), 30.0 * n_sites)
+    # Contrainte liante d'égalité : production totale du produit 1
+    ligne = np.zeros(n)
+    ligne[::n_produits] = 1.0
+    probleme.ajouter_contrainte_equalite(ligne, 6.0)
+    probleme.definir_bornes([(0, 15)] * n)
+
+    blocs = [list(range(s * n_produits, (s + 1) * n_produits)) for s in range(n_sites)]
+    return probleme, blocs
+
+
+def test_dantzig_wolfe_identique_a_highs():
+    """Même optimum que la résolution directe ; bornes convergentes à chaque tour."""
+    probleme, blocs = probleme_sites()
+    reference = SolveurPL().resoudre(probleme)
+
+    rapports = []
+    for n_processus, stabilisation in ((1, 0.0), (2, 0.5)):
+        decomposition = DecompositionDW(blocs, n_processus=n_processus, stabilisation=stabilisation,
+                                        rapport=rapports.append)
+        solution = decomposition.resoudre(probleme)
+        assert solution.statut == 'optimal'
+        assert np.isclose(solution.valeur_objectif, reference.valeur_objectif)
+        x = solution.valeurs_variables
+        assert np.all(probleme.A_ub @ x <= probleme.b_ub + 1e-6)
+        assert np.allclose(probleme.A_eq @ x, probleme.b_eq)
+
+    # Maximisation : la borne est au-dessus de la valeur du maître
+    assert rapports and all(r['borne'] >= r['valeur'] - 1e-6 for r in rapports if r['borne'] is not None)
+    assert np.isclose(rapports[-1]['borne'], reference.valeur_objectif)
+
+    print("✓ Test réussi!")
+
+
+def test_dantzig_wolfe_cas_limites():
+    """Contraintes liantes impossibles, blocs invalides, budget de tours."""
+    probleme, blocs = probleme_sites(graine=1)
+    probleme.b_eq = np.array([100.0])  # 3 sites x 15 au plus
+    assert DecompositionDW(blocs).resoudre(probleme).statut == 'infaisable'
+
+    try:
+        DecompositionDW([[0, 1]]).resoudre(probleme)
+        assert False, "Des variables sans bloc doivent être refusées"
+    except ValueError:
+        pass
+
+    probleme, blocs = probleme_sites(graine=2)
+    solution = DecompositionDW(blocs).resoudre(probleme, budget=Budget(max_iterations=1))
+    assert solution.statut in ('budget_epuise', 'optimal')
+
+    print("✓ Test réussi!")
+
+
+def test_dantzig_wolfe_infaisable_grandes_duales():
+    """
+    Maître infaisable : les pénalités des artificielles donnent des duales
+    ~1e7, les coûts réduits des colonnes déjà présentes ne sont nuls qu'à
+    l'arrondi près. La résolution ne s'arrêtait jamais (valeur = borne).
+    """
+    probleme = ProblemePL("Blocs infaisables")
+    probleme.definir_fonction_objectif([7, -4, -3, -2], maximiser=True)
+    probleme.ajouter_contrainte_inegalite([1, 3, 0, 0], 18)
+    probleme.ajouter_contrainte_inegalite([0, 0, 1, 0], 5)
+    probleme.ajouter_contrainte_inegalite([-2, -2, -1, 0], 2)   # Liante
+    probleme.ajouter_contrainte_equalite([1, 1, 1, 1], 39)      # Liante : 30 au plus
+    probleme.definir_bornes([(0, 10)] * 4)
+    assert SolveurPL().resoudre(probleme).statut == 'infaisable'
+
+    for stabilisation in (0.0, 0.5):
+        decomposition = DecompositionDW([[0, 1], [2], [3]], stabilisation=stabilisation)
+        # Le budget évite de bloquer la suite de tests en cas de régression
+        solution = decomposition.resoudre(probleme, budget=Budget(max_iterations=50))
+        assert solution.statut == 'infaisable'
+        assert decomposition.generation.iterations <= 5
+
+    print("✓ Test réussi!")
+
+
+if __name__ == "__main__":
+    test_dantzig_wolfe_identique_a_highs()
+    test_dantzig_wolfe_cas_limites()
+    test_dantzig_wolfe_infaisable_grandes_duales()
@@ -0,0 +1,67 @@
+"""
+Tests du dual et du choix primal / dual
+"""
+
+import numpy as np
+
+from benchmarks.generateurs import lp_aleatoire_dense
+from src.dualite import SolveurFormulation, choisir_formulation, probleme_dual
+from src.models import ProblemePL
+from src.solver import SolveurPL
+
+
+def probleme_mixte():
+    """Min avec égalité, variable libre, bornes inférieures non nulles et supérieures."""
+    probleme = ProblemePL("Mixte")
+    probleme.definir_fonction_objectif([2, -1, 3, 1], maximiser=False)
+    probleme.ajouter_contrainte_inegalite([1, 1, 1, 1], 10)
+    probleme.ajouter_contrainte_inegalite([-1, 2, 0, 1], 4)
+    probleme.ajouter_contrainte_equalite([1, -1, 1, 0], 1)
+    probleme.definir_bornes([(None, None), (1, 6), (0, None), (-2, 3)])
+    return probleme
+
+
+def test_dual_meme_valeur():
+    """Le dual a la valeur du primal (moins c^T l) ; primal et dual donnent le même x."""
+    probleme = probleme_mixte()
+    attendue = SolveurPL().resoudre(probleme)
+
+    dual = probleme_dual(probleme)
+    assert dual.type_optimisation == 'max' and len(dual.c) == 2 + 2 + 1   # y (2 lignes + 2 bornes sup), z
+    constante = 1 * (-1) + (-2) * 1                                        # c^T l
+    assert np.isclose(SolveurPL().resoudre(dual).valeur_objectif + constante, attendue.valeur_objectif)
+
+    for formulation in ('primal', 'dual'):
+        solution = SolveurFormulation(formulation).resoudre(probleme)
+        assert solution.statut == 'optimal'
+        assert np.isclose(solution.valeur_objectif, attendue.valeur_objectif)
+        x = solution.valeurs_variables
+        assert np.all(probleme.A_ub @ x <= probleme.b_ub + 1e-9)
+        assert np.allclose(probleme.A_eq @ x, probleme.b_eq)
+
+    print("✓ Test réussi!")
+
+
+def test_choix_automatique():
+    """Beaucoup de contraintes : dual ; beaucoup de variables : primal."""
+    for (m, n), attendue in (((200, 10), 'dual'), ((10, 200), 'primal')):
+        probleme = lp_aleatoire_dense(m, n, graine=m)
+        assert choisir_formulation(probleme) == attendue
+
+        solveur = SolveurFormulation()
+        solution = solveur.resoudre(probleme)
+        assert solveur.formulation_choisie == attendue
+        assert np.isclose(solution.valeur_objectif, SolveurPL().resoudre(probleme).valeur_objectif)
+
+    # Dual non borné : primal infaisable
+    probleme = ProblemePL()
+    probleme.definir_fonction_objectif([1, 1])
+    probleme.ajouter_contrainte_inegalite([1, 1], -1)
+    assert SolveurFormulation('dual').resoudre(probleme).statut == 'infaisable'
+
+    print("✓ Test réussi!")
+
+
+if __name__ == "__main__":
+    test_dual_meme_valeur()
+    test_choix_automatique()
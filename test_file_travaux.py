@@ -0,0 +1,127 @@
+"""
+Tests de la file de travaux persistante (SQLite)
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from benchmarks.generateurs import lp_aleatoire_dense
+from src.budget import Budget
+from src.file_travaux import FileTravaux, Travailleur, lancer_travailleurs
+from src.simplexe_standard import SimplexeStandard
+from src import solver
+from src.solver import SolveurPL
+
+
+def test_reprise_apres_interruption():
+    """Un travailleur « meurt » après un point de reprise : un autre repart de sa base."""
+    probleme = lp_aleatoire_dense(60, 80, graine=1)
+    attendu = SolveurPL().resoudre(probleme).valeur_objectif
+    lp = SimplexeStandard.depuis_probleme(probleme)
+    lp.resoudre()
+    pivots_complets = lp.iterations
+
+    with tempfile.TemporaryDirectory() as repertoire:
+        chemin = os.path.join(repertoire, "travaux.db")
+        with FileTravaux(chemin, duree_bail=0.2) as file:
+            numero = file.soumettre(probleme)
+
+            # Premier travailleur : quelques pivots, un point de reprise, puis plus rien
+            travail = file.reclamer('mort')
+            assert travail.point_reprise is None and file.statut(numero) == 'en_cours'
+            assert file.reclamer('autre') is None          # Bail en cours
+            partiel = SimplexeStandard.depuis_probleme(travail.probleme)
+            assert partiel.resoudre(Budget(max_iterations=pivots_complets // 2)) == 'budget_epuise'
+            assert file.enregistrer_point_reprise(numero, 'mort', partiel.etat_base(), partiel.iterations)
+
+            time.sleep(0.3)                                   # Le bail expire
+            travailleur = Travailleur(chemin, pivots_par_point=3, duree_bail=0.2, nom='vivant')
+            assert travailleur.executer() == 1
+
+            # L'ancien propriétaire ne peut plus écrire
+            assert not file.enregistrer_point_reprise(numero, 'mort', partiel.etat_base(), 0)
+
+            solution = file.solution(numero)
+            infos = file.infos(numero)
+            assert solution.succes and np.isclose(solution.valeur_objectif, attendu)
+            assert infos['statut'] == 'termine' and infos['tentatives'] == 2
+            assert infos['points_reprise'] > 1
+            # La reprise n'a pas refait les pivots déjà faits
+            assert infos['iterations'] - partiel.iterations < pivots_complets
+            travailleur.file.fermer()
+
+    print("✓ Test réussi!")
+
+
+def test_travailleurs_en_parallele():
+    """Plusieurs processus vident la file ; un problème entier est aussi traité."""
+    problemes = [lp_aleatoire_dense(10, 15, graine=g) for g in range(5)]
+    entier = lp_aleatoire_dense(5, 6, graine=9)
+    entier.definir_variables_entieres(list(range(6)))
+    problemes.append(entier)
+
+    with tempfile.TemporaryDirectory() as repertoire:
+        chemin = os.path.join(repertoire, "travaux.db")
+        with FileTravaux(chemin) as file:
+            numeros = [file.soumettre(p) for p in problemes]
+            for processus in lancer_travailleurs(chemin, n_processus=2, pivots_par_point=3):
+                processus.join(timeout=60)
+
+            assert file.compter()['termine'] == len(problemes)
+            for numero, probleme in zip(numeros, problemes):
+                solution = file.attendre(numero, delai=1)
+                assert np.isclose(solution.valeur_objectif, SolveurPL().resoudre(probleme).valeur_objectif)
+
+    print("✓ Test réussi!")
+
+
+def test_bail_renouvele_pendant_resolution_entiere():
+    """Un problème entier plus long que le bail : le bail est renouvelé, le travail n'est pas repris."""
+    probleme = lp_aleatoire_dense(5, 6, graine=9)
+    probleme.definir_variables_entieres(list(range(6)))
+    attendu = SolveurPL().resoudre(probleme).valeur_objectif
+
+    resoudre = solver.SolveurPL.resoudre
+
+    def resoudre_lentement(self, *args, **kwargs):
+        time.sleep(1.0)  # 5 fois la durée du bail
+        return resoudre(self, *args, **kwargs)
+
+    with tempfile.TemporaryDirectory() as repertoire:
+        chemin = os.path.join(repertoire, "travaux.db")
+        with FileTravaux(chemin, duree_bail=0.2) as file:
+            numero = file.soumettre(probleme)
+            resultats = []
+
+            def travailler():
+                # Une connexion SQLite par thread : le travailleur est créé ici
+                travailleur = Travailleur(chemin, duree_bail=0.2, nom='lent')
+                resultats.append(travailleur.traiter(travailleur.file.reclamer(travailleur.nom)))
+                travailleur.file.fermer()
+
+            solver.SolveurPL.resoudre = resoudre_lentement
+            try:
+                thread = threading.Thread(target=travailler)
+                thread.start()
+                time.sleep(0.6)
+                assert file.statut(numero) == 'en_cours'
+                assert file.reclamer('autre') is None      # Bail toujours valide
+                thread.join()
+            finally:
+                solver.SolveurPL.resoudre = resoudre
+
+            assert resultats[0] is not None
+            assert np.isclose(file.solution(numero).valeur_objectif, attendu)
+            assert file.infos(numero)['tentatives'] == 1
+
+    print("✓ Test réussi!")
+
+
+if __name__ == "__main__":
+    test_reprise_apres_interruption()
+    test_travailleurs_en_parallele()
+    test_bail_renouvele_pendant_resolution_entiere()
@@ -0,0 +1,85 @@
+"""
+Tests du solveur de flot à coût minimum
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
+
+import numpy as np
+
+from src.models import ProblemePL
+from src.solver import resoudre_rapide
+from src.budget import Budget
+from src.flot import ReseauFlot, SolveurFlot, detecter_reseau, resoudre_flot
+from generateurs import flot_cout_min
+
+
+def test_petit_reseau():
+    """Source 1, puits 4 : le chemin le moins cher est saturé avant l'autre."""
+    # Arcs : 1→2 (cap 4, coût 1), 1→3 (coût 4), 2→4 (coût 1), 3→4 (coût 1), 2→3 (coût 1)
+    solution = resoudre_flot([0, 0, 1, 2, 1], [1, 2, 3, 3, 2], [1, 4, 1, 1, 1],
+                             [6, 0, 0, -6], capacites=[4, np.inf, np.inf, np.inf, np.inf],
+                             verbose=False)
+    assert solution.statut == 'optimal'
+    assert np.allclose(solution.valeurs_variables, [4, 2, 4, 2, 0])
+    assert abs(solution.valeur_objectif - 18) < 1e-9
+    assert solution.noms_variables[0] == '1→2'
+
+
+def test_detection_et_comparaison_highs():
+    """Matrice d'incidence dense reconnue ; même optimum que HiGHS."""
+    for graine in range(5):
+        probleme = flot_cout_min(15, 45, graine=graine)
+        assert detecter_reseau(probleme) is not None
+        reference = resoudre_rapide(probleme, verbose=False)
+        solution = SolveurFlot().resoudre(probleme)
+        assert solution.statut == 'optimal'
+        assert abs(solution.valeur_objectif - reference.valeur_objectif) < 1e-6
+        assert np.allclose(probleme.A_eq @ solution.valeurs_variables, probleme.b_eq)
+        assert solution.noms_variables == probleme.noms_variables
+
+    probleme = ProblemePL()
+    probleme.definir_fonction_objectif([1, 1])
+    probleme.ajouter_contrainte_equalite([2, 1], 3)
+    assert detecter_reseau(probleme) is None
+
+
+def test_couts_negatifs_et_statuts():
+    """Cycle négatif borné, cycle négatif infini et offre inaccessible."""
+    # Circuit 1→2→1 de coût -1 limité par la capacité 3 de 2→1
+    reseau = ReseauFlot(2, [0, 1], [1, 0], [-2, 1], [0, 0], capacites=[np.inf, 3])
+    solution = SolveurFlot().resoudre(reseau)
+    assert solution.statut == 'optimal' and abs(solution.valeur_objectif + 3) < 1e-9
+
+    reseau = ReseauFlot(2, [0, 1], [1, 0], [-2, 1], [0, 0])
+    assert SolveurFlot().resoudre(reseau).statut == 'non_borne'
+
+    reseau = ReseauFlot(3, [0], [1], [1], [5, 0, -5])
+    assert SolveurFlot().resoudre(reseau).statut == 'infaisable'
+
+
+def test_cycle_negatif_capacite_infinie():
+    """Un cycle négatif sans limite de capacité est non borné, même entouré de cycles finis."""
+    inf = np.inf
+    reseaux = [
+        ReseauFlot(3, [1, 0, 1, 0, 0, 2, 2, 2, 0, 0], [0, 1, 0, 2, 2, 1, 1, 1, 2, 2],
+                   [-4, 5, 2, 5, -1, -3, 2, 2, 3, -4], [0, -5, 5],
+                   capacites=[inf, inf, inf, inf, 1, 0, inf, 4, 6, inf]),
+        ReseauFlot(5, [4, 0, 2, 3, 2, 1, 2, 4, 4, 2, 1], [3, 3, 4, 4, 4, 2, 4, 2, 3, 4, 3],
+                   [8, 0, -2, 8, -3, 0, 7, -1, -1, 8, -4], [0, 0, 2, -2, 0],
+                   capacites=[5, inf, 7, inf, inf, 3, inf, inf, inf, inf, 3]),
+    ]
+    for reseau in reseaux:
+        assert SolveurFlot().resoudre(reseau, verbose=False).statut == 'non_borne'
+        solution = SolveurFlot().resoudre(reseau, verbose=False,
+                                          budget=Budget(max_iterations=1000))
+        assert solution.statut == 'non_borne'
+
+
+if __name__ == "__main__":
+    test_petit_reseau()
+    test_detection_et_comparaison_highs()
+    test_couts_negatifs_et_statuts()
+    test_cycle_negatif_capacite_infinie()
+    print("✓ Test réussi!")
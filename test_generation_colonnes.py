@@ -0,0 +1,96 @@
+"""
+Tests de la génération de colonnes (problème de découpe)
+"""
+
+import numpy as np
+
+from src.models import ProblemePL
+from src.budget import Budget
+from src.generation_colonnes import GenerationColonnes, Colonne
+from src.solver import SolveurPL
+
+# Découpe de Chvátal : rouleaux de 100, relaxation optimale = 452.25
+LARGEUR = 100
+LARGEURS = np.array([45, 36, 31, 14])
+DEMANDES = np.array([97, 610, 395, 211])
+
+
+def meilleur_motif(valeurs):
+    """Sac à dos entier : motif de découpe de plus grande valeur."""
+    meilleur = np.zeros(LARGEUR + 1)
+    dernier = np.full(LARGEUR + 1, -1)
+    for place in range(1, LARGEUR + 1):
+        meilleur[place] = meilleur[place - 1]
+        for i, largeur in enumerate(LARGEURS):
+            if largeur <= place and meilleur[place - largeur] + valeurs[i] > meilleur[place] + 1e-12:
+                meilleur[place] = meilleur[place - largeur] + valeurs[i]
+                dernier[place] = i
+
+    motif = np.zeros(len(LARGEURS))
+    place = LARGEUR
+    while place > 0:
+        if dernier[place] < 0:
+            place -= 1
+        else:
+            motif[dernier[place]] += 1
+            place -= LARGEURS[dernier[place]]
+    return motif
+
+
+def pricing(duales):
+    """Les demandes sont écrites -A x <= -d : la valeur d'une pièce est -y_i."""
+    motif = meilleur_motif(-duales)
+    return [Colonne(1.0, -motif, donnees=motif)]
+
+
+def maitre_initial():
+    """Un motif homogène par pièce (maître réalisable)."""
+    n = len(LARGEURS)
+    probleme = ProblemePL("Découpe")
+    probleme.definir_fonction_objectif([1.0] * n, maximiser=False)
+    for i in range(n):
+        ligne = np.zeros(n)
+        ligne[i] = -(LARGEUR // LARGEURS[i])
+        probleme.ajouter_contrainte_inegalite(ligne, -DEMANDES[i])
+    return probleme
+
+
+def test_decoupe():
+    """Optimum de la relaxation, borne de Lasdon, puis maître entier."""
+    generation = GenerationColonnes(pricing, borne_somme=float(DEMANDES.sum()))
+    solution = generation.resoudre(maitre_initial())
+
+    assert solution.statut == 'optimal'
+    assert np.isclose(solution.valeur_objectif, 452.25)
+    assert generation.colonnes_ajoutees > 0
+    assert all(etape['borne'] <= etape['valeur'] + 1e-6 for etape in generation.historique)
+
+    # Le maître final se résout en nombres entiers
+    maitre = generation.probleme_maitre()
+    assert len(maitre.c) == len(solution.valeurs_variables)
+    maitre.definir_variables_entieres(list(range(len(maitre.c))))
+    entier = SolveurPL().resoudre(maitre)
+    assert entier.succes and entier.valeur_objectif >= 452.25
+
+    print("✓ Test réussi!")
+
+
+def test_stabilisation_eviction_budget():
+    """Mêmes optimums avec lissage et éviction ; budget : maître courant."""
+    for stabilisation, age_max, taille_max in ((0.5, None, None), (0.0, 0, 1)):
+        generation = GenerationColonnes(pricing, stabilisation=stabilisation,
+                                        age_max=age_max, taille_max=taille_max)
+        solution = generation.resoudre(maitre_initial())
+        assert np.isclose(solution.valeur_objectif, 452.25)
+        assert len(generation.colonnes) == generation.colonnes_ajoutees - generation.colonnes_retirees
+
+    solution = GenerationColonnes(pricing).resoudre(maitre_initial(), budget=Budget(max_iterations=1))
+    assert solution.statut == 'budget_epuise'
+    assert solution.valeur_objectif >= 452.25
+
+    print("✓ Test réussi!")
+
+
+if __name__ == "__main__":
+    test_decoupe()
+    test_stabilisation_eviction_budget()
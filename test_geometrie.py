@@ -0,0 +1,83 @@
+"""
+Tests du calcul exact de la région réalisable (graphique 2D)
+"""
+
+import math
+import random
+
+from src.models import ProblemePL
+from src.geometrie import (demi_plans_boite, intersection_demi_plans,
+                           region_realisable, segment_dans_boite)
+
+
+def _aire(sommets):
+    """Aire d'un polygone (formule du lacet)."""
+    return 0.5 * abs(sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2)
+                         in zip(sommets, sommets[1:] + sommets[:1])))
+
+
+def test_polygone_exemple():
+    """Région de l'exemple de production : sommets exacts."""
+    probleme = ProblemePL("Production")
+    probleme.definir_fonction_objectif([3, 5], maximiser=True)
+    probleme.ajouter_contrainte_inegalite([1, 0], 4)
+    probleme.ajouter_contrainte_inegalite([0, 2], 12)
+    probleme.ajouter_contrainte_inegalite([3, 2], 18)
+    probleme.definir_bornes([(0, None), (0, None)])
+
+    sommets, boite = region_realisable(probleme, [(2, 6)])
+    attendus = {(0, 0), (4, 0), (4, 3), (2, 6), (0, 6)}
+    assert len(sommets) == len(attendus)
+    for x, y in sommets:
+        assert any(math.isclose(x, a, abs_tol=1e-9) and math.isclose(y, b, abs_tol=1e-9)
+                   for a, b in attendus)
+    # La boîte contient toute la région
+    assert boite[0] < 0 and boite[1] > 6 and boite[2] < 0 and boite[3] > 9
+
+
+def test_egalite_et_region_vide():
+    """Une égalité donne un segment ; des contraintes incompatibles, une région vide."""
+    probleme = ProblemePL("Égalité")
+    probleme.definir_fonction_objectif([1, 1], maximiser=True)
+    probleme.ajouter_contrainte_equalite([1, 1], 10)
+    sommets, _ = region_realisable(probleme)
+    assert len(sommets) == 2
+    assert all(math.isclose(x + y, 10, abs_tol=1e-9) for x, y in sommets)
+
+    probleme.ajouter_contrainte_inegalite([1, 1], 5)
+    sommets, _ = region_realisable(probleme)
+    assert sommets == []
+
+
+def test_intersection_aleatoire():
+    """Comparaison avec un échantillonnage : l'aire est cohérente."""
+    rng = random.Random(0)
+    for _ in range(20):
+        demi_plans = [(rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(0.5, 2))
+                      for _ in range(15)]
+        boite = (-3, 3, -3, 3)
+        sommets = intersection_demi_plans(demi_plans + demi_plans_boite(boite))
+
+        dedans = 0
+        for _ in range(4000):
+            x, y = rng.uniform(-3, 3), rng.uniform(-3, 3)
+            dedans += all(a1 * x + a2 * y <= b for a1, a2, b in demi_plans)
+        assert abs(_aire(sommets) - 36 * dedans / 4000) < 1.0
+
+
+def test_segment_dans_boite():
+    """Droites verticales, obliques et hors de la boîte."""
+    def extremites(segment):
+        return {(round(x, 9) + 0.0, round(y, 9) + 0.0) for x, y in segment}
+
+    assert extremites(segment_dans_boite((1, 0, 2), (0, 5, 0, 5))) == {(2, 0), (2, 5)}
+    assert extremites(segment_dans_boite((1, 1, 4), (0, 5, 0, 5))) == {(4, 0), (0, 4)}
+    assert segment_dans_boite((1, 1, 20), (0, 5, 0, 5)) is None
+
+
+if __name__ == "__main__":
+    test_polygone_exemple()
+    test_egalite_et_region_vide()
+    test_intersection_aleatoire()
+    test_segment_dans_boite()
+    print("✓ Test réussi!")
@@ -0,0 +1,94 @@
+"""
+Tests des coupes de Gomory
+"""
+
+import itertools
+
+import numpy as np
+
+from src.models import ProblemePL
+from src.simplexe import SimplexeSolveur
+from src.simplexe_standard import SimplexeStandard
+from src.gomory import GenerateurGomory, coupe_tableau
+from src.branch_bound import BranchAndBound
+from src.solver import SolveurPL
+
+
+def probleme_entier(graine=1, n=12):
+    """Sac à dos entier (0 <= x <= 3) à 3 contraintes."""
+    rng = np.random.default_rng(graine)
+    poids = rng.integers(10, 60, (3, n)).astype(float)
+    valeurs = rng.integers(10, 80, n).astype(float)
+
+    probleme = ProblemePL()
+    probleme.definir_fonction_objectif(list(valeurs), maximiser=True)
+    for ligne in poids:
+        probleme.ajouter_contrainte_inegalite(list(ligne), np.floor(ligne.sum() / 3))
+    probleme.definir_bornes([(0, 3)] * n)
+    probleme.definir_variables_entieres(list(range(n)))
+    return probleme
+
+
+def test_coupe_tableau_du_cours():
+    """Coupe lue sur le tableau final : respectée par tous les points entiers."""
+    # Max 5x1 + 4x2 ; 6x1 + 4x2 <= 24 ; x1 + 2x2 <= 6 -> x = (3, 1.5)
+    A, b = np.array([[6, 4], [1, 2]]), np.array([24, 6])
+    solveur = SimplexeSolveur()
+    tableaux = solveur.resoudre([5, 4], A.tolist(), b.tolist())
+
+    coupe = coupe_tableau(tableaux[-1], 'x2', {'x1', 'x2', 't1', 't2'})
+    assert coupe is not None
+    coefficients, second_membre = coupe
+
+    def membre_gauche(x):
+        valeurs = dict(zip(['x1', 'x2'], x))
+        valeurs.update(zip(['t1', 't2'], b - A @ x))
+        return sum(coef * valeurs[nom] for nom, coef in coefficients.items())
+
+    # La solution fractionnaire est coupée, les points entiers réalisables non
+    assert membre_gauche(np.array([3, 1.5])) < second_membre
+    for x in itertools.product(range(5), range(4)):
+        x = np.array(x)
+        if np.all(A @ x <= b):
+            assert membre_gauche(x) >= second_membre - 1e-9
+
+    print("✓ Test réussi!")
+
+
+def test_renforcer_resserre_la_borne():
+    """Les coupes rapprochent la relaxation de l'optimum entier sans le couper."""
+    probleme = probleme_entier()
+    optimum = SolveurPL().resoudre(probleme).valeur_objectif
+
+    lp = SimplexeStandard.depuis_probleme(probleme)
+    lp.resoudre()
+    relaxation = lp.valeur_objectif
+
+    generateur = GenerateurGomory(age_max=1)
+    assert generateur.renforcer(lp, probleme.indices_entiers()) == 'optimal'
+    assert generateur.coupes_ajoutees > 0
+    assert optimum - 1e-6 <= lp.valeur_objectif < relaxation
+    # Les coupes retirées ne sont plus des lignes du simplexe
+    assert lp.m == 3 + len(generateur.coupes)
+    assert generateur.coupes_ajoutees == len(generateur.coupes) + generateur.coupes_retirees
+
+    print("✓ Test réussi!")
+
+
+def test_branch_bound_avec_coupes():
+    """Cut-and-branch : même optimum, en séquentiel et en parallèle."""
+    probleme = probleme_entier(graine=2)
+    optimum = SolveurPL().resoudre(probleme).valeur_objectif
+
+    for n_processus in (1, 2):
+        solution = BranchAndBound(n_processus=n_processus, coupes=GenerateurGomory()).resoudre(probleme)
+        assert solution.statut == 'optimal'
+        assert np.isclose(solution.valeur_objectif, optimum)
+
+    print("✓ Test réussi!")
+
+
+if __name__ == "__main__":
+    test_coupe_tableau_du_cours()
+    test_renforcer_resserre_la_borne()
+    test_branch_bound_avec_coupes()
@@ -0,0 +1,39 @@
+"""
+Tests du chargement paresseux du paquet src
+"""
+
+import os
+import subprocess
+import sys
+
+RACINE = os.path.dirname(os.path.abspath(__file__))
+
+
+def modules_charges(instruction):
+    """Exécute l'instruction dans un nouvel interpréteur et renvoie les modules lourds chargés."""
+    code = f"{instruction}\nimport sys\nprint(' '.join(m for m in ('numpy', 'scipy') if m in sys.modules))"
+    sortie = subprocess.run([sys.executable, '-c', code], cwd=RACINE,
+                            capture_output=True, text=True, check=True).stdout
+    return sortie.split()
+
+
+def test_import_paresseux():
+    """Importer src (ou un solveur) ne charge pas SciPy."""
+    assert modules_charges("import src") == []
+    assert 'scipy' not in modules_charges("from src import SimplexeSolveur, SolveurPL")
+
+
+def test_scipy_charge_a_la_resolution():
+    """SciPy n'est chargé qu'au moment de résoudre avec SolveurPL."""
+    instruction = (
+        "from src import ProblemePL, SolveurPL\n"
+        "p = ProblemePL(); p.definir_fonction_objectif([1, 1]); p.ajouter_contrainte_inegalite([1, 2], 4)\n"
+        "assert SolveurPL().resoudre(p).succes"
+    )
+    assert 'scipy' in modules_charges(instruction)
+
+
+if __name__ == "__main__":
+    test_import_paresseux()
+    test_scipy_charge_a_la_resolution()
+    print("✓ Test réussi!")
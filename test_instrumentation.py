@@ -0,0 +1,54 @@
+from src.instrumentation import CollecteurProfil, EcouteurSolveur
+from src.models import ProblemePL
+from src.simplexe import SimplexeSolveur
+from src.solver import SolveurPL
+
+
+class EcouteurPivots(EcouteurSolveur):
+    def __init__(self):
+        self.pivots = []
+
+    def pivot(self, iteration, var_entrante, var_sortante, degenere):
+        self.pivots.append((var_entrante, var_sortante))
+
+
+def test_collecteur_simplexe():
+    collecteur = CollecteurProfil()
+    ecouteur = EcouteurPivots()
+    solveur = SimplexeSolveur(ecouteurs=[collecteur, ecouteur])
+    solveur.resoudre([1200, 1000], [[3, 4], [6, 3]], [160, 180])
+
+    profil = collecteur.dernier
+    assert profil.statut == 'optimal'
+    assert profil.nb_pivots == 2 and profil.nb_pivots_degeneres == 0
+    assert ecouteur.pivots == [('x1', 't2'), ('x2', 't1')]
+    for phase in ('pricing', 'ratio', 'pivot', 'historique'):
+        assert profil.temps_phases[phase] >= 0
+    assert profil.memoire_max_octets > 0
+
+
+def test_pivot_degenere():
+    # La deuxième contrainte a un second membre nul : le pivot est dégénéré
+    collecteur = CollecteurProfil()
+    SimplexeSolveur(ecouteurs=[collecteur]).resoudre([1, 1], [[1, 1], [1, -1]], [4, 0])
+    assert collecteur.dernier.nb_pivots_degeneres >= 1
+
+
+def test_profil_attache_a_la_solution():
+    probleme = ProblemePL()
+    probleme.definir_fonction_objectif([1200, 1000])
+    probleme.ajouter_contrainte_inegalite([3, 4], 160)
+    probleme.ajouter_contrainte_inegalite([6, 3], 180)
+
+    collecteur = CollecteurProfil()
+    solution = SolveurPL(ecouteurs=[collecteur]).resoudre(probleme)
+    assert solution.profil is collecteur.dernier
+    assert solution.profil.moteur == 'scipy-highs'
+    assert 'resolution' in solution.profil.temps_phases
+
+
+if __name__ == "__main__":
+    test_collecteur_simplexe()
+    test_pivot_degenere()
+    test_profil_attache_a_la_solution()
+    print("✓ Test réussi!")
@@ -0,0 +1,79 @@
+"""
+Tests de la résolution par lots (module src.lot et sous-commande `lot`)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from benchmarks.generateurs import lp_aleatoire_dense
+from src.lot import enregistrer_probleme, lister_fichiers, resoudre_lot
+from src.solver import SolveurPL
+
+RACINE = os.path.dirname(os.path.abspath(__file__))
+
+
+def ecrire_modeles(repertoire, n=4):
+    """Écrit n modèles (.json et .npz en alternance) ; renvoie les objectifs attendus."""
+    attendus = {}
+    for i in range(n):
+        probleme = lp_aleatoire_dense(8, 10, graine=i)
+        chemin = os.path.join(repertoire, f"modele{i}.{'npz' if i % 2 else 'json'}")
+        enregistrer_probleme(probleme, chemin)
+        attendus[chemin] = SolveurPL().resoudre(probleme).valeur_objectif
+    return attendus
+
+
+def test_resoudre_lot():
+    """Tous les moteurs, en séquentiel et en parallèle ; un fichier illisible ne bloque pas le lot."""
+    with tempfile.TemporaryDirectory() as repertoire:
+        attendus = ecrire_modeles(repertoire)
+        casse = os.path.join(repertoire, "casse.json")
+        with open(casse, 'w') as f:
+            f.write("{pas du json")
+
+        fichiers = lister_fichiers([repertoire])
+        assert fichiers == sorted(list(attendus) + [casse])
+        assert lister_fichiers([os.path.join(repertoire, "*.npz")]) == sorted(
+            f for f in attendus if f.endswith('.npz'))
+
+        for moteur, n_processus in (('scipy-highs', 2), ('simplexe-standard', 1), ('branch-bound', 1)):
+            resultats = {r['fichier']: r for r in resoudre_lot(fichiers, moteur, n_processus)}
+            assert resultats[casse]['statut'] == 'erreur'
+            for chemin, attendu in attendus.items():
+                assert resultats[chemin]['statut'] == 'optimal'
+                assert np.isclose(resultats[chemin]['objectif'], attendu)
+                assert resultats[chemin]['iterations'] is not None
+                assert resultats[chemin]['temps_resolution'] >= 0
+
+    print("✓ Test réussi!")
+
+
+def test_sous_commande_lot():
+    """`python examples/main.py lot ...` écrit une ligne JSON par modèle."""
+    with tempfile.TemporaryDirectory() as repertoire:
+        attendus = ecrire_modeles(repertoire)
+        metriques = os.path.join(repertoire, "metriques.prom")
+        processus = subprocess.run(
+            [sys.executable, os.path.join(RACINE, "examples", "main.py"), "lot", repertoire,
+             "--processus", "2", "--metriques", metriques],
+            capture_output=True, text=True, timeout=120)
+
+        assert processus.returncode == 0, processus.stderr
+        lignes = [json.loads(ligne) for ligne in processus.stdout.splitlines()]
+        assert sorted(r['fichier'] for r in lignes) == sorted(attendus)
+        for resultat in lignes:
+            assert np.isclose(resultat['objectif'], attendus[resultat['fichier']])
+        with open(metriques, encoding='utf-8') as f:
+            assert 'pl_resolutions_total{moteur="scipy-highs",statut="optimal"} 4' in f.read()
+
+    print("✓ Test réussi!")
+
+
+if __name__ == "__main__":
+    test_resoudre_lot()
+    test_sous_commande_lot()
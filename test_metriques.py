@@ -0,0 +1,95 @@
+"""
+Tests du registre de métriques (format texte de Prometheus)
+"""
+
+import threading
+import urllib.request
+
+from src.cache import CacheSolutions
+from src.metriques import EcouteurMetriques, RegistreMetriques, _Metrique
+from src.simplexe import SimplexeSolveur
+
+# Exemple du cours
+c = [1200, 1000]
+A = [[3, 4], [6, 3]]
+b = [160, 180]
+
+
+def test_format_prometheus():
+    """Compteurs, jauges et histogrammes (classes cumulées, _sum, _count)."""
+    registre = RegistreMetriques()
+    requetes = registre.compteur('requetes_total', "Requêtes", ('route',))
+    requetes.incrementer(route='/a')
+    requetes.incrementer(2, route='/a "x"')
+    registre.jauge('temperature', "Température").fixer(21.5)
+    duree = registre.histogramme('duree_secondes', "Durée", seuils=(0.1, 1))
+    for valeur in (0.05, 0.5, 3):
+        duree.observer(valeur)
+
+    texte = registre.texte()
+    assert '# TYPE requetes_total counter' in texte
+    assert 'requetes_total{route="/a"} 1' in texte
+    assert 'requetes_total{route="/a \\"x\\""} 2' in texte
+    assert 'temperature 21.5' in texte
+    assert 'duree_secondes_bucket{le="0.1"} 1' in texte
+    assert 'duree_secondes_bucket{le="1"} 2' in texte
+    assert 'duree_secondes_bucket{le="+Inf"} 3' in texte
+    assert 'duree_secondes_sum 3.55' in texte and 'duree_secondes_count 3' in texte
+
+    # Redéclarer renvoie la même métrique ; les étiquettes sont vérifiées
+    assert registre.compteur('requetes_total', "Requêtes", ('route',)) is requetes
+    for appel in (lambda: requetes.incrementer(), lambda: requetes.incrementer(-1, route='/a'),
+                  lambda: registre.jauge('requetes_total', "Autre")):
+        try:
+            appel()
+            assert False, "ValueError attendue"
+        except ValueError:
+            pass
+
+    # Une métrique doit savoir écrire ses lignes
+    try:
+        _Metrique('abstraite', "Sans _lignes", (), threading.Lock())
+        assert False, "TypeError attendue"
+    except TypeError:
+        pass
+
+    print("✓ Test réussi!")
+
+
+def test_ecouteur_et_point_http():
+    """Résolutions par statut, itérations, cache ; export par GET /metrics."""
+    registre = RegistreMetriques()
+    ecouteur = EcouteurMetriques(registre)
+    cache = CacheSolutions()
+    registre.suivre_cache(cache)
+    solveur = SimplexeSolveur(cache=cache, ecouteurs=[ecouteur])
+    for _ in range(3):
+        solveur.resoudre(c, A, b)
+    solveur.resoudre([1, 1], [[-1, 0]], [1])   # Non borné
+
+    # Les deux résolutions servies par le cache sont comptées, hors histogrammes
+    assert ecouteur.resolutions.valeur(moteur='simplexe', statut='optimal') == 3
+    assert ecouteur.resolutions.valeur(moteur='simplexe', statut='non_borne') == 1
+    assert ecouteur.iterations.nombre(moteur='simplexe') == 2
+
+    serveur = registre.servir(port=0)
+    try:
+        url = f"http://127.0.0.1:{serveur.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=10) as reponse:
+            assert reponse.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+            texte = reponse.read().decode('utf-8')
+    finally:
+        serveur.shutdown()
+
+    assert 'pl_resolutions_total{moteur="simplexe",statut="optimal"} 3' in texte
+    assert 'pl_iterations_resolution_sum{moteur="simplexe"} 2' in texte
+    assert 'pl_cache_requetes_total{cache="solutions"} 4' in texte
+    assert 'pl_cache_taux_hits{cache="solutions"} 0.5' in texte
+    assert 'pl_duree_resolution_secondes_count{moteur="simplexe"} 2' in texte
+
+    print("✓ Test réussi!")
+
+
+if __name__ == "__main__":
+    test_format_prometheus()
+    test_ecouteur_et_point_http()
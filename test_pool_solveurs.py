@@ -0,0 +1,45 @@
+"""
+Tests du pool de solveurs (threads)
+"""
+
+import numpy as np
+
+from src.cache import CacheSolutions
+from src.instrumentation import CollecteurProfil
+from src.pool_solveurs import PoolSolveurs
+from src.simplexe import SimplexeSolveur
+
+
+def test_pool_simplexe():
+    """Résolutions concurrentes avec des solveurs partagés par le pool."""
+    rng = np.random.default_rng(0)
+    problemes = []
+    for _ in range(40):
+        n = int(rng.integers(2, 6))
+        problemes.append((list(rng.uniform(1, 10, n)), rng.uniform(1, 5, (3, n)).tolist(),
+                          list(rng.uniform(10, 20, 3))))
+    attendus = [SimplexeSolveur().resoudre(*p) for p in problemes]
+
+    cache = CacheSolutions()
+    fabrique = lambda: SimplexeSolveur(cache=cache, ecouteurs=[CollecteurProfil()])
+    with PoolSolveurs(fabrique, n_threads=4) as pool:
+        resultats = [f.result() for f in [pool.resoudre(*p) for p in problemes]]
+        # Deuxième passage : servi par le cache partagé
+        again = list(pool.map(lambda solveur, p: solveur.resoudre(*p), problemes))
+
+    for attendu, resultat, resultat_cache in zip(attendus, resultats, again):
+        assert resultat.statut == attendu.statut == 'optimal'
+        assert np.isclose(resultat.valeur_optimale, attendu.valeur_optimale)
+        assert resultat.variables_solution.keys() == attendu.variables_solution.keys()
+        assert np.isclose(resultat_cache.valeur_optimale, attendu.valeur_optimale)
+    assert cache.nb_hits == len(problemes)
+
+    # Chaque solveur n'a servi qu'à un thread à la fois : un profil par
+    # résolution, y compris celles servies par le cache
+    assert sum(len(s.ecouteurs[0].profils) for s in pool.solveurs) == 2 * len(problemes)
+
+    print("✓ Test réussi!")
+
+
+if __name__ == "__main__":
+    test_pool_simplexe()
@@ -0,0 +1,133 @@
+"""
+Tests du serveur HTTP local de résolution (uniquement sur localhost)
+"""
+
+import json
+import os
+import queue
+import signal
+import threading
+import time
+from urllib import request, error
+
+import numpy as np
+
+from src.models import ProblemePL
+from src.serveur import ServeurSolveur, resoudre_distant
+from src.solver import SolveurPL
+
+
+def petit_probleme(graine):
+    """Petit problème aléatoire borné (max c.x, A x <= b, 0 <= x <= 5)."""
+    rng = np.random.default_rng(graine)
+    probleme = ProblemePL(f"Aléatoire {graine}")
+    probleme.definir_fonction_objectif(list(rng.uniform(1, 5, 4)))
+    for ligne in rng.uniform(0, 3, (3, 4)):
+        probleme.ajouter_contrainte_inegalite(list(ligne), 10.0)
+    probleme.definir_bornes([(0, 5)] * 4)
+    return probleme
+
+
+def lire(url):
+    with request.urlopen(url, timeout=10) as reponse:
+        return json.loads(reponse.read())
+
+
+def test_resolution_lots_et_metriques():
+    """Requêtes JSON et binaires simultanées : mêmes solutions qu'en local."""
+    problemes = [petit_probleme(graine) for graine in range(12)]
+    attendues = [SolveurPL().resoudre(p).valeur_objectif for p in problemes]
+    solutions = [None] * len(problemes)
+
+    with ServeurSolveur(port=0, n_processus=2, attente_lot=0.02) as serveur:
+        assert lire(f"{serveur.url}/sante")['statut'] == 'ok'
+
+        def client(i):
+            solutions[i] = resoudre_distant(problemes[i], serveur.url, binaire=i % 2 == 1)
+
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(len(problemes))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metriques = lire(f"{serveur.url}/metriques")
+
+    for solution, attendue in zip(solutions, attendues):
+        assert solution.succes and np.isclose(solution.valeur_objectif, attendue)
+    assert metriques['reussies'] == len(problemes)
+    # Des requêtes arrivées ensemble ont partagé un lot
+    assert metriques['lots'] < len(problemes)
+    assert metriques['latence_p95_ms'] >= metriques['latence_p50_ms'] > 0
+
+    print("✓ Test réussi!")
+
+
+def test_requete_invalide_et_file_pleine():
+    """Corps invalide : 400 ; file pleine : 503 avec Retry-After."""
+    with ServeurSolveur(port=0, n_processus=1, taille_file=1, delai_reponse=5) as serveur:
+        invalide = request.Request(f"{serveur.url}/resoudre", data=b'{"A_ub": []}', method='POST')
+        try:
+            request.urlopen(invalide, timeout=10)
+            assert False, "400 attendu"
+        except error.HTTPError as reponse:
+            assert reponse.code == 400
+
+        # On remplit la file directement (le regroupement est bloqué faute de place)
+        while serveur._places.acquire(blocking=False):
+            pass
+        # (jusqu'à ce qu'elle reste pleine : le regroupement a pu prendre une requête)
+        while True:
+            try:
+                serveur.soumettre(petit_probleme(0))
+            except queue.Full:
+                time.sleep(0.05)
+                if serveur.file.full():
+                    break
+        try:
+            resoudre_distant(petit_probleme(2), serveur.url)
+            assert False, "503 attendu"
+        except error.HTTPError as reponse:
+            assert reponse.code == 503
+            assert reponse.headers['Retry-After'] == '1'
+
+        assert lire(f"{serveur.url}/metriques")['rejetees'] >= 1
+
+    print("✓ Test réussi!")
+
+
+def test_processus_mort():
+    """Un processus de calcul tué : le pool est recréé et la requête aboutit."""
+    probleme = petit_probleme(3)
+    attendue = SolveurPL().resoudre(probleme).valeur_objectif
+
+    with ServeurSolveur(port=0, n_processus=1, delai_reponse=30) as serveur:
+        assert resoudre_distant(probleme, serveur.url).succes
+        ancien = serveur._executeur
+        for pid in list(ancien._processes):
+            os.kill(pid, signal.SIGKILL)
+        time.sleep(0.5)  # Le pool se sait cassé
+
+        solution = resoudre_distant(probleme, serveur.url, delai=30)
+        assert solution.succes and np.isclose(solution.valeur_objectif, attendue)
+        assert serveur._executeur is not ancien
+        assert lire(f"{serveur.url}/sante")['statut'] == 'ok'
+        assert lire(f"{serveur.url}/metriques")['redemarrages'] == 1
+
+        # Pendant la recréation, /sante répond 503
+        serveur._pool_pret.clear()
+        try:
+            lire(f"{serveur.url}/sante")
+            assert False, "503 attendu"
+        except error.HTTPError as reponse:
+            assert reponse.code == 503
+            assert json.loads(reponse.read())['statut'] == 'redemarrage'
+        serveur._pool_pret.set()
+
+    print("✓ Test réussi!")
+
+
+if __name__ == "__main__":
+    test_resolution_lots_et_metriques()
+    test_requete_invalide_et_file_pleine()
+    test_processus_mort()
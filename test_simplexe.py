@@ -0,0 +1,228 @@
+import dataclasses
+import glob
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from src.budget import Budget, borne_lagrangienne
+from src.instrumentation import EcouteurSolveur
+from src.noyau import NUMBA_DISPONIBLE, charger_noyau
+from src.simplexe import PointReprise, SimplexeSolveur
+
+# Exemple du cours
+c = [1200, 1000]
+A = [[3, 4], [6, 3]]
+b = [160, 180]
+
+
+def test_iter_resoudre_identique_a_resoudre():
+    tableaux = SimplexeSolveur().resoudre(c, A, b)
+
+    solveur = SimplexeSolveur()
+    produits = list(solveur.iter_resoudre(c, A, b))
+
+    assert len(produits) == len(tableaux)
+    for t1, t2 in zip(tableaux, produits):
+        assert t1.iteration == t2.iteration
+        assert t1.message == t2.message
+        assert (t1.matrice == t2.matrice).all()
+    assert solveur.solution_trouvee
+    assert abs(solveur.valeur_optimale - 47200) < 1e-6
+
+
+def test_iter_resoudre_arret_anticipe():
+    solveur = SimplexeSolveur()
+    for tableau in solveur.iter_resoudre(c, A, b):
+        if tableau.iteration == 1:
+            break
+    # L'algorithme n'est pas allé au bout
+    assert not solveur.solution_trouvee
+
+
+def test_budget_iterations():
+    solveur = SimplexeSolveur()
+    solveur.resoudre(c, A, b, budget=Budget(max_iterations=1))
+
+    assert solveur.budget_epuise and not solveur.solution_trouvee
+    # Base courante réalisable (x1 = 30, x2 = 0) et écart valide
+    assert abs(solveur.valeur_courante - 36000) < 1e-6
+    assert solveur.valeur_courante + solveur.ecart_optimalite >= 47200 - 1e-6
+
+
+def test_pivot_colonne_sortante():
+    """Après un pivot, la colonne du pivot est celle de la variable sortante."""
+    tableau = SimplexeSolveur().resoudre(c, A, b)[2]
+
+    # x1 entre, t2 sort (pivot 6) : colonne de t2 = 1/6 sur la ligne du pivot,
+    # -3/6 ailleurs, et Δ(t2) = -1200/6
+    assert tableau.vars_hb == ['t2', 'x2'] and tableau.vars_base == ['t1', 'x1']
+    assert (abs(tableau.matrice - [[-0.5, 2.5], [1 / 6, 0.5]]) < 1e-9).all()
+    assert (abs(tableau.delta - [-200, 400]) < 1e-9).all()
+    assert (abs(tableau.colonne_c - [70, 30]) < 1e-9).all()
+    assert abs(tableau.valeur_z + 36000) < 1e-9
+
+
+def test_resultats_independants():
+    """Un même solveur réutilisé : pas de variables d'un problème précédent."""
+    solveur = SimplexeSolveur()
+    premier = solveur.resoudre([1, 1, 1], [[1, 1, 1]], [5], noms_vars=['a', 'b', 'c'])
+    second = solveur.resoudre(c, A, b)
+
+    assert set(second.variables_solution) == {'x1', 'x2', 't1', 't2'}
+    assert solveur.variables_solution == second.variables_solution
+    # Le premier résultat est intact (et non modifiable)
+    assert premier.solution_trouvee and 'a' in premier.variables_solution
+    assert len(second) == len(solveur.tableaux) and second[-1] is second.tableaux[-1]
+    try:
+        second.statut = 'non_borne'
+        assert False, "Le résultat doit être immuable"
+    except dataclasses.FrozenInstanceError:
+        pass
+
+
+def test_tampons_reutilises():
+    """Tableaux de travail gardés entre deux résolutions ; sans historique : tableau final seul."""
+    solveur = SimplexeSolveur(reutiliser_tampons=True, historique=False)
+    for _ in range(3):
+        resultat = solveur.resoudre(c, A, b)
+        assert abs(resultat.valeur_optimale - 47200) < 1e-6
+        assert len(resultat) == 1 and "OPTIMALE" in resultat[-1].message
+    # Un plus petit problème réutilise les mêmes tableaux
+    assert solveur.resoudre([1], [[2]], [4]).valeur_optimale == 2
+    assert solveur._tampons.nb_allocations == 1
+
+    # Mêmes tableaux qu'un solveur neuf, et le premier résultat n'est pas écrasé
+    avec_historique = SimplexeSolveur(reutiliser_tampons=True)
+    premier = avec_historique.resoudre(c, A, b)
+    avec_historique.resoudre([3, 1], [[1, 1], [2, 1]], [4, 6])
+    for t1, t2 in zip(premier, SimplexeSolveur().resoudre(c, A, b)):
+        assert (t1.matrice == t2.matrice).all() and t1.message == t2.message
+
+
+def _comparer_au_noyau_numpy(nom):
+    """Mêmes pivots, tableaux et valeurs que le noyau NumPy, avec et sans historique."""
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        m, n = rng.integers(1, 8, size=2)
+        A2 = rng.normal(size=(m, n)).round(1).tolist()
+        b2 = (np.abs(rng.normal(size=m)) * 5).tolist()
+        c2 = rng.normal(size=n).tolist()
+        for historique in (True, False):
+            reference = SimplexeSolveur(noyau='numpy', historique=historique).resoudre(c2, A2, b2)
+            resultat = SimplexeSolveur(noyau=nom, historique=historique).resoudre(c2, A2, b2)
+            assert resultat.statut == reference.statut
+            assert resultat.valeurs == reference.valeurs
+            assert len(resultat) == len(reference)
+            for t1, t2 in zip(reference, resultat):
+                assert t1.vars_base == t2.vars_base and t1.message == t2.message
+                assert np.array_equal(t1.matrice, t2.matrice)
+
+
+def test_noyaux_identiques():
+    """Le noyau en boucles (non compilé) fait les mêmes pivots que NumPy."""
+    _comparer_au_noyau_numpy('python')
+
+    if not NUMBA_DISPONIBLE:
+        assert charger_noyau('auto').nom == 'numpy'
+        try:
+            SimplexeSolveur(noyau='numba')
+            assert False, "Numba n'est pas installé"
+        except ValueError:
+            pass
+
+
+@pytest.mark.skipif(not NUMBA_DISPONIBLE, reason="Numba n'est pas installé")
+def test_noyau_numba():
+    """Les boucles compilées par Numba font les mêmes pivots que NumPy."""
+    assert charger_noyau('auto').nom == 'numba'
+    _comparer_au_noyau_numpy('numba')
+
+
+class _Interruption(EcouteurSolveur):
+    """Interrompt la résolution (comme Ctrl+C) après un pivot donné."""
+
+    def __init__(self, iteration):
+        self.iteration = iteration
+
+    def pivot(self, iteration, var_entrante, var_sortante, degenere):
+        if iteration == self.iteration:
+            raise KeyboardInterrupt
+
+
+def test_point_reprise():
+    """Une résolution interrompue puis reprise donne exactement le même résultat."""
+    rng = np.random.default_rng(1)
+    A2 = rng.normal(size=(15, 20)).round(2).tolist()
+    b2 = (np.abs(rng.normal(size=15)) * 5).tolist()
+    c2 = rng.normal(size=20).tolist()
+
+    with tempfile.TemporaryDirectory() as repertoire:
+        chemin = os.path.join(repertoire, 'reprise.npz')
+        for historique in (True, False):
+            reference = SimplexeSolveur(historique=historique).resoudre(c2, A2, b2, maximiser=False)
+            assert reference.iterations >= 5
+
+            try:
+                SimplexeSolveur(historique=historique, ecouteurs=[_Interruption(5)]).resoudre(
+                    c2, A2, b2, maximiser=False, point_reprise=chemin, intervalle_reprise=2)
+                assert False, "La résolution devait être interrompue"
+            except KeyboardInterrupt:
+                pass
+            assert os.path.exists(chemin)
+            if historique:
+                # Chaque point de reprise n'a écrit que les nouveaux tableaux
+                segments = PointReprise.charger(chemin).segments
+                assert len(segments) >= 2
+                debuts = (0,) + segments[:-1]
+                for k, (debut, fin) in enumerate(zip(debuts, segments)):
+                    with np.load(PointReprise.chemin_segment(chemin, k)) as segment:
+                        assert len(segment['hist_matrice']) == fin - debut > 0
+
+            resultat = SimplexeSolveur(historique=historique).reprendre(chemin)
+            assert resultat.statut == reference.statut
+            assert resultat.valeurs == reference.valeurs
+            assert resultat.iterations == reference.iterations
+            assert len(resultat) == len(reference)
+            for t1, t2 in zip(reference, resultat):
+                assert t1.iteration == t2.iteration and t1.message == t2.message
+                assert np.array_equal(t1.matrice, t2.matrice) and t1.valeur_z == t2.valeur_z
+
+            # Résolution terminée : l'historique est regroupé dans le fichier principal
+            assert glob.glob(chemin + '.historique-*') == []
+            SimplexeSolveur(historique=historique).resoudre(
+                c2, A2, b2, maximiser=False, point_reprise=chemin, intervalle_reprise=2)
+            assert glob.glob(chemin + '.historique-*') == []
+            resultat = SimplexeSolveur(historique=historique).reprendre(chemin)
+            assert resultat.valeurs == reference.valeurs and len(resultat) == len(reference)
+
+        # Point de reprise sans historique : pas de reprise avec historique
+        try:
+            SimplexeSolveur().reprendre(chemin)
+            assert False, "Historique manquant"
+        except ValueError:
+            pass
+
+
+def test_borne_lagrangienne():
+    # Min -1200x1 - 1000x2 : la valeur optimale est -47200
+    assert borne_lagrangienne([-1200, -1000], A, b) <= -47200
+    # Avec les multiplicateurs optimaux (y = 160, 120) la borne est exacte
+    borne = borne_lagrangienne([-1200, -1000], A, b, y_ub=[160, 120])
+    assert abs(borne + 47200) < 1e-6
+
+
+if __name__ == "__main__":
+    test_iter_resoudre_identique_a_resoudre()
+    test_iter_resoudre_arret_anticipe()
+    test_budget_iterations()
+    test_pivot_colonne_sortante()
+    test_resultats_independants()
+    test_tampons_reutilises()
+    test_noyaux_identiques()
+    if NUMBA_DISPONIBLE:
+        test_noyau_numba()
+    test_point_reprise()
+    test_borne_lagrangienne()
+    print("✓ Test réussi!")
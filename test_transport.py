@@ -0,0 +1,90 @@
+"""
+Tests du solveur de transport (Vogel / moindre coût / coin nord-ouest + MODI)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
+
+import numpy as np
+
+from src.models import ProblemePL
+from src.solver import resoudre_rapide
+from src.transport import ProblemeTransport, SolveurTransport, detecter_transport
+from src.instrumentation import CollecteurProfil
+from generateurs import transport
+
+
+def test_exemple_transport():
+    """L'exemple du cours (2 usines, 2 entrepôts) : coût minimal 520."""
+    probleme = ProblemePL("Transport optimal")
+    probleme.definir_noms_variables(['U1→A', 'U1→B', 'U2→A', 'U2→B'])
+    probleme.definir_fonction_objectif([8, 6, 5, 7], maximiser=False)
+    probleme.ajouter_contrainte_inegalite([1, 1, 0, 0], 50)
+    probleme.ajouter_contrainte_inegalite([0, 0, 1, 1], 40)
+    probleme.ajouter_contrainte_equalite([1, 0, 1, 0], 30)
+    probleme.ajouter_contrainte_equalite([0, 1, 0, 1], 60)
+    probleme.definir_bornes([(0, None)] * 4)
+
+    solution = SolveurTransport().resoudre(probleme)
+    assert solution.statut == 'optimal'
+    assert abs(solution.valeur_objectif - 520) < 1e-9
+    assert solution.noms_variables == ['U1→A', 'U1→B', 'U2→A', 'U2→B']
+    assert np.allclose(solution.valeurs_variables, [0, 50, 30, 10])
+
+
+def test_comparaison_highs():
+    """Mêmes optimums que HiGHS, quelle que soit la solution de départ."""
+    for graine in range(10):
+        probleme = transport(4, 6, graine=graine)
+        reference = resoudre_rapide(probleme, verbose=False)
+        for methode in SolveurTransport.METHODES_DEPART:
+            solution = SolveurTransport(methode).resoudre(probleme)
+            assert solution.statut == 'optimal'
+            assert abs(solution.valeur_objectif - reference.valeur_objectif) < 1e-6
+            x = solution.valeurs_variables
+            assert np.all(probleme.A_ub @ x <= probleme.b_ub + 1e-9)
+            assert np.allclose(probleme.A_eq @ x, probleme.b_eq)
+
+
+def test_detection():
+    """Structure reconnue (ou non) dans un ProblemePL."""
+    assert detecter_transport(transport(3, 4)) is not None
+
+    probleme = ProblemePL()
+    probleme.definir_fonction_objectif([3, 5], maximiser=True)
+    probleme.ajouter_contrainte_inegalite([1, 2], 4)
+    assert detecter_transport(probleme) is None
+
+
+def test_matrices_et_cas_limites():
+    """Données directes, routes interdites, offre insuffisante et budget."""
+    couts = np.array([[4.0, np.inf, 1.0], [2.0, 3.0, np.inf]])
+    solution = SolveurTransport().resoudre(ProblemeTransport([20, 30], [10, 15, 20], couts))
+    assert solution.statut == 'optimal'
+    assert solution.noms_variables[0] == 'U1→E1'
+    assert solution.valeurs_variables[1] == 0 and solution.valeurs_variables[5] == 0
+    assert abs(solution.valeur_objectif - (20 * 1 + 10 * 2 + 15 * 3)) < 1e-9
+
+    solution = SolveurTransport().resoudre(ProblemeTransport([10], [5, 8], [[1, 2]]))
+    assert solution.statut == 'infaisable'
+
+    rng = np.random.default_rng(0)
+    probleme = ProblemeTransport(np.full(30, 40.0), np.full(40, 30.0), rng.uniform(1, 10, (30, 40)))
+    collecteur = CollecteurProfil()
+    solution = SolveurTransport('coin_nord_ouest', ecouteurs=[collecteur]).resoudre(probleme)
+    assert solution.statut == 'optimal' and collecteur.dernier.nb_pivots > 5
+
+    from src.budget import Budget
+    interrompue = SolveurTransport('coin_nord_ouest').resoudre(probleme, budget=Budget(max_iterations=5))
+    assert interrompue.statut == 'budget_epuise'
+    assert interrompue.valeur_objectif >= solution.valeur_objectif
+    assert interrompue.valeur_objectif - interrompue.ecart_optimalite <= solution.valeur_objectif + 1e-6
+
+
+if __name__ == "__main__":
+    test_exemple_transport()
+    test_comparaison_highs()
+    test_detection()
+    test_matrices_et_cas_limites()
+    print("✓ Test réussi!")